@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Collect Benchmark
+지연이 큰(네트워크 마운트) 출력 디렉토리에서 collect_outputs 수집 시간 측정
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import consolidate
+
+
+def make_outputs(mission_path: Path, count: int) -> dict[str, Any]:
+    """count개 출력 파일과 그에 맞는 계획 생성"""
+    outputs_dir: Path = mission_path / "outputs"
+    outputs_dir.mkdir(parents=True)
+    commands: list[dict[str, Any]] = []
+
+    for i in range(count):
+        agent_id: str = f"bench_agent_{i:04d}"
+        (outputs_dir / f"{agent_id}.md").write_text(f"# {agent_id}\n\n" + "결과 본문 " * 200)
+        commands.append({"agent_id": agent_id})
+
+    return {"commands": commands}
+
+
+def with_latency(latency: float):
+    """파일 읽기마다 latency초 지연을 넣는 read_output 래퍼"""
+    original = consolidate.read_output
+
+    def slow_read(outputs_dir: Path, agent_id: str) -> dict[str, Any]:
+        time.sleep(latency)
+        return original(outputs_dir, agent_id)
+
+    return original, slow_read
+
+
+def run(count: int, latency: float, workers_list: list[int]) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        mission_path = Path(tmpdir)
+        plan = make_outputs(mission_path, count)
+        original, slow_read = with_latency(latency)
+        consolidate.read_output = slow_read
+        try:
+            for workers in workers_list:
+                start = time.perf_counter()
+                collected = consolidate.collect_outputs(mission_path, plan, workers)
+                elapsed = time.perf_counter() - start
+                assert [r["agent_id"] for r in collected] == [c["agent_id"] for c in plan["commands"]]
+                results.append({"workers": workers, "seconds": elapsed})
+        finally:
+            consolidate.read_output = original
+
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Collect Benchmark")
+    parser.add_argument("--count", "-n", type=int, default=1000, help="출력 파일 수")
+    parser.add_argument("--latency", "-l", type=float, default=0.02, help="파일당 읽기 지연(초)")
+    parser.add_argument("--workers", "-w", type=int, nargs="+", default=[1, 4, 16, 32], help="비교할 스레드 수")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    print(f"\n⏱️  collect_outputs: {args.count}개 출력, 파일당 지연 {args.latency*1000:.0f}ms")
+    results = run(args.count, args.latency, args.workers)
+    baseline: float = results[0]["seconds"]
+    for r in results:
+        print(f"   workers={r['workers']:>3}: {r['seconds']:.2f}s (x{baseline / r['seconds']:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Hot Path Benchmarks
+계획/모니터링/통합 핫패스 시간 및 최대 메모리 측정, 기준선 대비 회귀 검사
+"""
+
+import json
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synthetic import SHAPES, make_agents, make_mission_dir, make_subtasks, write_logs, write_outputs
+from assemble import save_execution_plan
+from execute import generate_openclaw_commands
+from monitor import check_agent_outputs, read_logs
+from consolidate import collect_outputs, generate_summary, validate_outputs
+
+
+BASELINE_FILE: Path = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE: float = 0.25   # 기준선보다 25% 넘게 느리거나 메모리를 더 쓰면 회귀
+MIN_SECONDS: float = 0.005        # 이보다 짧은 측정은 잡음이 커서 시간 회귀 판정에서 제외
+
+HOT_PATHS: tuple[str, ...] = (
+    "save_execution_plan", "generate_openclaw_commands", "check_agent_outputs", "read_logs", "generate_summary"
+)
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """
+    repeat회 실행 중 최소 시간, 별도 1회 실행의 tracemalloc 최대 메모리
+
+    메모리 추적은 실행을 느리게 하므로 시간 측정과 분리한다.
+    """
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_kb": peak / 1024}
+
+
+def bench_mission(root: Path, count: int, shape: str, output_bytes: int, log_events: int,
+                  repeat: int, seed: int = 0) -> dict[str, dict[str, float]]:
+    """합성 미션 하나를 만들고 핫패스별 측정 {이름: {"seconds", "peak_kb"}}"""
+    mission: dict[str, Any] = make_mission_dir(root, f"bench_{shape}_{count}")
+    mission_path: Path = Path(mission["path"])
+    agents: list[dict[str, Any]] = make_agents(mission["id"], make_subtasks(count, shape, seed))
+
+    results: dict[str, dict[str, float]] = {}
+    results["save_execution_plan"] = measure(lambda: save_execution_plan(mission, agents), repeat)
+
+    with open(mission_path / "execution_plan.json") as f:
+        plan: dict[str, Any] = json.load(f)
+    write_outputs(mission_path, plan, output_bytes)
+    write_logs(mission_path, plan, log_events)
+
+    collected = collect_outputs(mission_path, plan)
+    validation = validate_outputs(collected, plan)
+
+    results["generate_openclaw_commands"] = measure(lambda: generate_openclaw_commands(plan), repeat)
+    results["check_agent_outputs"] = measure(lambda: check_agent_outputs(mission_path, plan), repeat)
+    results["read_logs"] = measure(lambda: read_logs(mission_path), repeat)
+    results["generate_summary"] = measure(lambda: generate_summary(mission, collected, validation), repeat)
+
+    return results
+
+
+def run_suite(sizes: list[int], shapes: list[str], output_bytes: int, log_events: int,
+              repeat: int, paths: Optional[list[str]] = None) -> dict[str, dict[str, float]]:
+    """
+    전체 스위트 실행
+
+    Returns:
+        {"<핫패스>/<형태>/<에이전트 수>": {"seconds", "peak_kb"}}
+    """
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in sizes:
+            for shape in shapes:
+                measured = bench_mission(Path(tmpdir), count, shape, output_bytes, log_events, repeat)
+                for name, m in measured.items():
+                    if not paths or name in paths:
+                        results[f"{name}/{shape}/{count}"] = m
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]],
+            tolerance: float = DEFAULT_TOLERANCE) -> list[dict[str, Any]]:
+    """
+    기준선 대비 회귀 목록
+
+    시간은 양쪽 모두 MIN_SECONDS 이상일 때만 비교한다. 기준선에 없는 항목은 건너뛴다.
+    """
+    regressions: list[dict[str, Any]] = []
+    for key, current in sorted(results.items()):
+        base: Optional[dict[str, float]] = baseline.get(key)
+        if not base:
+            continue
+        for metric in ("seconds", "peak_kb"):
+            if metric == "seconds" and min(base[metric], current[metric]) < MIN_SECONDS:
+                continue
+            if base[metric] and current[metric] > base[metric] * (1 + tolerance):
+                regressions.append({
+                    "case": key,
+                    "metric": metric,
+                    "baseline": base[metric],
+                    "current": current[metric],
+                    "ratio": round(current[metric] / base[metric], 2)
+                })
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Hot Path Benchmarks")
+    parser.add_argument("--agents", "-n", type=int, nargs="+", default=[100, 1000], help="미션당 에이전트 수")
+    parser.add_argument("--shape", "-s", choices=SHAPES, nargs="+", default=list(SHAPES), help="DAG 형태")
+    parser.add_argument("--path", "-p", choices=HOT_PATHS, nargs="+", help="측정할 핫패스 (기본: 전체)")
+    parser.add_argument("--output-kb", type=int, default=8, help="에이전트 출력 크기(KB)")
+    parser.add_argument("--log-events", type=int, default=10000, help="실행 로그 줄 수")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--baseline", "-b", default=str(BASELINE_FILE), help="기준선 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--tolerance", "-t", type=float, default=DEFAULT_TOLERANCE, help="허용 회귀 비율")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    results = run_suite(args.agents, args.shape, args.output_kb * 1024, args.log_events, args.repeat, args.path)
+    baseline_path: Path = Path(args.baseline)
+
+    if args.save_baseline:
+        merged = {**load_baseline(baseline_path), **results}
+        with open(baseline_path, "w") as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+
+    regressions = compare(results, load_baseline(baseline_path), args.tolerance) if not args.save_baseline else []
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, indent=2))
+    else:
+        print(f"\n⏱️  핫패스 벤치마크 (출력 {args.output_kb}KB, 로그 {args.log_events}줄, 최소 {args.repeat}회)")
+        for key, m in results.items():
+            print(f"   {key:<45} {m['seconds'] * 1000:>10.1f}ms {m['peak_kb']:>10.0f}KB")
+        if args.save_baseline:
+            print(f"\n💾 기준선 저장: {baseline_path}")
+        for r in regressions:
+            print(f"   ❌ 회귀 {r['case']} {r['metric']}: {r['baseline']:.4g} → {r['current']:.4g} (x{r['ratio']})")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
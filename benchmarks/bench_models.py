@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Model Memory Benchmark
+JSON에서 읽은 dict와 __slots__ 모델(models.py)의 메모리/필드 접근 시간 비교 (에이전트 목록, 실행 계획)
+"""
+
+import gc
+import json
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synthetic import make_agents, make_mission_dir, make_subtasks
+from assemble import save_execution_plan
+from models import AgentConfig, Plan
+from serialization import dumps, loads
+
+
+def retained(build: Callable[[], Any]) -> tuple[Any, dict[str, float]]:
+    """build() 결과와 그 결과가 붙잡고 있는 메모리(KB), 만드는 동안의 최대 메모리(KB)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result: Any = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {"retained_kb": round(current / 1024), "peak_kb": round(peak / 1024)}
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """repeat회 중 최소 시간(ms)"""
+    times: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return round(min(times) * 1000, 2)
+
+
+def duration_by_type_dict(agents: list[dict[str, Any]]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for a in agents:
+        totals[a["type"]] = totals.get(a["type"], 0) + a["estimated_duration"]
+    return totals
+
+
+def duration_by_type_model(agents: list[AgentConfig]) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for a in agents:
+        totals[a.type] = totals.get(a.type, 0) + a.estimated_duration
+    return totals
+
+
+def bench_agents(count: int, repeat: int) -> dict[str, dict[str, float]]:
+    """에이전트 count개: dict 목록 vs AgentConfig 목록"""
+    raw: bytes = dumps(make_agents("bench_mission", make_subtasks(count, "random")))
+
+    dicts, dict_mem = retained(lambda: loads(raw))
+    models, model_mem = retained(lambda: [AgentConfig.from_dict(a) for a in loads(raw)])
+    assert [m.to_dict() for m in models[:10]] == dicts[:10]
+
+    return {
+        "dict": {**dict_mem, "access_ms": best_of(lambda: duration_by_type_dict(dicts), repeat)},
+        "model": {
+            **model_mem,
+            "access_ms": best_of(lambda: duration_by_type_model(models), repeat),
+            "convert_ms": best_of(lambda: [AgentConfig.from_dict(a) for a in dicts], 1),
+            "to_dict_ms": best_of(lambda: [m.to_dict() for m in models], 1)
+        }
+    }
+
+
+def bench_plan(count: int) -> dict[str, dict[str, float]]:
+    """에이전트 count개 실행 계획: dict vs Plan"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        mission: dict[str, Any] = make_mission_dir(Path(tmpdir))
+        plan_path: str = save_execution_plan(mission, make_agents(mission["id"], make_subtasks(count, "wide")))
+        with open(plan_path, "rb") as f:
+            raw: bytes = f.read()
+
+    plan_dict, dict_mem = retained(lambda: loads(raw))
+    plan_model, model_mem = retained(lambda: Plan.from_dict(loads(raw)))
+    assert plan_model.to_dict() == plan_dict
+
+    return {"dict": dict_mem, "model": model_mem}
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Model Memory Benchmark")
+    parser.add_argument("--agents", "-n", type=int, default=100000, help="에이전트 목록 크기")
+    parser.add_argument("--plan-agents", type=int, default=10000, help="실행 계획 에이전트 수 (0이면 생략)")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    results: dict[str, dict[str, dict[str, float]]] = {f"agents/{args.agents}": bench_agents(args.agents, args.repeat)}
+    if args.plan_agents:
+        results[f"plan/{args.plan_agents}"] = bench_plan(args.plan_agents)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("\n🧠 모델 메모리 벤치마크 (retained: 결과가 유지하는 메모리, peak: 변환 중 최대)")
+    for case, rows in results.items():
+        dict_kb: float = rows["dict"]["retained_kb"]
+        model_kb: float = rows["model"]["retained_kb"]
+        print(f"   {case:<16} dict {dict_kb / 1024:>8.1f}MB → 모델 {model_kb / 1024:>8.1f}MB "
+              f"({(1 - model_kb / dict_kb) * 100 if dict_kb else 0:>4.0f}% 절감, 변환 중 최대 {rows['model']['peak_kb'] / 1024:.1f}MB)")
+        if "access_ms" in rows["dict"]:
+            m: dict[str, float] = rows["model"]
+            print(f"   {'':<16} 타입별 합계 dict {rows['dict']['access_ms']:>7.2f}ms → 모델 {m['access_ms']:>7.2f}ms  "
+                  f"변환 {m['convert_ms']:.0f}ms, to_dict {m['to_dict_ms']:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Prompt Rendering Benchmark
+spawn 프롬프트 렌더링 처리량(기존 f-string vs 컴파일된 템플릿, 개별 vs 일괄)과
+실행 명령어 생성(프롬프트 인라인 vs 파일 참조)의 시간/크기 비교
+"""
+
+import json
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synthetic import make_agents, make_subtasks
+from execute import generate_openclaw_commands
+from prompt_templates import render_prompt, render_prompts
+
+MISSION_PATH: str = "/tmp/avengers-missions/bench_mission"
+
+
+def legacy_spawn_prompt(agent: dict[str, Any], mission_path: str) -> str:
+    """템플릿 도입 전 assemble.generate_spawn_command의 프롬프트 (비교 기준)"""
+    return f"""
+# 🦸 Avengers Mission
+
+## 당신의 역할
+{agent['emoji']} {agent['type'].upper()} 에이전트
+
+## 태스크
+{agent['description']}
+
+## 입력 데이터
+{json.dumps(agent['inputs'], ensure_ascii=False) if agent['inputs'] else '없음'}
+
+## 기대 출력
+{agent['expected_output'] or '태스크 완료 보고'}
+
+## 출력 위치
+{mission_path}/outputs/{agent['id']}.md
+
+## 완료 시
+1. 결과를 위 경로에 저장 (파일 마지막 줄에 "MISSION_COMPLETE: {agent['id']}" 기록)
+2. "MISSION_COMPLETE: {agent['id']}" 메시지 출력
+"""
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    """(마지막 결과, repeat회 중 최소 시간 초)"""
+    best: float = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def make_plan(agents: list[dict[str, Any]], prompts: list[str]) -> dict[str, Any]:
+    """Phase 하나짜리 계획 (save_execution_plan 없이 명령어 생성 측정용)"""
+    return {
+        "phases": [{"phase": 1, "parallel": True, "agents": [{"id": a["id"]} for a in agents]}],
+        "commands": [
+            {
+                "agent_id": a["id"],
+                "type": "spawn",
+                "params": {"task": p, "model": a["model"], "runTimeoutSeconds": a["timeout"],
+                           "cleanup": "keep", "label": a["id"]}
+            }
+            for a, p in zip(agents, prompts)
+        ]
+    }
+
+
+def run_benchmark(count: int, repeat: int, ref_count: int) -> dict[str, dict[str, float]]:
+    """
+    파일 참조 방식은 에이전트마다 파일을 쓰므로 파일 시스템 속도에 좌우돼 앞 ref_count개로만 측정한다.
+
+    Returns:
+        {"render/legacy" | "render/single" | "render/bulk": {"agents", "seconds", "per_second"},
+         "commands/inline" | "commands/refs": {"agents", "seconds", "per_second", "script_kb"}}
+    """
+    agents: list[dict[str, Any]] = make_agents("bench_mission", make_subtasks(count, "random"))
+    results: dict[str, dict[str, float]] = {}
+
+    def record(name: str, seconds: float, n: int = count, **extra: float) -> None:
+        results[name] = {
+            "agents": n, "seconds": round(seconds, 4), "per_second": round(n / seconds) if seconds else 0, **extra
+        }
+
+    legacy, seconds = timed(lambda: [legacy_spawn_prompt(a, MISSION_PATH) for a in agents], repeat)
+    record("render/legacy", seconds)
+    single, seconds = timed(lambda: [render_prompt("spawn", a, MISSION_PATH) for a in agents], repeat)
+    record("render/single", seconds)
+    bulk, seconds = timed(lambda: render_prompts("spawn", agents, MISSION_PATH), repeat)
+    record("render/bulk", seconds)
+    assert legacy == single == bulk
+
+    plan: dict[str, Any] = make_plan(agents, bulk)
+    inline, seconds = timed(lambda: generate_openclaw_commands(plan), repeat)
+    record("commands/inline", seconds, script_kb=round(sum(len(c["code"]) for c in inline[0]["commands"]) / 1024))
+
+    ref_plan: dict[str, Any] = make_plan(agents[:ref_count], bulk[:ref_count])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        refs, seconds = timed(lambda: generate_openclaw_commands(ref_plan, prompt_dir=Path(tmpdir)), 1)
+    record("commands/refs", seconds, ref_count,
+           script_kb=round(sum(len(c["code"]) for c in refs[0]["commands"]) / 1024))
+
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Prompt Rendering Benchmark")
+    parser.add_argument("--agents", "-n", type=int, default=100000, help="에이전트 수")
+    parser.add_argument("--ref-agents", type=int, default=10000, help="파일 참조 방식 측정 에이전트 수")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="반복 횟수 (최소 시간 사용, 파일 참조는 1회)")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    results = run_benchmark(args.agents, args.repeat, min(args.ref_agents, args.agents))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\n📝 프롬프트 렌더링 벤치마크 (에이전트 {args.agents}개, 최소 {args.repeat}회)")
+    for name, m in results.items():
+        line: str = f"   {name:<18} {m['agents']:>7}개 {m['seconds'] * 1000:>9.1f}ms  {m['per_second']:>10,}개/초"
+        if "script_kb" in m:
+            line += f"  스크립트 {m['script_kb']:>9,.0f}KB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Serialization Benchmark
+대용량 실행 계획의 디코딩/검증/인코딩 시간과 파일 크기를 백엔드(json, orjson)와 형식(들여쓰기, 압축)별로 비교
+"""
+
+import json
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synthetic import SHAPES, make_agents, make_mission_dir, make_subtasks
+from assemble import save_execution_plan
+from serialization import DECODERS, PlanSchema, compile_schema, dumps, loads, msgspec, validate
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """repeat회 중 최소 시간(ms)"""
+    times: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def make_plan(root: Path, count: int, shape: str) -> dict[str, Any]:
+    """합성 미션의 실행 계획 생성"""
+    mission: dict[str, Any] = make_mission_dir(root, f"bench_{shape}_{count}")
+    plan_path: str = save_execution_plan(mission, make_agents(mission["id"], make_subtasks(count, shape)))
+    with open(plan_path, "rb") as f:
+        return loads(f.read())
+
+
+def bench_plan(plan: dict[str, Any], repeat: int) -> dict[str, dict[str, float]]:
+    """
+    백엔드별 측정
+
+    Returns:
+        {백엔드: {"pretty_kb", "compact_kb", "loads_ms", "dumps_pretty_ms", "dumps_compact_ms"}}
+        + {"validate": {"checker_ms"[, "msgspec_ms"]}}
+    """
+    results: dict[str, dict[str, float]] = {}
+
+    for backend in DECODERS:
+        pretty: bytes = dumps(plan, True, backend)
+        compact: bytes = dumps(plan, False, backend)
+        results[backend] = {
+            "pretty_kb": round(len(pretty) / 1024, 1),
+            "compact_kb": round(len(compact) / 1024, 1),
+            "loads_ms": round(best_of(lambda: loads(compact, backend), repeat), 2),
+            "dumps_pretty_ms": round(best_of(lambda: dumps(plan, True, backend), repeat), 2),
+            "dumps_compact_ms": round(best_of(lambda: dumps(plan, False, backend), repeat), 2)
+        }
+
+    checker = compile_schema(PlanSchema)
+    results["validate"] = {"checker_ms": round(best_of(lambda: checker(plan, "$"), repeat), 2)}
+    if msgspec is not None:
+        results["validate"]["msgspec_ms"] = round(best_of(lambda: validate(plan, PlanSchema), repeat), 2)
+
+    return results
+
+
+def run_benchmark(sizes: list[int], shape: str, repeat: int) -> dict[str, dict[str, dict[str, float]]]:
+    """{"<형태>/<에이전트 수>": bench_plan 결과}"""
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in sizes:
+            results[f"{shape}/{count}"] = bench_plan(make_plan(Path(tmpdir), count, shape), repeat)
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Serialization Benchmark")
+    parser.add_argument("--agents", "-n", type=int, nargs="+", default=[1000, 10000], help="계획당 에이전트 수")
+    parser.add_argument("--shape", "-s", choices=SHAPES, default="wide", help="DAG 형태")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    results = run_benchmark(args.agents, args.shape, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\n📦 직렬화 벤치마크 ({args.shape}, 최소 {args.repeat}회)")
+    for case, rows in results.items():
+        print(f"   {case}")
+        for backend, m in rows.items():
+            if backend == "validate":
+                line: str = f"      검증     checker {m['checker_ms']:>8.2f}ms"
+                if "msgspec_ms" in m:
+                    line += f"  msgspec {m['msgspec_ms']:>8.2f}ms"
+                print(line)
+                continue
+            print(f"      {backend:<8} 크기 {m['pretty_kb']:>9.1f}KB → {m['compact_kb']:>9.1f}KB  "
+                  f"loads {m['loads_ms']:>8.2f}ms  dumps 들여쓰기 {m['dumps_pretty_ms']:>8.2f}ms → "
+                  f"압축 {m['dumps_compact_ms']:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
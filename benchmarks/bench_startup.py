@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - CLI Startup Benchmark
+스크립트별 실행 vs avengers 단일 진입점(선택: 상주 워커 경유)의 시작 시간(-X importtime, 실제 실행 시간) 비교
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import argparse
+import tarfile
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional
+
+
+REPO_DIR: Path = Path(__file__).parent.parent
+SCRIPTS_DIR: Path = REPO_DIR / "scripts"
+COMMANDS: tuple[str, ...] = ("assemble", "execute", "monitor", "consolidate")
+
+
+def parse_importtime(stderr: str, module: str) -> Optional[int]:
+    """-X importtime 출력에서 최상위 module의 누적 import 시간(µs)"""
+    for line in stderr.splitlines():
+        parts: list[str] = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            return int(parts[1])
+    return None
+
+
+def import_time(scripts_dir: Path, module: str, repeat: int) -> int:
+    """module import 누적 시간 최솟값(µs) - 인터프리터 자체 시작 비용은 제외"""
+    code: str = f"import sys; sys.path.insert(0, {str(scripts_dir)!r}); import {module}"
+    samples: list[int] = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                              capture_output=True, text=True, check=True)
+        value: Optional[int] = parse_importtime(proc.stderr, module)
+        if value is not None:
+            samples.append(value)
+    return min(samples) if samples else 0
+
+
+def wall_time(argv: list[str], repeat: int, env: Optional[dict[str, str]] = None) -> float:
+    """명령 실행 전체 시간 최솟값(ms) - 인터프리터 시작 포함"""
+    samples: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        subprocess.run(argv, capture_output=True, check=False, env=env)
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def checkout_scripts(ref: str, target: Path) -> Path:
+    """git ref의 scripts/를 target에 풀어 경로 반환 (기준선 비교용)"""
+    archive: bytes = subprocess.run(["git", "-C", str(REPO_DIR), "archive", ref, "scripts"],
+                                    capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(target)
+    return target / "scripts"
+
+
+def start_worker(socket_path: Path) -> subprocess.Popen:
+    """worker.py를 띄우고 소켓이 생길 때까지 대기"""
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / "worker.py"), "--socket", str(socket_path)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline: float = time.monotonic() + 10
+    while not socket_path.exists():
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            raise RuntimeError("워커 시작 실패")
+        time.sleep(0.05)
+    return proc
+
+
+def run_benchmark(repeat: int, baseline_dir: Optional[Path] = None,
+                  commands: tuple[str, ...] = COMMANDS,
+                  worker_socket: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """
+    명령별 측정
+
+    Returns:
+        {명령: {"import_us", "script_ms", "entry_ms"[, "worker_ms"][, "baseline_import_us", "baseline_script_ms"]}}
+    """
+    results: dict[str, dict[str, Any]] = {}
+    entry: str = str(SCRIPTS_DIR / "avengers.py")
+
+    for command in commands:
+        script: str = str(SCRIPTS_DIR / f"{command}.py")
+        row: dict[str, Any] = {
+            "import_us": import_time(SCRIPTS_DIR, command, repeat),
+            "script_ms": round(wall_time([sys.executable, script, "--help"], repeat), 1),
+            "entry_ms": round(wall_time([sys.executable, entry, command, "--help"], repeat), 1)
+        }
+        if worker_socket is not None:
+            env: dict[str, str] = {**os.environ, "AVENGERS_WORKER_SOCKET": str(worker_socket)}
+            row["worker_ms"] = round(wall_time([sys.executable, entry, command, "--help"], repeat, env), 1)
+        if baseline_dir is not None:
+            row["baseline_import_us"] = import_time(baseline_dir, command, repeat)
+            row["baseline_script_ms"] = round(
+                wall_time([sys.executable, str(baseline_dir / f"{command}.py"), "--help"], repeat), 1
+            )
+        results[command] = row
+
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - CLI Startup Benchmark")
+    parser.add_argument("--repeat", "-r", type=int, default=10, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--ref", help="비교할 git ref (예: HEAD~1)의 스크립트별 실행을 기준선으로 측정")
+    parser.add_argument("--worker", "-w", action="store_true", help="상주 워커를 띄우고 워커 경유 실행도 측정")
+    parser.add_argument("--command", "-c", choices=COMMANDS, nargs="+", default=list(COMMANDS), help="측정할 명령")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        baseline_dir: Optional[Path] = checkout_scripts(args.ref, Path(tmpdir)) if args.ref else None
+        worker: Optional[subprocess.Popen] = None
+        worker_socket: Optional[Path] = Path(tmpdir) / "worker.sock" if args.worker else None
+        try:
+            if worker_socket is not None:
+                worker = start_worker(worker_socket)
+            results = run_benchmark(args.repeat, baseline_dir, tuple(args.command), worker_socket)
+        finally:
+            if worker is not None:
+                worker.terminate()
+                worker.wait()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"\n🚀 CLI 시작 시간 (--help, 최소 {args.repeat}회)" + (f", 기준선 {args.ref}" if args.ref else ""))
+    for command, row in results.items():
+        line: str = (f"   {command:<12} import {row['import_us'] / 1000:>6.1f}ms  "
+                     f"스크립트 {row['script_ms']:>6.1f}ms  avengers {row['entry_ms']:>6.1f}ms")
+        if "worker_ms" in row:
+            line += f"  워커 {row['worker_ms']:>6.1f}ms"
+        if "baseline_import_us" in row:
+            line += (f"  | 기준선 import {row['baseline_import_us'] / 1000:>6.1f}ms  "
+                     f"스크립트 {row['baseline_script_ms']:>6.1f}ms")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
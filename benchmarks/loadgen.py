@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Load Generator
+가짜 OpenClaw 백엔드로 동시 미션 N개를 끝까지 실행하고 처리량/지연 백분위 측정
+"""
+
+import json
+import sys
+import time
+import argparse
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from synthetic import SHAPES, make_agents, make_mission_dir, make_subtasks
+from assemble import save_execution_plan
+from config import DEFAULT_MODEL_LIMIT, FAKE_FAILURE_RATES, FAKE_TIME_SCALE, MODEL_LIMITS
+from dispatcher import EXISTING_POOL
+from fake_backend import FakeOpenClaw
+from runtime_stats import record_agent_failed, record_agent_finished
+from scheduler import agent_states, dispatch, load_active_missions, schedule_next
+from utils import percentile, update_mission_status
+from validation import validate_mission_outputs
+
+
+MAX_ATTEMPTS: int = 3  # 에이전트당 최대 시도 횟수 (넘으면 미션 실패)
+WAIT_SECONDS: float = 0.5
+
+
+def create_missions(root: Path, count: int, agents: int, shape: str, seed: int = 0) -> dict[str, dict[str, Any]]:
+    """실행 중(executing) 상태의 합성 미션 count개 생성 {mission_id: {"path", "plan"}}"""
+    created: dict[str, dict[str, Any]] = {}
+    for i in range(count):
+        mission: dict[str, Any] = make_mission_dir(root, f"load_{i:04d}")
+        plan_path: str = save_execution_plan(
+            mission, make_agents(mission["id"], make_subtasks(agents, shape, seed + i))
+        )
+        with open(plan_path) as f:
+            created[mission["id"]] = {"path": Path(mission["path"]), "plan": json.load(f)}
+    return created
+
+
+def scaled_limits(time_scale: float) -> dict[str, dict[str, Any]]:
+    """분당 호출 한도를 시뮬레이션 시간에 맞춘 모델별 한도 (실제 1초 = 시뮬레이션 1/time_scale초)"""
+    limits: dict[str, dict[str, Any]] = {**MODEL_LIMITS, EXISTING_POOL: DEFAULT_MODEL_LIMIT}
+    return {key: {**l, "rate_per_minute": l["rate_per_minute"] / time_scale} for key, l in limits.items()}
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "p50": round(percentile(values, 50), 1),
+        "p95": round(percentile(values, 95), 1),
+        "p99": round(percentile(values, 99), 1),
+        "max": round(max(values), 1)
+    }
+
+
+def run_load(root: Path, missions: dict[str, dict[str, Any]], backend: FakeOpenClaw,
+             max_attempts: int = MAX_ATTEMPTS) -> dict[str, Any]:
+    """
+    스케줄러 → 가짜 백엔드 → 검증 루프를 모든 미션이 끝날 때까지 실행
+
+    실행 계층과 같은 경로(schedule_next/dispatch/validate_mission_outputs)를 쓰므로
+    모델별 동시 실행/호출 속도 한도, 반려 후 재디스패치가 그대로 반영된다.
+    시간은 백엔드 time_scale로 나눠 시뮬레이션 초로 보고한다.
+    """
+    start: float = time.perf_counter()
+    in_flight: dict[Future, dict[str, Any]] = {}
+    attempts: dict[tuple[str, str], int] = {}
+    outcomes: dict[str, int] = {}
+    agent_latency: list[float] = []
+    finished_at: dict[str, float] = {}
+    failed: set[str] = set()
+    limits: dict[str, dict[str, Any]] = scaled_limits(backend.time_scale)
+
+    def finish(mission_id: str, status: str) -> None:
+        update_mission_status(missions[mission_id]["path"], status)
+        finished_at[mission_id] = time.perf_counter()
+        if status == "failed":
+            failed.add(mission_id)
+
+    while True:
+        active = [m for m in load_active_missions(root) if m["mission"]["id"] not in finished_at]
+        selected = schedule_next(active, limits=limits)
+        for item in dispatch(selected):
+            key = (item["mission_id"], item["agent_id"])
+            attempts[key] = attempts.get(key, 0) + 1
+            future: Future = backend.submit(item["command"])
+            in_flight[future] = {**item, "dispatched_at": time.perf_counter()}
+
+        if not in_flight:
+            # 호출 한도로만 막혔으면 토큰이 찰 때까지 기다렸다 다시 시도
+            if not any(s == "ready" for m in active for s in m["states"].values()):
+                break
+            time.sleep(backend.time_scale)
+            continue
+
+        done, _ = wait(list(in_flight), timeout=WAIT_SECONDS, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = in_flight.pop(future)
+            mission_id, agent_id = item["mission_id"], item["agent_id"]
+            try:
+                result: dict[str, Any] = future.result()
+            except RuntimeError:
+                result = {"status": "error", "reply": None}
+            outcomes[result["status"]] = outcomes.get(result["status"], 0) + 1
+            agent_latency.append((time.perf_counter() - item["dispatched_at"]) / backend.time_scale)
+
+            # spawn 출력은 future 처리 전에 다른 결과의 검증으로 이미 미션이 끝났을 수 있다
+            if mission_id in finished_at:
+                continue
+            mission_path: Path = missions[mission_id]["path"]
+            plan: dict[str, Any] = missions[mission_id]["plan"]
+
+            if result["status"] in ("timeout", "error"):
+                record_agent_failed(mission_path, agent_id, {"reason": result["status"]})
+            else:
+                if item["command"]["type"] == "send":
+                    (mission_path / "outputs" / f"{agent_id}.md").write_text(result["reply"])
+                # 세션 종료 = 종료 신호 (완료 마커 없는 불량 출력도 바로 검증되도록)
+                record_agent_finished(mission_path, agent_id)
+            validate_mission_outputs(mission_path, plan)
+
+            states: dict[str, str] = agent_states(mission_path, plan)
+            if states.get(agent_id) != "done" and attempts[(mission_id, agent_id)] >= max_attempts:
+                finish(mission_id, "failed")
+            elif all(s == "done" for s in states.values()):
+                finish(mission_id, "completed")
+
+    # 디스패치할 것이 없는데 끝나지 않은 미션 (의존성 교착 등)
+    for mission_id in missions:
+        if mission_id not in finished_at:
+            finish(mission_id, "failed")
+
+    wall: float = time.perf_counter() - start
+    simulated: float = wall / backend.time_scale
+    completed: int = len(missions) - len(failed)
+    agents_done: int = outcomes.get("ok", 0)
+
+    return {
+        "missions": len(missions),
+        "completed": completed,
+        "failed": len(failed),
+        "dispatches": sum(attempts.values()),
+        "outcomes": outcomes,
+        "wall_seconds": round(wall, 3),
+        "simulated_seconds": round(simulated, 1),
+        "throughput": {
+            "missions_per_hour": round(completed / simulated * 3600, 2) if simulated else 0.0,
+            "agents_per_hour": round(agents_done / simulated * 3600, 2) if simulated else 0.0
+        },
+        "agent_latency": latency_summary(agent_latency),
+        "mission_latency": latency_summary([(t - start) / backend.time_scale for t in finished_at.values()])
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Load Generator")
+    parser.add_argument("--missions", "-m", type=int, default=10, help="동시 미션 수")
+    parser.add_argument("--agents", "-n", type=int, default=12, help="미션당 에이전트 수")
+    parser.add_argument("--shape", "-s", choices=SHAPES, default="random", help="DAG 형태")
+    parser.add_argument("--time-scale", type=float, default=FAKE_TIME_SCALE, help="시뮬레이션 1초당 실제 초")
+    parser.add_argument("--timeout-rate", type=float, default=FAKE_FAILURE_RATES["timeout"], help="timeout 주입 확률")
+    parser.add_argument("--invalid-rate", type=float, default=FAKE_FAILURE_RATES["invalid"], help="불량 출력 주입 확률")
+    parser.add_argument("--error-rate", type=float, default=FAKE_FAILURE_RATES["error"], help="호출 실패 주입 확률")
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS, help="에이전트당 최대 시도 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--keep", metavar="DIR", help="미션 디렉토리를 DIR에 남김 (기본: 임시 디렉토리)")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    backend = FakeOpenClaw(
+        time_scale=args.time_scale,
+        failure_rates={"timeout": args.timeout_rate, "invalid": args.invalid_rate, "error": args.error_rate},
+        seed=args.seed
+    )
+    tmpdir: Optional[tempfile.TemporaryDirectory] = None if args.keep else tempfile.TemporaryDirectory()
+    root: Path = Path(args.keep) if args.keep else Path(tmpdir.name)
+    root.mkdir(parents=True, exist_ok=True)
+
+    try:
+        missions = create_missions(root, args.missions, args.agents, args.shape, args.seed)
+        report = run_load(root, missions, backend, args.max_attempts)
+    finally:
+        backend.shutdown()
+        if tmpdir:
+            tmpdir.cleanup()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"\n🏋️  부하 테스트: 미션 {args.missions}개 x 에이전트 {args.agents}개 ({args.shape})")
+    print(f"   완료 {report['completed']} / 실패 {report['failed']}, 디스패치 {report['dispatches']}회 {report['outcomes']}")
+    print(f"   실제 {report['wall_seconds']}s = 시뮬레이션 {report['simulated_seconds']:.0f}s")
+    print(f"   처리량: 미션 {report['throughput']['missions_per_hour']}/h, "
+          f"에이전트 {report['throughput']['agents_per_hour']}/h")
+    for name in ("agent_latency", "mission_latency"):
+        s = report[name]
+        print(f"   {name}: p50 {s['p50']}s / p95 {s['p95']}s / p99 {s['p99']}s / max {s['max']}s")
+
+
+if __name__ == "__main__":
+    main()
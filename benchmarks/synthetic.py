@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Synthetic Missions
+벤치마크용 합성 미션 생성 (넓은/깊은/랜덤 DAG, 대용량 출력/로그)
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from assemble import create_agent_config
+from config import AGENT_TYPES
+
+
+SHAPES: tuple[str, ...] = ("wide", "deep", "random")
+RANDOM_MAX_DEPS: int = 3  # random DAG에서 에이전트당 최대 의존 수
+
+
+def make_subtasks(count: int, shape: str, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    count개 서브태스크 생성
+
+    - wide: 의존성 없음 (Phase 1개)
+    - deep: 직전 에이전트 하나에 의존하는 사슬 (Phase count개)
+    - random: 앞선 에이전트 중 최대 RANDOM_MAX_DEPS개에 의존
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"알 수 없는 형태: {shape}")
+
+    rng: random.Random = random.Random(seed)
+    types: list[str] = list(AGENT_TYPES)
+    subtasks: list[dict[str, Any]] = []
+
+    for i in range(count):
+        if shape == "deep":
+            deps: list[int] = [i - 1] if i else []
+        elif shape == "random":
+            deps = sorted(rng.sample(range(i), min(i, rng.randint(0, RANDOM_MAX_DEPS))))
+        else:
+            deps = []
+        subtasks.append({
+            "description": f"합성 서브태스크 {i}: 시장 데이터 조사 및 분석",
+            "type": types[i % len(types)],
+            "inputs": [f"input-{i}"],
+            "expected_output": "## 요약\n## 상세",
+            "dependencies": [f"agent_{d:02d}" for d in deps]
+        })
+
+    return subtasks
+
+
+def make_agents(mission_id: str, subtasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """에이전트 설정 생성 (실행 시간 통계 저장소는 읽지 않음)"""
+    return [create_agent_config(st, mission_id, i, {}) for i, st in enumerate(subtasks)]
+
+
+def make_mission_dir(root: Path, mission_id: str = "bench_mission") -> dict[str, Any]:
+    """빈 미션 디렉토리와 mission.json 생성"""
+    mission_path: Path = root / mission_id
+    for sub in ("agents", "outputs", "logs"):
+        (mission_path / sub).mkdir(parents=True, exist_ok=True)
+
+    mission: dict[str, Any] = {
+        "id": mission_id,
+        "path": str(mission_path),
+        "task": "합성 벤치마크 미션",
+        "status": "executing",
+        "created_at": "2026-01-01T00:00:00"
+    }
+    with open(mission_path / "mission.json", "w") as f:
+        json.dump(mission, f, ensure_ascii=False)
+    return mission
+
+
+def write_outputs(mission_path: Path, plan: dict[str, Any], size_bytes: int) -> None:
+    """계획의 모든 에이전트에 size_bytes 안팎의 출력 파일 쓰기"""
+    paragraph: str = "에이전트 분석 결과 본문입니다. Competitor pricing trends and findings. "
+    body: str = (paragraph * (size_bytes // len(paragraph.encode()) + 1))[:max(0, size_bytes // 2)]
+    outputs_dir: Path = mission_path / "outputs"
+
+    for cmd in plan["commands"]:
+        agent_id: str = cmd["agent_id"]
+        (outputs_dir / f"{agent_id}.md").write_text(
+            f"# {agent_id}\n\n## 요약\n{body}\n\n## 상세\n{body}\n\nMISSION_COMPLETE: {agent_id}\n"
+        )
+
+
+def write_logs(mission_path: Path, plan: dict[str, Any], events: int) -> None:
+    """agent_started/agent_finished 위주의 로그 events줄 쓰기"""
+    agent_ids: list[str] = [c["agent_id"] for c in plan["commands"]] or ["none"]
+    start: datetime = datetime(2026, 1, 1)
+
+    with open(mission_path / "logs" / "execution.jsonl", "w") as f:
+        for i in range(events):
+            agent_id: str = agent_ids[(i // 2) % len(agent_ids)]
+            entry: dict[str, Any] = {
+                "timestamp": (start + timedelta(seconds=i)).isoformat(),
+                "event": "agent_started" if i % 2 == 0 else "agent_finished",
+                "data": {"agent_id": agent_id, "type": "researcher", "model": "sonnet"}
+            }
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
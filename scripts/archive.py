@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Archive Script
+완료 미션 보관(압축 + 인덱스), 보관 미션 읽기/복원
+"""
+
+import json
+import os
+import shutil
+import sys
+import zipfile
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import (
+        MISSION_DIR, ARCHIVE_DIR, ARCHIVE_RETENTION_DAYS, ARCHIVE_STATUSES, ARCHIVE_CACHE_DIR, ARCHIVE_EXTRACTED_MARKER
+    )
+except ImportError:
+    from .config import (
+        MISSION_DIR, ARCHIVE_DIR, ARCHIVE_RETENTION_DAYS, ARCHIVE_STATUSES, ARCHIVE_CACHE_DIR, ARCHIVE_EXTRACTED_MARKER
+    )
+
+
+INDEX_FILE: str = "index.json"
+
+
+def load_archive_index(archive_dir: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """보관 인덱스 로드 {mission_id: 항목}"""
+    try:
+        with open((archive_dir or ARCHIVE_DIR) / INDEX_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_archive_index(index: dict[str, dict[str, Any]], archive_dir: Optional[Path] = None) -> None:
+    """보관 인덱스 저장 (임시 파일 후 교체)"""
+    root: Path = archive_dir or ARCHIVE_DIR
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = root / f"{INDEX_FILE}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, root / INDEX_FILE)
+
+
+def shard_name(mission: dict[str, Any], archive_dir: Path) -> str:
+    """미션 생성 월 기준 보관 파일 이름 (같은 미션이 이미 들어 있으면 다음 번호)"""
+    month: str = (mission.get("created_at") or "")[:7].replace("-", "") or "misc"
+    name: str = f"missions-{month}.zip"
+    n: int = 1
+
+    while (archive_dir / name).exists():
+        with zipfile.ZipFile(archive_dir / name) as zf:
+            if f"{mission['id']}/mission.json" not in zf.namelist():
+                break
+        n += 1
+        name = f"missions-{month}-{n}.zip"
+
+    return name
+
+
+def archive_candidates(mission_dir: Optional[Path] = None, older_than_days: int = ARCHIVE_RETENTION_DAYS,
+                       now: Optional[datetime] = None) -> list[Path]:
+    """보관 대상: ARCHIVE_STATUSES 상태이고 완료(없으면 생성) 시각이 기준보다 오래된 미션"""
+    root: Path = mission_dir or MISSION_DIR
+    cutoff: datetime = (now or datetime.now()) - timedelta(days=older_than_days)
+    candidates: list[Path] = []
+
+    if not root.exists():
+        return candidates
+
+    for mission_path in sorted(p for p in root.iterdir() if p.is_dir()):
+        try:
+            with open(mission_path / "mission.json") as f:
+                mission: dict[str, Any] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        if mission.get("status") not in ARCHIVE_STATUSES:
+            continue
+        finished: str = mission.get("completed_at") or mission.get("created_at") or ""
+        try:
+            if datetime.fromisoformat(finished) <= cutoff:
+                candidates.append(mission_path)
+        except ValueError:
+            continue
+
+    return candidates
+
+
+def archive_mission(mission_path: Path, archive_dir: Optional[Path] = None) -> dict[str, Any]:
+    """
+    미션 디렉토리를 월별 zip에 추가하고 인덱스에 기록한 뒤 원본 삭제
+
+    쓴 항목을 다시 읽어 CRC를 확인한 다음에만 원본을 지운다.
+
+    Returns:
+        인덱스 항목
+    """
+    root: Path = archive_dir or ARCHIVE_DIR
+    root.mkdir(parents=True, exist_ok=True)
+
+    with open(mission_path / "mission.json") as f:
+        mission: dict[str, Any] = json.load(f)
+    mission_id: str = mission_path.name
+
+    files: dict[str, int] = {}
+    for path in sorted(p for p in mission_path.rglob("*") if p.is_file()):
+        files[path.relative_to(mission_path).as_posix()] = path.stat().st_size
+
+    name: str = shard_name({**mission, "id": mission_id}, root)
+    with zipfile.ZipFile(root / name, "a", compression=zipfile.ZIP_DEFLATED) as zf:
+        for rel in files:
+            zf.write(mission_path / rel, f"{mission_id}/{rel}")
+
+    with zipfile.ZipFile(root / name) as zf:
+        for rel, size in files.items():
+            if len(zf.read(f"{mission_id}/{rel}")) != size:
+                raise OSError(f"보관 검증 실패: {mission_id}/{rel}")
+        compressed: int = sum(zf.getinfo(f"{mission_id}/{rel}").compress_size for rel in files)
+
+    entry: dict[str, Any] = {
+        "archive": name,
+        "task": mission.get("task", ""),
+        "status": mission.get("status"),
+        "created_at": mission.get("created_at"),
+        "completed_at": mission.get("completed_at"),
+        "archived_at": datetime.now().isoformat(),
+        "files": files,
+        "bytes": sum(files.values()),
+        "compressed_bytes": compressed
+    }
+    index = load_archive_index(root)
+    index[mission_id] = entry
+    save_archive_index(index, root)
+
+    shutil.rmtree(mission_path)
+    return entry
+
+
+def extract_archived(mission_id: str, target_dir: Optional[Path] = None,
+                     archive_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    보관된 미션을 target_dir/<mission_id>로 풀기 (기본: 읽기용 캐시)
+
+    이미 풀려 있으면 다시 풀지 않는다. 보관되지 않은 미션이면 None.
+    """
+    root: Path = archive_dir or ARCHIVE_DIR
+    entry: Optional[dict[str, Any]] = load_archive_index(root).get(mission_id)
+    if not entry:
+        return None
+
+    base: Path = target_dir or ARCHIVE_CACHE_DIR
+    mission_path: Path = base / mission_id
+    if (mission_path / ARCHIVE_EXTRACTED_MARKER).exists():
+        return mission_path
+
+    with zipfile.ZipFile(root / entry["archive"]) as zf:
+        zf.extractall(base, [f"{mission_id}/{rel}" for rel in entry["files"]])
+    (mission_path / ARCHIVE_EXTRACTED_MARKER).touch()
+
+    return mission_path
+
+
+def restore_mission(mission_id: str, mission_dir: Optional[Path] = None,
+                    archive_dir: Optional[Path] = None) -> Path:
+    """보관된 미션을 미션 디렉토리로 복원하고 인덱스에서 제거"""
+    root: Path = archive_dir or ARCHIVE_DIR
+    target: Path = mission_dir or MISSION_DIR
+    if (target / mission_id).exists():
+        raise FileExistsError(f"이미 존재하는 미션입니다: {mission_id}")
+
+    mission_path: Optional[Path] = extract_archived(mission_id, target, root)
+    if mission_path is None:
+        raise FileNotFoundError(f"보관된 미션이 아닙니다: {mission_id}")
+    (mission_path / ARCHIVE_EXTRACTED_MARKER).unlink()
+
+    index = load_archive_index(root)
+    index.pop(mission_id, None)
+    save_archive_index(index, root)
+
+    cached: Path = ARCHIVE_CACHE_DIR / mission_id
+    if cached.exists():
+        shutil.rmtree(cached)
+
+    return mission_path
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Archive")
+    parser.add_argument("--mission", "-m", help="특정 미션만 보관")
+    parser.add_argument("--older-than", "-o", type=int, default=ARCHIVE_RETENTION_DAYS, help="보관 기준 경과 일수")
+    parser.add_argument("--restore", "-r", metavar="MISSION", help="보관된 미션 복원")
+    parser.add_argument("--list", "-l", action="store_true", help="보관된 미션 목록")
+    parser.add_argument("--dry-run", "-d", action="store_true", help="대상만 출력")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.list:
+        index = load_archive_index()
+        if args.json:
+            print(json.dumps(index, indent=2, ensure_ascii=False))
+            return
+        print(f"\n📦 보관된 미션: {len(index)}개")
+        for mission_id, entry in sorted(index.items()):
+            print(f"   {mission_id} [{entry['status']}] {entry['archive']} — {entry['task'][:40]}")
+        return
+
+    if args.restore:
+        try:
+            mission_path = restore_mission(args.restore)
+        except (FileNotFoundError, FileExistsError) as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+        print(f"✅ 복원 완료: {mission_path}")
+        return
+
+    if args.mission:
+        mission_path = MISSION_DIR / args.mission
+        if not (mission_path / "mission.json").exists():
+            print(f"❌ 오류: 미션을 찾을 수 없습니다: {args.mission}")
+            sys.exit(1)
+        with open(mission_path / "mission.json") as f:
+            status: Optional[str] = json.load(f).get("status")
+        if status not in ARCHIVE_STATUSES:
+            print(f"❌ 오류: {', '.join(ARCHIVE_STATUSES)} 상태의 미션만 보관할 수 있습니다 (현재: {status})")
+            sys.exit(1)
+        candidates: list[Path] = [mission_path]
+    else:
+        candidates = archive_candidates(older_than_days=args.older_than)
+
+    if args.dry_run:
+        result: list[dict[str, Any]] = [{"mission_id": p.name} for p in candidates]
+    else:
+        result = [{"mission_id": p.name, **archive_mission(p)} for p in candidates]
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n📦 보관 대상: {len(candidates)}개 (기준 {args.older_than}일)")
+    for r in result:
+        if "archive" in r:
+            ratio = r["compressed_bytes"] / r["bytes"] if r["bytes"] else 0
+            print(f"   {r['mission_id']} → {r['archive']} ({r['bytes']:,} → {r['compressed_bytes']:,} bytes, {ratio:.0%})")
+        else:
+            print(f"   {r['mission_id']}")
+    if args.dry_run:
+        print("\n(dry-run: 변경 없음)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,21 +4,35 @@ Agent Avengers - Assemble Script
 태스크 분해 → 에이전트 배정 → 스폰/디스패치
 """
 
+import hashlib
 import json
 import os
 import sys
 import argparse
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 try:
-    from config import WORKSPACE, MISSION_DIR, AGENT_TYPES
+    from config import WORKSPACE, MISSION_DIR, AGENT_TYPES, MISSION_PRIORITIES, DEFAULT_MISSION_PRIORITY
+    from runtime_stats import load_runtime_model, adaptive_timeout, estimate_duration
+    from prompt_builder import estimate_tokens, prompt_budget, fit_agent_inputs
+    from tracing import span
+    from profiling import profiled, add_profile_argument
+    from serialization import read_json, write_json
+    from prompt_templates import render_prompt
 except ImportError:
-    from .config import WORKSPACE, MISSION_DIR, AGENT_TYPES
+    from .config import WORKSPACE, MISSION_DIR, AGENT_TYPES, MISSION_PRIORITIES, DEFAULT_MISSION_PRIORITY
+    from .runtime_stats import load_runtime_model, adaptive_timeout, estimate_duration
+    from .prompt_builder import estimate_tokens, prompt_budget, fit_agent_inputs
+    from .tracing import span
+    from .profiling import profiled, add_profile_argument
+    from .serialization import read_json, write_json
+    from .prompt_templates import render_prompt
 
 
-def create_mission(task_description: str) -> dict[str, Any]:
+def create_mission(task_description: str, priority: str = DEFAULT_MISSION_PRIORITY) -> dict[str, Any]:
     """미션 생성 및 초기화"""
     mission_id: str = datetime.now().strftime("%Y%m%d_%H%M%S")
     mission_path: Path = MISSION_DIR / mission_id
@@ -34,14 +48,14 @@ def create_mission(task_description: str) -> dict[str, Any]:
         "path": str(mission_path),
         "task": task_description,
         "status": "initializing",
+        "priority": priority,
         "created_at": datetime.now().isoformat(),
         "agents": [],
         "subtasks": []
     }
     
     # 미션 파일 저장
-    with open(mission_path / "mission.json", "w") as f:
-        json.dump(mission, f, indent=2, ensure_ascii=False)
+    write_json(mission_path / "mission.json", mission)
     
     return mission
 
@@ -68,19 +82,29 @@ def decompose_task(task: str) -> list[dict[str, Any]]:
     return []
 
 
-def create_agent_config(subtask: dict[str, Any], mission_id: str, index: int) -> dict[str, Any]:
-    """에이전트 설정 생성"""
+def create_agent_config(subtask: dict[str, Any], mission_id: str, index: int,
+                        runtime_model: Optional[dict[str, dict[str, Any]]] = None) -> dict[str, Any]:
+    """
+    에이전트 설정 생성
+
+    timeout은 서브태스크 지정값 → 관측 실행 시간 기반 적응형 값 → AGENT_TYPES 기본값 순으로 결정.
+    runtime_model을 넘기지 않으면 AGENT_TYPES 고정 timeout을 쓴다 (통계 로드는 호출하는 쪽에서 한 번만).
+    """
     agent_type: str = subtask.get("type") or detect_agent_type(subtask["description"])
     type_config: dict[str, Any] = AGENT_TYPES.get(agent_type, AGENT_TYPES["researcher"])
+    stats: dict[str, dict[str, Any]] = runtime_model if runtime_model is not None else {}
 
     agent_id: str = f"{mission_id}_agent_{index:02d}"
+    model: str = subtask.get("model") or type_config["model"]
+    timeout: int = subtask.get("timeout") or adaptive_timeout(agent_type, model, type_config["timeout"], stats)
 
     return {
         "id": agent_id,
         "type": agent_type,
         "emoji": type_config["emoji"],
-        "model": subtask.get("model") or type_config["model"],
-        "timeout": subtask.get("timeout") or type_config["timeout"],
+        "model": model,
+        "timeout": timeout,
+        "estimated_duration": estimate_duration(agent_type, model, timeout, stats),
         "description": subtask["description"],
         "inputs": subtask.get("inputs", []),
         "expected_output": subtask.get("expected_output", ""),
@@ -92,32 +116,8 @@ def create_agent_config(subtask: dict[str, Any], mission_id: str, index: int) ->
 
 def generate_spawn_command(agent: dict[str, Any], mission_path: str) -> dict[str, Any]:
     """sessions_spawn 호출용 파라미터 생성"""
-    
-    prompt = f"""
-# 🦸 Avengers Mission
-
-## 당신의 역할
-{agent['emoji']} {agent['type'].upper()} 에이전트
-
-## 태스크
-{agent['description']}
-
-## 입력 데이터
-{json.dumps(agent['inputs'], ensure_ascii=False) if agent['inputs'] else '없음'}
-
-## 기대 출력
-{agent['expected_output'] or '태스크 완료 보고'}
-
-## 출력 위치
-{mission_path}/outputs/{agent['id']}.md
-
-## 완료 시
-1. 결과를 위 경로에 저장
-2. "MISSION_COMPLETE: {agent['id']}" 메시지 출력
-"""
-    
     return {
-        "task": prompt,
+        "task": render_prompt("spawn", agent, mission_path),
         "model": agent["model"],
         "runTimeoutSeconds": agent["timeout"],
         "cleanup": "keep",  # 결과 확인을 위해 유지
@@ -127,42 +127,92 @@ def generate_spawn_command(agent: dict[str, Any], mission_path: str) -> dict[str
 
 def generate_send_command(agent: dict[str, Any], existing_agent_id: str) -> dict[str, Any]:
     """sessions_send 호출용 파라미터 생성 (기존 에이전트용)"""
-    
-    message = f"""
-# 🦸 Avengers Mission 요청
+    return {
+        "label": existing_agent_id,
+        "message": render_prompt("send", agent, label=existing_agent_id),
+        "timeoutSeconds": agent["timeout"]
+    }
 
-## 태스크
-{agent['description']}
 
-## 입력 데이터
-{json.dumps(agent['inputs'], ensure_ascii=False) if agent['inputs'] else '없음'}
+def build_agent_command(agent: dict[str, Any], mission_path: str) -> Optional[dict[str, Any]]:
+    """
+    모델 토큰 예산 안에서 에이전트 명령어 생성
 
-## 기대 출력
-{agent['expected_output'] or '태스크 완료 보고'}
+    inputs가 예산을 넘으면 항목별로 요약/축약하고, 최종 프롬프트 토큰 수를 기록한다.
+    profile 등 명령어가 없는 모드는 None.
+    """
+    cmd_type: str
+    key: str
+    generate: Callable[[dict[str, Any]], dict[str, Any]]
+    if agent["mode"] == "spawn":
+        cmd_type, key = "spawn", "task"
+        generate = partial(generate_spawn_command, mission_path=mission_path)
+    elif agent["mode"] == "existing":
+        cmd_type, key = "send", "message"
+        generate = partial(generate_send_command, existing_agent_id=agent.get("existing_agent_id", agent["type"]))
+    else:
+        return None
+
+    base: dict[str, Any] = generate({**agent, "inputs": []})
+    input_budget: int = max(0, prompt_budget(agent["model"]) - estimate_tokens(base[key]))
+    params: dict[str, Any] = generate(fit_agent_inputs(agent, input_budget))
 
-## 완료 시
-"MISSION_COMPLETE: {agent['id']}" 라고 알려줘
-"""
-    
     return {
-        "label": existing_agent_id,
-        "message": message,
-        "timeoutSeconds": agent["timeout"]
+        "agent_id": agent["id"],
+        "type": cmd_type,
+        "params": params,
+        "prompt_tokens": estimate_tokens(params[key])
     }
 
 
-def save_execution_plan(mission: dict[str, Any], agents: list[dict[str, Any]]) -> str:
-    """실행 계획 저장"""
+def resolve_dependency_ids(dependencies: list[str], mission_id: str) -> list[str]:
+    """서브태스크의 짧은 의존성 ID(agent_00)를 전체 에이전트 ID로 변환"""
+    return [d if d.startswith(f"{mission_id}_") else f"{mission_id}_{d}" for d in dependencies]
+
+
+def agent_fingerprint(agent: dict[str, Any]) -> str:
+    """
+    에이전트 태스크 정의 지문 - 재계획 시 기존 에이전트와 짝짓기용
+
+    에이전트 ID(서브태스크 위치)와 의존성 ID는 넣지 않는다. 서브태스크를 끼워 넣거나
+    빼서 위치가 밀려도 같은 태스크는 같은 지문이 된다 (의존 관계는 재계획에서 따로 비교).
+    """
+    payload: dict[str, Any] = {
+        "type": agent["type"],
+        "model": agent["model"],
+        "mode": agent["mode"],
+        "description": agent["description"],
+        "inputs": agent["inputs"],
+        "expected_output": agent["expected_output"],
+        "existing_agent_id": agent.get("existing_agent_id")
+    }
+    encoded: bytes = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def save_execution_plan(mission: dict[str, Any], agents: list[dict[str, Any]],
+                        completed: Optional[set[str]] = None) -> str:
+    """
+    실행 계획 저장
+
+    completed에 포함된 에이전트는 이미 유효한 출력이 있는 것으로 보고 Phase에
+    status "completed"로 남긴다 (재계획용). 의존 관계/타입/소요 시간 조회는 그대로 되고,
+    실행 명령어 출력(execute)만 건너뛴다. Phase 예상 소요에는 넣지 않는다.
+    """
     mission_path: Path = Path(mission["path"])
+    dependency_ids: dict[str, list[str]] = {
+        a["id"]: resolve_dependency_ids(a["dependencies"], mission["id"]) for a in agents
+    }
+    kept: set[str] = completed or set()
 
     # 의존성 기반 실행 순서 계산
     phases: list[list[dict[str, Any]]] = []
-    remaining: list[dict[str, Any]] = agents.copy()
+    remaining: list[dict[str, Any]] = list(agents)
     completed_ids: set[str] = set()
 
     while remaining:
         # 의존성이 모두 해결된 에이전트 찾기
-        ready: list[dict[str, Any]] = [a for a in remaining if all(d in completed_ids for d in a["dependencies"])]
+        ready: list[dict[str, Any]] = [a for a in remaining if all(d in completed_ids for d in dependency_ids[a["id"]])]
 
         if not ready:
             # 순환 의존성 또는 오류
@@ -173,20 +223,35 @@ def save_execution_plan(mission: dict[str, Any], agents: list[dict[str, Any]]) -
             completed_ids.add(a["id"])
             remaining.remove(a)
 
+    phase_estimates: list[int] = [
+        max((a.get("estimated_duration", 0) for a in phase if a["id"] not in kept), default=0) for phase in phases
+    ]
+
     plan: dict[str, Any] = {
         "mission_id": mission["id"],
         "total_agents": len(agents),
+        "estimated_duration": sum(phase_estimates),
+        "completed_agents": sorted(kept),
+        "fingerprints": {a["id"]: agent_fingerprint(a) for a in agents},
+        # 출력 파일 마지막 줄에 완료 마커를 쓰도록 지시한 프롬프트로 만든 계획 (마커 검증 대상)
+        "completion_marker": True,
         "phases": [
             {
                 "phase": i + 1,
                 "parallel": len(phase) > 1,
+                "estimated_duration": phase_estimates[i],
                 "agents": [
                     {
                         "id": a["id"],
                         "type": a["type"],
                         "emoji": a["emoji"],
                         "mode": a["mode"],
-                        "description": a["description"][:50] + "..." if len(a["description"]) > 50 else a["description"]
+                        "model": a["model"],
+                        "estimated_duration": a.get("estimated_duration", 0),
+                        "dependencies": dependency_ids[a["id"]],
+                        "expected_output": a["expected_output"],
+                        "description": a["description"][:50] + "..." if len(a["description"]) > 50 else a["description"],
+                        "status": "completed" if a["id"] in kept else "pending"
                     }
                     for a in phase
                 ]
@@ -196,49 +261,40 @@ def save_execution_plan(mission: dict[str, Any], agents: list[dict[str, Any]]) -
         "commands": []
     }
     
-    # 각 에이전트별 명령어 생성
+    # 각 에이전트별 명령어 생성 (모델별 토큰 예산 적용)
     for agent in agents:
-        if agent["mode"] == "spawn":
-            cmd = generate_spawn_command(agent, str(mission_path))
-            plan["commands"].append({
-                "agent_id": agent["id"],
-                "type": "spawn",
-                "params": cmd
-            })
-        elif agent["mode"] == "existing":
-            existing_id = agent.get("existing_agent_id", agent["type"])
-            cmd = generate_send_command(agent, existing_id)
-            plan["commands"].append({
-                "agent_id": agent["id"],
-                "type": "send",
-                "params": cmd
-            })
+        command = build_agent_command(agent, str(mission_path))
+        if command:
+            plan["commands"].append(command)
+    plan["prompt_tokens"] = sum(c["prompt_tokens"] for c in plan["commands"])
     
     # 계획 저장
-    with open(mission_path / "execution_plan.json", "w") as f:
-        json.dump(plan, f, indent=2, ensure_ascii=False)
+    write_json(mission_path / "execution_plan.json", plan)
     
     return str(mission_path / "execution_plan.json")
 
 
 def print_plan_summary(plan_path: str) -> None:
     """실행 계획 요약 출력"""
-    with open(plan_path) as f:
-        plan: dict[str, Any] = json.load(f)
+    plan: dict[str, Any] = read_json(Path(plan_path))
     
     print("\n" + "="*60)
     print("🦸 AVENGERS ASSEMBLE - 실행 계획")
     print("="*60)
     print(f"미션 ID: {plan['mission_id']}")
     print(f"총 에이전트: {plan['total_agents']}명")
+    if plan.get("estimated_duration"):
+        print(f"예상 소요: 약 {plan['estimated_duration'] // 60}분")
     print()
     
     for phase in plan["phases"]:
         parallel_tag = "⚡ 병렬" if phase["parallel"] else "➡️ 순차"
-        print(f"Phase {phase['phase']} ({parallel_tag}):")
+        estimate_tag = f", ~{phase['estimated_duration'] // 60}분" if phase.get("estimated_duration") else ""
+        print(f"Phase {phase['phase']} ({parallel_tag}{estimate_tag}):")
         for agent in phase["agents"]:
             mode_icon = "🔶" if agent["mode"] == "spawn" else "🔷"
-            print(f"  {agent['emoji']} {agent['id']}: {agent['description']}")
+            kept_tag = " (유지)" if agent.get("status") == "completed" else ""
+            print(f"  {agent['emoji']} {agent['id']}: {agent['description']}{kept_tag}")
         print()
     
     print("="*60)
@@ -252,6 +308,9 @@ def main() -> None:
     parser.add_argument("--task", "-t", help="태스크 설명")
     parser.add_argument("--subtasks", "-s", help="서브태스크 JSON 파일")
     parser.add_argument("--interactive", "-i", action="store_true", help="대화형 모드")
+    parser.add_argument("--priority", "-p", choices=list(MISSION_PRIORITIES), default=DEFAULT_MISSION_PRIORITY,
+                        help="미션 우선순위 (동시 실행 미션 간 공정 분배 가중치)")
+    add_profile_argument(parser)
 
     args: argparse.Namespace = parser.parse_args()
 
@@ -277,26 +336,31 @@ def main() -> None:
         print("  python3 assemble.py --task '복잡한 작업 설명'")
         sys.exit(1)
 
-    # 미션 생성
-    mission: dict[str, Any] = create_mission(task)
-    print(f"📁 미션 생성: {mission['id']}")
-
-    if subtasks:
-        # 에이전트 설정 생성
-        agents: list[dict[str, Any]] = [
-            create_agent_config(st, mission["id"], i)
-            for i, st in enumerate(subtasks)
-        ]
+    with profiled("assemble", args.profile) as profile:
+        # 미션 생성
+        mission: dict[str, Any] = create_mission(task, args.priority)
+        print(f"📁 미션 생성: {mission['id']}")
+        if profile:
+            profile.attach(Path(mission["path"]))
+
+        if subtasks:
+            with span(Path(mission["path"]), "assemble", {"subtasks": len(subtasks)}):
+                # 에이전트 설정 생성 (실행 시간 통계는 한 번만 로드)
+                runtime_model: dict[str, dict[str, Any]] = load_runtime_model()
+                agents: list[dict[str, Any]] = [
+                    create_agent_config(st, mission["id"], i, runtime_model)
+                    for i, st in enumerate(subtasks)
+                ]
 
-        # 실행 계획 저장
-        plan_path: str = save_execution_plan(mission, agents)
+                # 실행 계획 저장
+                plan_path: str = save_execution_plan(mission, agents)
 
-        # 요약 출력
-        print_plan_summary(plan_path)
-    else:
-        print(f"\n📝 서브태스크 정의 필요:")
-        print(f"   {mission['path']}/subtasks.json 생성 후")
-        print(f"   python3 assemble.py --subtasks {mission['path']}/subtasks.json")
+            # 요약 출력
+            print_plan_summary(plan_path)
+        else:
+            print(f"\n📝 서브태스크 정의 필요:")
+            print(f"   {mission['path']}/subtasks.json 생성 후")
+            print(f"   python3 assemble.py --subtasks {mission['path']}/subtasks.json")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - CLI Entry Point
+단일 진입점: avengers <명령> [옵션...] → 해당 스크립트의 main()만 불러서 실행
+
+명령 모듈은 고른 것 하나만 import한다. 명령 목록/도움말은 아무 모듈도 불러오지 않는다.
+AVENGERS_WORKER_SOCKET이 설정돼 있고 워커(worker.py)가 떠 있으면 명령을 워커에 넘겨
+인터프리터 시작/모듈 import 비용 없이 실행한다. 워커가 없거나 거절하면 직접 실행한다.
+"""
+
+import os
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# typing은 import만으로 수 ms가 걸려(re 포함) 쓰지 않는다 - Optional 주석은 문자열로만 둔다
+
+
+# 명령 → (모듈, 설명)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "assemble": ("assemble", "태스크 분해 및 실행 계획 생성"),
+    "execute": ("execute", "실행 명령어 생성"),
+    "monitor": ("monitor", "진행 상황 모니터링"),
+    "consolidate": ("consolidate", "결과 통합 리포트"),
+    "validate": ("validation", "출력 내용 검증"),
+    "hedge": ("hedge", "헤지 복제본 정리"),
+    "replan": ("replan", "서브태스크 변경 후 증분 재계획"),
+    "schedule": ("scheduler", "미션 간 우선순위 디스패치"),
+    "stats": ("runtime_stats", "에이전트 실행 시간 통계"),
+    "archive": ("archive", "완료 미션 보관/복원"),
+    "search": ("search", "미션/출력/로그 전문 검색"),
+    "trace": ("tracing", "OTLP 트레이스 내보내기"),
+    "timeline": ("timeline", "Gantt 타임라인"),
+    "metrics": ("metrics", "Prometheus 메트릭"),
+    "profile": ("profiling", "--profile 결과 보기")
+}
+
+WORKER_SOCKET_ENV: str = "AVENGERS_WORKER_SOCKET"
+WORKER_PROTOCOL: str = "1"
+
+# 끝나지 않거나 터미널을 다루는 옵션 - 워커로 보내지 않고 직접 실행
+LOCAL_ONLY_FLAGS: dict[str, tuple[str, ...]] = {
+    "monitor": ("--watch", "-w"),
+    "validate": ("--watch", "-w"),
+    "metrics": ("--serve", "-s", "--interval", "-i")
+}
+
+
+def usage() -> str:
+    lines: list[str] = ["usage: avengers <command> [options...]", "", "commands:"]
+    lines += [f"  {name:<12} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "각 명령의 옵션: avengers <command> --help"]
+    return "\n".join(lines)
+
+
+def load_command(name: str) -> ModuleType:
+    """명령 모듈 import (패키지로 실행되면 상대 경로로)"""
+    module: str = COMMANDS[name][0]
+    return import_module(f"{__package__}.{module}" if __package__ else module)
+
+
+def worker_env() -> dict[str, str]:
+    """워커와 일치해야 하는 환경 (설정은 import 시점에 고정되므로 AVENGERS_* 전체)"""
+    return {k: v for k, v in os.environ.items() if k.startswith("AVENGERS_") and k != WORKER_SOCKET_ENV}
+
+
+def encode_request(name: str, args: list[str], cwd: str, env: dict[str, str]) -> bytes:
+    """요청: 프로토콜 버전, cwd, 환경, 명령, 인자를 NUL로 구분 (argv에는 NUL이 올 수 없음)"""
+    env_blob: str = "\x1f".join(f"{k}={v}" for k, v in sorted(env.items()))
+    return "\0".join([WORKER_PROTOCOL, cwd, env_blob, name, *args]).encode()
+
+
+def decode_request(data: bytes) -> tuple[str, list[str], str, dict[str, str]]:
+    """encode_request의 역 (name, args, cwd, env)"""
+    version, cwd, env_blob, name, *args = data.decode().split("\0")
+    if version != WORKER_PROTOCOL:
+        raise ValueError(f"프로토콜 버전 불일치: {version}")
+    env: dict[str, str] = dict(item.split("=", 1) for item in env_blob.split("\x1f") if item)
+    return name, args, cwd, env
+
+
+def run_in_worker(socket_path: str, name: str, args: list[str]) -> "Optional[int]":
+    """
+    워커에서 명령 실행 후 stdout/stderr를 그대로 옮기고 종료 코드 반환
+
+    연결할 수 없거나 워커가 거절하면(환경 불일치 등) None - 호출 측이 직접 실행한다.
+    요청을 보낸 뒤 연결이 끊기면 명령이 이미 실행됐을 수 있어 재실행하지 않고 1을 반환한다.
+    """
+    # socket 모듈은 enum 등을 끌어와 느려서, 클라이언트는 C 구현(_socket)을 직접 쓴다
+    import _socket
+
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+
+        try:
+            sock.sendall(encode_request(name, args, os.getcwd(), worker_env()))
+            sock.shutdown(_socket.SHUT_WR)
+            chunks: list[bytes] = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        except OSError as e:
+            print(f"❌ 워커 연결 끊김: {e}", file=sys.stderr)
+            return 1
+    finally:
+        sock.close()
+
+    header, _, body = b"".join(chunks).partition(b"\n")
+    fields: list[bytes] = header.split()
+    if len(fields) != 4 or fields[0] != b"ok":
+        return None
+
+    code, out_len = int(fields[1]), int(fields[2])
+    sys.stdout.buffer.write(body[:out_len])
+    sys.stdout.flush()
+    sys.stderr.buffer.write(body[out_len:])
+    sys.stderr.flush()
+    return code
+
+
+def main(argv: "Optional[list[str]]" = None) -> int:
+    args: list[str] = sys.argv[1:] if argv is None else argv
+
+    if not args or args[0] in ("-h", "--help", "help"):
+        print(usage())
+        return 0
+
+    name: str = args[0]
+    if name not in COMMANDS:
+        print(f"❌ 알 수 없는 명령: {name}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    socket_path: str = os.environ.get(WORKER_SOCKET_ENV, "")
+    if socket_path and not set(args[1:]) & set(LOCAL_ONLY_FLAGS.get(name, ())):
+        code: "Optional[int]" = run_in_worker(socket_path, name, args[1:])
+        if code is not None:
+            return code
+
+    # 하위 명령의 argparse가 "avengers <명령>"을 프로그램 이름으로 쓰도록
+    sys.argv = [f"avengers {name}", *args[1:]]
+    load_command(name).main()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Agent Avengers - Configuration
 """
 
 import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -51,3 +52,129 @@ AGENT_TYPES: dict[str, dict[str, Any]] = {
         "keywords": ["통합", "병합", "조합", "최종"]
     }
 }
+
+# 모델별 용량 제한 (동시 실행 수, 분당 디스패치 수, 순간 허용량)
+MODEL_LIMITS: dict[str, dict[str, Any]] = {
+    "opus": {"max_concurrency": 3, "rate_per_minute": 10, "burst": 3},
+    "sonnet": {"max_concurrency": 6, "rate_per_minute": 30, "burst": 6},
+    "haiku": {"max_concurrency": 10, "rate_per_minute": 60, "burst": 10}
+}
+DEFAULT_MODEL_LIMIT: dict[str, Any] = {"max_concurrency": 4, "rate_per_minute": 20, "burst": 4}
+
+# 동시 실행 미션 간 우선순위 가중치 (가중 공정 큐잉)
+MISSION_PRIORITIES: dict[str, int] = {
+    "low": 1,
+    "normal": 2,
+    "high": 4,
+    "urgent": 8
+}
+DEFAULT_MISSION_PRIORITY: str = "normal"
+
+# 헤지(중복) 디스패치 정책
+# 에이전트가 같은 타입의 과거 실행 시간 백분위를 넘기면 복제본을 추가 스폰
+HEDGE_PERCENTILE: int = 90
+HEDGE_MIN_SAMPLES: int = 5
+HEDGE_FALLBACK_RATIO: float = 0.5  # 표본 부족 시 timeout 대비 대기 비율
+HEDGE_SUFFIX: str = "__hedge"
+
+# 실행 시간 통계 저장소 (에이전트 시작/종료 이벤트 기반)
+RUNTIME_STATS_FILE: Path = MISSION_DIR / "runtime_stats.jsonl"
+RUNTIME_MIN_SAMPLES: int = 5
+RUNTIME_TIMEOUT_PERCENTILE: int = 95
+RUNTIME_TIMEOUT_MULTIPLIER: float = 1.5  # 관측 백분위 대비 timeout 여유 배율
+RUNTIME_MIN_TIMEOUT: int = 120
+RUNTIME_DEFAULT_ESTIMATE_RATIO: float = 0.5  # 표본 부족 시 timeout 대비 예상 소요 비율
+
+# 업스트림 출력 전달 (의존 에이전트 프롬프트에 주입)
+UPSTREAM_MAX_TOKENS: int = 8000  # 업스트림 섹션 전체 상한 (초과분은 요약 + 파일 경로 참조)
+
+# 모델별 프롬프트 토큰 예산 (로컬 근사 토크나이저 기준)
+MODEL_PROMPT_BUDGETS: dict[str, int] = {
+    "opus": 24000,
+    "sonnet": 24000,
+    "haiku": 12000
+}
+DEFAULT_PROMPT_BUDGET: int = 12000
+
+# 결과 통합 병렬도 (출력 파일 읽기는 I/O 대기 위주라 코어 수보다 크게)
+CONSOLIDATE_WORKERS: int = 16
+
+# 출력 검증 규칙
+COMPLETION_MARKER: str = "MISSION_COMPLETE"
+VALIDATION_RULES: list[str] = ["completion_marker", "min_length", "required_headings", "patterns"]
+VALIDATION_MIN_LENGTH: int = 100  # 공백 제외 전 글자 수
+# 종료 신호(agent_finished, 끝 줄 완료 마커)가 없는 출력은 이 시간(초) 동안 바뀌지 않아야 검증 (작성 중 반려 방지)
+VALIDATION_SETTLE_SECONDS: int = 60
+# 모든 타입 공통 금지 패턴 (에러 페이지, API 오류 응답)
+VALIDATION_FORBIDDEN_PATTERNS: list[str] = [
+    r"(?i)<!doctype html|<html[\s>]",
+    r"(?i)\b(rate limit exceeded|internal server error|service unavailable)\b"
+]
+# 타입별 규칙: min_length, required(반드시 매치), forbidden(매치되면 실패)
+VALIDATION_TYPE_RULES: dict[str, dict[str, Any]] = {
+    "coder": {"required": [r"```"]},
+    "writer": {"min_length": 300},
+    "reviewer": {"min_length": 50}
+}
+
+# 유사 중복 섹션 제거 (MinHash + LSH)
+DEDUP_THRESHOLD: float = 0.8      # 추정 자카드 유사도 이상이면 중복
+DEDUP_SHINGLE_SIZE: int = 5       # 단어 n-gram 크기
+DEDUP_NUM_PERM: int = 64          # MinHash 서명 길이 (= 밴드 수 x 밴드 크기)
+DEDUP_BANDS: int = 16
+DEDUP_MIN_WORDS: int = 20         # 이보다 짧은 섹션은 비교하지 않음
+
+# 전문 검색 인덱스 (SQLite FTS5)
+SEARCH_INDEX_FILE: Path = MISSION_DIR / "search_index.db"
+SEARCH_DEFAULT_LIMIT: int = 20
+
+# 미션 보관 (완료 미션을 월별 zip으로 묶고 원본 디렉토리 삭제)
+ARCHIVE_DIR: Path = MISSION_DIR / "archive"
+ARCHIVE_RETENTION_DAYS: int = 14
+ARCHIVE_STATUSES: list[str] = ["completed", "failed", "cancelled"]
+ARCHIVE_CACHE_DIR: Path = Path(tempfile.gettempdir()) / "avengers-archive-cache"  # 읽기용 압축 해제 위치
+ARCHIVE_EXTRACTED_MARKER: str = ".extracted"  # 읽기용 캐시에 풀린 미션 표시 (쓰기 금지)
+
+# Prometheus 메트릭 (metrics.py --serve / --textfile)
+METRICS_PORT: int = int(os.environ.get("AVENGERS_METRICS_PORT", "9477"))
+METRICS_TEXTFILE: str = os.environ.get("AVENGERS_METRICS_TEXTFILE", "")  # node_exporter textfile collector 경로
+METRICS_STATE_FILE: str = ".metrics_state.json"  # 미션 디렉토리 안의 카운터 누적값 파일 (보관/삭제돼도 줄지 않게)
+# 히스토그램 버킷 상한 (초 / 에이전트 수)
+METRICS_BUCKETS: dict[str, list[float]] = {
+    "agent_runtime_seconds": [30, 60, 120, 300, 600, 900, 1200, 1800, 2400, 3600],
+    "queue_wait_seconds": [1, 5, 15, 30, 60, 120, 300, 600, 1800],
+    "consolidate_seconds": [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+    "plan_agents": [1, 2, 3, 5, 8, 13, 21, 34]
+}
+
+# 가짜 OpenClaw 백엔드 (부하/처리량 테스트용, 실제 모델 호출 없음)
+# 타입별 실행 시간 분포: 로그정규 (중앙값 초, 표준편차 sigma)
+FAKE_AGENT_LATENCY: dict[str, dict[str, float]] = {
+    "researcher": {"median": 300, "sigma": 0.5},
+    "analyst": {"median": 240, "sigma": 0.5},
+    "writer": {"median": 180, "sigma": 0.4},
+    "coder": {"median": 420, "sigma": 0.6},
+    "reviewer": {"median": 120, "sigma": 0.4},
+    "integrator": {"median": 150, "sigma": 0.4}
+}
+FAKE_DEFAULT_LATENCY: dict[str, float] = {"median": 200, "sigma": 0.5}
+# 실패 주입 확률: timeout(출력 없음), invalid(검증에서 반려될 출력), error(호출 실패)
+FAKE_FAILURE_RATES: dict[str, float] = {"timeout": 0.02, "invalid": 0.03, "error": 0.01}
+FAKE_TIME_SCALE: float = 0.001  # 시뮬레이션 1초 = 실제 1ms
+
+# 프로파일링 (--profile 또는 AVENGERS_PROFILE=1, 결과는 미션 logs/에 저장)
+PROFILE_ENABLED: bool = os.environ.get("AVENGERS_PROFILE", "").lower() not in ("", "0", "false", "no")
+PROFILE_TOP_N: int = int(os.environ.get("AVENGERS_PROFILE_TOP", "15"))  # 요약에 출력할 핫스팟 수
+PROFILE_MEMORY: bool = os.environ.get("AVENGERS_PROFILE_MEMORY", "1") != "0"  # tracemalloc 할당 추적 (느려짐)
+
+# 상주 워커 (worker.py, avengers 진입점이 AVENGERS_WORKER_SOCKET이 있으면 워커로 명령 전달)
+WORKER_SOCKET: str = os.environ.get("AVENGERS_WORKER_SOCKET", str(MISSION_DIR / "worker.sock"))
+WORKER_PRELOAD: list[str] = ["assemble", "execute", "monitor", "consolidate"]  # 시작할 때 미리 import할 명령
+
+# JSON 직렬화 (serialization.py) - orjson이 있으면 사용, 없으면 표준 json
+JSON_BACKEND: str = os.environ.get("AVENGERS_JSON_BACKEND", "auto")  # auto | orjson | json
+JSON_PRETTY: bool = os.environ.get("AVENGERS_JSON_PRETTY", "0") == "1"  # 미션/계획 파일 들여쓰기 (기본: 압축)
+JSON_VALIDATE: bool = os.environ.get("AVENGERS_JSON_VALIDATE", "1") != "0"  # 미션/계획 로드 시 구조 검증
+
+# 프롬프트 템플릿 (prompt_templates.py) - spawn.md / send.md / spawn.<타입>.md 등이 있으면 기본 템플릿 대신 사용
+PROMPT_TEMPLATE_DIR: str = os.environ.get("AVENGERS_PROMPT_TEMPLATES", str(MISSION_DIR / "templates"))
@@ -4,83 +4,128 @@ Agent Avengers - Consolidate Script
 에이전트 결과 수집, 검증, 통합
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 try:
-    from config import MISSION_DIR
-    from utils import load_mission
-    from exceptions import MissionNotFoundError, PlanNotFoundError
+    from config import MISSION_DIR, CONSOLIDATE_WORKERS, VALIDATION_RULES, VALIDATION_MIN_LENGTH, VALIDATION_FORBIDDEN_PATTERNS
+    from utils import load_mission, ensure_writable
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from runtime_stats import ingest_mission
+    from validation import agent_specs, check_output
+    from tracing import span
+    from profiling import profiled, add_profile_argument
+    from serialization import read_json, write_json
 except ImportError:
-    from .config import MISSION_DIR
-    from .utils import load_mission
-    from .exceptions import MissionNotFoundError, PlanNotFoundError
+    from .config import MISSION_DIR, CONSOLIDATE_WORKERS, VALIDATION_RULES, VALIDATION_MIN_LENGTH, VALIDATION_FORBIDDEN_PATTERNS
+    from .utils import load_mission, ensure_writable
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .runtime_stats import ingest_mission
+    from .validation import agent_specs, check_output
+    from .tracing import span
+    from .profiling import profiled, add_profile_argument
+    from .serialization import read_json, write_json
 
 
-def collect_outputs(mission_path: Path, plan: dict[str, Any]) -> list[dict[str, Any]]:
-    """에이전트 출력 수집"""
+MANIFEST_FILE: str = ".consolidate_manifest.json"
+MANIFEST_VERSION: int = 1
+
+
+def read_output(outputs_dir: Path, agent_id: str) -> dict[str, Any]:
+    """에이전트 출력 하나 읽기 (없으면 missing)"""
+    output_file: Path = outputs_dir / f"{agent_id}.md"
+
+    try:
+        content: str = output_file.read_bytes().decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return {
+            "agent_id": agent_id,
+            "status": "missing",
+            "content": None,
+            "file": str(output_file),
+            "size": 0
+        }
+
+    return {
+        "agent_id": agent_id,
+        "status": "completed",
+        "content": content,
+        "file": str(output_file),
+        "size": len(content)
+    }
+
+
+def collect_outputs(mission_path: Path, plan: dict[str, Any],
+                    workers: int = CONSOLIDATE_WORKERS) -> list[dict[str, Any]]:
+    """
+    에이전트 출력 수집
+
+    파일 읽기는 스레드 풀에서 병렬로 하되(네트워크 볼륨 지연 은닉),
+    결과는 계획의 명령어 순서를 유지한다.
+    """
     outputs_dir: Path = mission_path / "outputs"
-    results: list[dict[str, Any]] = []
-
-    for cmd in plan.get("commands", []):
-        agent_id: str = cmd["agent_id"]
-        output_file: Path = outputs_dir / f"{agent_id}.md"
-
-        if output_file.exists():
-            with open(output_file) as f:
-                content: str = f.read()
-
-            results.append({
-                "agent_id": agent_id,
-                "status": "completed",
-                "content": content,
-                "file": str(output_file),
-                "size": len(content)
-            })
-        else:
-            results.append({
-                "agent_id": agent_id,
-                "status": "missing",
-                "content": None,
-                "file": str(output_file),
-                "size": 0
-            })
+    agent_ids: list[str] = [cmd["agent_id"] for cmd in plan.get("commands", [])]
+
+    if workers <= 1 or len(agent_ids) <= 1:
+        return [read_output(outputs_dir, agent_id) for agent_id in agent_ids]
 
-    return results
+    with ThreadPoolExecutor(max_workers=min(workers, len(agent_ids))) as pool:
+        return list(pool.map(lambda agent_id: read_output(outputs_dir, agent_id), agent_ids))
 
 
-def validate_outputs(results: list[dict[str, Any]]) -> dict[str, Any]:
-    """출력 검증"""
+def classify_output(r: dict[str, Any], spec: Optional[dict[str, Any]] = None) -> tuple[str, Optional[str]]:
+    """출력 하나를 completed | missing | empty | invalid 로 분류 (이슈 메시지 포함)"""
+    if r["status"] == "missing":
+        return "missing", f"누락: {r['agent_id']}"
+    if r["size"] == 0:
+        return "empty", f"빈 파일: {r['agent_id']}"
+    if spec and (issues := check_output(r["content"], spec)):
+        return "invalid", f"검증 실패: {r['agent_id']} ({'; '.join(issues)})"
+    return "completed", None
+
+
+def tally_validation(classified: list[tuple[str, Optional[str]]]) -> dict[str, Any]:
+    """분류 결과 집계"""
     validation: dict[str, Any] = {
-        "total": len(results),
+        "total": len(classified),
         "completed": 0,
         "missing": 0,
         "empty": 0,
+        "invalid": 0,
         "issues": []
     }
 
-    for r in results:
-        if r["status"] == "missing":
-            validation["missing"] += 1
-            validation["issues"].append(f"누락: {r['agent_id']}")
-        elif r["size"] == 0:
-            validation["empty"] += 1
-            validation["issues"].append(f"빈 파일: {r['agent_id']}")
-        else:
-            validation["completed"] += 1
+    for kind, issue in classified:
+        validation[kind] += 1
+        if issue:
+            validation["issues"].append(issue)
 
     validation["success"] = validation["completed"] == validation["total"]
 
     return validation
 
 
-def generate_summary(mission: dict[str, Any], results: list[dict[str, Any]], validation: dict[str, Any]) -> str:
-    """통합 리포트 생성"""
+def validate_outputs(results: list[dict[str, Any]], plan: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    출력 검증
+
+    기본은 누락/빈 파일만 판정한다. plan이 주어지면 내용 규칙(validation.VALIDATION_RULES)도
+    적용한다 (consolidate --validate).
+    """
+    specs: dict[str, dict[str, Any]] = agent_specs(plan) if plan else {}
+    return tally_validation([classify_output(r, specs.get(r["agent_id"])) for r in results])
+
+
+def summary_header(mission: dict[str, Any], validation: dict[str, Any]) -> str:
+    """리포트 상단 (미션 정보, 실행 결과, 이슈)"""
     report: str = f"""# 🦸 Avengers Mission Report
 
 ## 미션 정보
@@ -94,6 +139,7 @@ def generate_summary(mission: dict[str, Any], results: list[dict[str, Any]], val
 - **완료:** {validation['completed']}
 - **누락:** {validation['missing']}
 - **빈 결과:** {validation['empty']}
+- **검증 실패:** {validation.get('invalid', 0)}
 - **성공 여부:** {'✅ 성공' if validation['success'] else '⚠️ 일부 실패'}
 
 """
@@ -104,18 +150,12 @@ def generate_summary(mission: dict[str, Any], results: list[dict[str, Any]], val
             report += f"- {issue}\n"
         report += "\n"
 
-    report += "---\n\n## 에이전트별 결과\n\n"
-    
-    for r in results:
-        if r["status"] == "completed" and r["content"]:
-            report += f"### {r['agent_id']}\n\n"
-            report += r["content"]
-            report += "\n\n---\n\n"
-        else:
-            report += f"### {r['agent_id']}\n\n"
-            report += f"*결과 없음 ({r['status']})*\n\n---\n\n"
-    
-    report += f"""
+    return report
+
+
+def report_metadata(mission: dict[str, Any], validation: dict[str, Any]) -> str:
+    """리포트 하단 메타데이터 블록"""
+    return f"""
 ## 메타데이터
 
 ```json
@@ -126,14 +166,218 @@ def generate_summary(mission: dict[str, Any], results: list[dict[str, Any]], val
 }, indent=2, ensure_ascii=False)}
 ```
 """
-    
+
+
+def render_agent_section(r: dict[str, Any]) -> str:
+    """리포트의 에이전트 결과 섹션 하나"""
+    if r["status"] == "completed" and r["content"]:
+        return f"### {r['agent_id']}\n\n{r['content']}\n\n---\n\n"
+    return f"### {r['agent_id']}\n\n*결과 없음 ({r['status']})*\n\n---\n\n"
+
+
+def assemble_report(mission: dict[str, Any], sections: list[str], validation: dict[str, Any]) -> str:
+    """상단 요약 + 에이전트 섹션 + 메타데이터 조립"""
+    return "".join([
+        summary_header(mission, validation),
+        "---\n\n## 에이전트별 결과\n\n",
+        *sections,
+        report_metadata(mission, validation)
+    ])
+
+
+def generate_summary(mission: dict[str, Any], results: list[dict[str, Any]], validation: dict[str, Any]) -> str:
+    """통합 리포트 생성"""
+    return assemble_report(mission, [render_agent_section(r) for r in results], validation)
+
+
+def load_manifest(mission_path: Path) -> dict[str, dict[str, Any]]:
+    """증분 통합 매니페스트 로드 (없거나 형식이 다르면 빈 매니페스트)"""
+    try:
+        with open(mission_path / MANIFEST_FILE) as f:
+            data: dict[str, Any] = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    return data.get("entries", {}) if data.get("version") == MANIFEST_VERSION else {}
+
+
+def save_manifest(mission_path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """매니페스트 저장 (임시 파일 후 교체)"""
+    tmp_path: Path = mission_path / f"{MANIFEST_FILE}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "entries": entries}, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, mission_path / MANIFEST_FILE)
+
+
+def spec_key(spec: Optional[dict[str, Any]]) -> str:
+    """검증 스펙 + 전역 규칙 지문 (규칙이 바뀌면 캐시된 판정 무효화)"""
+    payload: str = json.dumps(
+        [spec, VALIDATION_RULES, VALIDATION_MIN_LENGTH, VALIDATION_FORBIDDEN_PATTERNS],
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def refresh_entry(outputs_dir: Path, agent_id: str, entry: Optional[dict[str, Any]],
+                  spec: Optional[dict[str, Any]]) -> tuple[dict[str, Any], bool]:
+    """
+    출력 하나의 매니페스트 항목 갱신
+
+    (mtime, size)와 검증 스펙이 같으면 파일을 읽지 않고, 내용 해시가 같으면
+    렌더링하지 않고 기존 조각을 재사용한다.
+
+    Returns:
+        (항목, 다시 렌더링했는지)
+    """
+    key: str = spec_key(spec)
+    try:
+        stat = os.stat(outputs_dir / f"{agent_id}.md")
+    except FileNotFoundError:
+        stat = None
+
+    if entry and entry.get("spec") == key:
+        if stat is None and entry["status"] == "missing":
+            return entry, False
+        if stat and (entry.get("mtime_ns"), entry.get("size")) == (stat.st_mtime_ns, stat.st_size):
+            return entry, False
+
+    r: dict[str, Any] = read_output(outputs_dir, agent_id)
+    digest: Optional[str] = hashlib.sha256(r["content"].encode()).hexdigest() if r["content"] is not None else None
+    mtime_ns: Optional[int] = stat.st_mtime_ns if stat else None
+    size: int = stat.st_size if stat else 0
+
+    if entry and entry.get("spec") == key and digest and entry.get("sha256") == digest:
+        return {**entry, "mtime_ns": mtime_ns, "size": size}, False
+
+    kind, issue = classify_output(r, spec)
+    return {
+        "status": r["status"],
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "sha256": digest,
+        "spec": key,
+        "kind": kind,
+        "issue": issue,
+        "fragment": render_agent_section(r)
+    }, True
+
+
+def consolidate_incremental(mission_path: Path, plan: dict[str, Any], workers: int = CONSOLIDATE_WORKERS,
+                            full: bool = False,
+                            validate: bool = False) -> tuple[list[str], dict[str, Any], dict[str, int]]:
+    """
+    매니페스트 기반 증분 통합
+
+    바뀐 출력만 다시 읽고 검증/렌더링하며, 나머지는 이전 조각을 그대로 쓴다.
+    계획에서 빠진 에이전트 항목은 매니페스트에서 제거된다. validate가 꺼져 있으면
+    누락/빈 파일만 판정한다.
+
+    Returns:
+        (계획 순서의 에이전트 섹션 조각, 검증 결과, {"rendered", "reused"})
+    """
+    manifest: dict[str, dict[str, Any]] = {} if full else load_manifest(mission_path)
+    specs: dict[str, dict[str, Any]] = agent_specs(plan) if validate else {}
+    outputs_dir: Path = mission_path / "outputs"
+    agent_ids: list[str] = [cmd["agent_id"] for cmd in plan.get("commands", [])]
+
+    def refresh(agent_id: str) -> tuple[dict[str, Any], bool]:
+        return refresh_entry(outputs_dir, agent_id, manifest.get(agent_id), specs.get(agent_id))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(agent_ids) or 1))) as pool:
+        refreshed: list[tuple[dict[str, Any], bool]] = list(pool.map(refresh, agent_ids))
+
+    entries: dict[str, dict[str, Any]] = {agent_id: e for agent_id, (e, _) in zip(agent_ids, refreshed)}
+    if full or any(changed for _, changed in refreshed) or entries != manifest:
+        save_manifest(mission_path, entries)
+
+    rendered: int = sum(1 for _, changed in refreshed if changed)
+    validation: dict[str, Any] = tally_validation([(e["kind"], e["issue"]) for e in entries.values()])
+
+    return [e["fragment"] for e in entries.values()], validation, {
+        "rendered": rendered,
+        "reused": len(agent_ids) - rendered
+    }
+
+
+def group_results(results: list[dict[str, Any]], plan: dict[str, Any], by: str = "phase") -> dict[str, list[dict[str, Any]]]:
+    """
+    결과를 Phase 또는 에이전트 타입별로 묶기 (계획 순서 유지)
+
+    Phase에 없는 에이전트(이전 형식의 재계획 결과)는 "유지됨" 그룹에 들어간다.
+    """
+    keys: dict[str, str] = {}
+    for phase in plan.get("phases", []):
+        for a in phase["agents"]:
+            keys[a["id"]] = f"Phase {phase['phase']}" if by == "phase" else a["type"]
+
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for r in results:
+        groups.setdefault(keys.get(r["agent_id"], "유지됨"), []).append(r)
+
+    return groups
+
+
+def group_slug(key: str) -> str:
+    """그룹 리포트 파일 이름"""
+    return re.sub(r"[^0-9A-Za-z가-힣_-]+", "_", key).strip("_").lower() or "group"
+
+
+def generate_group_report(mission: dict[str, Any], key: str, results: list[dict[str, Any]]) -> str:
+    """그룹 중간 리포트 생성"""
+    completed: int = sum(1 for r in results if r["status"] == "completed" and r["content"])
+    report: str = f"# {key}\n\n- **미션:** {mission['id']}\n- **완료:** {completed}/{len(results)}\n\n---\n\n"
+
+    for r in results:
+        report += f"## {r['agent_id']}\n\n"
+        if r["status"] == "completed" and r["content"]:
+            report += r["content"]
+            report += "\n\n---\n\n"
+        else:
+            report += f"*결과 없음 ({r['status']})*\n\n---\n\n"
+
+    return report
+
+
+def generate_tree_report(mission: dict[str, Any], plan: dict[str, Any], results: list[dict[str, Any]],
+                         validation: dict[str, Any], report_dir: Path, by: str = "phase",
+                         workers: int = CONSOLIDATE_WORKERS) -> str:
+    """
+    계층형(map-reduce) 통합 리포트 생성
+
+    그룹별 중간 리포트를 스레드 풀에서 병렬로 만들어 report_dir에 쓰고,
+    최상위 리포트에는 요약, 목차, 그룹 링크와 에이전트별 상태만 담는다.
+    """
+    groups: dict[str, list[dict[str, Any]]] = group_results(results, plan, by)
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    def write_group(key: str) -> Path:
+        path: Path = report_dir / f"{group_slug(key)}.md"
+        path.write_text(generate_group_report(mission, key, groups[key]))
+        return path
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        paths: dict[str, Path] = dict(zip(groups, pool.map(write_group, groups)))
+
+    report: str = summary_header(mission, validation)
+    report += "---\n\n## 목차\n\n"
+    for key, group in groups.items():
+        done: int = sum(1 for r in group if r["status"] == "completed" and r["content"])
+        report += f"- [{key}]({report_dir.name}/{paths[key].name}) — {done}/{len(group)} 완료\n"
+
+    report += "\n## 에이전트별 상태\n\n| 그룹 | 에이전트 | 상태 | 크기 |\n|------|----------|------|------|\n"
+    for key, group in groups.items():
+        for r in group:
+            report += f"| [{key}]({report_dir.name}/{paths[key].name}) | {r['agent_id']} | {r['status']} | {r['size']} |\n"
+
+    report += report_metadata(mission, validation)
+
     return report
 
 
 def update_mission_status(mission_path: Path, status: str, updates: Optional[dict[str, Any]] = None) -> None:
     """미션 상태 업데이트"""
-    with open(mission_path / "mission.json") as f:
-        mission: dict[str, Any] = json.load(f)
+    ensure_writable(mission_path)
+    mission: dict[str, Any] = read_json(mission_path / "mission.json")
 
     mission["status"] = status
     mission["completed_at"] = datetime.now().isoformat()
@@ -141,8 +385,7 @@ def update_mission_status(mission_path: Path, status: str, updates: Optional[dic
     if updates:
         mission.update(updates)
 
-    with open(mission_path / "mission.json", "w") as f:
-        json.dump(mission, f, indent=2, ensure_ascii=False)
+    write_json(mission_path / "mission.json", mission)
 
 
 def main() -> None:
@@ -151,67 +394,128 @@ def main() -> None:
     parser.add_argument("--output", "-o", help="출력 파일 경로")
     parser.add_argument("--force", "-f", action="store_true", help="미완료 에이전트 무시")
     parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+    parser.add_argument("--tree", choices=["phase", "type"], help="그룹별 중간 리포트 + 목차형 최상위 리포트")
+    parser.add_argument("--validate", action="store_true", help="누락/빈 파일 외에 내용 규칙(완료 마커, 길이, 패턴)도 검증")
+    parser.add_argument("--dedup", action="store_true", help="에이전트 간 유사 중복 섹션을 상호 참조로 축약")
+    parser.add_argument("--full", action="store_true", help="증분 매니페스트를 무시하고 전체 재처리")
+    parser.add_argument("--workers", type=int, default=CONSOLIDATE_WORKERS, help="병렬 작업 스레드 수")
+    add_profile_argument(parser)
 
     args: argparse.Namespace = parser.parse_args()
 
-    try:
-        mission, plan = load_mission(args.mission)
-    except (MissionNotFoundError, PlanNotFoundError) as e:
-        print(f"❌ 오류: {e}")
-        sys.exit(1)
-
-    mission_path: Path = Path(mission["path"])
-
-    print(f"\n🔧 결과 수집 중: {args.mission}")
-
-    # 결과 수집
-    results: list[dict[str, Any]] = collect_outputs(mission_path, plan)
-
-    # 검증
-    validation: dict[str, Any] = validate_outputs(results)
-
-    print(f"   완료: {validation['completed']}/{validation['total']}")
-
-    if not validation["success"] and not args.force:
-        print("\n⚠️  일부 에이전트가 완료되지 않았습니다:")
-        for issue in validation["issues"]:
-            print(f"   - {issue}")
-        print("\n   --force 옵션으로 강제 통합 가능")
+    if args.dedup and args.tree:
+        # 상호 참조는 한 파일 안의 에이전트 앵커(#id)라 그룹별 파일로 나뉘면 대상이 없다
+        print("❌ 오류: --dedup은 --tree와 함께 쓸 수 없습니다")
         sys.exit(1)
 
-    # 리포트 생성
-    report: str = generate_summary(mission, results, validation)
-
-    # 저장
-    output_path: Path
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        output_path = mission_path / "FINAL_REPORT.md"
-
-    with open(output_path, "w") as f:
-        f.write(report)
-
-    # 상태 업데이트
-    update_mission_status(mission_path, "completed", {
-        "validation": validation
-    })
-
-    if args.json:
-        print(json.dumps({
-            "mission_id": mission["id"],
-            "report_path": str(output_path),
+    with profiled("consolidate", args.profile) as profile:
+        try:
+            mission, plan = load_mission(args.mission, writable=True)
+        except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+
+        mission_path: Path = Path(mission["path"])
+        if profile:
+            profile.attach(mission_path)
+
+        print(f"\n🔧 결과 수집 중: {args.mission}")
+
+        # 교차 출력 처리(--tree/--dedup)가 없으면 바뀐 출력만 다시 처리
+        incremental: bool = not (args.tree or args.dedup)
+        results: list[dict[str, Any]] = []
+        sections: list[str] = []
+        validation: dict[str, Any]
+
+        with span(mission_path, "consolidate.collect", {"incremental": incremental, "workers": args.workers}) as attrs:
+            if incremental:
+                sections, validation, incremental_stats = consolidate_incremental(
+                    mission_path, plan, args.workers, args.full, args.validate
+                )
+                attrs.update(incremental_stats)
+                print(f"   증분 통합: 갱신 {incremental_stats['rendered']} / 재사용 {incremental_stats['reused']}")
+            else:
+                # 결과 수집 및 검증
+                results = collect_outputs(mission_path, plan, args.workers)
+                validation = validate_outputs(results, plan if args.validate else None)
+
+        print(f"   완료: {validation['completed']}/{validation['total']}")
+
+        if not validation["success"] and not args.force:
+            print("\n⚠️  일부 에이전트가 완료되지 않았습니다:")
+            for issue in validation["issues"]:
+                print(f"   - {issue}")
+            print("\n   --force 옵션으로 강제 통합 가능")
+            sys.exit(1)
+
+        # 유사 중복 섹션 축약
+        dedup_stats: Optional[dict[str, Any]] = None
+        if args.dedup:
+            try:
+                from dedup import dedupe_results
+            except ImportError:
+                from .dedup import dedupe_results
+            results, dedup_stats = dedupe_results(results)
+            print(f"   중복 섹션 축약: {dedup_stats['collapsed']}/{dedup_stats['sections']} "
+                  f"(-{dedup_stats['saved_chars']:,}자)")
+
+        # 저장 경로
+        output_path: Path
+        if args.output:
+            output_path = Path(args.output)
+        else:
+            output_path = mission_path / "FINAL_REPORT.md"
+
+        # 리포트 생성
+        report: str
+        with span(mission_path, "consolidate.render", {"mode": args.tree or ("incremental" if incremental else "flat")}):
+            if args.tree:
+                report = generate_tree_report(mission, plan, results, validation,
+                                              output_path.parent / "reports", args.tree, args.workers)
+            elif incremental:
+                report = assemble_report(mission, sections, validation)
+            else:
+                report = generate_summary(mission, results, validation)
+
+            with open(output_path, "w") as f:
+                f.write(report)
+
+        # 상태 업데이트
+        update_mission_status(mission_path, "completed", {
             "validation": validation
-        }, indent=2, ensure_ascii=False))
-    else:
-        print(f"\n✅ 통합 완료!")
-        print(f"📄 리포트: {output_path}")
-        print(f"\n{'='*60}")
-        print("미션 요약:")
-        print(f"  - 총 에이전트: {validation['total']}")
-        print(f"  - 성공: {validation['completed']}")
-        print(f"  - 상태: {'✅ 완료' if validation['success'] else '⚠️ 부분 완료'}")
-        print(f"{'='*60}")
+        })
+
+        # 실행 시간 통계 반영 (다음 계획의 timeout/소요 추정에 사용)
+        ingest_mission(mission_path, plan)
+
+        # 검색 인덱스 갱신 (실패해도 통합 결과에는 영향 없음)
+        # sqlite3/검색 모듈은 이 단계에서만 쓰므로 지연 import
+        import sqlite3
+        try:
+            from search import update_index
+        except ImportError:
+            from .search import update_index
+        try:
+            update_index(mission_path)
+        except sqlite3.Error as e:
+            print(f"⚠️  검색 인덱스 갱신 실패: {e}")
+
+        if args.json:
+            print(json.dumps({
+                "mission_id": mission["id"],
+                "report_path": str(output_path),
+                "validation": validation,
+                "dedup": dedup_stats
+            }, indent=2, ensure_ascii=False))
+        else:
+            print(f"\n✅ 통합 완료!")
+            print(f"📄 리포트: {output_path}")
+            print(f"\n{'='*60}")
+            print("미션 요약:")
+            print(f"  - 총 에이전트: {validation['total']}")
+            print(f"  - 성공: {validation['completed']}")
+            print(f"  - 상태: {'✅ 완료' if validation['success'] else '⚠️ 부분 완료'}")
+            print(f"{'='*60}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Dataflow
+업스트림 에이전트 출력을 의존 에이전트 프롬프트에 주입
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import UPSTREAM_MAX_TOKENS
+    from prompt_builder import estimate_tokens, prompt_budget, fit_texts
+except ImportError:
+    from .config import UPSTREAM_MAX_TOKENS
+    from .prompt_builder import estimate_tokens, prompt_budget, fit_texts
+
+
+UPSTREAM_HEADING: str = "## 업스트림 결과"
+INSERT_BEFORE: str = "## 기대 출력"
+
+
+def agent_dependencies(plan: dict[str, Any]) -> dict[str, list[str]]:
+    """
+    에이전트별 의존성 목록
+
+    의존성이 기록되지 않은 이전 형식의 계획은 직전 Phase 전체를 의존성으로 본다.
+    """
+    dependencies: dict[str, list[str]] = {}
+    previous: list[str] = []
+
+    for phase in plan.get("phases", []):
+        for a in phase["agents"]:
+            dependencies[a["id"]] = a["dependencies"] if "dependencies" in a else list(previous)
+        previous = [a["id"] for a in phase["agents"]]
+
+    return dependencies
+
+
+def upstream_section(mission_path: Path, dependencies: list[str],
+                     budget: int = UPSTREAM_MAX_TOKENS) -> str:
+    """
+    업스트림 출력 섹션 생성
+
+    도착한 출력들을 토큰 예산 안에서 나눠 담는다. 예산을 넘는 출력은
+    계층 요약과 함께 파일 경로를 남기고, 아직 없는 출력은 경로만 넣는다.
+    """
+    outputs: dict[str, str] = {}
+    for dep in dependencies:
+        output_file: Path = mission_path / "outputs" / f"{dep}.md"
+        if output_file.exists():
+            outputs[dep] = output_file.read_text()
+
+    fitted: dict[str, str] = dict(zip(outputs, fit_texts(list(outputs.values()), budget)))
+    lines: list[str] = [UPSTREAM_HEADING, ""]
+
+    for dep in dependencies:
+        output_file = mission_path / "outputs" / f"{dep}.md"
+        lines.append(f"### {dep}")
+
+        if dep not in outputs:
+            lines.append(f"(아직 없음 — 완료 후 {output_file} 참조)")
+        else:
+            lines.append(fitted[dep].rstrip())
+            if fitted[dep] != outputs[dep]:
+                lines.append(f"\n…(요약됨, 전체 {estimate_tokens(outputs[dep])}토큰: {output_file})")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def inject_upstream(text: str, section: str) -> str:
+    """프롬프트의 '기대 출력' 앞에 업스트림 섹션 삽입 (없으면 끝에 추가)"""
+    if INSERT_BEFORE in text:
+        return text.replace(INSERT_BEFORE, f"{section}\n{INSERT_BEFORE}", 1)
+    return f"{text.rstrip()}\n\n{section}"
+
+
+def resolve_command_params(mission_path: Path, command: dict[str, Any],
+                           dependencies: Optional[list[str]]) -> dict[str, Any]:
+    """명령어 파라미터에 현재 시점의 업스트림 출력을 반영한 사본 반환"""
+    params: dict[str, Any] = dict(command["params"])
+    if not dependencies:
+        return params
+
+    key: str = "task" if command["type"] == "spawn" else "message"
+    remaining: int = prompt_budget(params.get("model")) - estimate_tokens(params[key])
+    budget: int = max(0, min(UPSTREAM_MAX_TOKENS, remaining))
+    params[key] = inject_upstream(params[key], upstream_section(mission_path, dependencies, budget))
+    return params
+
+
+def resolve_plan_commands(plan: dict[str, Any], mission_path: Path) -> dict[str, Any]:
+    """모든 명령어에 업스트림 출력을 반영한 계획 사본 반환 (원본 계획은 그대로)"""
+    dependencies: dict[str, list[str]] = agent_dependencies(plan)
+
+    return {
+        **plan,
+        "commands": [
+            {**cmd, "params": resolve_command_params(mission_path, cmd, dependencies.get(cmd["agent_id"]))}
+            for cmd in plan.get("commands", [])
+        ]
+    }
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Dedup
+에이전트 출력 간 유사 중복 섹션 탐지(MinHash + LSH) 및 상호 참조로 축약
+"""
+
+import random
+import re
+import zlib
+from typing import Any
+
+try:
+    from config import DEDUP_THRESHOLD, DEDUP_SHINGLE_SIZE, DEDUP_NUM_PERM, DEDUP_BANDS, DEDUP_MIN_WORDS
+except ImportError:
+    from .config import DEDUP_THRESHOLD, DEDUP_SHINGLE_SIZE, DEDUP_NUM_PERM, DEDUP_BANDS, DEDUP_MIN_WORDS
+
+
+_PRIME: int = (1 << 61) - 1
+_MAX_HASH: int = (1 << 32) - 1
+_rng = random.Random(42)  # 실행마다 같은 서명이 나오도록 고정 시드
+_PERMUTATIONS: list[tuple[int, int]] = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(DEDUP_NUM_PERM)
+]
+
+HEADING_LINE_RE: re.Pattern = re.compile(r"^#{1,6}\s")
+WORD_RE: re.Pattern = re.compile(r"\w+")
+
+
+def split_sections(content: str) -> list[dict[str, str]]:
+    """마크다운을 헤딩 단위 섹션으로 분리 (첫 헤딩 앞 본문은 제목 없는 섹션)"""
+    sections: list[dict[str, str]] = []
+    heading: str = ""
+    lines: list[str] = []
+
+    for line in content.splitlines(keepends=True):
+        if HEADING_LINE_RE.match(line):
+            if heading or "".join(lines).strip():
+                sections.append({"heading": heading, "body": "".join(lines)})
+            heading, lines = line.rstrip("\n"), []
+        else:
+            lines.append(line)
+
+    if heading or "".join(lines).strip():
+        sections.append({"heading": heading, "body": "".join(lines)})
+
+    return sections
+
+
+def shingles(text: str, k: int = DEDUP_SHINGLE_SIZE) -> set[int]:
+    """소문자 단어 k-gram 해시 집합"""
+    words: list[str] = WORD_RE.findall(text.lower())
+    if len(words) < k:
+        return {zlib.crc32(" ".join(words).encode())} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + k]).encode()) for i in range(len(words) - k + 1)}
+
+
+def minhash(shingle_set: set[int]) -> tuple[int, ...]:
+    """MinHash 서명"""
+    return tuple(
+        min(((a * x + b) % _PRIME) & _MAX_HASH for x in shingle_set)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """서명으로 추정한 자카드 유사도"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def find_duplicate_clusters(sections: list[dict[str, Any]], threshold: float = DEDUP_THRESHOLD,
+                            bands: int = DEDUP_BANDS) -> list[list[int]]:
+    """
+    서로 다른 에이전트의 유사 섹션 클러스터 찾기
+
+    LSH 밴딩으로 후보 쌍만 비교하고 union-find로 묶는다. 같은 에이전트 섹션은
+    다른 에이전트를 거쳐서도 한 클러스터에 들어가지 않는다 (자기 자신을 참조하는 축약 방지).
+
+    Args:
+        sections: {"agent_id", "signature"(없으면 비교 제외)} 목록
+        threshold: 중복 판정 유사도
+        bands: LSH 밴드 수 (DEDUP_NUM_PERM의 약수)
+
+    Returns:
+        섹션 인덱스 클러스터 목록 (각 클러스터는 오름차순, 2개 이상)
+    """
+    parent: list[int] = list(range(len(sections)))
+    members_of: list[set[str]] = [{s["agent_id"]} for s in sections]  # 루트별 소속 에이전트
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    rows: int = DEDUP_NUM_PERM // bands
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    for i, s in enumerate(sections):
+        if s.get("signature") is None:
+            continue
+        for band in range(bands):
+            buckets.setdefault((band, s["signature"][band * rows:(band + 1) * rows]), []).append(i)
+
+    checked: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if (i, j) in checked or sections[i]["agent_id"] == sections[j]["agent_id"]:
+                    continue
+                checked.add((i, j))
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j or members_of[root_i] & members_of[root_j]:
+                    continue
+                if similarity(sections[i]["signature"], sections[j]["signature"]) >= threshold:
+                    root, child = min(root_i, root_j), max(root_i, root_j)
+                    parent[child] = root
+                    members_of[root] |= members_of[child]
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(sections)):
+        clusters.setdefault(find(i), []).append(i)
+
+    return [c for c in clusters.values() if len(c) > 1]
+
+
+def dedupe_results(results: list[dict[str, Any]], threshold: float = DEDUP_THRESHOLD,
+                   min_words: int = DEDUP_MIN_WORDS) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    결과 목록의 유사 중복 섹션을 축약
+
+    클러스터에서 계획 순서상 처음 나온 섹션만 남기고, 나머지는 원본을
+    가리키는 상호 참조 한 줄로 바꾼다. 원본 섹션에는 유사 섹션 목록을 덧붙인다.
+
+    Returns:
+        (축약된 결과 목록 사본, 통계)
+    """
+    sections: list[dict[str, Any]] = []
+    for r in results:
+        if r["status"] != "completed" or not r["content"]:
+            continue
+        for s in split_sections(r["content"]):
+            shingle_set: set[int] = shingles(s["body"])
+            enough: bool = len(WORD_RE.findall(s["body"])) >= min_words
+            sections.append({
+                **s,
+                "agent_id": r["agent_id"],
+                "signature": minhash(shingle_set) if enough and shingle_set else None
+            })
+
+    notes: dict[int, str] = {}
+    collapsed: int = 0
+    saved: int = 0
+    for cluster in find_duplicate_clusters(sections, threshold):
+        keep: dict[str, Any] = sections[cluster[0]]
+        others: list[dict[str, Any]] = [sections[i] for i in cluster[1:]]
+        notes[cluster[0]] = "\n> 🔁 유사 섹션: " + ", ".join(
+            f"[{s['agent_id']}](#{s['agent_id']})" for s in others
+        ) + "\n\n"
+        for i in cluster[1:]:
+            title: str = keep["heading"].lstrip("#").strip() or "본문"
+            reference: str = (
+                f"\n> 🔁 [{keep['agent_id']}](#{keep['agent_id']})의 '{title}' 섹션과 거의 동일 "
+                f"({similarity(sections[i]['signature'], keep['signature']):.0%}) — 생략\n\n"
+            )
+            saved += len(sections[i]["body"]) - len(reference)
+            notes[i] = reference
+            sections[i]["body"] = ""
+            collapsed += 1
+
+    # 섹션을 다시 에이전트별 내용으로 조립
+    rebuilt: dict[str, list[str]] = {}
+    for i, s in enumerate(sections):
+        parts: list[str] = rebuilt.setdefault(s["agent_id"], [])
+        if s["heading"]:
+            parts.append(s["heading"] + "\n")
+        parts.append(s["body"])
+        if i in notes:
+            parts.append(notes[i])
+
+    deduped: list[dict[str, Any]] = []
+    for r in results:
+        if r["agent_id"] in rebuilt and r["status"] == "completed" and r["content"]:
+            content: str = "".join(rebuilt[r["agent_id"]])
+            deduped.append({**r, "content": content})
+        else:
+            deduped.append(r)
+
+    return deduped, {
+        "sections": len(sections),
+        "collapsed": collapsed,
+        "saved_chars": max(0, saved)
+    }
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Dispatcher
+모델별 동시 실행 수/호출 속도 제한을 지키는 에이전트 디스패처
+"""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+try:
+    from config import MODEL_LIMITS, DEFAULT_MODEL_LIMIT, RUNTIME_DEFAULT_ESTIMATE_RATIO
+except ImportError:
+    from .config import MODEL_LIMITS, DEFAULT_MODEL_LIMIT, RUNTIME_DEFAULT_ESTIMATE_RATIO
+
+
+EXISTING_POOL: str = "existing"  # sessions_send 대상(모델 미지정) 풀
+_EPSILON: float = 1e-9
+
+
+class TokenBucket:
+    """분당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate_per_minute: float, burst: int, now: float) -> None:
+        self.rate: float = rate_per_minute / 60.0
+        self.capacity: float = float(burst)
+        self.tokens: float = float(burst)
+        self.updated: float = now
+
+    def refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def try_acquire(self, now: float) -> bool:
+        self.refill(now)
+        if self.tokens >= 1.0 - _EPSILON:
+            self.tokens = max(0.0, self.tokens - 1.0)
+            return True
+        return False
+
+    def wait_time(self, now: float) -> float:
+        """토큰 1개가 생길 때까지 남은 시간(초)"""
+        self.refill(now)
+        if self.tokens >= 1.0 - _EPSILON:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate if self.rate > 0 else float("inf")
+
+
+class ModelPool:
+    """모델 하나의 동시 실행 슬롯 + 토큰 버킷"""
+
+    def __init__(self, model: str, limits: dict[str, Any], now: float) -> None:
+        self.model: str = model
+        self.max_concurrency: int = limits["max_concurrency"]
+        self.bucket: TokenBucket = TokenBucket(limits["rate_per_minute"], limits["burst"], now)
+        self.in_flight: int = 0
+
+    def has_slot(self) -> bool:
+        return self.in_flight < self.max_concurrency
+
+
+def agent_pool_key(agent: dict[str, Any]) -> str:
+    """에이전트가 속한 용량 풀 이름"""
+    return agent.get("model") or EXISTING_POOL
+
+
+class Dispatcher:
+    """
+    모델별 풀로 에이전트 디스패치
+
+    submit()으로 대기열에 넣고 poll()로 지금 보낼 수 있는 에이전트를 받는다.
+    대기열은 예상 소요 시간이 긴 순서로 정렬되어, 각 풀이 빌 때마다
+    가장 오래 걸릴 작업부터 채운다. 끝난 에이전트는 release()로 슬롯을 반환한다.
+    """
+
+    def __init__(self, limits: Optional[dict[str, dict[str, Any]]] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.limits: dict[str, dict[str, Any]] = limits if limits is not None else MODEL_LIMITS
+        self.clock: Callable[[], float] = clock
+        self.pools: dict[str, ModelPool] = {}
+        self.queue: list[dict[str, Any]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def pool(self, key: str) -> ModelPool:
+        if key not in self.pools:
+            self.pools[key] = ModelPool(key, self.limits.get(key, DEFAULT_MODEL_LIMIT), self.clock())
+        return self.pools[key]
+
+    def submit(self, agent: dict[str, Any]) -> None:
+        with self._lock:
+            self.queue.append(agent)
+            self.queue.sort(key=lambda a: -a.get("estimated_duration", 0))
+
+    def poll(self) -> list[dict[str, Any]]:
+        """용량이 허락하는 대기 에이전트를 모두 꺼내 디스패치"""
+        now: float = self.clock()
+        dispatched: list[dict[str, Any]] = []
+
+        with self._lock:
+            remaining: list[dict[str, Any]] = []
+            for agent in self.queue:
+                pool = self.pool(agent_pool_key(agent))
+                if pool.has_slot() and pool.bucket.try_acquire(now):
+                    pool.in_flight += 1
+                    dispatched.append(agent)
+                else:
+                    remaining.append(agent)
+            self.queue = remaining
+
+        return dispatched
+
+    def release(self, agent: dict[str, Any]) -> None:
+        with self._lock:
+            pool = self.pool(agent_pool_key(agent))
+            pool.in_flight = max(0, pool.in_flight - 1)
+
+    def next_token_wait(self) -> Optional[float]:
+        """슬롯은 있지만 토큰이 없어 막힌 풀이 풀리기까지 최소 대기 시간"""
+        now: float = self.clock()
+        with self._lock:
+            waits: list[float] = [
+                self.pool(key).bucket.wait_time(now)
+                for key in {agent_pool_key(a) for a in self.queue}
+                if self.pool(key).has_slot()
+            ]
+        return min(waits) if waits else None
+
+    @property
+    def pending(self) -> int:
+        return len(self.queue)
+
+
+def plan_dispatch(agents: list[dict[str, Any]],
+                  limits: Optional[dict[str, dict[str, Any]]] = None) -> list[dict[str, Any]]:
+    """
+    한 Phase의 에이전트를 용량 제한 안에서 디스패치하는 일정 시뮬레이션
+
+    Args:
+        agents: id, model, estimated_duration(없으면 timeout 비율)을 가진 에이전트 목록
+        limits: 모델별 제한 (기본 MODEL_LIMITS)
+
+    Returns:
+        디스패치 순서대로 [{"agent_id", "pool", "start_offset", "batch"}]
+    """
+    clock: list[float] = [0.0]
+    dispatcher = Dispatcher(limits, clock=lambda: clock[0])
+    running: list[tuple[float, dict[str, Any]]] = []
+    schedule: list[dict[str, Any]] = []
+    batch: int = 0
+
+    for agent in agents:
+        if "estimated_duration" not in agent:
+            agent = dict(agent, estimated_duration=int(agent.get("timeout", 0) * RUNTIME_DEFAULT_ESTIMATE_RATIO))
+        dispatcher.submit(agent)
+
+    while dispatcher.pending:
+        started = dispatcher.poll()
+        if started:
+            batch += 1
+            for agent in started:
+                running.append((clock[0] + max(agent["estimated_duration"], 1), agent))
+                schedule.append({
+                    "agent_id": agent["id"],
+                    "pool": agent_pool_key(agent),
+                    "start_offset": int(clock[0]),
+                    "batch": batch
+                })
+            continue
+
+        # 다음 이벤트(에이전트 완료 또는 토큰 충전)까지 시간 전진
+        candidates: list[float] = [finish for finish, _ in running]
+        token_wait = dispatcher.next_token_wait()
+        if token_wait is not None:
+            candidates.append(clock[0] + token_wait)
+        if not candidates or min(candidates) == float("inf"):
+            raise ValueError(f"용량이 없는 풀에 에이전트가 대기 중입니다: {[a['id'] for a in dispatcher.queue]}")
+        clock[0] = min(candidates)
+
+        for finish, agent in [r for r in running if r[0] <= clock[0]]:
+            running.remove((finish, agent))
+            dispatcher.release(agent)
+
+    return schedule
@@ -23,3 +23,8 @@ class PlanNotFoundError(AvengersError):
 class InvalidMissionError(AvengersError):
     """유효하지 않은 미션 데이터일 때 발생"""
     pass
+
+
+class ArchivedMissionError(AvengersError):
+    """보관된(읽기 전용) 미션에 쓰려고 할 때 발생"""
+    pass
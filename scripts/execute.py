@@ -11,55 +11,102 @@ import time
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 try:
-    from config import MISSION_DIR
-    from utils import load_mission, update_mission_status, log_event
-    from exceptions import MissionNotFoundError, PlanNotFoundError
+    from config import MISSION_DIR, HEDGE_PERCENTILE
+    from utils import load_mission, update_mission_status, log_event, read_log_events
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from hedge import generate_hedge_commands
+    from dispatcher import plan_dispatch
+    from dataflow import resolve_plan_commands
+    from tracing import span
+    from profiling import profiled, add_profile_argument
+    from prompt_templates import reference_params
 except ImportError:
-    from .config import MISSION_DIR
+    from .config import MISSION_DIR, HEDGE_PERCENTILE
     from .utils import load_mission, update_mission_status, log_event
-    from .exceptions import MissionNotFoundError, PlanNotFoundError
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .hedge import generate_hedge_commands
+    from .dispatcher import plan_dispatch
+    from .dataflow import resolve_plan_commands
+    from .tracing import span
+    from .profiling import profiled, add_profile_argument
+    from .prompt_templates import reference_params
 
 
-def generate_openclaw_commands(plan: dict[str, Any]) -> list[dict[str, Any]]:
-    """OpenClaw에서 실행할 명령어 생성"""
+def js_template_escape(text: str) -> str:
+    """JS 템플릿 리터럴에 안전하게 넣도록 백슬래시/백틱/${ 이스케이프"""
+    return text.replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
+
+
+def format_spawn_code(params: dict[str, Any]) -> str:
+    """sessions_spawn 호출 코드 생성"""
+    return f"""sessions_spawn({{
+  task: `{js_template_escape(params['task'])}`,
+  model: "{params['model']}",
+  runTimeoutSeconds: {params['runTimeoutSeconds']},
+  cleanup: "{params['cleanup']}",
+  label: "{params['label']}"
+}})"""
+
+
+def format_send_code(params: dict[str, Any]) -> str:
+    """sessions_send 호출 코드 생성"""
+    return f"""sessions_send({{
+  label: "{params['label']}",
+  message: `{js_template_escape(params['message'])}`,
+  timeoutSeconds: {params['timeoutSeconds']}
+}})"""
+
+
+def generate_openclaw_commands(plan: dict[str, Any],
+                               hedges: Optional[dict[str, dict[str, Any]]] = None,
+                               prompt_dir: Optional[Path] = None) -> list[dict[str, Any]]:
+    """
+    OpenClaw에서 실행할 명령어 생성
+
+    hedges가 주어지면 해당 spawn 에이전트에 헤지 복제본 명령어를 덧붙인다.
+    prompt_dir이 주어지면 프롬프트 전문을 prompt_dir/<에이전트 또는 헤지 label>.md에 쓰고
+    명령어에는 파일 경로만 넣는다 (에이전트가 많을 때 실행 스크립트 크기를 줄임).
+    """
     commands: list[dict[str, Any]] = []
+    commands_by_id: dict[str, dict[str, Any]] = {c["agent_id"]: c for c in plan["commands"]}
+
+    def code_for(kind: str, params: dict[str, Any], name: str) -> str:
+        if prompt_dir is not None:
+            params = reference_params(params, kind, prompt_dir / f"{name}.md")
+        return format_spawn_code(params) if kind == "spawn" else format_send_code(params)
 
     for phase in plan["phases"]:
         phase_commands: list[dict[str, Any]] = []
 
         for agent in phase["agents"]:
-            # 해당 에이전트의 명령어 찾기
-            cmd_info = next(
-                (c for c in plan["commands"] if c["agent_id"] == agent["id"]),
-                None
-            )
+            if agent.get("status") == "completed":
+                # 재계획에서 유지된 완료 에이전트
+                continue
+            cmd_info = commands_by_id.get(agent["id"])
             
             if cmd_info:
                 if cmd_info["type"] == "spawn":
-                    phase_commands.append({
+                    command: dict[str, Any] = {
                         "type": "spawn",
                         "agent_id": agent["id"],
-                        "code": f"""sessions_spawn({{
-  task: `{cmd_info['params']['task']}`,
-  model: "{cmd_info['params']['model']}",
-  runTimeoutSeconds: {cmd_info['params']['runTimeoutSeconds']},
-  cleanup: "{cmd_info['params']['cleanup']}",
-  label: "{cmd_info['params']['label']}"
-}})"""
-                    })
-                    
+                        "code": code_for("spawn", cmd_info["params"], agent["id"])
+                    }
+                    if hedges and agent["id"] in hedges:
+                        hedge_params: dict[str, Any] = hedges[agent["id"]]["params"]
+                        command["hedge"] = {
+                            "after": hedges[agent["id"]]["after"],
+                            "label": hedge_params["label"],
+                            "code": code_for("spawn", hedge_params, hedge_params["label"])
+                        }
+                    phase_commands.append(command)
                 elif cmd_info["type"] == "send":
                     phase_commands.append({
                         "type": "send",
                         "agent_id": agent["id"],
-                        "code": f"""sessions_send({{
-  label: "{cmd_info['params']['label']}",
-  message: `{cmd_info['params']['message']}`,
-  timeoutSeconds: {cmd_info['params']['timeoutSeconds']}
-}})"""
+                        "code": code_for("send", cmd_info["params"], agent["id"])
                     })
         
         commands.append({
@@ -71,6 +118,41 @@ def generate_openclaw_commands(plan: dict[str, Any]) -> list[dict[str, Any]]:
     return commands
 
 
+def apply_dispatch_schedule(commands: list[dict[str, Any]], plan: dict[str, Any],
+                            limits: Optional[dict[str, dict[str, Any]]] = None) -> list[dict[str, Any]]:
+    """
+    Phase별 명령어를 모델 용량 제한에 맞춰 배치로 재정렬
+
+    각 명령어에 batch(1부터)와 start_offset(Phase 시작 기준 초)을 추가한다.
+    """
+    params_by_id: dict[str, dict[str, Any]] = {c["agent_id"]: c["params"] for c in plan["commands"]}
+    estimates: dict[str, int] = {
+        a["id"]: a["estimated_duration"]
+        for phase in plan["phases"] for a in phase["agents"] if a.get("estimated_duration")
+    }
+
+    for phase_info in commands:
+        agents: list[dict[str, Any]] = []
+        for cmd in phase_info["commands"]:
+            params = params_by_id[cmd["agent_id"]]
+            agent: dict[str, Any] = {
+                "id": cmd["agent_id"],
+                "model": params.get("model"),
+                "timeout": params.get("runTimeoutSeconds") or params.get("timeoutSeconds", 0)
+            }
+            if cmd["agent_id"] in estimates:
+                agent["estimated_duration"] = estimates[cmd["agent_id"]]
+            agents.append(agent)
+
+        schedule = {s["agent_id"]: s for s in plan_dispatch(agents, limits)}
+        for cmd in phase_info["commands"]:
+            cmd["batch"] = schedule[cmd["agent_id"]]["batch"]
+            cmd["start_offset"] = schedule[cmd["agent_id"]]["start_offset"]
+        phase_info["commands"].sort(key=lambda c: (c["batch"], c["agent_id"]))
+
+    return commands
+
+
 def print_execution_script(commands: list[dict[str, Any]], mission_id: str) -> None:
     """실행 스크립트 출력"""
     print("\n" + "="*70)
@@ -92,16 +174,30 @@ def print_execution_script(commands: list[dict[str, Any]], mission_id: str) -> N
         if parallel:
             print("// 아래 명령어들을 동시에 실행")
         
+        batch: Optional[int] = None
         for cmd in cmds:
+            if cmd.get("batch") and cmd["batch"] != batch:
+                batch = cmd["batch"]
+                print(f"// ── 배치 {batch} (Phase 시작 +{cmd['start_offset']}초, 용량 확보 후) ──")
             print(f"// {cmd['agent_id']}")
             print(cmd["code"])
             print()
+            if "hedge" in cmd:
+                print(f"// ⏱️ {cmd['hedge']['after']}초 내 미완료 시 헤지 복제본 스폰 (먼저 끝난 쪽 채택)")
+                print(cmd["hedge"]["code"])
+                print()
         
         if phase_info != commands[-1]:
             print("// ⏳ 위 에이전트들 완료 대기 후 다음 Phase 진행")
             print("// sessions_list({ kinds: ['spawn'], messageLimit: 1 })")
+            print(f"// 업스트림 결과가 주입된 다음 Phase 명령어: python3 scripts/execute.py --mission {mission_id} --phase {phase + 1}")
     
     print("-"*70)
+    if any("hedge" in cmd for phase_info in commands for cmd in phase_info["commands"]):
+        print("\n🏁 헤지 판정 (먼저 끝난 결과 채택, 패자 세션 중단 대상 출력):")
+        print(f"   python3 scripts/hedge.py --mission {mission_id}")
+    print("\n⏱️ 에이전트 시작/종료 기록 (실행 시간 통계용):")
+    print(f"   python3 scripts/runtime_stats.py --mission {mission_id} --agent <agent_id> --start|--finish")
     print("\n📊 진행 모니터링:")
     print(f"   python3 scripts/monitor.py --mission {mission_id}")
     print("\n📦 결과 통합:")
@@ -125,50 +221,108 @@ def save_execution_script(commands: list[dict[str, Any]], mission_path: Path) ->
             f.write(f"## Phase {phase} {'(병렬)' if parallel else '(순차)'}\n\n")
             
             for cmd in cmds:
-                f.write(f"### {cmd['agent_id']}\n\n")
+                if cmd.get("batch"):
+                    f.write(f"### {cmd['agent_id']} (배치 {cmd['batch']}, +{cmd['start_offset']}초)\n\n")
+                else:
+                    f.write(f"### {cmd['agent_id']}\n\n")
                 f.write("```javascript\n")
                 f.write(cmd["code"])
                 f.write("\n```\n\n")
+
+                if "hedge" in cmd:
+                    f.write(f"#### {cmd['hedge']['label']} ({cmd['hedge']['after']}초 후 미완료 시)\n\n")
+                    f.write("```javascript\n")
+                    f.write(cmd["hedge"]["code"])
+                    f.write("\n```\n\n")
     
     return script_path
 
 
+def record_execution_start(mission_path: Path, mission: dict[str, Any], plan: dict[str, Any],
+                           total_phases: int, phase: Optional[int] = None, phase_agents: int = 0) -> None:
+    """
+    실행 시작 기록
+
+    이미 실행 중인 미션을 Phase별로 이어 실행할 때는 execution_started/상태 변경을 다시 남기지 않고
+    phase_started만 기록한다 (runtime_stats/timeline/tracing이 첫 execution_started를 실행 시작으로 본다).
+    """
+    if phase and mission.get("status") == "executing":
+        log_event(mission_path, "phase_started", {"phase": phase, "agents": phase_agents})
+        return
+
+    log_event(mission_path, "execution_started", {
+        "total_phases": total_phases,
+        "total_agents": plan["total_agents"]
+    })
+    if phase:
+        log_event(mission_path, "phase_started", {"phase": phase, "agents": phase_agents})
+    update_mission_status(mission_path, "executing")
+
+
 def main() -> None:
     parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Execute")
     parser.add_argument("--mission", "-m", required=True, help="미션 ID")
     parser.add_argument("--dry-run", "-d", action="store_true", help="명령어만 출력")
     parser.add_argument("--save", "-s", action="store_true", help="스크립트 파일 저장")
+    parser.add_argument("--phase", "-p", type=int, help="해당 Phase 명령어만 출력 (완료된 업스트림 결과 주입)")
+    parser.add_argument("--throttle", action="store_true", help="모델별 용량 제한(MODEL_LIMITS)에 맞춰 배치 분할")
+    parser.add_argument("--hedge", action="store_true", help="느린 에이전트 헤지 복제본 명령어 포함")
+    parser.add_argument("--hedge-percentile", type=float, default=HEDGE_PERCENTILE, help="헤지 기준 과거 실행 시간 백분위")
+    parser.add_argument("--prompt-refs", action="store_true", help="프롬프트 전문은 미션 agents/에 쓰고 명령어에는 파일 경로만 포함")
+    add_profile_argument(parser)
 
     args: argparse.Namespace = parser.parse_args()
 
-    try:
-        mission, plan = load_mission(args.mission)
-    except (MissionNotFoundError, PlanNotFoundError) as e:
-        print(f"❌ 오류: {e}")
-        print(f"   경로: {MISSION_DIR / args.mission}")
-        sys.exit(1)
+    with profiled("execute", args.profile) as profile:
+        try:
+            mission, plan = load_mission(args.mission, writable=True)
+        except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+            print(f"❌ 오류: {e}")
+            print(f"   경로: {MISSION_DIR / args.mission}")
+            sys.exit(1)
 
-    mission_path: Path = Path(mission["path"])
+        mission_path: Path = Path(mission["path"])
+        if profile:
+            profile.attach(mission_path)
 
-    # 실행 명령어 생성
-    commands: list[dict[str, Any]] = generate_openclaw_commands(plan)
+        with span(mission_path, "execute", {"phase": args.phase or 0, "hedge": args.hedge, "throttle": args.throttle}):
+            # 의존 에이전트 프롬프트에 현재까지 도착한 업스트림 출력 주입
+            plan = resolve_plan_commands(plan, mission_path)
 
-    # 실행 시작 로깅
-    log_event(mission_path, "execution_started", {
-        "total_phases": len(commands),
-        "total_agents": plan["total_agents"]
-    })
+            # 헤지 정책 (opt-in, Phase별 이어 실행 시에는 처음 한 번만 기록)
+            hedges: Optional[dict[str, dict[str, Any]]] = None
+            if args.hedge:
+                hedges = generate_hedge_commands(plan, args.hedge_percentile)
+            resuming: bool = bool(args.phase) and mission.get("status") == "executing"
+            if hedges is not None and not (resuming and read_log_events(mission_path, "hedge_policy")):
+                log_event(mission_path, "hedge_policy", {
+                    "percentile": args.hedge_percentile,
+                    "delays": {agent_id: h["after"] for agent_id, h in hedges.items()},
+                    "samples": {agent_id: h["samples"] for agent_id, h in hedges.items()}
+                })
 
-    # 상태 업데이트
-    update_mission_status(mission_path, "executing")
+            # 실행 명령어 생성
+            prompt_dir: Optional[Path] = mission_path / "agents" if args.prompt_refs else None
+            if prompt_dir is not None:
+                prompt_dir.mkdir(exist_ok=True)
+            commands: list[dict[str, Any]] = generate_openclaw_commands(plan, hedges, prompt_dir)
+            total_phases: int = len(commands)
+            if args.phase:
+                commands = [c for c in commands if c["phase"] == args.phase]
+            if args.throttle:
+                commands = apply_dispatch_schedule(commands, plan)
+
+            # 실행 시작 로깅 + 상태 업데이트
+            record_execution_start(mission_path, mission, plan, total_phases, args.phase,
+                                   sum(len(c["commands"]) for c in commands))
 
-    # 명령어 출력
-    print_execution_script(commands, args.mission)
+        # 명령어 출력
+        print_execution_script(commands, args.mission)
 
-    # 파일 저장
-    if args.save:
-        script_path: Path = save_execution_script(commands, mission_path)
-        print(f"\n📄 스크립트 저장됨: {script_path}")
+        # 파일 저장
+        if args.save:
+            script_path: Path = save_execution_script(commands, mission_path)
+            print(f"\n📄 스크립트 저장됨: {script_path}")
 
 
 if __name__ == "__main__":
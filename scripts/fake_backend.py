@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Fake OpenClaw Backend
+실제 모델 호출 없이 sessions_spawn/sessions_send를 흉내 내는 로컬 백엔드 (부하 테스트용)
+"""
+
+import math
+import random
+import re
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import (
+        FAKE_AGENT_LATENCY, FAKE_DEFAULT_LATENCY, FAKE_FAILURE_RATES, FAKE_TIME_SCALE, COMPLETION_MARKER
+    )
+except ImportError:
+    from .config import (
+        FAKE_AGENT_LATENCY, FAKE_DEFAULT_LATENCY, FAKE_FAILURE_RATES, FAKE_TIME_SCALE, COMPLETION_MARKER
+    )
+
+
+OUTCOMES: tuple[str, ...] = ("timeout", "invalid", "error")
+
+# prompt_templates 기본 spawn/send 템플릿의 섹션 제목
+PROMPT_SECTIONS: tuple[str, ...] = ("당신의 역할", "태스크", "입력 데이터", "기대 출력", "출력 위치", "완료 시")
+
+ROLE_RE: re.Pattern = re.compile(r"^\S+ ([A-Z]+) 에이전트\s*$", re.MULTILINE)
+MARKER_RE: re.Pattern = re.compile(rf"{COMPLETION_MARKER}: ([\w\-]+)")
+HEADING_LINE_RE: re.Pattern = re.compile(r"^#{1,6}\s+.+$", re.MULTILINE)
+
+FILLER: str = "시뮬레이션된 에이전트 결과입니다. Simulated findings with supporting detail. "
+
+
+def prompt_section(text: str, title: str) -> str:
+    """
+    프롬프트에서 "## title" 아래 내용
+
+    기대 출력 안에도 ## 제목이 들어 있을 수 있어, 프롬프트 자체의 섹션 제목에서만 끊는다.
+    """
+    following: str = "|".join(re.escape(t) for t in PROMPT_SECTIONS)
+    match = re.search(rf"^## {re.escape(title)}\s*\n(.*?)(?=^## (?:{following})\s*$|\Z)",
+                      text, re.MULTILINE | re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def prompt_agent_type(text: str) -> Optional[str]:
+    """spawn 프롬프트의 역할 줄("🔬 RESEARCHER 에이전트")에서 타입 추출"""
+    match = ROLE_RE.search(text)
+    return match.group(1).lower() if match else None
+
+
+def fake_output(agent_id: str, expected_output: str) -> str:
+    """기대 출력의 제목을 모두 갖추고(코드 블록 포함) 완료 마커로 끝나는 정상 출력"""
+    headings: list[str] = HEADING_LINE_RE.findall(expected_output) or ["## 결과"]
+    body: str = "\n\n".join(f"{h}\n{FILLER * 4}" for h in headings)
+    code: str = f"```python\nprint({agent_id!r})\n```"
+    return f"# {agent_id}\n\n{body}\n\n{code}\n\n{COMPLETION_MARKER}: {agent_id}\n"
+
+
+class FakeOpenClaw:
+    """
+    가짜 OpenClaw 세션 백엔드
+
+    호출마다 에이전트 타입별 로그정규 분포에서 실행 시간을 뽑아 time_scale만큼
+    축소해 실제로 대기한 뒤 결과를 낸다. spawn은 프롬프트의 출력 위치에 파일을
+    쓰고, send는 응답 본문을 돌려준다. failure_rates에 따라 timeout(출력 없음),
+    invalid(검증에서 반려될 출력), error(호출 실패)를 주입한다.
+    """
+
+    def __init__(self, time_scale: float = FAKE_TIME_SCALE,
+                 failure_rates: Optional[dict[str, float]] = None,
+                 latency: Optional[dict[str, dict[str, float]]] = None,
+                 seed: Optional[int] = None, max_workers: int = 64) -> None:
+        self.time_scale: float = time_scale
+        self.failure_rates: dict[str, float] = failure_rates if failure_rates is not None else FAKE_FAILURE_RATES
+        self.latency: dict[str, dict[str, float]] = latency if latency is not None else FAKE_AGENT_LATENCY
+        self.rng: random.Random = random.Random(seed)
+        self.lock: threading.Lock = threading.Lock()
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers)
+        self.calls: int = 0
+
+    def sample(self, agent_type: Optional[str]) -> tuple[float, str]:
+        """(시뮬레이션 실행 시간(초), 결과 종류) 추첨"""
+        dist: dict[str, float] = self.latency.get(agent_type or "", FAKE_DEFAULT_LATENCY)
+        with self.lock:
+            self.calls += 1
+            latency: float = self.rng.lognormvariate(math.log(dist["median"]), dist["sigma"])
+            roll: float = self.rng.random()
+
+        outcome: str = "ok"
+        for kind in OUTCOMES:
+            rate: float = self.failure_rates.get(kind, 0.0)
+            if roll < rate:
+                outcome = kind
+                break
+            roll -= rate
+        return latency, outcome
+
+    def _run(self, agent_id: str, agent_type: Optional[str], timeout: float,
+             expected_output: str, output_path: Optional[Path]) -> dict[str, Any]:
+        latency, outcome = self.sample(agent_type)
+        if outcome == "timeout" or latency > timeout:
+            outcome, latency = "timeout", timeout
+
+        time.sleep(latency * self.time_scale)
+        if outcome == "error":
+            raise RuntimeError(f"fake backend error: {agent_id}")
+
+        content: Optional[str] = None
+        if outcome == "invalid":
+            content = "Rate limit exceeded. Please retry later.\n"
+        elif outcome == "ok":
+            content = fake_output(agent_id, expected_output)
+
+        if content is not None and output_path is not None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(content)
+
+        return {"agent_id": agent_id, "status": outcome, "latency": latency, "reply": content}
+
+    def sessions_spawn(self, params: dict[str, Any]) -> Future:
+        """sessions_spawn 파라미터 처리 - 프롬프트의 출력 위치에 결과 파일 쓰기"""
+        task: str = params["task"]
+        output: str = prompt_section(task, "출력 위치")
+        return self.executor.submit(
+            self._run, params["label"], prompt_agent_type(task), params.get("runTimeoutSeconds", math.inf),
+            prompt_section(task, "기대 출력"), Path(output) if output else None
+        )
+
+    def sessions_send(self, params: dict[str, Any]) -> Future:
+        """sessions_send 파라미터 처리 - 응답 본문(reply)만 반환, 파일 저장은 호출 측 몫"""
+        message: str = params["message"]
+        marker = MARKER_RE.search(message)
+        return self.executor.submit(
+            self._run, marker.group(1) if marker else params["label"], None,
+            params.get("timeoutSeconds", math.inf), prompt_section(message, "기대 출력"), None
+        )
+
+    def submit(self, command: dict[str, Any]) -> Future:
+        """실행 계획 명령어({"type": "spawn"|"send", "params"}) 처리"""
+        if command["type"] == "spawn":
+            return self.sessions_spawn(command["params"])
+        return self.sessions_send(command["params"])
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Hedge Script
+느린 에이전트(straggler)에 대한 중복 스폰 및 승자 채택
+"""
+
+import json
+import os
+import sys
+import argparse
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_FALLBACK_RATIO, HEDGE_SUFFIX
+    from utils import load_mission, log_event, read_log_events, percentile
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from runtime_stats import load_runtime_model
+except ImportError:
+    from .config import HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_FALLBACK_RATIO, HEDGE_SUFFIX
+    from .utils import load_mission, log_event, read_log_events, percentile
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .runtime_stats import load_runtime_model
+
+
+def hedge_label(agent_id: str) -> str:
+    """헤지 복제본 라벨"""
+    return f"{agent_id}{HEDGE_SUFFIX}"
+
+
+def compute_hedge_delay(timeout: int, samples: list[float],
+                        pct: float = HEDGE_PERCENTILE,
+                        min_samples: int = HEDGE_MIN_SAMPLES) -> int:
+    """
+    헤지 복제본을 띄우기까지 대기할 시간(초) 계산
+
+    표본이 충분하면 백분위 값을, 부족하면 timeout 비율을 사용한다.
+    어느 경우든 timeout을 넘지 않는다.
+    """
+    if len(samples) >= min_samples:
+        delay = percentile(samples, pct)
+    else:
+        delay = timeout * HEDGE_FALLBACK_RATIO
+
+    return max(1, min(int(delay), timeout))
+
+
+def runtime_samples(stats: dict[str, dict[str, Any]], agent_type: str, model: Optional[str]) -> list[float]:
+    """타입/모델 표본이 충분하면 그것을, 아니면 타입 전체 표본 사용"""
+    specific = stats.get(f"{agent_type}/{model}")
+    if specific and specific["count"] >= HEDGE_MIN_SAMPLES:
+        return specific["durations"]
+    return stats.get(agent_type, {}).get("durations", [])
+
+
+def generate_hedge_commands(plan: dict[str, Any], pct: float = HEDGE_PERCENTILE,
+                            store_path: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """
+    spawn 에이전트별 헤지 복제본 파라미터 생성
+
+    Returns:
+        {agent_id: {"after": 대기초, "samples": 표본수, "params": sessions_spawn 파라미터}}
+    """
+    agent_types: dict[str, str] = {
+        a["id"]: a["type"] for phase in plan.get("phases", []) for a in phase["agents"]
+    }
+    stats: dict[str, dict[str, Any]] = load_runtime_model(store_path)
+    hedges: dict[str, dict[str, Any]] = {}
+
+    for cmd in plan.get("commands", []):
+        if cmd["type"] != "spawn":
+            continue
+
+        agent_id: str = cmd["agent_id"]
+        samples: list[float] = runtime_samples(
+            stats, agent_types.get(agent_id, "researcher"), cmd["params"].get("model")
+        )
+
+        params: dict[str, Any] = dict(cmd["params"])
+        label: str = hedge_label(agent_id)
+        params["task"] = params["task"].replace(f"{agent_id}.md", f"{label}.md").replace(
+            f"MISSION_COMPLETE: {agent_id}", f"MISSION_COMPLETE: {label}"
+        )
+        params["label"] = label
+
+        hedges[agent_id] = {
+            "after": compute_hedge_delay(params["runTimeoutSeconds"], samples, pct),
+            "samples": len(samples),
+            "params": params
+        }
+
+    return hedges
+
+
+def resolve_hedges(mission_path: Path, plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    원본/헤지 중 먼저 끝난 출력을 outputs/<id>.md로 채택
+
+    이미 판정된 에이전트의 늦게 도착한 패자 출력은 기록 없이 삭제한다.
+    """
+    outputs_dir: Path = mission_path / "outputs"
+    resolved_ids: set[str] = {
+        e["data"].get("agent_id") for e in read_log_events(mission_path, "hedge_resolved")
+    }
+    resolutions: list[dict[str, Any]] = []
+
+    for cmd in plan.get("commands", []):
+        agent_id: str = cmd["agent_id"]
+        primary: Path = outputs_dir / f"{agent_id}.md"
+        hedge: Path = outputs_dir / f"{hedge_label(agent_id)}.md"
+
+        if not hedge.exists():
+            continue
+
+        if agent_id in resolved_ids:
+            hedge.unlink()
+            continue
+
+        if primary.exists() and primary.stat().st_mtime <= hedge.stat().st_mtime:
+            winner, loser_label = "primary", hedge_label(agent_id)
+            hedge.unlink()
+        else:
+            winner, loser_label = "hedge", agent_id
+            os.replace(hedge, primary)
+
+        resolution: dict[str, Any] = {
+            "agent_id": agent_id,
+            "winner": winner,
+            "cancel_label": loser_label
+        }
+        log_event(mission_path, "hedge_resolved", resolution)
+        resolutions.append(resolution)
+
+    return resolutions
+
+
+def hedge_summary(mission_path: Path) -> dict[str, Any]:
+    """헤지 정책과 관측된 헤지 승률 요약"""
+    policies = read_log_events(mission_path, "hedge_policy")
+    resolved = read_log_events(mission_path, "hedge_resolved")
+    hedge_wins: int = sum(1 for e in resolved if e["data"].get("winner") == "hedge")
+
+    return {
+        "policy": policies[-1]["data"] if policies else None,
+        "resolved": len(resolved),
+        "hedge_wins": hedge_wins,
+        "win_rate": hedge_wins / len(resolved) if resolved else 0.0
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Hedge")
+    parser.add_argument("--mission", "-m", required=True, help="미션 ID")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        mission, plan = load_mission(args.mission, writable=True)
+    except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    mission_path: Path = Path(mission["path"])
+
+    resolutions: list[dict[str, Any]] = resolve_hedges(mission_path, plan)
+    summary: dict[str, Any] = hedge_summary(mission_path)
+    log_event(mission_path, "hedge_summary", summary)
+
+    if args.json:
+        print(json.dumps({
+            "mission_id": mission["id"],
+            "resolutions": resolutions,
+            "summary": summary
+        }, indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n🏁 헤지 판정: {args.mission}")
+    for r in resolutions:
+        winner = "헤지 복제본" if r["winner"] == "hedge" else "원본"
+        print(f"   {r['agent_id']}: {winner} 채택 → 중단 대상 세션: {r['cancel_label']}")
+    if not resolutions:
+        print("   새로 판정된 에이전트 없음")
+
+    print(f"\n📊 누적 헤지 승률: {summary['hedge_wins']}/{summary['resolved']} ({summary['win_rate']*100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
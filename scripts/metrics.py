@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Metrics Script
+미션/에이전트 Prometheus 메트릭 (/metrics 엔드포인트 또는 textfile collector 파일)
+"""
+
+import json
+import os
+import threading
+import time
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import MISSION_DIR, METRICS_PORT, METRICS_TEXTFILE, METRICS_BUCKETS, METRICS_STATE_FILE
+    from utils import read_log_events
+    from runtime_stats import plan_agent_info
+    from tracing import build_spans
+    from search import mission_signature
+except ImportError:
+    from .config import MISSION_DIR, METRICS_PORT, METRICS_TEXTFILE, METRICS_BUCKETS, METRICS_STATE_FILE
+    from .utils import read_log_events
+    from .runtime_stats import plan_agent_info
+    from .tracing import build_spans
+    from .search import mission_signature
+
+
+PREFIX: str = "avengers"
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# 메트릭 이름 → (타입, 설명)
+METRICS: dict[str, tuple[str, str]] = {
+    "missions": ("gauge", "Missions by status"),
+    "agents_dispatched_total": ("counter", "Agents dispatched"),
+    "agents_completed_total": ("counter", "Agents that produced an output"),
+    "agents_failed_total": ("counter", "Agent runs that failed or whose output was rejected"),
+    "agent_runtime_seconds": ("histogram", "Agent runtime"),
+    "queue_wait_seconds": ("histogram", "Time between an agent becoming ready and starting"),
+    "consolidate_seconds": ("histogram", "Consolidation stage duration"),
+    "plan_agents": ("histogram", "Agents per execution plan"),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+# 미션별 관측치 캐시 {mission_id: (지문, 관측치)} - 서버 모드에서 바뀐 미션만 다시 읽기
+_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+# ThreadingHTTPServer의 동시 스크레이프가 캐시와 누적 상태 파일을 함께 갱신하지 않도록
+_state_lock: threading.Lock = threading.Lock()
+
+HISTOGRAM_PARTS: tuple[str, ...] = ("_bucket", "_sum", "_count")
+
+
+def labels(**kwargs: Any) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in kwargs.items()))
+
+
+def mission_observations(mission_path: Path) -> dict[str, Any]:
+    """
+    미션 하나의 메트릭 관측치
+
+    log_event/update_mission_status가 남긴 기록(execution.jsonl, mission.json)과
+    출력 디렉토리에서 계산한다.
+
+    Returns:
+        {"status", "counters": [(이름, 레이블, 값)], "histograms": [(이름, 레이블, 값)]}
+    """
+    with open(mission_path / "mission.json") as f:
+        mission: dict[str, Any] = {**json.load(f), "id": mission_path.name, "path": str(mission_path)}
+
+    plan: dict[str, Any] = {}
+    try:
+        with open(mission_path / "execution_plan.json") as f:
+            plan = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    info: dict[str, dict[str, Any]] = plan_agent_info(plan)
+
+    def agent_labels(agent_id: str) -> Labels:
+        agent = info.get(agent_id, {"type": "unknown", "model": None})
+        return labels(type=agent["type"], model=agent["model"] or "default")
+
+    outputs_dir: Path = mission_path / "outputs"
+    completed: set[str] = {
+        p.stem for p in outputs_dir.glob("*.md") if p.stem in info
+    } if outputs_dir.exists() else set()
+    started: set[str] = {
+        e["data"].get("agent_id") for e in read_log_events(mission_path, "agent_started")
+    } & set(info)
+
+    counters: list[tuple[str, Labels, float]] = []
+    for agent_id in started | completed:
+        counters.append(("agents_dispatched_total", agent_labels(agent_id), 1))
+    for agent_id in completed:
+        counters.append(("agents_completed_total", agent_labels(agent_id), 1))
+    for e in read_log_events(mission_path):
+        if e["event"] in ("output_rejected", "agent_failed"):
+            counters.append(("agents_failed_total", agent_labels(e["data"].get("agent_id")), 1))
+
+    histograms: list[tuple[str, Labels, float]] = []
+    if plan:
+        histograms.append(("plan_agents", (), plan.get("total_agents", len(info))))
+
+    for sp in build_spans(mission, plan):
+        duration: float = sp["end"] - sp["start"]
+        attrs: dict[str, Any] = sp.get("attributes", {})
+        if sp["name"].startswith("agent "):
+            histograms.append(("agent_runtime_seconds", labels(type=attrs.get("agent.type", "unknown")), duration))
+        elif sp["name"].startswith("queue "):
+            histograms.append(("queue_wait_seconds", agent_labels(attrs.get("agent.id")), duration))
+        elif sp["name"].startswith("consolidate."):
+            histograms.append(("consolidate_seconds", labels(stage=sp["name"].split(".", 1)[1]), duration))
+
+    return {"status": mission.get("status", "unknown"), "counters": counters, "histograms": histograms}
+
+
+def series_key(name: str, label_set: Labels) -> str:
+    """(이름, 레이블) → 상태 파일 키"""
+    return json.dumps([name, label_set], ensure_ascii=False)
+
+
+def parse_series_key(key: str) -> tuple[str, Labels]:
+    name, pairs = json.loads(key)
+    return name, tuple((k, v) for k, v in pairs)
+
+
+def histogram_series(name: str, label_set: Labels, values: list[float]) -> dict[str, float]:
+    """히스토그램 관측값 → 누적 가능한 _bucket/_sum/_count 시리즈 {상태 파일 키: 값} (le 레이블은 맨 뒤)"""
+    series: dict[str, float] = {}
+    for bound in METRICS_BUCKETS[name]:
+        series[series_key(f"{name}_bucket", label_set + (("le", format_value(bound)),))] = sum(
+            1 for v in values if v <= bound
+        )
+    series[series_key(f"{name}_bucket", label_set + (("le", "+Inf"),))] = len(values)
+    series[series_key(f"{name}_sum", label_set)] = round(sum(values), 6)
+    series[series_key(f"{name}_count", label_set)] = len(values)
+    return series
+
+
+def split_totals(totals: dict[str, float]) -> tuple[dict[tuple[str, Labels], float],
+                                                  dict[tuple[str, Labels], dict[str, Any]]]:
+    """
+    누적값 → (카운터, 히스토그램)
+
+    히스토그램은 {(이름, 레이블): {"buckets": {le: 개수}, "sum", "count"}}
+    """
+    counters: dict[tuple[str, Labels], float] = {}
+    histograms: dict[tuple[str, Labels], dict[str, Any]] = {}
+
+    for key, value in totals.items():
+        name, label_set = parse_series_key(key)
+        part: str = next((p for p in HISTOGRAM_PARTS if name.endswith(p)), "")
+        base: str = name[:-len(part)] if part else name
+        if not part or METRICS.get(base, ("",))[0] != "histogram":
+            counters[(name, label_set)] = value
+            continue
+        if part == "_bucket":
+            label_set, le = label_set[:-1], label_set[-1][1]
+        entry = histograms.setdefault((base, label_set), {"buckets": {}, "sum": 0, "count": 0})
+        if part == "_bucket":
+            entry["buckets"][le] = value
+        else:
+            entry[part[1:]] = value
+
+    return counters, histograms
+
+
+def load_counter_state(path: Path) -> dict[str, dict[str, Any]]:
+    """누적 상태 {"totals": {키: 누적값}, "missions": {미션 ID: {키: 반영한 값}}} (없으면 빈 상태)"""
+    try:
+        with open(path) as f:
+            state: dict[str, Any] = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"totals": {}, "missions": {}}
+    return {"totals": state.get("totals", {}), "missions": state.get("missions", {})}
+
+
+def save_counter_state(path: Path, state: dict[str, dict[str, Any]]) -> None:
+    tmp_path: Path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def accumulate_counters(state: dict[str, dict[str, Any]],
+                        contributions: dict[str, dict[str, float]]) -> bool:
+    """
+    미션별 현재 카운터/히스토그램 시리즈 값을 누적값에 반영 (바뀌었으면 True)
+
+    미션마다 지금까지 반영한 최대값을 기억하고 그보다 늘어난 만큼만 더한다. 그래서 미션이
+    보관/삭제되거나 출력이 반려돼 현재 값이 줄어도 *_total과 히스토그램 _bucket/_sum/_count는
+    줄지 않고, 보관했다 복원한
+    미션도 두 번 세지 않는다.
+    """
+    totals: dict[str, float] = state["totals"]
+    changed: bool = False
+
+    for mission_id, current in contributions.items():
+        seen: dict[str, float] = state["missions"].setdefault(mission_id, {})
+        for key, value in current.items():
+            delta: float = value - seen.get(key, 0)
+            if delta > 0:
+                totals[key] = totals.get(key, 0) + delta
+                seen[key] = value
+                changed = True
+
+    return changed
+
+
+def collect_metrics(mission_dir: Optional[Path] = None) -> dict[str, Any]:
+    """
+    전체 미션 메트릭 집계 (지문이 같은 미션은 캐시 재사용)
+
+    게이지는 지금 디스크에 있는 미션으로 계산하고, 카운터와 히스토그램은
+    미션 디렉토리의 METRICS_STATE_FILE에 누적해 단조 증가를 유지한다.
+    캐시와 상태 파일은 _state_lock 안에서만 읽고 쓴다.
+
+    Returns:
+        {"gauges"/"counters": {(이름, 레이블): 값},
+         "histograms": {(이름, 레이블): {"buckets": {le: 개수}, "sum", "count"}}}
+    """
+    root: Path = mission_dir or MISSION_DIR
+    gauges: dict[tuple[str, Labels], float] = {}
+    contributions: dict[str, dict[str, float]] = {}
+    present: set[str] = set()
+
+    mission_paths: list[Path] = sorted(p for p in root.iterdir() if p.is_dir()) if root.exists() else []
+    with _state_lock:
+        for mission_path in mission_paths:
+            if not (mission_path / "mission.json").exists():
+                continue
+            signature: str = mission_signature(mission_path)
+            cached = _cache.get(mission_path.name)
+            if cached and cached[0] == signature:
+                observations: dict[str, Any] = cached[1]
+            else:
+                try:
+                    observations = mission_observations(mission_path)
+                except json.JSONDecodeError:
+                    continue
+                _cache[mission_path.name] = (signature, observations)
+            present.add(mission_path.name)
+
+            gauge: tuple[str, Labels] = ("missions", labels(status=observations["status"]))
+            gauges[gauge] = gauges.get(gauge, 0) + 1
+            current: dict[str, float] = contributions.setdefault(mission_path.name, {})
+            for name, label_set, value in observations["counters"]:
+                counter_key: str = series_key(name, label_set)
+                current[counter_key] = current.get(counter_key, 0) + value
+            values: dict[tuple[str, Labels], list[float]] = {}
+            for name, label_set, value in observations["histograms"]:
+                values.setdefault((name, label_set), []).append(value)
+            for (name, label_set), observed in values.items():
+                current.update(histogram_series(name, label_set, observed))
+
+        for mission_id in set(_cache) - present:
+            _cache.pop(mission_id, None)
+
+        state_path: Path = root / METRICS_STATE_FILE
+        state: dict[str, dict[str, Any]] = load_counter_state(state_path)
+        if accumulate_counters(state, contributions) and root.exists():
+            save_counter_state(state_path, state)
+        counters, histograms = split_totals(state["totals"])
+
+    return {"gauges": gauges, "counters": counters, "histograms": histograms}
+
+
+def format_labels(label_set: Labels, extra: Labels = ()) -> str:
+    pairs: Labels = label_set + extra
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_metrics(collected: dict[str, Any]) -> str:
+    """Prometheus 텍스트 노출 형식으로 변환"""
+    lines: list[str] = []
+
+    for name, (metric_type, help_text) in METRICS.items():
+        full_name: str = f"{PREFIX}_{name}"
+        source: dict = collected["histograms" if metric_type == "histogram" else metric_type + "s"]
+        series = sorted((label_set, v) for (n, label_set), v in source.items() if n == name)
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+
+        for label_set, value in series:
+            if metric_type != "histogram":
+                lines.append(f"{full_name}{format_labels(label_set)} {format_value(value)}")
+                continue
+            for le in [format_value(b) for b in METRICS_BUCKETS[name]] + ["+Inf"]:
+                count: float = value["buckets"].get(le, 0)
+                lines.append(f"{full_name}_bucket{format_labels(label_set, (('le', le),))} {format_value(count)}")
+            lines.append(f"{full_name}_sum{format_labels(label_set)} {format_value(round(value['sum'], 6))}")
+            lines.append(f"{full_name}_count{format_labels(label_set)} {format_value(value['count'])}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path, mission_dir: Optional[Path] = None) -> None:
+    """textfile collector 파일 쓰기 (임시 파일 후 교체 - 수집기가 반쯤 쓴 파일을 읽지 않도록)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(render_metrics(collect_metrics(mission_dir)))
+    os.replace(tmp_path, path)
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 요청마다 미션 디렉토리에서 다시 집계"""
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body: bytes = render_metrics(collect_metrics()).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Metrics")
+    parser.add_argument("--serve", "-s", action="store_true", help="/metrics HTTP 엔드포인트 실행")
+    parser.add_argument("--port", "-p", type=int, default=METRICS_PORT, help="서버 포트")
+    parser.add_argument("--textfile", "-t", default=METRICS_TEXTFILE or None, help="textfile collector 파일 경로")
+    parser.add_argument("--interval", "-i", type=int, default=0, help="textfile 갱신 간격(초, 0이면 한 번만)")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.serve:
+        server = ThreadingHTTPServer(("", args.port), MetricsHandler)
+        print(f"📈 메트릭 서버: http://localhost:{args.port}/metrics")
+        print("   종료하려면 Ctrl+C")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 메트릭 서버 종료")
+        finally:
+            server.server_close()
+        return
+
+    if not args.textfile:
+        print(render_metrics(collect_metrics()), end="")
+        return
+
+    path: Path = Path(args.textfile)
+    try:
+        while True:
+            write_textfile(path)
+            if not args.interval:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n👋 메트릭 갱신 종료")
+        return
+    print(f"📄 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Models
+미션/에이전트/실행 계획의 __slots__ 데이터 모델 (JSON dict 형태와 상호 변환)
+
+에이전트 수만 개를 메모리에 올릴 때 dict 대신 쓴다. 인스턴스마다 __dict__가 없고,
+type/emoji/model/mode/status처럼 에이전트마다 반복되는 문자열과 에이전트 ID는
+sys.intern으로 하나의 객체를 공유한다 (JSON에서 읽은 문자열은 값이 같아도 각각 따로 생성됨).
+모델에 없는 키는 extra에 담아 to_dict()에서 그대로 돌려준다.
+
+아직 CLI 경로(execute/scheduler/monitor 등)는 이 모델을 쓰지 않는 독립 계층이다. from_dict 변환이
+계획을 한 번 순회하는 비용보다 커서, 한 번 읽고 끝나는 명령에서는 손해이기 때문이다. 많은 계획을
+오래 메모리에 두는 경로(상주 워커, 스케줄러 루프)에서 변환 비용이 상쇄될 때 옮겨 쓴다.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+try:
+    from config import DEFAULT_MISSION_PRIORITY
+except ImportError:
+    from .config import DEFAULT_MISSION_PRIORITY
+
+
+def intern_str(value: Any) -> Any:
+    """문자열이면 intern, 아니면 그대로 (None 등)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _split(cls: type, data: dict[str, Any]) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+    """dict → (모델 필드, 나머지 키 - 없으면 None)"""
+    names: dict[str, Any] = cls.__dataclass_fields__
+    known: dict[str, Any] = {}
+    extra: Optional[dict[str, Any]] = None
+    for k, v in data.items():
+        if k in names and k != "extra":
+            known[k] = v
+        elif extra is None:
+            extra = {k: v}
+        else:
+            extra[k] = v
+    return known, extra
+
+
+def _join(obj: Any, names: tuple[str, ...]) -> dict[str, Any]:
+    """모델 → dict (필드 순서 + extra)"""
+    data: dict[str, Any] = {name: getattr(obj, name) for name in names}
+    if obj.extra:
+        data.update(obj.extra)
+    return data
+
+
+@dataclass(slots=True)
+class AgentConfig:
+    """create_agent_config() 결과 / 실행 계획 Phase의 에이전트 항목"""
+    id: str
+    type: str = "researcher"
+    emoji: str = ""
+    model: Optional[str] = None
+    timeout: int = 0
+    estimated_duration: int = 0
+    description: str = ""
+    inputs: list[Any] = field(default_factory=list)
+    expected_output: str = ""
+    dependencies: list[str] = field(default_factory=list)
+    status: str = "pending"
+    mode: str = "spawn"
+    extra: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        self.id = intern_str(self.id)
+        self.type = intern_str(self.type)
+        self.emoji = intern_str(self.emoji)
+        self.model = intern_str(self.model)
+        self.status = intern_str(self.status)
+        self.mode = intern_str(self.mode)
+        self.dependencies = [intern_str(d) for d in self.dependencies]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AgentConfig":
+        known, extra = _split(cls, data)
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        return _join(self, AGENT_FIELDS)
+
+    def to_phase_dict(self) -> dict[str, Any]:
+        """실행 계획 phases[].agents[] 항목 형태 (save_execution_plan과 같은 키)"""
+        return _join(self, PHASE_AGENT_FIELDS)
+
+
+@dataclass(slots=True)
+class Phase:
+    """실행 계획의 Phase (같은 Phase 에이전트는 병렬 실행 가능)"""
+    phase: int
+    parallel: bool = False
+    estimated_duration: int = 0
+    agents: list[AgentConfig] = field(default_factory=list)
+    extra: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Phase":
+        known, extra = _split(cls, data)
+        known["agents"] = [AgentConfig.from_dict(a) for a in known.get("agents", [])]
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = _join(self, PHASE_FIELDS)
+        data["agents"] = [a.to_phase_dict() for a in self.agents]
+        return data
+
+
+@dataclass(slots=True)
+class Command:
+    """OpenClaw 호출 명령 (spawn: sessions_spawn 파라미터, send: sessions_send 파라미터)"""
+    agent_id: str
+    type: str
+    params: dict[str, Any] = field(default_factory=dict)
+    prompt_tokens: int = 0
+    extra: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        self.agent_id = intern_str(self.agent_id)
+        self.type = intern_str(self.type)
+        # 모델/정리 방식/대상 에이전트 이름은 명령마다 반복된다
+        for key in COMMAND_INTERNED_PARAMS:
+            if key in self.params:
+                self.params[key] = intern_str(self.params[key])
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Command":
+        known, extra = _split(cls, data)
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        return _join(self, COMMAND_FIELDS)
+
+
+@dataclass(slots=True)
+class Plan:
+    """execution_plan.json"""
+    mission_id: str = ""
+    total_agents: int = 0
+    estimated_duration: int = 0
+    completed_agents: list[str] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    phases: list[Phase] = field(default_factory=list)
+    commands: list[Command] = field(default_factory=list)
+    prompt_tokens: int = 0
+    extra: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        self.mission_id = intern_str(self.mission_id)
+        self.completed_agents = [intern_str(a) for a in self.completed_agents]
+        self.fingerprints = {intern_str(k): v for k, v in self.fingerprints.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Plan":
+        known, extra = _split(cls, data)
+        known["phases"] = [Phase.from_dict(p) for p in known.get("phases", [])]
+        known["commands"] = [Command.from_dict(c) for c in known.get("commands", [])]
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = _join(self, PLAN_FIELDS)
+        data["phases"] = [p.to_dict() for p in self.phases]
+        data["commands"] = [c.to_dict() for c in self.commands]
+        return data
+
+    def agents(self) -> list[AgentConfig]:
+        """Phase 순서대로 전체 에이전트"""
+        return [a for phase in self.phases for a in phase.agents]
+
+    def command_index(self) -> dict[str, Command]:
+        """agent_id → 명령 (명령 목록을 매번 선형 탐색하지 않도록)"""
+        return {c.agent_id: c for c in self.commands}
+
+
+@dataclass(slots=True)
+class Mission:
+    """mission.json (updated_at, completed_at 등 이후 추가되는 키는 extra)"""
+    id: str
+    path: str = ""
+    task: str = ""
+    status: str = "initializing"
+    priority: str = DEFAULT_MISSION_PRIORITY
+    created_at: str = ""
+    agents: list[Any] = field(default_factory=list)
+    subtasks: list[Any] = field(default_factory=list)
+    extra: Optional[dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        self.id = intern_str(self.id)
+        self.status = intern_str(self.status)
+        self.priority = intern_str(self.priority)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Mission":
+        known, extra = _split(cls, data)
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> dict[str, Any]:
+        return _join(self, MISSION_FIELDS)
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(name for name in cls.__slots__ if name != "extra")
+
+
+AGENT_FIELDS: tuple[str, ...] = _field_names(AgentConfig)
+PHASE_FIELDS: tuple[str, ...] = _field_names(Phase)
+COMMAND_FIELDS: tuple[str, ...] = _field_names(Command)
+PLAN_FIELDS: tuple[str, ...] = _field_names(Plan)
+MISSION_FIELDS: tuple[str, ...] = _field_names(Mission)
+
+PHASE_AGENT_FIELDS: tuple[str, ...] = (
+    "id", "type", "emoji", "mode", "model", "estimated_duration", "dependencies", "expected_output", "description",
+    "status"
+)
+COMMAND_INTERNED_PARAMS: tuple[str, ...] = ("model", "cleanup", "label")
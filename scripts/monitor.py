@@ -8,6 +8,7 @@ import json
 import os
 import sys
 import argparse
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -16,10 +17,23 @@ try:
     from config import MISSION_DIR
     from utils import load_mission_only as load_mission
     from exceptions import MissionNotFoundError
+    from profiling import profiled, add_profile_argument
 except ImportError:
     from .config import MISSION_DIR
     from .utils import load_mission_only as load_mission
     from .exceptions import MissionNotFoundError
+    from .profiling import profiled, add_profile_argument
+
+
+# 로그 꼬리 캐시 {(로그 파일, limit): (inode, 읽은 바이트 위치, 최근 항목)} - 상주 워커에서만 켠다
+_log_tails: Optional[dict[tuple[Path, int], tuple[int, int, deque]]] = None
+
+
+def enable_log_cache() -> None:
+    """read_logs가 지난 호출 이후 추가된 줄만 읽도록 설정 (worker.py)"""
+    global _log_tails
+    if _log_tails is None:
+        _log_tails = {}
 
 
 def check_agent_outputs(mission_path: Path, plan: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -57,6 +71,8 @@ def read_logs(mission_path: Path, limit: int = 20) -> list[dict[str, Any]]:
 
     if not log_file.exists():
         return []
+    if _log_tails is not None:
+        return _read_log_tail(log_file, limit)
 
     logs: list[dict[str, Any]] = []
     with open(log_file) as f:
@@ -70,6 +86,35 @@ def read_logs(mission_path: Path, limit: int = 20) -> list[dict[str, Any]]:
     return logs[-limit:]
 
 
+def _read_log_tail(log_file: Path, limit: int) -> list[dict[str, Any]]:
+    """
+    캐시된 위치부터 새 줄만 읽어 최근 limit개 유지
+
+    파일이 바뀌었거나(inode) 줄어들었으면 처음부터 다시 읽는다.
+    아직 줄바꿈이 오지 않은 마지막 줄은 다음 호출에서 읽는다.
+    """
+    stat = log_file.stat()
+    key: tuple[Path, int] = (log_file, limit)
+    inode, offset, tail = _log_tails.get(key, (stat.st_ino, 0, deque(maxlen=limit)))
+    if inode != stat.st_ino or stat.st_size < offset:
+        inode, offset, tail = stat.st_ino, 0, deque(maxlen=limit)
+
+    with open(log_file, "rb") as f:
+        f.seek(offset)
+        data: bytes = f.read()
+
+    end: int = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        if line.strip():
+            try:
+                tail.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+    _log_tails[key] = (inode, offset + end, tail)
+    return list(tail)
+
+
 def print_status(mission: dict[str, Any], plan: Optional[dict[str, Any]], agent_results: list[dict[str, Any]], logs: list[dict[str, Any]]) -> None:
     """상태 출력"""
     print("\n" + "="*70)
@@ -82,6 +127,8 @@ def print_status(mission: dict[str, Any], plan: Optional[dict[str, Any]], agent_
     print(f"   생성: {mission['created_at']}")
     if mission.get('updated_at'):
         print(f"   업데이트: {mission['updated_at']}")
+    if mission.get('archived'):
+        print(f"   📦 보관됨 (읽기 전용 사본: {mission['path']})")
     
     if plan:
         print(f"\n📊 에이전트 현황:")
@@ -99,6 +146,11 @@ def print_status(mission: dict[str, Any], plan: Optional[dict[str, Any]], agent_
         print(f"   [{bar}]")
         print()
         
+        # 재계획 시 유지된 완료 에이전트
+        if plan.get("completed_agents"):
+            print(f"   이전 실행에서 유지: {len(plan['completed_agents'])}개")
+            print()
+
         # 에이전트별 상태
         for phase in plan["phases"]:
             print(f"   Phase {phase['phase']}:")
@@ -167,30 +219,34 @@ def main() -> None:
     parser.add_argument("--watch", "-w", action="store_true", help="실시간 모니터링")
     parser.add_argument("--interval", "-i", type=int, default=10, help="갱신 간격(초)")
     parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+    add_profile_argument(parser)
 
     args: argparse.Namespace = parser.parse_args()
 
-    try:
-        mission, plan = load_mission(args.mission)
-    except MissionNotFoundError as e:
-        print(f"❌ 오류: {e}")
-        sys.exit(1)
-
-    mission_path: Path = Path(mission["path"])
-    agent_results: list[dict[str, Any]] = check_agent_outputs(mission_path, plan)
-    logs: list[dict[str, Any]] = read_logs(mission_path)
-
-    if args.json:
-        output: dict[str, Any] = {
-            "mission": mission,
-            "agents": agent_results,
-            "logs": logs
-        }
-        print(json.dumps(output, indent=2, ensure_ascii=False))
-    elif args.watch:
-        watch_mode(args.mission, args.interval)
-    else:
-        print_status(mission, plan, agent_results, logs)
+    with profiled("monitor", args.profile) as profile:
+        try:
+            mission, plan = load_mission(args.mission)
+        except MissionNotFoundError as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+
+        mission_path: Path = Path(mission["path"])
+        if profile:
+            profile.attach(mission_path)
+        agent_results: list[dict[str, Any]] = check_agent_outputs(mission_path, plan)
+        logs: list[dict[str, Any]] = read_logs(mission_path)
+
+        if args.json:
+            output: dict[str, Any] = {
+                "mission": mission,
+                "agents": agent_results,
+                "logs": logs
+            }
+            print(json.dumps(output, indent=2, ensure_ascii=False))
+        elif args.watch:
+            watch_mode(args.mission, args.interval)
+        else:
+            print_status(mission, plan, agent_results, logs)
 
 
 if __name__ == "__main__":
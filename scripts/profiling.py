@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Profiling Script
+CLI 실행의 cProfile/tracemalloc 수집, pstats·collapsed stack 저장, 핫스팟 요약
+"""
+
+import sys
+import time
+import argparse
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TextIO
+
+# cProfile/pstats/tracemalloc은 import만으로 수십 ms가 걸려 --profile일 때만 불러온다
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+    import tracemalloc
+
+try:
+    from config import PROFILE_ENABLED, PROFILE_TOP_N, PROFILE_MEMORY
+    from utils import log_event
+except ImportError:
+    from .config import PROFILE_ENABLED, PROFILE_TOP_N, PROFILE_MEMORY
+    from .utils import log_event
+
+
+# pstats 함수 키: (파일, 줄 번호, 함수 이름)
+FuncKey = tuple[str, int, str]
+
+MAX_STACK_DEPTH: int = 64
+MIN_STACK_MICROS: float = 1.0  # 이보다 작은 스택은 collapsed 출력에서 제외
+
+
+def func_label(func: FuncKey) -> str:
+    """pstats 함수 키 → 사람이 읽을 이름 ("name (file.py:12)", 내장 함수는 이름만)"""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def hotspots(stats: "pstats.Stats", top: int = PROFILE_TOP_N, sort: str = "tottime") -> list[dict[str, Any]]:
+    """
+    시간 상위 함수 목록
+
+    Args:
+        sort: "tottime"(자체 시간) 또는 "cumtime"(하위 호출 포함)
+    """
+    index: int = 2 if sort == "tottime" else 3
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][index], reverse=True)
+    return [
+        {
+            "function": func_label(func),
+            "calls": nc,
+            "tottime": round(tt, 6),
+            "cumtime": round(ct, 6)
+        }
+        for func, (cc, nc, tt, ct, callers) in entries[:top]
+    ]
+
+
+def collapsed_stacks(stats: "pstats.Stats", root: Optional[str] = None,
+                     min_micros: float = MIN_STACK_MICROS) -> dict[str, int]:
+    """
+    cProfile 호출 그래프 → flamegraph.pl / speedscope용 collapsed stack {"a;b;c": 마이크로초}
+
+    cProfile은 호출자-피호출자 간선만 남기므로, 루트에서 간선별 누적 시간
+    비율로 자체 시간을 나눠 스택을 근사한다. 재귀 호출은 한 번만 펼친다.
+    프로파일 시작 전에 이미 실행 중이던 프레임은 보이지 않으므로, root를 주면
+    모든 스택 앞에 붙여 하나의 루트로 묶는다.
+    """
+    entries: dict[FuncKey, tuple] = stats.stats
+    callees: dict[FuncKey, dict[FuncKey, float]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    stacks: dict[str, float] = {}
+
+    def walk(func: FuncKey, frames: list[str], on_stack: set[FuncKey], share: float) -> None:
+        _, _, tt, _, _ = entries[func]
+        frames = frames + [func_label(func).replace(";", ":")]
+        self_micros: float = tt * share * 1e6
+        if self_micros >= min_micros:
+            key: str = ";".join(frames)
+            stacks[key] = stacks.get(key, 0.0) + self_micros
+        if len(frames) >= MAX_STACK_DEPTH:
+            return
+        for callee, edge_ct in callees.get(func, {}).items():
+            callee_ct: float = entries[callee][3]
+            if callee in on_stack or callee_ct <= 0:
+                continue
+            callee_share: float = share * min(1.0, edge_ct / callee_ct)
+            if callee_ct * callee_share * 1e6 < min_micros:
+                continue
+            walk(callee, frames, on_stack | {callee}, callee_share)
+
+    roots: list[FuncKey] = [f for f, e in entries.items() if not any(c in entries for c in e[4])]
+    for func in roots:
+        walk(func, [root] if root else [], {func}, 1.0)
+
+    return {key: round(value) for key, value in stacks.items() if round(value) > 0}
+
+
+def memory_hotspots(snapshot: "tracemalloc.Snapshot", top: int = PROFILE_TOP_N) -> list[dict[str, Any]]:
+    """tracemalloc 스냅샷에서 할당 크기 상위 위치 (프로파일러 자체 할당 제외)"""
+    import cProfile
+    import tracemalloc
+
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, cProfile.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+    ))
+    return [
+        {
+            "location": f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+class ProfileSession:
+    """
+    프로파일링 세션 (cProfile + 선택적 tracemalloc)
+
+    미션 경로는 시작할 때 모를 수 있어(assemble은 실행 중에 미션 생성) attach()로 나중에 지정한다.
+    """
+
+    def __init__(self, name: str, memory: bool = PROFILE_MEMORY) -> None:
+        import cProfile
+
+        self.name: str = name
+        self.memory: bool = memory
+        self.profiler: "cProfile.Profile" = cProfile.Profile()
+        self.mission_path: Optional[Path] = None
+        self.started_at: datetime = datetime.now()
+        self.elapsed: float = 0.0
+        self.stats: Optional["pstats.Stats"] = None
+        self.snapshot: Optional["tracemalloc.Snapshot"] = None
+        self.peak_kb: float = 0.0
+        self._owns_tracemalloc: bool = False
+        self._start: float = 0.0
+
+    def attach(self, mission_path: Path) -> None:
+        """결과를 저장할 미션 지정"""
+        self.mission_path = Path(mission_path)
+
+    def start(self) -> None:
+        import tracemalloc
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._start = time.perf_counter()
+        self.profiler.enable()
+
+    def stop(self) -> None:
+        import pstats
+        import tracemalloc
+
+        self.profiler.disable()
+        self.elapsed = time.perf_counter() - self._start
+        if self._owns_tracemalloc:
+            self.snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_kb = round(peak / 1024, 1)
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self.stats = pstats.Stats(self.profiler)
+
+    def save(self) -> dict[str, Path]:
+        """
+        미션 logs/에 profile_<이름>_<시각>.pstats / .collapsed 저장 후 profile_saved 이벤트 기록
+
+        Returns:
+            {"pstats": 경로, "collapsed": 경로} (미션이 지정되지 않았으면 빈 딕셔너리)
+        """
+        if self.mission_path is None or self.stats is None:
+            return {}
+
+        logs_dir: Path = self.mission_path / "logs"
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        stem: str = f"profile_{self.name}_{self.started_at.strftime('%Y%m%d_%H%M%S')}"
+        paths: dict[str, Path] = {
+            "pstats": logs_dir / f"{stem}.pstats",
+            "collapsed": logs_dir / f"{stem}.collapsed"
+        }
+
+        self.stats.dump_stats(paths["pstats"])
+        with open(paths["collapsed"], "w") as f:
+            for stack, micros in sorted(collapsed_stacks(self.stats, self.name).items()):
+                f.write(f"{stack} {micros}\n")
+
+        log_event(self.mission_path, "profile_saved", {
+            "command": self.name,
+            "seconds": round(self.elapsed, 4),
+            "peak_kb": self.peak_kb,
+            "files": {kind: path.name for kind, path in paths.items()}
+        })
+        return paths
+
+    def summary(self, top: int = PROFILE_TOP_N) -> dict[str, Any]:
+        return {
+            "command": self.name,
+            "seconds": round(self.elapsed, 4),
+            "peak_kb": self.peak_kb,
+            "hotspots": hotspots(self.stats, top) if self.stats else [],
+            "memory": memory_hotspots(self.snapshot, top) if self.snapshot else []
+        }
+
+
+def print_profile_summary(summary: dict[str, Any], paths: dict[str, Path], out: Optional[TextIO] = None) -> None:
+    """
+    핫스팟 요약 출력
+
+    --json 출력과 섞이지 않도록 기본으로 stderr에 쓴다.
+    """
+    out = out or sys.stderr
+    print(f"\n🔥 프로파일 {summary['command']}: {summary['seconds']:.3f}s"
+          + (f", 최대 메모리 {summary['peak_kb']:,.0f}KB" if summary["peak_kb"] else ""), file=out)
+    print(f"   {'calls':>8} {'self(s)':>9} {'cum(s)':>9}  function", file=out)
+    for h in summary["hotspots"]:
+        print(f"   {h['calls']:>8} {h['tottime']:>9.4f} {h['cumtime']:>9.4f}  {h['function']}", file=out)
+    if summary["memory"]:
+        print("   메모리 할당 상위 (종료 시점):", file=out)
+        for m in summary["memory"]:
+            print(f"   {m['size_kb']:>10,.1f}KB {m['count']:>7}회  {m['location']}", file=out)
+    for kind, path in paths.items():
+        print(f"   💾 {kind}: {path}", file=out)
+    if not paths:
+        print("   ⚠️  미션이 없어 프로파일 파일 저장 생략", file=out)
+
+
+@contextmanager
+def profiled(name: str, enabled: bool, mission_path: Optional[Path] = None,
+             top: int = PROFILE_TOP_N) -> Iterator[Optional[ProfileSession]]:
+    """
+    블록 실행을 프로파일링 (enabled가 False면 아무것도 하지 않고 None)
+
+    블록이 예외(sys.exit 포함)로 끝나도 수집한 결과는 저장/출력한다.
+
+    Yields:
+        ProfileSession (미션 경로를 나중에 알게 되면 attach() 호출)
+    """
+    if not enabled:
+        yield None
+        return
+
+    session: ProfileSession = ProfileSession(name)
+    if mission_path is not None:
+        session.attach(mission_path)
+
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        print_profile_summary(session.summary(top), session.save())
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """공통 --profile 옵션 (기본값은 AVENGERS_PROFILE 환경 변수)"""
+    parser.add_argument("--profile", action="store_true", default=PROFILE_ENABLED,
+                        help="cProfile/tracemalloc 프로파일을 미션 logs/에 저장하고 핫스팟 요약 출력 (env: AVENGERS_PROFILE)")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Profile Viewer")
+    parser.add_argument("pstats_file", help="--profile로 저장된 .pstats 파일")
+    parser.add_argument("--top", "-n", type=int, default=PROFILE_TOP_N, help="출력할 함수 수")
+    parser.add_argument("--sort", "-s", choices=["tottime", "cumtime"], default="tottime", help="정렬 기준")
+    parser.add_argument("--collapsed", "-c", action="store_true", help="collapsed stack 출력 (flamegraph.pl 입력)")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    import pstats
+    try:
+        stats: pstats.Stats = pstats.Stats(args.pstats_file)
+    except (FileNotFoundError, TypeError, ValueError, EOFError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    if args.collapsed:
+        for stack, micros in sorted(collapsed_stacks(stats).items()):
+            print(f"{stack} {micros}")
+        return
+
+    print(f"\n🔥 {args.pstats_file} (정렬: {args.sort})")
+    print(f"   {'calls':>8} {'self(s)':>9} {'cum(s)':>9}  function")
+    for h in hotspots(stats, args.top, args.sort):
+        print(f"   {h['calls']:>8} {h['tottime']:>9.4f} {h['cumtime']:>9.4f}  {h['function']}")
+
+
+if __name__ == "__main__":
+    main()
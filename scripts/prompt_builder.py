@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Prompt Builder
+토큰 예산을 지키는 spawn/send 프롬프트 생성 (입력 축약·요약 포함)
+"""
+
+import json
+import math
+from typing import Any, Optional
+
+try:
+    from config import MODEL_PROMPT_BUDGETS, DEFAULT_PROMPT_BUDGET
+except ImportError:
+    from .config import MODEL_PROMPT_BUDGETS, DEFAULT_PROMPT_BUDGET
+
+
+TRUNCATION_MARK: str = "…(생략)"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 근사 토큰 수
+
+    ASCII는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰으로 센다.
+    UTF-8 인코딩 길이로 비ASCII 문자 수를 구해 문자 단위 순회를 피한다.
+    """
+    if not text:
+        return 0
+    extra_bytes: int = len(text.encode("utf-8")) - len(text)
+    non_ascii: int = (extra_bytes + 1) // 2  # 한글(3바이트) 기준 근사
+    ascii_chars: int = max(0, len(text) - non_ascii)
+    return math.ceil(ascii_chars / 4 + non_ascii)
+
+
+def prompt_budget(model: Optional[str]) -> int:
+    """모델별 프롬프트 토큰 예산"""
+    return MODEL_PROMPT_BUDGETS.get(model or "", DEFAULT_PROMPT_BUDGET)
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """토큰 예산 안으로 잘라내기 (줄 경계 우선)"""
+    if estimate_tokens(text) <= budget:
+        return text
+    if budget <= estimate_tokens(TRUNCATION_MARK):
+        return ""
+
+    # 이진 탐색으로 예산에 맞는 최대 길이 찾기
+    low, high = 0, len(text)
+    limit: int = budget - estimate_tokens(TRUNCATION_MARK)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= limit:
+            low = mid
+        else:
+            high = mid - 1
+
+    cut: str = text[:low]
+    newline: int = cut.rfind("\n")
+    if newline > low // 2:
+        cut = cut[:newline]
+    return cut.rstrip() + "\n" + TRUNCATION_MARK
+
+
+def summarize_markdown(text: str, budget: int) -> str:
+    """
+    마크다운 계층 요약
+
+    1단계: 제목 + 각 섹션 첫 문장, 2단계: 제목만, 3단계: 잘라내기.
+    예산 안에 드는 가장 자세한 단계를 사용한다.
+    """
+    if estimate_tokens(text) <= budget:
+        return text
+
+    lines: list[str] = text.splitlines()
+    outline: list[str] = []
+    need_lead: bool = True
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            outline.append(stripped)
+            need_lead = True
+        elif need_lead and stripped:
+            sentence_end = max(stripped.find(". "), stripped.find("다. "))
+            outline.append(stripped[:sentence_end + 1] if sentence_end > 0 else stripped)
+            need_lead = False
+
+    for candidate in ("\n".join(outline), "\n".join(l for l in outline if l.startswith("#"))):
+        if candidate and estimate_tokens(candidate) <= budget:
+            return candidate
+
+    return truncate_to_tokens("\n".join(outline) or text, budget)
+
+
+def allocate_budget(sizes: list[int], budget: int) -> list[int]:
+    """
+    여러 입력에 예산 분배 (water-filling)
+
+    작은 입력은 전부 받고, 남은 예산을 큰 입력들이 균등하게 나눈다.
+    """
+    allocation: list[int] = [0] * len(sizes)
+    remaining: int = budget
+
+    for k, i in enumerate(sorted(range(len(sizes)), key=lambda i: sizes[i])):
+        share: int = remaining // (len(sizes) - k)
+        allocation[i] = min(sizes[i], share)
+        remaining -= allocation[i]
+
+    return allocation
+
+
+def fit_texts(texts: list[str], budget: int) -> list[str]:
+    """텍스트 목록을 합계 예산 안으로 요약/축약"""
+    sizes: list[int] = [estimate_tokens(t) for t in texts]
+    if sum(sizes) <= budget:
+        return list(texts)
+
+    return [
+        t if size <= share else summarize_markdown(t, share)
+        for t, size, share in zip(texts, sizes, allocate_budget(sizes, budget))
+    ]
+
+
+def fit_agent_inputs(agent: dict[str, Any], budget: int) -> dict[str, Any]:
+    """에이전트 inputs가 예산을 넘으면 항목별로 요약한 사본 반환"""
+    inputs: list[Any] = agent.get("inputs") or []
+    if estimate_tokens(json.dumps(inputs, ensure_ascii=False)) <= budget:
+        return agent
+
+    texts: list[str] = [i if isinstance(i, str) else json.dumps(i, ensure_ascii=False) for i in inputs]
+    # JSON 인코딩(따옴표/구분자) 여유분 확보
+    fitted: list[str] = fit_texts(texts, max(0, budget - 4 * len(texts)))
+    return {**agent, "inputs": fitted}
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Prompt Templates
+spawn/send 프롬프트 템플릿: 타입별로 한 번 컴파일해 두고 에이전트마다 값만 채워 렌더링
+
+템플릿은 str.format 문법({필드})을 쓴다. 타입마다 같은 값인 필드(emoji, type, role)는
+컴파일할 때 리터럴로 박아 넣고, 나머지는 f-string 렌더 함수의 인자가 된다.
+PROMPT_TEMPLATE_DIR의 spawn.md / send.md(전체), spawn.<타입>.md / send.<타입>.md(타입별)가
+기본 템플릿보다 우선한다.
+"""
+
+import json
+import os
+import re
+from json.encoder import encode_basestring
+from pathlib import Path
+from string import Formatter
+from typing import Any, Callable, Optional
+
+try:
+    from config import PROMPT_TEMPLATE_DIR
+except ImportError:
+    from .config import PROMPT_TEMPLATE_DIR
+
+
+SPAWN_TEMPLATE: str = """
+# 🦸 Avengers Mission
+
+## 당신의 역할
+{emoji} {role} 에이전트
+
+## 태스크
+{description}
+
+## 입력 데이터
+{inputs}
+
+## 기대 출력
+{expected_output}
+
+## 출력 위치
+{mission_path}/outputs/{agent_id}.md
+
+## 완료 시
+1. 결과를 위 경로에 저장 (파일 마지막 줄에 "MISSION_COMPLETE: {agent_id}" 기록)
+2. "MISSION_COMPLETE: {agent_id}" 메시지 출력
+"""
+
+SEND_TEMPLATE: str = """
+# 🦸 Avengers Mission 요청
+
+## 태스크
+{description}
+
+## 입력 데이터
+{inputs}
+
+## 기대 출력
+{expected_output}
+
+## 완료 시
+"MISSION_COMPLETE: {agent_id}" 라고 알려줘
+"""
+
+# 프롬프트 전문을 파일로 빼고 명령어에는 경로만 남길 때 쓰는 본문
+REFERENCE_TEMPLATE: str = """
+# 🦸 Avengers Mission
+
+## 지시 파일
+{path}
+
+위 파일을 읽고 파일의 지시를 그대로 수행하세요.
+"""
+
+DEFAULT_TEMPLATES: dict[str, str] = {"spawn": SPAWN_TEMPLATE, "send": SEND_TEMPLATE}
+PROMPT_KEYS: dict[str, str] = {"spawn": "task", "send": "message"}  # 명령어 params에서 프롬프트 키
+
+STATIC_FIELDS: tuple[str, ...] = ("emoji", "type", "role")
+# 렌더 함수 인자 순서
+DYNAMIC_FIELDS: tuple[str, ...] = ("description", "inputs", "expected_output", "mission_path", "agent_id", "label")
+
+NO_INPUTS: str = "없음"
+DEFAULT_EXPECTED_OUTPUT: str = "태스크 완료 보고"
+
+# f-string 코드에 그대로 넣어도 되는 서식 지정자 (따옴표/중괄호 제외)
+_SPEC_RE: re.Pattern = re.compile(r"^[\w<>=^+\- #.,%]*$")
+
+Renderer = Callable[..., str]
+
+
+def _literal(text: str) -> str:
+    """리터럴 조각 → f-string 소스 조각"""
+    return "f" + repr(text.replace("{", "{{").replace("}", "}}"))
+
+
+def compile_template(text: str, static: Optional[dict[str, str]] = None, name: str = "template") -> Renderer:
+    """
+    템플릿 → 렌더 함수 render(description, inputs, expected_output, mission_path, agent_id, label)
+
+    static 필드는 이 시점에 값으로 치환하고, 나머지 필드는 인자를 그대로 꽂는 f-string 하나로
+    컴파일한다 (렌더링 때 템플릿을 다시 해석하지 않음). 템플릿 문자열은 repr로만 코드에 들어간다.
+
+    Raises:
+        ValueError: 알 수 없는 필드, 위치 인자({}), 허용하지 않는 변환(!r/!s/!a 외)이나 서식 지정자
+    """
+    static = static or {}
+    chunks: list[str] = []
+    pending: str = ""
+
+    for literal, field, spec, conversion in Formatter().parse(text):
+        pending += literal
+        if field is None:
+            continue
+        if conversion not in (None, "r", "s", "a"):
+            raise ValueError(f"{name}: 허용하지 않는 변환 {{{field}!{conversion}}}")
+        if spec and not _SPEC_RE.match(spec):
+            raise ValueError(f"{name}: 허용하지 않는 서식 지정자 {{{field}:{spec}}}")
+        if field in STATIC_FIELDS:
+            value: Any = static.get(field, "")
+            if conversion:
+                value = {"r": repr, "s": str, "a": ascii}[conversion](value)
+            pending += format(value, spec or "")
+        elif field in DYNAMIC_FIELDS:
+            if pending:
+                chunks.append(_literal(pending))
+                pending = ""
+            arg: str = f"_{DYNAMIC_FIELDS.index(field)}"
+            chunks.append("f'{" + arg + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}'")
+        else:
+            raise ValueError(f"{name}: 알 수 없는 필드 {{{field}}} (사용 가능: {', '.join(STATIC_FIELDS + DYNAMIC_FIELDS)})")
+
+    if pending or not chunks:
+        chunks.append(_literal(pending))
+
+    params: str = ", ".join(f"_{i}" for i in range(len(DYNAMIC_FIELDS)))
+    code = compile(f"lambda {params}: {' '.join(chunks)}", f"<prompt {name}>", "eval")
+    return eval(code, {"__builtins__": {}})
+
+
+def format_inputs(inputs: list[Any]) -> str:
+    """
+    프롬프트의 입력 데이터 칸 (json.dumps(inputs, ensure_ascii=False)와 같은 문자열, 비었으면 NO_INPUTS)
+
+    흔한 경우인 문자열 목록은 인코더 객체를 만들지 않고 C 구현 문자열 인코더로 바로 잇는다.
+    """
+    if not inputs:
+        return NO_INPUTS
+    if all(type(i) is str for i in inputs):
+        return "[" + ", ".join(map(encode_basestring, inputs)) + "]"
+    return json.dumps(inputs, ensure_ascii=False)
+
+
+def load_template_overrides(template_dir: Path) -> dict[str, str]:
+    """템플릿 디렉토리의 덮어쓰기 템플릿 {"spawn": ..., "spawn.coder": ...} (없으면 빈 dict)"""
+    if not template_dir.is_dir():
+        return {}
+    return {
+        path.stem: path.read_text()
+        for path in sorted(template_dir.glob("*.md"))
+        if path.stem.split(".", 1)[0] in DEFAULT_TEMPLATES
+    }
+
+
+def template_fingerprint(template_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """템플릿 디렉토리의 *.md (이름, mtime_ns, 크기) 목록 (없으면 빈 튜플)"""
+    try:
+        entries = list(os.scandir(template_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    return tuple(sorted(
+        (e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries if e.name.endswith(".md")
+    ))
+
+
+_overrides: Optional[dict[str, str]] = None
+_overrides_fingerprint: Optional[tuple[tuple[str, int, int], ...]] = None  # 디렉토리에서 읽었을 때만
+_compiled: dict[tuple[str, str, str], Renderer] = {}
+
+
+def set_template_overrides(overrides: Optional[dict[str, str]]) -> None:
+    """덮어쓰기 템플릿 지정 (None이면 PROMPT_TEMPLATE_DIR에서 다시 읽음) 후 컴파일 캐시 비우기"""
+    global _overrides, _overrides_fingerprint
+    _overrides = overrides
+    _overrides_fingerprint = None
+    _compiled.clear()
+
+
+def refresh_template_overrides() -> bool:
+    """
+    PROMPT_TEMPLATE_DIR에서 읽은 덮어쓰기가 그 뒤 바뀌었으면 버리고 다음 렌더링 때 다시 읽기 (버렸으면 True)
+
+    상주 워커가 요청마다 호출해, 템플릿 파일을 고친 뒤에도 직접 실행과 같은 프롬프트를 만들게 한다.
+    set_template_overrides(dict)로 직접 지정한 덮어쓰기는 건드리지 않는다.
+    """
+    if _overrides_fingerprint is None or template_fingerprint(Path(PROMPT_TEMPLATE_DIR)) == _overrides_fingerprint:
+        return False
+    set_template_overrides(None)
+    return True
+
+
+def template_source(kind: str, agent_type: str) -> str:
+    """타입별 덮어쓰기 → kind 전체 덮어쓰기 → 기본 템플릿 순으로 선택"""
+    global _overrides, _overrides_fingerprint
+    if _overrides is None:
+        template_dir: Path = Path(PROMPT_TEMPLATE_DIR)
+        _overrides_fingerprint = template_fingerprint(template_dir)
+        _overrides = load_template_overrides(template_dir)
+    return _overrides.get(f"{kind}.{agent_type}") or _overrides.get(kind) or DEFAULT_TEMPLATES[kind]
+
+
+def compiled_template(kind: str, agent_type: str, emoji: str) -> Renderer:
+    """(kind, 타입, 이모지)별 렌더 함수 (처음 요청될 때 한 번만 컴파일)"""
+    key: tuple[str, str, str] = (kind, agent_type, emoji)
+    renderer: Optional[Renderer] = _compiled.get(key)
+    if renderer is None:
+        static: dict[str, str] = {"emoji": emoji, "type": agent_type, "role": agent_type.upper()}
+        renderer = _compiled[key] = compile_template(template_source(kind, agent_type), static, f"{kind}.{agent_type}")
+    return renderer
+
+
+def render_prompt(kind: str, agent: dict[str, Any], mission_path: str = "", label: str = "") -> str:
+    """에이전트 하나의 프롬프트 (kind: spawn | send, send 프롬프트에는 type/emoji가 없어도 됨)"""
+    return compiled_template(kind, agent.get("type", ""), agent.get("emoji", ""))(
+        agent["description"],
+        format_inputs(agent["inputs"]),
+        agent["expected_output"] or DEFAULT_EXPECTED_OUTPUT,
+        mission_path,
+        agent["id"],
+        label
+    )
+
+
+def render_prompts(kind: str, agents: list[dict[str, Any]], mission_path: str = "",
+                   labels: Optional[list[str]] = None) -> list[str]:
+    """
+    여러 에이전트 프롬프트 일괄 렌더링 (render_prompt와 같은 결과)
+
+    렌더 함수는 (타입, 이모지)별로 한 번만 찾고, 전역/속성 조회를 루프 밖으로 뺀다.
+    """
+    renderers: dict[tuple[str, str], Renderer] = {}
+    inputs_text: Callable[[list[Any]], str] = format_inputs
+    prompts: list[str] = []
+    append: Callable[[str], None] = prompts.append
+
+    for i, agent in enumerate(agents):
+        key: tuple[str, str] = (agent.get("type", ""), agent.get("emoji", ""))
+        renderer: Optional[Renderer] = renderers.get(key)
+        if renderer is None:
+            renderer = renderers[key] = compiled_template(kind, *key)
+        append(renderer(
+            agent["description"],
+            inputs_text(agent["inputs"]),
+            agent["expected_output"] or DEFAULT_EXPECTED_OUTPUT,
+            mission_path,
+            agent["id"],
+            labels[i] if labels else ""
+        ))
+
+    return prompts
+
+
+def reference_params(params: dict[str, Any], kind: str, path: Path) -> dict[str, Any]:
+    """
+    프롬프트 전문을 path에 쓰고 프롬프트 자리에 파일 경로만 남긴 params 사본
+
+    실행 스크립트에 수만 개 프롬프트를 인라인으로 넣지 않기 위한 것.
+    """
+    key: str = PROMPT_KEYS[kind]
+    with open(path, "w") as f:
+        f.write(params[key])
+    return {**params, key: REFERENCE_TEMPLATE.format(path=path)}
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Replan Script
+서브태스크 변경분만 반영하는 증분 재계획
+"""
+
+import json
+import os
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    from config import MISSION_DIR
+    from utils import load_mission, update_mission_status, log_event
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from assemble import create_agent_config, agent_fingerprint, resolve_dependency_ids, save_execution_plan, print_plan_summary
+    from runtime_stats import load_runtime_model
+except ImportError:
+    from .config import MISSION_DIR
+    from .utils import load_mission, update_mission_status, log_event
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .assemble import create_agent_config, agent_fingerprint, resolve_dependency_ids, save_execution_plan, print_plan_summary
+    from .runtime_stats import load_runtime_model
+
+
+def match_agent_ids(mission_id: str, old_plan: dict[str, Any], agents: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    새 에이전트 위치 ID → 최종 ID
+
+    지문이 같은 기존 에이전트가 있으면 그 ID를 그대로 쓴다 (서브태스크 위치가 밀려도 출력/로그 유지).
+    짝이 없는 에이전트는 같은 위치의 기존 ID가 비어 있으면 그것을(내용 변경), 아니면 쓰이지 않은
+    새 ID를 받는다. 이전 계획에 지문이 없으면 위치 ID를 그대로 쓴다.
+    """
+    old_fingerprints: dict[str, str] = old_plan.get("fingerprints") or {}
+    if not old_fingerprints:
+        return {a["id"]: a["id"] for a in agents}
+
+    candidates: dict[str, list[str]] = {}
+    for old_id, fingerprint in old_fingerprints.items():
+        candidates.setdefault(fingerprint, []).append(old_id)
+
+    ids: dict[str, str] = {}
+    for a in agents:
+        matches: list[str] = candidates.get(agent_fingerprint(a), [])
+        if matches:
+            # 같은 태스크가 여럿이면 같은 위치의 ID를 우선
+            old_id: str = a["id"] if a["id"] in matches else matches[0]
+            matches.remove(old_id)
+            ids[a["id"]] = old_id
+
+    used: set[str] = set(old_fingerprints) | set(ids.values())
+    claimed: set[str] = set(ids.values())
+    next_index: int = 0
+    for a in agents:
+        if a["id"] in ids:
+            continue
+        if a["id"] not in claimed and (a["id"] in old_fingerprints or a["id"] not in used):
+            ids[a["id"]] = a["id"]
+        else:
+            while f"{mission_id}_agent_{next_index:02d}" in used:
+                next_index += 1
+            ids[a["id"]] = f"{mission_id}_agent_{next_index:02d}"
+        used.add(ids[a["id"]])
+        claimed.add(ids[a["id"]])
+
+    return ids
+
+
+def diff_plan(mission_id: str, old_plan: dict[str, Any], agents: list[dict[str, Any]],
+              finished: set[str]) -> tuple[dict[str, list[str]], list[dict[str, Any]]]:
+    """
+    새 에이전트 설정과 기존 계획 비교
+
+    에이전트는 ID가 아니라 태스크 지문으로 짝짓고(match_agent_ids), 짝지은 에이전트는
+    의존 대상이 바뀌었을 때만 변경으로 본다. 지문이 없는 이전 형식의 계획은 변경 여부를
+    알 수 없으므로 같은 ID의 에이전트를 unknown으로 분류하고, 출력이 있으면 유지한다.
+
+    Args:
+        mission_id: 미션 ID
+        old_plan: 기존 execution_plan.json
+        agents: 새 서브태스크로 만든 에이전트 설정 (위치 ID)
+        finished: 출력 파일이 있는 에이전트 ID
+
+    Returns:
+        (added / changed / removed / downstream(변경 전파로 무효화) / unknown / kept(완료 유지) 목록,
+         최종 ID와 의존성 ID로 바꾼 에이전트 설정)
+    """
+    ids: dict[str, str] = match_agent_ids(mission_id, old_plan, agents)
+    agents = [
+        {**a, "id": ids[a["id"]],
+         "dependencies": [ids.get(d, d) for d in resolve_dependency_ids(a["dependencies"], mission_id)]}
+        for a in agents
+    ]
+
+    old_fingerprints: dict[str, str] = old_plan.get("fingerprints") or {}
+    old_dependencies: dict[str, list[str]] = {
+        a["id"]: a["dependencies"] for phase in old_plan.get("phases", []) for a in phase["agents"]
+        if "dependencies" in a
+    }
+    old_ids: set[str] = {c["agent_id"] for c in old_plan.get("commands", [])}
+    new_ids: set[str] = {a["id"] for a in agents}
+
+    added: list[str] = [a["id"] for a in agents if a["id"] not in old_ids]
+    removed: list[str] = sorted(old_ids - new_ids)
+    changed: list[str] = []
+    unknown: list[str] = []
+    for a in agents:
+        if a["id"] not in old_ids:
+            continue
+        if not old_fingerprints:
+            unknown.append(a["id"])
+        elif (old_fingerprints.get(a["id"]) != agent_fingerprint(a)
+              or old_dependencies.get(a["id"], a["dependencies"]) != a["dependencies"]):
+            changed.append(a["id"])
+
+    # 변경/삭제된 에이전트에 (간접적으로) 의존하는 에이전트 무효화
+    dirty: set[str] = set(added) | set(changed) | set(removed)
+    downstream: list[str] = []
+    grew: bool = True
+    while grew:
+        grew = False
+        for a in agents:
+            if a["id"] not in dirty and any(d in dirty for d in a["dependencies"]):
+                dirty.add(a["id"])
+                downstream.append(a["id"])
+                grew = True
+
+    kept: list[str] = [a["id"] for a in agents if a["id"] not in dirty and a["id"] in finished]
+
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "downstream": downstream,
+        "unknown": [agent_id for agent_id in unknown if agent_id not in dirty],
+        "kept": kept
+    }, agents
+
+
+def archive_stale_outputs(mission_path: Path, agent_ids: list[str]) -> Path:
+    """무효화된 출력을 outputs/.stale/<시각>/ 으로 이동 (삭제하지 않음)"""
+    stale_dir: Path = mission_path / "outputs" / ".stale" / datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    for agent_id in agent_ids:
+        output_file: Path = mission_path / "outputs" / f"{agent_id}.md"
+        if output_file.exists():
+            stale_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(output_file, stale_dir / output_file.name)
+
+    return stale_dir
+
+
+def replan_mission(mission: dict[str, Any], old_plan: dict[str, Any], subtasks: list[dict[str, Any]],
+                   dry_run: bool = False) -> tuple[dict[str, list[str]], str]:
+    """
+    증분 재계획 실행
+
+    Returns:
+        (diff, 계획 파일 경로) 튜플. dry_run이면 파일은 바뀌지 않는다.
+    """
+    mission_path: Path = Path(mission["path"])
+    runtime_model: dict[str, dict[str, Any]] = load_runtime_model()
+    agents: list[dict[str, Any]] = [
+        create_agent_config(st, mission["id"], i, runtime_model) for i, st in enumerate(subtasks)
+    ]
+
+    outputs_dir: Path = mission_path / "outputs"
+    finished: set[str] = {p.stem for p in outputs_dir.glob("*.md")} if outputs_dir.exists() else set()
+    diff, agents = diff_plan(mission["id"], old_plan, agents, finished)
+    plan_path: str = str(mission_path / "execution_plan.json")
+
+    if dry_run:
+        return diff, plan_path
+
+    invalidated: list[str] = diff["changed"] + diff["removed"] + diff["downstream"]
+    archive_stale_outputs(mission_path, invalidated)
+
+    plan_path = save_execution_plan(mission, agents, completed=set(diff["kept"]))
+    update_mission_status(mission_path, mission["status"], {
+        "subtasks": subtasks,
+        "replanned_at": datetime.now().isoformat()
+    })
+    log_event(mission_path, "replanned", {
+        **{key: len(ids) for key, ids in diff.items()},
+        "invalidated": invalidated
+    })
+
+    return diff, plan_path
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Replan")
+    parser.add_argument("--mission", "-m", required=True, help="미션 ID")
+    parser.add_argument("--subtasks", "-s", required=True, help="수정된 서브태스크 JSON 파일")
+    parser.add_argument("--dry-run", "-d", action="store_true", help="변경 내역만 출력")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        mission, plan = load_mission(args.mission, writable=True)
+    except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    with open(args.subtasks) as f:
+        subtasks: list[dict[str, Any]] = json.load(f).get("subtasks", [])
+
+    diff, plan_path = replan_mission(mission, plan, subtasks, args.dry_run)
+
+    if args.json:
+        print(json.dumps({"mission_id": mission["id"], "diff": diff, "plan_path": plan_path},
+                         indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n🔁 재계획: {args.mission}")
+    print(f"   유지(완료): {len(diff['kept'])}")
+    print(f"   추가: {len(diff['added'])} / 변경: {len(diff['changed'])} / 삭제: {len(diff['removed'])}")
+    print(f"   하위 의존 무효화: {len(diff['downstream'])}")
+    if diff["unknown"]:
+        print(f"   ⚠️  이전 계획에 지문이 없어 변경 여부를 알 수 없음: {len(diff['unknown'])}개 "
+              f"(출력이 있으면 유지, 없으면 실행)")
+
+    if args.dry_run:
+        print("\n(dry-run: 계획 파일은 변경되지 않음)")
+    else:
+        print_plan_summary(plan_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Runtime Stats Script
+에이전트 실행 시간 통계 수집 및 적응형 timeout/소요 시간 추정
+"""
+
+import json
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import (
+        AGENT_TYPES, RUNTIME_STATS_FILE, RUNTIME_MIN_SAMPLES, RUNTIME_TIMEOUT_PERCENTILE,
+        RUNTIME_TIMEOUT_MULTIPLIER, RUNTIME_MIN_TIMEOUT, RUNTIME_DEFAULT_ESTIMATE_RATIO
+    )
+    from utils import load_mission, log_event, read_log_events, percentile
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+except ImportError:
+    from .config import (
+        AGENT_TYPES, RUNTIME_STATS_FILE, RUNTIME_MIN_SAMPLES, RUNTIME_TIMEOUT_PERCENTILE,
+        RUNTIME_TIMEOUT_MULTIPLIER, RUNTIME_MIN_TIMEOUT, RUNTIME_DEFAULT_ESTIMATE_RATIO
+    )
+    from .utils import load_mission, log_event, read_log_events, percentile
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+
+
+# (저장소 경로, mtime) → 통계 캐시
+_stats_cache: dict[str, tuple[float, dict[str, dict[str, Any]]]] = {}
+
+
+def plan_agent_info(plan: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """계획에서 에이전트별 타입/모델/프롬프트 크기 추출"""
+    info: dict[str, dict[str, Any]] = {
+        a["id"]: {"type": a["type"], "model": None, "prompt_size": 0}
+        for phase in plan.get("phases", []) for a in phase["agents"]
+    }
+
+    for cmd in plan.get("commands", []):
+        params: dict[str, Any] = cmd.get("params", {})
+        entry = info.setdefault(cmd["agent_id"], {"type": "researcher", "model": None, "prompt_size": 0})
+        entry["model"] = params.get("model")
+        entry["prompt_size"] = len(params.get("task") or params.get("message") or "")
+
+    return info
+
+
+def record_agent_started(mission_path: Path, agent_id: str, data: Optional[dict[str, Any]] = None) -> None:
+    """에이전트 시작 이벤트 기록"""
+    log_event(mission_path, "agent_started", {"agent_id": agent_id, **(data or {})})
+
+
+def record_agent_finished(mission_path: Path, agent_id: str, data: Optional[dict[str, Any]] = None) -> None:
+    """에이전트 종료 이벤트 기록"""
+    log_event(mission_path, "agent_finished", {"agent_id": agent_id, **(data or {})})
+
+
+def record_agent_failed(mission_path: Path, agent_id: str, data: Optional[dict[str, Any]] = None) -> None:
+    """에이전트 실행 실패 이벤트 기록 (스케줄러가 다시 디스패치)"""
+    log_event(mission_path, "agent_failed", {"agent_id": agent_id, **(data or {})})
+
+
+def estimate_agent_runtimes(mission_path: Path, plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    출력 파일 수정 시각으로 에이전트별 실행 시간 추정
+
+    시작/종료 이벤트가 없는 미션용 대체 경로. Phase 1은 execution_started
+    시각부터, 이후 Phase는 이전 Phase의 마지막 출력 시각부터 시작했다고 가정한다.
+    """
+    started = read_log_events(mission_path, "execution_started")
+    if not started:
+        return []
+
+    phase_start: float = datetime.fromisoformat(started[0]["timestamp"]).timestamp()
+    outputs_dir: Path = mission_path / "outputs"
+    runtimes: list[dict[str, Any]] = []
+
+    for phase in plan.get("phases", []):
+        phase_end: float = phase_start
+        for agent in phase["agents"]:
+            output_file: Path = outputs_dir / f"{agent['id']}.md"
+            if not output_file.exists():
+                continue
+
+            finished: float = output_file.stat().st_mtime
+            phase_end = max(phase_end, finished)
+            if finished > phase_start:
+                runtimes.append({
+                    "agent_id": agent["id"],
+                    "type": agent["type"],
+                    "started_at": phase_start,
+                    "finished_at": finished,
+                    "duration": finished - phase_start
+                })
+        phase_start = phase_end
+
+    return runtimes
+
+
+def collect_mission_samples(mission_path: Path, plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    미션의 에이전트 실행 시간 표본 생성
+
+    agent_started/agent_finished 이벤트를 우선 사용하고,
+    이벤트가 없는 에이전트는 출력 파일 기반 추정치로 보완한다.
+    """
+    info: dict[str, dict[str, Any]] = plan_agent_info(plan)
+    mission_id: str = plan.get("mission_id") or mission_path.name
+
+    starts: dict[str, float] = {}
+    for e in read_log_events(mission_path, "agent_started"):
+        starts.setdefault(e["data"].get("agent_id"), datetime.fromisoformat(e["timestamp"]).timestamp())
+
+    # 출력 파일로 감지한 종료는 기록 시각 대신 파일 수정 시각(finished_at)을 사용
+    spans: dict[str, tuple[float, float]] = {}
+    for e in read_log_events(mission_path, "agent_finished"):
+        agent_id = e["data"].get("agent_id")
+        if agent_id in starts and agent_id not in spans:
+            finished: str = e["data"].get("finished_at") or e["timestamp"]
+            spans[agent_id] = (starts[agent_id], datetime.fromisoformat(finished).timestamp())
+
+    for r in estimate_agent_runtimes(mission_path, plan):
+        spans.setdefault(r["agent_id"], (r["started_at"], r["finished_at"]))
+
+    samples: list[dict[str, Any]] = []
+    for agent_id, (started_at, finished_at) in spans.items():
+        agent = info.get(agent_id, {"type": "researcher", "model": None, "prompt_size": 0})
+        samples.append({
+            "mission_id": mission_id,
+            "agent_id": agent_id,
+            "type": agent["type"],
+            "model": agent["model"],
+            "prompt_size": agent["prompt_size"],
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "duration": finished_at - started_at
+        })
+
+    return samples
+
+
+def load_runtime_samples(store_path: Optional[Path] = None) -> list[dict[str, Any]]:
+    """실행 시간 표본 전체 로드"""
+    path: Path = store_path or RUNTIME_STATS_FILE
+    if not path.exists():
+        return []
+
+    samples: list[dict[str, Any]] = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                try:
+                    samples.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    return samples
+
+
+def ingest_mission(mission_path: Path, plan: dict[str, Any], store_path: Optional[Path] = None) -> int:
+    """
+    미션 실행 시간 표본을 저장소에 추가
+
+    Returns:
+        새로 추가된 표본 수 (이미 기록된 에이전트는 건너뜀)
+    """
+    path: Path = store_path or RUNTIME_STATS_FILE
+    known: set[tuple[str, str]] = {(s["mission_id"], s["agent_id"]) for s in load_runtime_samples(path)}
+    new_samples: list[dict[str, Any]] = [
+        s for s in collect_mission_samples(mission_path, plan)
+        if (s["mission_id"], s["agent_id"]) not in known and s["duration"] > 0
+    ]
+
+    if new_samples:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            for s in new_samples:
+                f.write(json.dumps(s, ensure_ascii=False) + "\n")
+
+    return len(new_samples)
+
+
+def compute_runtime_stats(samples: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    타입별, 타입/모델별 실행 시간 백분위 계산
+
+    Returns:
+        {"researcher": {...}, "researcher/sonnet": {...}} 형태의 통계
+    """
+    groups: dict[str, list[float]] = {}
+    for s in samples:
+        groups.setdefault(s["type"], []).append(s["duration"])
+        if s.get("model"):
+            groups.setdefault(f"{s['type']}/{s['model']}", []).append(s["duration"])
+
+    return {
+        key: {
+            "count": len(durations),
+            "p50": percentile(durations, 50),
+            "p90": percentile(durations, 90),
+            "p95": percentile(durations, 95),
+            "max": max(durations),
+            "durations": sorted(durations)
+        }
+        for key, durations in groups.items()
+    }
+
+
+def load_runtime_model(store_path: Optional[Path] = None) -> dict[str, dict[str, Any]]:
+    """저장소 통계 로드 (파일이 바뀌지 않았으면 캐시 사용)"""
+    path: Path = store_path or RUNTIME_STATS_FILE
+    if not path.exists():
+        return {}
+
+    mtime: float = path.stat().st_mtime
+    cached = _stats_cache.get(str(path))
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    stats = compute_runtime_stats(load_runtime_samples(path))
+    _stats_cache[str(path)] = (mtime, stats)
+    return stats
+
+
+def lookup_stats(stats: dict[str, dict[str, Any]], agent_type: str,
+                 model: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """표본이 충분한 가장 구체적인 통계 (타입/모델 → 타입)"""
+    for key in ([f"{agent_type}/{model}"] if model else []) + [agent_type]:
+        entry = stats.get(key)
+        if entry and entry["count"] >= RUNTIME_MIN_SAMPLES:
+            return entry
+    return None
+
+
+def adaptive_timeout(agent_type: str, model: Optional[str], default: int,
+                     stats: Optional[dict[str, dict[str, Any]]] = None) -> int:
+    """관측된 실행 시간 백분위 기반 timeout (표본 부족 시 기본값)"""
+    entry = lookup_stats(stats if stats is not None else load_runtime_model(), agent_type, model)
+    if not entry:
+        return default
+
+    observed = percentile(entry["durations"], RUNTIME_TIMEOUT_PERCENTILE)
+    return max(RUNTIME_MIN_TIMEOUT, int(observed * RUNTIME_TIMEOUT_MULTIPLIER))
+
+
+def estimate_duration(agent_type: str, model: Optional[str], timeout: int,
+                      stats: Optional[dict[str, dict[str, Any]]] = None) -> int:
+    """예상 소요 시간(초) - 관측 중앙값, 표본 부족 시 timeout 비율"""
+    entry = lookup_stats(stats if stats is not None else load_runtime_model(), agent_type, model)
+    if not entry:
+        return int(timeout * RUNTIME_DEFAULT_ESTIMATE_RATIO)
+
+    return int(entry["p50"])
+
+
+def print_stats(stats: dict[str, dict[str, Any]]) -> None:
+    """통계 표 출력"""
+    print("\n" + "="*70)
+    print("⏱️ AVENGERS RUNTIME STATS")
+    print("="*70)
+
+    if not stats:
+        print("기록된 표본 없음")
+    for key in sorted(stats):
+        s = stats[key]
+        agent_type = key.split("/")[0]
+        default = AGENT_TYPES.get(agent_type, AGENT_TYPES["researcher"])["timeout"]
+        model = key.split("/")[1] if "/" in key else None
+        print(f"  {key:<22} n={s['count']:<5} p50={s['p50']:>7.0f}s p95={s['p95']:>7.0f}s "
+              f"timeout={adaptive_timeout(agent_type, model, default, stats)}s (기본 {default}s)")
+
+    print("="*70)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Runtime Stats")
+    parser.add_argument("--mission", "-m", help="미션 ID")
+    parser.add_argument("--agent", "-a", help="에이전트 ID (--start/--finish와 함께)")
+    parser.add_argument("--start", action="store_true", help="에이전트 시작 기록")
+    parser.add_argument("--finish", action="store_true", help="에이전트 종료 기록")
+    parser.add_argument("--ingest", action="store_true", help="미션 실행 시간을 통계 저장소에 반영")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.mission:
+        try:
+            mission, plan = load_mission(args.mission, writable=args.start or args.finish)
+        except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+
+        mission_path: Path = Path(mission["path"])
+
+        if args.start or args.finish:
+            if not args.agent:
+                print("❌ 오류: --agent 필요")
+                sys.exit(1)
+            info = plan_agent_info(plan).get(args.agent, {})
+            if args.start:
+                record_agent_started(mission_path, args.agent, info)
+            else:
+                record_agent_finished(mission_path, args.agent)
+            return
+
+        if args.ingest:
+            added: int = ingest_mission(mission_path, plan)
+            print(f"📥 표본 {added}개 추가: {args.mission}")
+
+    stats = load_runtime_model()
+
+    if args.json:
+        print(json.dumps({
+            key: {k: v for k, v in s.items() if k != "durations"} for key, s in stats.items()
+        }, indent=2, ensure_ascii=False))
+    else:
+        print_stats(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Scheduler Script
+동시 실행 중인 미션들 사이의 우선순위/가중 공정 큐잉 스케줄러
+"""
+
+import json
+import os
+import sys
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import MISSION_DIR, MISSION_PRIORITIES, DEFAULT_MISSION_PRIORITY, RUNTIME_DEFAULT_ESTIMATE_RATIO
+    from utils import load_mission_only, update_mission_status, read_log_events
+    from exceptions import MissionNotFoundError, InvalidMissionError, ArchivedMissionError
+    from dispatcher import EXISTING_POOL, Dispatcher, agent_pool_key
+    from runtime_stats import record_agent_started
+    from execute import format_spawn_code, format_send_code
+    from dataflow import agent_dependencies, resolve_command_params
+    from prompt_builder import estimate_tokens
+    from validation import output_complete, validate_mission_outputs
+    from tracing import span
+    from serialization import read_json
+except ImportError:
+    from .config import MISSION_DIR, MISSION_PRIORITIES, DEFAULT_MISSION_PRIORITY, RUNTIME_DEFAULT_ESTIMATE_RATIO
+    from .utils import load_mission_only, update_mission_status, read_log_events
+    from .exceptions import MissionNotFoundError, InvalidMissionError, ArchivedMissionError
+    from .dispatcher import EXISTING_POOL, Dispatcher, agent_pool_key
+    from .runtime_stats import record_agent_started
+    from .execute import format_spawn_code, format_send_code
+    from .dataflow import agent_dependencies, resolve_command_params
+    from .prompt_builder import estimate_tokens
+    from .validation import output_complete, validate_mission_outputs
+    from .tracing import span
+    from .serialization import read_json
+
+
+def mission_weight(mission: dict[str, Any]) -> int:
+    """미션 우선순위 가중치"""
+    return MISSION_PRIORITIES.get(
+        mission.get("priority", DEFAULT_MISSION_PRIORITY),
+        MISSION_PRIORITIES[DEFAULT_MISSION_PRIORITY]
+    )
+
+
+def plan_agents(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """Phase 순서대로 에이전트 목록 (명령어 파라미터 포함)"""
+    commands: dict[str, dict[str, Any]] = {c["agent_id"]: c for c in plan.get("commands", [])}
+    dependencies: dict[str, list[str]] = agent_dependencies(plan)
+    agents: list[dict[str, Any]] = []
+
+    for phase in plan.get("phases", []):
+        for a in phase["agents"]:
+            cmd = commands.get(a["id"])
+            if not cmd:
+                continue
+            params: dict[str, Any] = cmd["params"]
+            timeout: int = params.get("runTimeoutSeconds") or params.get("timeoutSeconds", 0)
+            agents.append({
+                **a,
+                "phase": phase["phase"],
+                "model": a.get("model") or params.get("model"),
+                "estimated_duration": a.get("estimated_duration") or int(timeout * RUNTIME_DEFAULT_ESTIMATE_RATIO),
+                "upstream": dependencies.get(a["id"], []),
+                "command": cmd
+            })
+
+    return agents
+
+
+def agent_states(mission_path: Path, plan: dict[str, Any],
+                 events: Optional[list[dict[str, Any]]] = None) -> dict[str, str]:
+    """
+    에이전트별 상태 계산: done | running | ready | blocked
+
+    의존성이 기록된 계획은 의존성 완료 여부로, 이전 형식의 계획은
+    앞선 Phase 전체 완료 여부로 ready를 판단한다. events를 넘기면 로그를 다시 읽지 않는다.
+    출력 파일이 있어도 아직 쓰는 중이면(validation.output_complete) done이 아니라 running이다
+    (쓰다 만 업스트림 출력이 의존 에이전트 프롬프트에 주입되지 않도록).
+    """
+    outputs_dir: Path = mission_path / "outputs"
+    outputs: set[str] = set(os.listdir(outputs_dir)) if outputs_dir.exists() else set()
+    started: set[str] = set()
+    finished: set[str] = set()
+    for e in read_log_events(mission_path) if events is None else events:
+        if e["event"] == "agent_started":
+            started.add(e["data"].get("agent_id"))
+            finished.discard(e["data"].get("agent_id"))
+        elif e["event"] == "agent_finished":
+            finished.add(e["data"].get("agent_id"))
+        elif e["event"] == "replanned":
+            # 재계획으로 무효화된 에이전트는 다시 디스패치 대상
+            started.difference_update(e["data"].get("invalidated", []))
+        elif e["event"] in ("output_rejected", "agent_failed"):
+            # 검증에서 반려됐거나 실행이 실패(timeout/호출 오류)한 에이전트도 다시 디스패치 대상
+            started.discard(e["data"].get("agent_id"))
+
+    all_ids: set[str] = {c["agent_id"] for c in plan.get("commands", [])} | {
+        a["id"] for p in plan.get("phases", []) for a in p["agents"]
+    }
+    now: float = time.time()
+    written: set[str] = {agent_id for agent_id in all_ids if f"{agent_id}.md" in outputs}
+    done: set[str] = {
+        agent_id for agent_id in written
+        if output_complete(outputs_dir / f"{agent_id}.md", agent_id, agent_id in finished, now)
+    }
+    states: dict[str, str] = {}
+    earlier_phases_done: bool = True
+
+    for phase in plan.get("phases", []):
+        for a in phase["agents"]:
+            if a["id"] in done:
+                states[a["id"]] = "done"
+            elif a["id"] in started or a["id"] in written:
+                states[a["id"]] = "running"
+            elif "dependencies" in a:
+                states[a["id"]] = "ready" if all(d in done for d in a["dependencies"]) else "blocked"
+            else:
+                states[a["id"]] = "ready" if earlier_phases_done else "blocked"
+        earlier_phases_done = earlier_phases_done and all(a["id"] in done for a in phase["agents"])
+
+    return states
+
+
+def load_active_missions(mission_dir: Optional[Path] = None) -> list[dict[str, Any]]:
+    """실행 중(executing)인 미션과 상태 스냅샷 로드"""
+    root: Path = mission_dir or MISSION_DIR
+    active: list[dict[str, Any]] = []
+
+    if not root.exists():
+        return active
+
+    for mission_path in sorted(p for p in root.iterdir() if p.is_dir()):
+        plan_file: Path = mission_path / "execution_plan.json"
+        mission_file: Path = mission_path / "mission.json"
+        if not plan_file.exists() or not mission_file.exists():
+            continue
+        try:
+            mission: dict[str, Any] = read_json(mission_file)
+            if mission.get("status") != "executing":
+                continue
+            plan: dict[str, Any] = read_json(plan_file)
+        except ValueError:
+            continue
+
+        agents = plan_agents(plan)
+        events = read_log_events(mission_path)
+        states = agent_states(mission_path, plan, events)
+        pools: dict[str, str] = {a["id"]: agent_pool_key(a) for a in agents}
+        active.append({
+            "mission": mission,
+            "path": mission_path,
+            "plan": plan,
+            "weight": mission_weight(mission),
+            "agents": agents,
+            "states": states,
+            # 지금까지 받은 서비스 (디스패치된 에이전트 예상 소요 합)
+            "service": sum(a["estimated_duration"] for a in agents if states.get(a["id"]) in ("running", "done")),
+            # 호출 속도 제한 재생용 (시작 시각, 풀) - 끝난 에이전트도 호출 한도는 소비했다
+            "dispatches": [
+                (datetime.fromisoformat(e["timestamp"]).timestamp(),
+                 e["data"].get("model") or pools.get(e["data"].get("agent_id"), EXISTING_POOL))
+                for e in events if e["event"] == "agent_started"
+            ]
+        })
+
+    return active
+
+
+def replay_dispatches(dispatcher: Dispatcher, dispatches: list[tuple[float, str]], now: float) -> None:
+    """
+    기록된 시작 시각을 풀별 토큰 버킷에 재생
+
+    스케줄러는 호출마다 새 프로세스라 버킷이 가득 찬 채로 만들어지므로,
+    지난 디스패치가 소비한 토큰을 로그에서 되살려야 분당 한도가 호출 사이에도 유지된다.
+    """
+    by_pool: dict[str, list[float]] = {}
+    for at, key in dispatches:
+        if at <= now:
+            by_pool.setdefault(key, []).append(at)
+
+    for key, times in by_pool.items():
+        bucket = dispatcher.pool(key).bucket
+        times.sort()
+        bucket.updated = times[0]
+        for at in times:
+            bucket.refill(at)
+            bucket.tokens = max(0.0, bucket.tokens - 1.0)
+        bucket.refill(now)
+
+
+def schedule_next(missions: list[dict[str, Any]], limit: Optional[int] = None,
+                  limits: Optional[dict[str, dict[str, Any]]] = None,
+                  now: Optional[float] = None) -> list[dict[str, Any]]:
+    """
+    미션 간 가중 공정 큐잉으로 다음 디스패치 대상 선택
+
+    가중치 대비 받은 서비스(service / weight)가 가장 적은 미션부터 ready
+    에이전트를 하나씩 배정한다. 동률이면 남은 에이전트가 적은 미션이 먼저다.
+    모델별 동시 실행 한도는 전체 미션의 running 에이전트를 합산해 적용하고,
+    분당 호출 한도(토큰 버킷)는 전체 미션의 시작 기록을 재생한 뒤 배정할 때마다 토큰을 소비한다.
+    """
+    now = time.time() if now is None else now
+    dispatcher = Dispatcher(limits, clock=lambda: now)
+    for m in missions:
+        for a in m["agents"]:
+            if m["states"].get(a["id"]) == "running":
+                dispatcher.pool(agent_pool_key(a)).in_flight += 1
+    replay_dispatches(dispatcher, [d for m in missions for d in m.get("dispatches", [])], now)
+
+    service: dict[str, float] = {m["mission"]["id"]: float(m["service"]) for m in missions}
+    queues: dict[str, list[dict[str, Any]]] = {
+        m["mission"]["id"]: [a for a in m["agents"] if m["states"].get(a["id"]) == "ready"]
+        for m in missions
+    }
+    remaining: dict[str, int] = {
+        m["mission"]["id"]: sum(1 for s in m["states"].values() if s != "done") for m in missions
+    }
+    by_id: dict[str, dict[str, Any]] = {m["mission"]["id"]: m for m in missions}
+    selected: list[dict[str, Any]] = []
+
+    while limit is None or len(selected) < limit:
+        candidates = [mid for mid, q in queues.items() if q]
+        if not candidates:
+            break
+
+        mission_id = min(candidates, key=lambda mid: (service[mid] / by_id[mid]["weight"], remaining[mid], mid))
+        queue = queues[mission_id]
+        agent = next((
+            a for a in queue
+            if (pool := dispatcher.pool(agent_pool_key(a))).has_slot() and pool.bucket.try_acquire(now)
+        ), None)
+
+        if agent is None:
+            # 이 미션의 ready 에이전트는 모두 포화됐거나 호출 한도에 걸린 풀 소속
+            queues[mission_id] = []
+            continue
+
+        queue.remove(agent)
+        dispatcher.pool(agent_pool_key(agent)).in_flight += 1
+        service[mission_id] += agent["estimated_duration"]
+        remaining[mission_id] -= 1
+        selected.append({
+            "mission_id": mission_id,
+            "mission_path": by_id[mission_id]["path"],
+            "agent": agent
+        })
+
+    return selected
+
+
+def dispatch(selected: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """선택된 에이전트를 시작 처리하고 OpenClaw 명령어 반환 (업스트림 출력 주입)"""
+    dispatched: list[dict[str, Any]] = []
+
+    for s in selected:
+        agent: dict[str, Any] = s["agent"]
+        cmd: dict[str, Any] = agent["command"]
+        with span(s["mission_path"], "dispatch", {"agent.id": agent["id"], "pool": agent_pool_key(agent)}):
+            params: dict[str, Any] = resolve_command_params(s["mission_path"], cmd, agent.get("upstream"))
+            record_agent_started(s["mission_path"], agent["id"], {
+                "type": agent["type"],
+                "model": agent["model"],
+                "prompt_tokens": estimate_tokens(params.get("task") or params.get("message") or ""),
+                "scheduler": True
+            })
+        dispatched.append({
+            "mission_id": s["mission_id"],
+            "agent_id": agent["id"],
+            "pool": agent_pool_key(agent),
+            "command": {"type": cmd["type"], "params": params},
+            "code": format_spawn_code(params) if cmd["type"] == "spawn" else format_send_code(params)
+        })
+
+    return dispatched
+
+
+def print_queue_status(missions: list[dict[str, Any]]) -> None:
+    """미션별 큐 상태 출력"""
+    print("\n" + "="*70)
+    print("🦸 AVENGERS SCHEDULER - 미션 큐")
+    print("="*70)
+
+    if not missions:
+        print("실행 중인 미션 없음")
+
+    for m in missions:
+        counts: dict[str, int] = {}
+        for state in m["states"].values():
+            counts[state] = counts.get(state, 0) + 1
+        print(f"  {m['mission']['id']} [{m['mission'].get('priority', DEFAULT_MISSION_PRIORITY)} x{m['weight']}] "
+              f"done {counts.get('done', 0)} / running {counts.get('running', 0)} / "
+              f"ready {counts.get('ready', 0)} / blocked {counts.get('blocked', 0)}")
+
+    print("="*70)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Scheduler")
+    parser.add_argument("--next", "-n", type=int, nargs="?", const=0, help="다음 디스패치 대상 선택 (개수, 생략 시 용량만큼)")
+    parser.add_argument("--dry-run", "-d", action="store_true", help="선택만 하고 시작 기록은 남기지 않음")
+    parser.add_argument("--set-priority", nargs=2, metavar=("MISSION", "PRIORITY"), help="미션 우선순위 변경")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.set_priority:
+        mission_id, priority = args.set_priority
+        if priority not in MISSION_PRIORITIES:
+            print(f"❌ 오류: 우선순위는 {', '.join(MISSION_PRIORITIES)} 중 하나")
+            sys.exit(1)
+        try:
+            mission, _ = load_mission_only(mission_id, writable=True)
+        except (MissionNotFoundError, InvalidMissionError, ArchivedMissionError) as e:
+            print(f"❌ 오류: {e}")
+            sys.exit(1)
+        update_mission_status(Path(mission["path"]), mission["status"], {"priority": priority})
+        print(f"✅ {mission_id} 우선순위: {priority}")
+        return
+
+    missions: list[dict[str, Any]] = load_active_missions()
+
+    if args.next is not None and not args.dry_run:
+        # 새로 도착한 출력을 먼저 검증해 불량 결과는 즉시 재디스패치 대상으로
+        rejected: int = 0
+        for m in missions:
+            rejected += sum(1 for r in validate_mission_outputs(m["path"], m["plan"]) if r.get("rejected"))
+        if rejected:
+            missions = load_active_missions()
+
+    if args.next is None:
+        if args.json:
+            print(json.dumps([
+                {"mission_id": m["mission"]["id"], "weight": m["weight"], "states": m["states"]}
+                for m in missions
+            ], indent=2, ensure_ascii=False))
+        else:
+            print_queue_status(missions)
+        return
+
+    selected = schedule_next(missions, args.next or None)
+    if args.dry_run:
+        result = [{"mission_id": s["mission_id"], "agent_id": s["agent"]["id"]} for s in selected]
+    else:
+        result = dispatch(selected)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    if not result:
+        print("⏳ 디스패치 가능한 에이전트 없음 (용량 포화, 호출 속도 제한 또는 의존성 대기)")
+    for r in result:
+        print(f"// {r['mission_id']} / {r['agent_id']}")
+        if "code" in r:
+            print(r["code"])
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Search Script
+미션 태스크/에이전트/출력/로그 전문 검색 (SQLite FTS5 인덱스)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import MISSION_DIR, SEARCH_INDEX_FILE, SEARCH_DEFAULT_LIMIT
+    from utils import read_log_events
+    from archive import load_archive_index
+except ImportError:
+    from .config import MISSION_DIR, SEARCH_INDEX_FILE, SEARCH_DEFAULT_LIMIT
+    from .utils import read_log_events
+    from .archive import load_archive_index
+
+
+KINDS: tuple[str, ...] = ("task", "agent", "output", "log")
+
+SCHEMA: str = """
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    mission_id UNINDEXED, kind UNINDEXED, ref UNINDEXED, title, body,
+    tokenize = 'unicode61'
+);
+CREATE TABLE IF NOT EXISTS indexed (
+    mission_id TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+"""
+
+TOKEN_RE: re.Pattern = re.compile(r"\w+")
+
+
+def open_index(index_path: Optional[Path] = None) -> sqlite3.Connection:
+    """인덱스 DB 열기 (없으면 생성)"""
+    path: Path = index_path or SEARCH_INDEX_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn: sqlite3.Connection = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def mission_signature(mission_path: Path) -> str:
+    """미션 디렉토리 상태 지문 (파일별 mtime/size) - 바뀌었을 때만 재색인"""
+    parts: list[str] = []
+    for rel in ("mission.json", "execution_plan.json", "logs/execution.jsonl"):
+        try:
+            stat = os.stat(mission_path / rel)
+            parts.append(f"{rel}:{stat.st_mtime_ns}:{stat.st_size}")
+        except FileNotFoundError:
+            continue
+
+    outputs_dir: Path = mission_path / "outputs"
+    if outputs_dir.exists():
+        for entry in sorted(os.scandir(outputs_dir), key=lambda e: e.name):
+            if entry.is_file() and entry.name.endswith(".md"):
+                stat = entry.stat()
+                parts.append(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size}")
+
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def mission_documents(mission_path: Path) -> list[tuple[str, str, str, str]]:
+    """미션 하나의 색인 문서 (kind, ref, title, body)"""
+    with open(mission_path / "mission.json") as f:
+        mission: dict[str, Any] = json.load(f)
+
+    docs: list[tuple[str, str, str, str]] = [("task", mission["id"], mission["id"], mission.get("task", ""))]
+
+    plan: dict[str, Any] = {}
+    try:
+        with open(mission_path / "execution_plan.json") as f:
+            plan = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    agent_types: dict[str, str] = {
+        a["id"]: a["type"] for phase in plan.get("phases", []) for a in phase["agents"]
+    }
+    for cmd in plan.get("commands", []):
+        agent_id: str = cmd["agent_id"]
+        params: dict[str, Any] = cmd.get("params", {})
+        title: str = f"{agent_id} ({agent_types[agent_id]})" if agent_id in agent_types else agent_id
+        docs.append(("agent", agent_id, title, params.get("task") or params.get("message") or ""))
+
+    outputs_dir: Path = mission_path / "outputs"
+    if outputs_dir.exists():
+        for output_file in sorted(outputs_dir.glob("*.md")):
+            content: str = output_file.read_bytes().decode("utf-8", errors="replace")
+            docs.append(("output", output_file.stem, output_file.stem, content))
+
+    for e in read_log_events(mission_path):
+        docs.append(("log", e.get("timestamp", ""), e["event"], json.dumps(e.get("data", {}), ensure_ascii=False)))
+
+    return docs
+
+
+def index_mission(conn: sqlite3.Connection, mission_path: Path, force: bool = False) -> bool:
+    """
+    미션 하나 (재)색인
+
+    Returns:
+        실제로 색인했는지 (지문이 같아 건너뛰면 False)
+    """
+    mission_id: str = mission_path.name
+    signature: str = mission_signature(mission_path)
+    row = conn.execute("SELECT signature FROM indexed WHERE mission_id = ?", (mission_id,)).fetchone()
+    if row and row[0] == signature and not force:
+        return False
+
+    docs = mission_documents(mission_path)
+    with conn:
+        conn.execute("DELETE FROM docs WHERE mission_id = ?", (mission_id,))
+        conn.executemany(
+            "INSERT INTO docs (mission_id, kind, ref, title, body) VALUES (?, ?, ?, ?, ?)",
+            [(mission_id, *doc) for doc in docs]
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO indexed (mission_id, signature, indexed_at) VALUES (?, ?, ?)",
+            (mission_id, signature, datetime.now().isoformat())
+        )
+    return True
+
+
+def index_all(conn: sqlite3.Connection, mission_dir: Optional[Path] = None,
+              force: bool = False, archive_dir: Optional[Path] = None) -> dict[str, int]:
+    """전체 미션 증분 색인 (보관되지 않고 사라진 미션은 인덱스에서 제거)"""
+    root: Path = mission_dir or MISSION_DIR
+    present: set[str] = set()
+    indexed: int = 0
+
+    if root.exists():
+        for mission_path in sorted(p for p in root.iterdir() if p.is_dir()):
+            if not (mission_path / "mission.json").exists():
+                continue
+            present.add(mission_path.name)
+            try:
+                indexed += index_mission(conn, mission_path, force)
+            except json.JSONDecodeError:
+                continue
+
+    # 보관된 미션은 디렉토리가 없어도 검색 대상으로 유지
+    present |= set(load_archive_index(archive_dir))
+    stale: list[str] = [
+        mid for (mid,) in conn.execute("SELECT mission_id FROM indexed") if mid not in present
+    ]
+    with conn:
+        for mission_id in stale:
+            conn.execute("DELETE FROM docs WHERE mission_id = ?", (mission_id,))
+            conn.execute("DELETE FROM indexed WHERE mission_id = ?", (mission_id,))
+
+    return {"missions": len(present), "indexed": indexed, "removed": len(stale)}
+
+
+def update_index(mission_path: Path, index_path: Optional[Path] = None) -> bool:
+    """미션 하나의 인덱스 갱신 (consolidate 후 호출)"""
+    conn = open_index(index_path)
+    try:
+        return index_mission(conn, mission_path)
+    finally:
+        conn.close()
+
+
+def build_query(text: str) -> str:
+    """
+    일반 검색어를 FTS5 질의로 변환
+
+    단어마다 접두사 검색을 적용해 조사가 붙은 한국어("경쟁사를")도 찾는다.
+    따옴표/연산자가 있으면 FTS5 문법으로 보고 그대로 쓴다.
+    """
+    if re.search(r'["*()]|\b(AND|OR|NOT|NEAR)\b', text):
+        return text
+    return " ".join(f'"{token}"*' for token in TOKEN_RE.findall(text))
+
+
+def search(conn: sqlite3.Connection, text: str, limit: int = SEARCH_DEFAULT_LIMIT,
+           kind: Optional[str] = None, mission_id: Optional[str] = None) -> list[dict[str, Any]]:
+    """BM25 순위 검색"""
+    query: str = build_query(text)
+    if not query:
+        return []
+
+    sql: str = (
+        "SELECT mission_id, kind, ref, title, snippet(docs, 4, '[', ']', '…', 12), bm25(docs) "
+        "FROM docs WHERE docs MATCH ?"
+    )
+    params: list[Any] = [query]
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    if mission_id:
+        sql += " AND mission_id = ?"
+        params.append(mission_id)
+    sql += " ORDER BY bm25(docs) LIMIT ?"
+    params.append(limit)
+
+    return [
+        {"mission_id": m, "kind": k, "ref": r, "title": t, "snippet": s, "score": round(-score, 3)}
+        for m, k, r, t, s, score in conn.execute(sql, params)
+    ]
+
+
+def print_hits(query: str, hits: list[dict[str, Any]], elapsed_ms: float) -> None:
+    """검색 결과 출력"""
+    print(f"\n🔎 '{query}' — {len(hits)}건 ({elapsed_ms:.1f}ms)")
+    for h in hits:
+        print(f"   [{h['kind']}] {h['mission_id']} / {h['title']}  ({h['score']})")
+        print(f"      {' '.join(h['snippet'].split())}")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Search")
+    parser.add_argument("query", nargs="?", help="검색어 (FTS5 문법 지원)")
+    parser.add_argument("--reindex", "-r", action="store_true", help="전체 미션 증분 색인")
+    parser.add_argument("--force", "-f", action="store_true", help="변경 여부와 상관없이 재색인")
+    parser.add_argument("--mission", "-m", help="해당 미션으로 검색 범위 제한")
+    parser.add_argument("--kind", "-k", choices=KINDS, help="문서 종류 제한")
+    parser.add_argument("--limit", "-n", type=int, default=SEARCH_DEFAULT_LIMIT, help="최대 결과 수")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if not args.query and not args.reindex:
+        parser.print_help()
+        sys.exit(1)
+
+    conn = open_index()
+    try:
+        if args.reindex:
+            stats = index_all(conn, force=args.force)
+            if not args.query:
+                if args.json:
+                    print(json.dumps(stats, indent=2, ensure_ascii=False))
+                else:
+                    print(f"📚 색인 완료: 미션 {stats['missions']} / 갱신 {stats['indexed']} / 제거 {stats['removed']}")
+                return
+
+        start = time.perf_counter()
+        try:
+            hits = search(conn, args.query, args.limit, args.kind, args.mission)
+        except sqlite3.OperationalError as e:
+            print(f"❌ 오류: 검색어를 해석할 수 없습니다: {e}")
+            sys.exit(1)
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(hits, indent=2, ensure_ascii=False))
+    else:
+        print_hits(args.query, hits, elapsed_ms)
+
+
+if __name__ == "__main__":
+    main()
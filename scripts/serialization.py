@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Serialization
+미션/실행 계획 JSON 읽기·쓰기 (orjson 우선, 표준 json 대체) 및 구조 검증
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional, TypedDict, Union, get_args, get_origin, get_type_hints
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from config import JSON_BACKEND, JSON_PRETTY, JSON_VALIDATE
+except ImportError:
+    from .config import JSON_BACKEND, JSON_PRETTY, JSON_VALIDATE
+
+
+class SchemaError(ValueError):
+    """JSON 구조가 스키마와 맞지 않을 때 (json.JSONDecodeError와 같이 ValueError로 처리 가능)"""
+    pass
+
+
+# ── 스키마 ──────────────────────────────────────────────────
+# 필수 키는 기반 클래스, 선택 키는 total=False 하위 클래스에 둔다.
+# 여기 없는 키도 허용하며 그대로 보존한다 (검증만 하고 변환하지 않음).
+
+class _AgentRequired(TypedDict):
+    id: str
+
+
+class AgentSchema(_AgentRequired, total=False):
+    type: str
+    mode: str
+    model: Optional[str]
+    dependencies: list[str]
+
+
+class PhaseSchema(TypedDict):
+    phase: int
+    agents: list[AgentSchema]
+
+
+class CommandSchema(TypedDict):
+    agent_id: str
+    type: str
+    params: dict[str, Any]
+
+
+class _PlanRequired(TypedDict):
+    phases: list[PhaseSchema]
+    commands: list[CommandSchema]
+
+
+class PlanSchema(_PlanRequired, total=False):
+    mission_id: str
+    total_agents: int
+    completed_agents: list[str]
+    fingerprints: dict[str, str]
+    completion_marker: bool
+
+
+class _MissionRequired(TypedDict):
+    id: str
+    status: str
+
+
+class MissionSchema(_MissionRequired, total=False):
+    path: str
+    task: str
+    priority: str
+    created_at: str
+    updated_at: str
+
+
+# ── 인코딩/디코딩 ───────────────────────────────────────────
+
+def _dumps_json(obj: Any, pretty: bool) -> bytes:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _dumps_orjson(obj: Any, pretty: bool) -> bytes:
+    option: int = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    return orjson.dumps(obj, option=option)
+
+
+DECODERS: dict[str, Callable[[Union[bytes, str]], Any]] = {"json": json.loads}
+ENCODERS: dict[str, Callable[[Any, bool], bytes]] = {"json": _dumps_json}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+    ENCODERS["orjson"] = _dumps_orjson
+
+BACKEND: str = JSON_BACKEND if JSON_BACKEND in DECODERS else ("orjson" if orjson is not None else "json")
+
+
+def loads(data: Union[bytes, str], backend: Optional[str] = None) -> Any:
+    """JSON 디코딩 (문법 오류는 json.JSONDecodeError - orjson 오류도 그 하위 클래스)"""
+    return DECODERS[backend or BACKEND](data)
+
+
+def dumps(obj: Any, pretty: bool = False, backend: Optional[str] = None) -> bytes:
+    """JSON 인코딩 (UTF-8, 비ASCII 문자 그대로, 문자열이 아닌 키는 문자열로)"""
+    return ENCODERS[backend or BACKEND](obj, pretty)
+
+
+# ── 검증 ───────────────────────────────────────────────────
+
+Checker = Callable[[Any, str], None]
+
+
+def _fail(where: str, expected: str, value: Any) -> None:
+    raise SchemaError(f"{where}: {expected} 필요 ({type(value).__name__})")
+
+
+def compile_schema(tp: Any) -> Checker:
+    """
+    타입 주석 → 검사 함수
+
+    TypedDict, list[...], dict[...], Optional/Union, str/int/float/bool, Any를 지원한다.
+    큰 계획을 매번 해석하지 않도록 스키마마다 한 번만 만들어 둔다.
+    """
+    if tp is Any:
+        return lambda value, where: None
+
+    if isinstance(tp, type) and hasattr(tp, "__required_keys__"):
+        required: frozenset = tp.__required_keys__
+        fields: dict[str, Checker] = {k: compile_schema(t) for k, t in get_type_hints(tp).items()}
+
+        def check_dict(value: Any, where: str) -> None:
+            if not isinstance(value, dict):
+                _fail(where, "객체", value)
+            missing = required - value.keys()
+            if missing:
+                raise SchemaError(f"{where}: 필수 키 누락 {sorted(missing)}")
+            for key, check in fields.items():
+                if key in value:
+                    check(value[key], f"{where}.{key}")
+        return check_dict
+
+    origin = get_origin(tp)
+    args: tuple = get_args(tp)
+
+    if origin is Union:
+        nullable: bool = type(None) in args
+        options: list[Checker] = [compile_schema(a) for a in args if a is not type(None)]
+
+        def check_union(value: Any, where: str) -> None:
+            if value is None and nullable:
+                return
+            errors: list[str] = []
+            for check in options:
+                try:
+                    check(value, where)
+                    return
+                except SchemaError as e:
+                    errors.append(str(e))
+            raise SchemaError(errors[0] if len(errors) == 1 else f"{where}: {' / '.join(errors)}")
+        return check_union
+
+    if origin is list:
+        item: Optional[Checker] = compile_schema(args[0]) if args and args[0] is not Any else None
+
+        def check_list(value: Any, where: str) -> None:
+            if not isinstance(value, list):
+                _fail(where, "배열", value)
+            if item is not None:
+                for i, v in enumerate(value):
+                    item(v, f"{where}[{i}]")
+        return check_list
+
+    if origin is dict or tp is dict:
+        return lambda value, where: None if isinstance(value, dict) else _fail(where, "객체", value)
+
+    if tp is int:
+        return lambda value, where: (
+            None if isinstance(value, int) and not isinstance(value, bool) else _fail(where, "정수", value)
+        )
+    if tp is float:
+        return lambda value, where: (
+            None if isinstance(value, (int, float)) and not isinstance(value, bool) else _fail(where, "숫자", value)
+        )
+    if tp in (str, bool):
+        name: str = {str: "문자열", bool: "불리언"}[tp]
+        return lambda value, where: None if isinstance(value, tp) else _fail(where, name, value)
+
+    raise TypeError(f"지원하지 않는 스키마 타입: {tp!r}")
+
+
+_checkers: dict[type, Checker] = {}
+
+
+def validate(value: Any, schema: type) -> None:
+    """
+    디코딩된 값의 스키마 검증 (실패 시 SchemaError)
+
+    msgspec이 있으면 msgspec.convert가 이미 파싱된 값을 C 구현으로 검사하고(다시 파싱하지 않음),
+    없으면 compile_schema 검사 함수가 순회한다. 검증 전용이라 구조체를 만들어 돌려주지 않는다:
+    스키마가 TypedDict라 변환 결과도 일반 dict이고 스키마에 없는 키가 빠지므로 버린다.
+    """
+    if msgspec is not None:
+        try:
+            msgspec.convert(value, schema)
+        except msgspec.ValidationError as e:
+            raise SchemaError(str(e)) from None
+        return
+
+    checker: Optional[Checker] = _checkers.get(schema)
+    if checker is None:
+        checker = _checkers[schema] = compile_schema(schema)
+    checker(value, "$")
+
+
+# ── 파일 ───────────────────────────────────────────────────
+
+def read_json(path: Path, schema: Optional[type] = None) -> Any:
+    """
+    JSON 파일 읽기 (+ 선택적 스키마 검증, AVENGERS_JSON_VALIDATE=0이면 생략)
+
+    Raises:
+        FileNotFoundError: 파일 없음
+        ValueError: 문법 오류(json.JSONDecodeError) 또는 구조 오류(SchemaError)
+    """
+    with open(path, "rb") as f:
+        data: Any = loads(f.read())
+    if schema is not None and JSON_VALIDATE:
+        validate(data, schema)
+    return data
+
+
+def write_json(path: Path, obj: Any, pretty: bool = JSON_PRETTY) -> None:
+    """JSON 파일 쓰기 (기본은 들여쓰기 없는 압축 형식, AVENGERS_JSON_PRETTY=1이면 들여쓰기)"""
+    data: bytes = dumps(obj, pretty)
+    with open(path, "wb") as f:
+        f.write(data)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Timeline Script
+실행 로그로 에이전트 타임라인(Gantt) 재구성, 병렬 효율/크리티컬 패스 분석
+"""
+
+import html
+import json
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from utils import load_mission, read_log_events
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from runtime_stats import collect_mission_samples
+    from dataflow import agent_dependencies
+except ImportError:
+    from .utils import load_mission, read_log_events
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .runtime_stats import collect_mission_samples
+    from .dataflow import agent_dependencies
+
+
+FORMATS: dict[str, str] = {"html": "timeline.html", "svg": "timeline.svg", "chrome": "timeline.trace.json"}
+
+TYPE_COLORS: dict[str, str] = {
+    "researcher": "#4e79a7",
+    "analyst": "#f28e2b",
+    "writer": "#59a14f",
+    "coder": "#e15759",
+    "reviewer": "#b07aa1",
+    "integrator": "#76b7b2"
+}
+DEFAULT_COLOR: str = "#9c9c9c"
+
+# SVG 레이아웃 (px)
+CHART_WIDTH: int = 900
+LABEL_WIDTH: int = 180
+ROW_HEIGHT: int = 22
+AXIS_HEIGHT: int = 30
+
+
+def agent_phases(plan: dict[str, Any]) -> dict[str, int]:
+    """에이전트별 Phase 번호"""
+    return {a["id"]: phase["phase"] for phase in plan.get("phases", []) for a in phase["agents"]}
+
+
+def build_timeline(mission_path: Path, plan: dict[str, Any]) -> dict[str, Any]:
+    """
+    에이전트 실행 구간 재구성
+
+    agent_started/agent_finished 이벤트(없으면 출력 파일 시각 추정)를 쓰고,
+    시각은 실행 시작(execution_started, 없으면 첫 에이전트 시작) 기준 초로 바꾼다.
+
+    Returns:
+        {"origin": epoch 초, "bars": [{"agent_id", "type", "model", "phase", "start", "end"}]}
+    """
+    samples: list[dict[str, Any]] = collect_mission_samples(mission_path, plan)
+    started = read_log_events(mission_path, "execution_started")
+    starts: list[float] = [s["started_at"] for s in samples]
+    if started:
+        starts.append(datetime.fromisoformat(started[0]["timestamp"]).timestamp())
+    origin: float = min(starts) if starts else 0.0
+
+    phases: dict[str, int] = agent_phases(plan)
+    order: dict[str, int] = {agent_id: i for i, agent_id in enumerate(phases)}
+    bars: list[dict[str, Any]] = [
+        {
+            "agent_id": s["agent_id"],
+            "type": s["type"],
+            "model": s["model"],
+            "phase": phases.get(s["agent_id"], 0),
+            "start": round(s["started_at"] - origin, 3),
+            "end": round(s["finished_at"] - origin, 3)
+        }
+        for s in samples
+    ]
+    bars.sort(key=lambda b: (b["phase"], b["start"], order.get(b["agent_id"], len(order))))
+
+    return {"origin": origin, "bars": bars}
+
+
+def critical_path(plan: dict[str, Any], durations: dict[str, float]) -> tuple[float, list[str]]:
+    """
+    실제 소요 시간 기준 크리티컬 패스 (의존성 DAG의 최장 경로)
+
+    의존성이 모두 즉시 충족됐다면 가능했던 최소 makespan이다.
+    실행 기록이 없는 에이전트는 0초로 본다.
+
+    Returns:
+        (길이(초), 경로 에이전트 ID 목록)
+    """
+    dependencies: dict[str, list[str]] = agent_dependencies(plan)
+    finish: dict[str, float] = {}
+    previous: dict[str, Optional[str]] = {}
+
+    # Phase 순서가 곧 위상 순서 (의존 대상은 항상 이전 Phase)
+    for agent_id in dependencies:
+        deps: list[str] = [d for d in dependencies[agent_id] if d in finish]
+        before: Optional[str] = max(deps, key=lambda d: finish[d]) if deps else None
+        finish[agent_id] = (finish[before] if before else 0.0) + durations.get(agent_id, 0.0)
+        previous[agent_id] = before
+
+    if not finish:
+        return 0.0, []
+
+    last: Optional[str] = max(finish, key=lambda a: finish[a])
+    length: float = finish[last]
+    path: list[str] = []
+    while last:
+        path.append(last)
+        last = previous[last]
+
+    return round(length, 3), path[::-1]
+
+
+def merge_intervals(intervals: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """겹치는 구간 병합"""
+    merged: list[tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def peak_concurrency(bars: list[dict[str, Any]]) -> int:
+    """동시에 실행 중이던 에이전트 최대 수"""
+    edges: list[tuple[float, int]] = sorted(
+        [(b["start"], 1) for b in bars] + [(b["end"], -1) for b in bars]
+    )
+    running: int = 0
+    peak: int = 0
+    for _, delta in edges:
+        running += delta
+        peak = max(peak, running)
+    return peak
+
+
+def timeline_stats(timeline: dict[str, Any], plan: dict[str, Any]) -> dict[str, Any]:
+    """
+    병렬 효율 분석
+
+    - utilization: 에이전트 실행 시간 합 / (makespan x 최대 동시 실행 수)
+    - phases: Phase별 구간, 실행 중인 에이전트가 없던 시간(idle), 이전 Phase 종료 후 대기(wait_before)
+    - critical_path: 실제 소요 시간으로 계산한 최장 의존 경로와 makespan 대비 비율
+    """
+    bars: list[dict[str, Any]] = timeline["bars"]
+    if not bars:
+        return {"agents": 0, "makespan": 0.0, "busy": 0.0, "parallelism": 0.0, "peak_concurrency": 0,
+                "utilization": 0.0, "phases": [],
+                "critical_path": {"length": 0.0, "agents": [], "efficiency": 0.0}}
+
+    makespan: float = max(b["end"] for b in bars)
+    busy: float = sum(b["end"] - b["start"] for b in bars)
+    peak: int = peak_concurrency(bars)
+
+    phases: list[dict[str, Any]] = []
+    previous_end: float = 0.0
+    for phase in sorted({b["phase"] for b in bars}):
+        phase_bars = [b for b in bars if b["phase"] == phase]
+        start: float = min(b["start"] for b in phase_bars)
+        end: float = max(b["end"] for b in phase_bars)
+        covered: float = sum(e - s for s, e in merge_intervals([(b["start"], b["end"]) for b in phase_bars]))
+        phases.append({
+            "phase": phase,
+            "agents": len(phase_bars),
+            "start": start,
+            "end": end,
+            "idle": round(end - start - covered, 3),
+            "wait_before": round(max(0.0, start - previous_end), 3)
+        })
+        previous_end = max(previous_end, end)
+
+    length, path = critical_path(plan, {b["agent_id"]: b["end"] - b["start"] for b in bars})
+
+    return {
+        "agents": len(bars),
+        "makespan": round(makespan, 3),
+        "busy": round(busy, 3),
+        "parallelism": round(busy / makespan, 3) if makespan else 0.0,
+        "peak_concurrency": peak,
+        "utilization": round(busy / (makespan * peak), 3) if makespan and peak else 0.0,
+        "phases": phases,
+        "critical_path": {
+            "length": length,
+            "agents": path,
+            "efficiency": round(length / makespan, 3) if makespan else 0.0
+        }
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """초 → 사람이 읽기 쉬운 길이 (90 → 1m30s)"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, secs = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+def render_svg(timeline: dict[str, Any], stats: dict[str, Any]) -> str:
+    """Gantt 차트 SVG (크리티컬 패스 에이전트는 테두리 강조)"""
+    bars: list[dict[str, Any]] = timeline["bars"]
+    makespan: float = stats["makespan"] or 1.0
+    scale: float = CHART_WIDTH / makespan
+    critical: set[str] = set(stats["critical_path"]["agents"])
+    width: int = LABEL_WIDTH + CHART_WIDTH + 20
+    height: int = AXIS_HEIGHT + ROW_HEIGHT * len(bars) + 10
+
+    parts: list[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="12">'
+    ]
+
+    # 시간 축 (10등분 눈금)
+    for i in range(11):
+        x: float = LABEL_WIDTH + CHART_WIDTH * i / 10
+        parts.append(f'<line x1="{x:.1f}" y1="{AXIS_HEIGHT - 5}" x2="{x:.1f}" y2="{height}" stroke="#e5e5e5"/>')
+        parts.append(f'<text x="{x:.1f}" y="{AXIS_HEIGHT - 10}" text-anchor="middle" fill="#666">'
+                     f'{format_seconds(makespan * i / 10)}</text>')
+
+    for row, b in enumerate(bars):
+        y: int = AXIS_HEIGHT + row * ROW_HEIGHT
+        x = LABEL_WIDTH + b["start"] * scale
+        w: float = max(1.0, (b["end"] - b["start"]) * scale)
+        stroke: str = ' stroke="#000" stroke-width="2"' if b["agent_id"] in critical else ""
+        title: str = html.escape(
+            f"{b['agent_id']} ({b['type']}, phase {b['phase']}): "
+            f"{format_seconds(b['start'])} → {format_seconds(b['end'])} ({format_seconds(b['end'] - b['start'])})"
+        )
+        parts.append(f'<text x="{LABEL_WIDTH - 8}" y="{y + ROW_HEIGHT - 7}" text-anchor="end">'
+                     f'{html.escape(b["agent_id"])}</text>')
+        parts.append(f'<rect x="{x:.1f}" y="{y + 3}" width="{w:.1f}" height="{ROW_HEIGHT - 6}" rx="3" '
+                     f'fill="{TYPE_COLORS.get(b["type"], DEFAULT_COLOR)}"{stroke}><title>{title}</title></rect>')
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def render_html(mission: dict[str, Any], timeline: dict[str, Any], stats: dict[str, Any]) -> str:
+    """SVG 차트와 분석 표를 담은 HTML 페이지"""
+    cp: dict[str, Any] = stats["critical_path"]
+    summary_rows: list[tuple[str, str]] = [
+        ("에이전트", str(stats["agents"])),
+        ("실제 makespan", format_seconds(stats["makespan"])),
+        ("크리티컬 패스", f"{format_seconds(cp['length'])} ({cp['efficiency']:.0%} of makespan)"),
+        ("평균 병렬도", f"{stats['parallelism']:.2f}"),
+        ("최대 동시 실행", str(stats["peak_concurrency"])),
+        ("활용률", f"{stats['utilization']:.0%}"),
+    ]
+    phase_rows: str = "\n".join(
+        f"<tr><td>{p['phase']}</td><td>{p['agents']}</td><td>{format_seconds(p['start'])}</td>"
+        f"<td>{format_seconds(p['end'])}</td><td>{format_seconds(p['wait_before'])}</td>"
+        f"<td>{format_seconds(p['idle'])}</td></tr>"
+        for p in stats["phases"]
+    )
+    legend: str = " ".join(
+        f'<span style="color:{color}">■</span> {agent_type}' for agent_type, color in TYPE_COLORS.items()
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>Timeline - {html.escape(mission['id'])}</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; margin: 12px 0; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 10px; text-align: left; }}
+</style>
+</head>
+<body>
+<h1>🦸 {html.escape(mission['id'])}</h1>
+<p>{html.escape(mission.get('task', ''))}</p>
+<table>
+{"".join(f"<tr><th>{k}</th><td>{html.escape(v)}</td></tr>" for k, v in summary_rows)}
+</table>
+<p>크리티컬 패스: {html.escape(" → ".join(cp["agents"]))}</p>
+<table>
+<tr><th>Phase</th><th>에이전트</th><th>시작</th><th>종료</th><th>이전 Phase 후 대기</th><th>유휴</th></tr>
+{phase_rows}
+</table>
+<p>{legend}</p>
+{render_svg(timeline, stats)}
+</body>
+</html>
+"""
+
+
+def to_chrome_trace(mission: dict[str, Any], timeline: dict[str, Any]) -> dict[str, Any]:
+    """Chrome trace-event JSON (chrome://tracing, Perfetto) - 에이전트마다 스레드 하나"""
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": mission["id"]}}
+    ]
+    for tid, b in enumerate(timeline["bars"], 1):
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": b["agent_id"]}})
+        events.append({
+            "name": b["agent_id"],
+            "cat": b["type"],
+            "ph": "X",
+            "pid": 1,
+            "tid": tid,
+            "ts": int(b["start"] * 1e6),
+            "dur": int((b["end"] - b["start"]) * 1e6),
+            "args": {"type": b["type"], "model": b["model"], "phase": b["phase"]}
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_timeline(mission: dict[str, Any], plan: dict[str, Any], fmt: str = "html",
+                    output_path: Optional[Path] = None) -> tuple[Path, dict[str, Any]]:
+    """
+    타임라인 파일 저장 (기본: reports/timeline.*)
+
+    Returns:
+        (파일 경로, 분석 결과) 튜플
+    """
+    mission_path: Path = Path(mission["path"])
+    timeline = build_timeline(mission_path, plan)
+    stats = timeline_stats(timeline, plan)
+
+    path: Path = output_path or mission_path / "reports" / FORMATS[fmt]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        if fmt == "chrome":
+            json.dump(to_chrome_trace(mission, timeline), f, ensure_ascii=False)
+        elif fmt == "svg":
+            f.write(render_svg(timeline, stats))
+        else:
+            f.write(render_html(mission, timeline, stats))
+
+    return path, stats
+
+
+def print_stats(mission_id: str, stats: dict[str, Any]) -> None:
+    """분석 결과 출력"""
+    cp: dict[str, Any] = stats["critical_path"]
+    print(f"\n📊 타임라인: {mission_id}")
+    print(f"   에이전트 {stats['agents']}개, makespan {format_seconds(stats['makespan'])}, "
+          f"크리티컬 패스 {format_seconds(cp['length'])} ({cp['efficiency']:.0%})")
+    print(f"   평균 병렬도 {stats['parallelism']:.2f} / 최대 {stats['peak_concurrency']} "
+          f"/ 활용률 {stats['utilization']:.0%}")
+    for p in stats["phases"]:
+        print(f"   Phase {p['phase']}: {format_seconds(p['start'])} → {format_seconds(p['end'])} "
+              f"(대기 {format_seconds(p['wait_before'])}, 유휴 {format_seconds(p['idle'])})")
+    if cp["agents"]:
+        print(f"   크리티컬 패스: {' → '.join(cp['agents'])}")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Timeline")
+    parser.add_argument("--mission", "-m", required=True, help="미션 ID")
+    parser.add_argument("--format", "-f", choices=list(FORMATS), default="html", help="출력 형식")
+    parser.add_argument("--output", "-o", help="출력 파일 경로 (기본: reports/timeline.*)")
+    parser.add_argument("--json", "-j", action="store_true", help="분석 결과만 JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        mission, plan = load_mission(args.mission, writable=not (args.json or args.output))
+    except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    if args.json:
+        timeline = build_timeline(Path(mission["path"]), plan)
+        print(json.dumps({**timeline, "stats": timeline_stats(timeline, plan)}, indent=2, ensure_ascii=False))
+        return
+
+    path, stats = export_timeline(mission, plan, args.format, Path(args.output) if args.output else None)
+    print_stats(args.mission, stats)
+    print(f"📄 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Tracing Script
+미션 수명주기 스팬 기록 및 OTLP 호환 JSON 내보내기
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import argparse
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    from utils import load_mission, log_event, read_log_events, mission_trace_id, current_span_id, active_span
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from runtime_stats import collect_mission_samples
+    from dataflow import agent_dependencies
+except ImportError:
+    from .utils import load_mission, log_event, read_log_events, mission_trace_id, current_span_id, active_span
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .runtime_stats import collect_mission_samples
+    from .dataflow import agent_dependencies
+
+
+SERVICE_NAME: str = "agent-avengers"
+QUEUE_MIN_SECONDS: float = 1.0  # 이보다 짧은 대기는 큐 스팬으로 만들지 않음
+
+# OTLP Status.code
+STATUS_OK: int = 1
+STATUS_ERROR: int = 2
+
+
+def new_span_id() -> str:
+    """임의 스팬 ID (16자리 hex)"""
+    return os.urandom(8).hex()
+
+
+def derived_span_id(mission_id: str, name: str) -> str:
+    """미션/이름에서 결정적으로 만든 스팬 ID (루트, 에이전트 스팬용)"""
+    return hashlib.sha256(f"{mission_id}:{name}".encode()).hexdigest()[:16]
+
+
+def root_span_id(mission_id: str) -> str:
+    """미션 루트 스팬 ID"""
+    return derived_span_id(mission_id, "mission")
+
+
+@contextmanager
+def span(mission_path: Path, name: str, attributes: Optional[dict[str, Any]] = None) -> Iterator[dict[str, Any]]:
+    """
+    스팬 기록 컨텍스트
+
+    블록 안에서 남긴 log_event에는 이 스팬 ID가 붙고, 블록이 끝나면
+    "span" 이벤트로 시작/종료 시각과 부모 스팬이 기록된다.
+    바깥에 열린 스팬이 없으면 미션 루트 스팬의 자식이 된다.
+
+    Yields:
+        attributes 딕셔너리 (블록 안에서 속성 추가 가능)
+    """
+    parent_id: str = current_span_id() or root_span_id(mission_path.name)
+    span_id: str = new_span_id()
+    attrs: dict[str, Any] = dict(attributes or {})
+    start: float = time.time()
+    status: str = "ok"
+
+    try:
+        with active_span(span_id):
+            yield attrs
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        log_event(mission_path, "span", {
+            "span_id": span_id,
+            "parent_span_id": parent_id,
+            "name": name,
+            "start": start,
+            "end": time.time(),
+            "status": status,
+            "attributes": attrs
+        })
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """ISO 시각 → epoch 초"""
+    try:
+        return datetime.fromisoformat(value).timestamp() if value else None
+    except ValueError:
+        return None
+
+
+def build_spans(mission: dict[str, Any], plan: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    미션 로그에서 스팬 목록 재구성
+
+    기록된 span 이벤트에 더해 에이전트 실행(agent_started/agent_finished, 없으면
+    출력 시각 추정)과 큐 대기(실행 가능해진 시각 → 시작 시각) 스팬을 만든다.
+    루트 스팬은 미션 생성부터 마지막 스팬 종료까지다.
+    """
+    mission_path: Path = Path(mission["path"])
+    mission_id: str = mission["id"]
+    root_id: str = root_span_id(mission_id)
+    spans: list[dict[str, Any]] = []
+
+    for e in read_log_events(mission_path, "span"):
+        spans.append(dict(e["data"]))
+
+    samples: list[dict[str, Any]] = collect_mission_samples(mission_path, plan)
+    finished: dict[str, float] = {s["agent_id"]: s["finished_at"] for s in samples}
+    started_events = read_log_events(mission_path, "execution_started")
+    execution_start: Optional[float] = _timestamp(started_events[0]["timestamp"]) if started_events else None
+    dependencies: dict[str, list[str]] = agent_dependencies(plan)
+
+    for s in samples:
+        agent_span_id: str = derived_span_id(mission_id, s["agent_id"])
+        spans.append({
+            "span_id": agent_span_id,
+            "parent_span_id": root_id,
+            "name": f"agent {s['agent_id']}",
+            "start": s["started_at"],
+            "end": s["finished_at"],
+            "status": "ok",
+            "attributes": {"agent.id": s["agent_id"], "agent.type": s["type"], "agent.model": s["model"] or ""}
+        })
+
+        # 큐 대기: 실행 시작 또는 마지막 의존 에이전트 종료부터 실제 시작까지
+        ready_times: list[float] = [finished[d] for d in dependencies.get(s["agent_id"], []) if d in finished]
+        if execution_start is not None:
+            ready_times.append(execution_start)
+        ready: Optional[float] = max(ready_times) if ready_times else None
+        if ready is not None and s["started_at"] - ready >= QUEUE_MIN_SECONDS:
+            spans.append({
+                "span_id": derived_span_id(mission_id, f"queue:{s['agent_id']}"),
+                "parent_span_id": root_id,
+                "name": f"queue {s['agent_id']}",
+                "start": ready,
+                "end": s["started_at"],
+                "status": "ok",
+                "attributes": {"agent.id": s["agent_id"], "queue.wait_seconds": round(s["started_at"] - ready, 3)}
+            })
+
+    created: Optional[float] = _timestamp(mission.get("created_at"))
+    starts: list[float] = [sp["start"] for sp in spans] + ([created] if created else [])
+    ends: list[float] = [sp["end"] for sp in spans] + [
+        t for t in (_timestamp(mission.get("completed_at")),) if t
+    ]
+    if starts and ends:
+        spans.insert(0, {
+            "span_id": root_id,
+            "parent_span_id": None,
+            "name": f"mission {mission_id}",
+            "start": min(starts),
+            "end": max(ends),
+            "status": "ok",
+            "attributes": {"mission.id": mission_id, "mission.status": mission.get("status", "")}
+        })
+
+    return spans
+
+
+def otlp_value(value: Any) -> dict[str, Any]:
+    """파이썬 값 → OTLP AnyValue"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": k, "value": otlp_value(v)} for k, v in attributes.items() if v is not None]
+
+
+def to_otlp(mission: dict[str, Any], spans: list[dict[str, Any]]) -> dict[str, Any]:
+    """스팬 목록 → OTLP/JSON ExportTraceServiceRequest"""
+    trace_id: str = mission_trace_id(mission["id"])
+    otlp_spans: list[dict[str, Any]] = []
+
+    for sp in spans:
+        otlp_span: dict[str, Any] = {
+            "traceId": trace_id,
+            "spanId": sp["span_id"],
+            "name": sp["name"],
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(int(sp["start"] * 1e9)),
+            "endTimeUnixNano": str(int(sp["end"] * 1e9)),
+            "attributes": otlp_attributes(sp.get("attributes", {})),
+            "status": {"code": STATUS_ERROR if sp.get("status") == "error" else STATUS_OK}
+        }
+        if sp.get("parent_span_id"):
+            otlp_span["parentSpanId"] = sp["parent_span_id"]
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": otlp_attributes({"service.name": SERVICE_NAME, "mission.id": mission["id"]})},
+            "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": otlp_spans}]
+        }]
+    }
+
+
+def export_trace(mission: dict[str, Any], plan: dict[str, Any],
+                 output_path: Optional[Path] = None) -> tuple[Path, int]:
+    """
+    미션 트레이스를 OTLP JSON 파일로 내보내기 (기본: logs/trace.otlp.json)
+
+    Returns:
+        (파일 경로, 스팬 수) 튜플
+    """
+    spans: list[dict[str, Any]] = build_spans(mission, plan)
+    path: Path = output_path or Path(mission["path"]) / "logs" / "trace.otlp.json"
+    with open(path, "w") as f:
+        json.dump(to_otlp(mission, spans), f, ensure_ascii=False)
+    return path, len(spans)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Tracing")
+    parser.add_argument("--mission", "-m", required=True, help="미션 ID")
+    parser.add_argument("--output", "-o", help="출력 파일 경로 (기본: logs/trace.otlp.json)")
+    parser.add_argument("--json", "-j", action="store_true", help="OTLP JSON을 표준 출력으로")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        mission, plan = load_mission(args.mission, writable=not (args.json or args.output))
+    except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(to_otlp(mission, build_spans(mission, plan)), indent=2, ensure_ascii=False))
+        return
+
+    path, count = export_trace(mission, plan, Path(args.output) if args.output else None)
+    print(f"\n🧵 트레이스 내보내기: {args.mission}")
+    print(f"   trace_id: {mission_trace_id(mission['id'])}")
+    print(f"   스팬: {count}개")
+    print(f"📄 {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,116 @@ Agent Avengers - Utilities
 공통 유틸리티 함수
 """
 
+import hashlib
 import json
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 try:
-    from config import MISSION_DIR
-    from exceptions import MissionNotFoundError, PlanNotFoundError, InvalidMissionError
+    from config import MISSION_DIR, ARCHIVE_EXTRACTED_MARKER
+    from exceptions import MissionNotFoundError, PlanNotFoundError, InvalidMissionError, ArchivedMissionError
+    from serialization import MissionSchema, PlanSchema, dumps, loads, read_json, write_json
 except ImportError:
-    from .config import MISSION_DIR
-    from .exceptions import MissionNotFoundError, PlanNotFoundError, InvalidMissionError
+    from .config import MISSION_DIR, ARCHIVE_EXTRACTED_MARKER
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, InvalidMissionError, ArchivedMissionError
+    from .serialization import MissionSchema, PlanSchema, dumps, loads, read_json, write_json
 
 
-def load_mission(mission_id: str) -> tuple[dict[str, Any], dict[str, Any]]:
+# 현재 열린 트레이싱 스팬 ID (tracing.span이 설정, log_event가 기록)
+CURRENT_SPAN: ContextVar[Optional[str]] = ContextVar("avengers_current_span", default=None)
+
+
+def mission_trace_id(mission_id: str) -> str:
+    """미션 트레이스 ID (W3C/OTLP 형식 32자리 hex, 미션 ID에서 결정적으로 생성)"""
+    return hashlib.sha256(mission_id.encode()).hexdigest()[:32]
+
+
+def current_span_id() -> Optional[str]:
+    """현재 열린 스팬 ID (없으면 None)"""
+    return CURRENT_SPAN.get()
+
+
+@contextmanager
+def active_span(span_id: str) -> Iterator[None]:
+    """블록 안에서 span_id를 현재 스팬으로 설정"""
+    token = CURRENT_SPAN.set(span_id)
+    try:
+        yield
+    finally:
+        CURRENT_SPAN.reset(token)
+
+
+def resolve_mission_path(mission_id: str) -> tuple[Path, bool]:
+    """
+    미션 디렉토리 경로
+
+    Returns:
+        (경로, 보관 여부) 튜플. 보관된 미션은 읽기용 캐시에 풀어서 그 경로를 반환한다.
+    """
+    mission_path = MISSION_DIR / mission_id
+    if not (mission_path / "mission.json").exists():
+        # 보관본 조회에만 필요한 zipfile/shutil은 여기서 불러온다
+        try:
+            from archive import extract_archived
+        except ImportError:
+            from .archive import extract_archived
+        extracted = extract_archived(mission_id)
+        if extracted is not None:
+            return extracted, True
+    return mission_path, False
+
+
+def archived_error(mission_id: str) -> ArchivedMissionError:
+    """보관된 미션 쓰기 시도 예외 (복원 방법 안내 포함)"""
+    return ArchivedMissionError(
+        f"보관된 미션은 수정할 수 없습니다: {mission_id} - 먼저 복원하세요 (`archive.py --restore {mission_id}`)"
+    )
+
+
+def ensure_writable(mission_path: Path) -> None:
+    """
+    쓰기 전 확인: 보관본 읽기용 캐시에 풀린 미션이면 ArchivedMissionError
+
+    캐시에 쓴 내용은 보관본에 반영되지 않고 사라지므로 조용히 쓰지 않는다.
+    """
+    if (mission_path / ARCHIVE_EXTRACTED_MARKER).exists():
+        raise archived_error(mission_path.name)
+
+
+def _read_mission_file(mission_id: str, writable: bool = False) -> tuple[dict[str, Any], Path]:
+    """
+    mission.json 로드 (보관된 미션이면 path를 캐시 경로로 바꾸고 archived 표시)
+
+    writable이면 보관된 미션은 ArchivedMissionError (읽기 전용 명령만 보관본을 연다).
+    """
+    mission_path, archived = resolve_mission_path(mission_id)
+    if archived and writable:
+        raise archived_error(mission_id)
+
+    try:
+        mission = read_json(mission_path / "mission.json", MissionSchema)
+    except FileNotFoundError:
+        raise MissionNotFoundError(f"미션을 찾을 수 없습니다: {mission_id}")
+    except ValueError as e:
+        raise InvalidMissionError(f"미션 파일이 유효하지 않습니다: {e}")
+
+    if archived:
+        mission["path"] = str(mission_path)
+        mission["archived"] = True
+
+    return mission, mission_path
+
+
+def load_mission(mission_id: str, writable: bool = False) -> tuple[dict[str, Any], dict[str, Any]]:
     """
     미션 및 실행 계획 로드
 
     Args:
         mission_id: 미션 ID
+        writable: 미션에 쓸 명령이면 True (보관된 미션은 ArchivedMissionError)
 
     Returns:
         (mission, plan) 튜플
@@ -30,33 +121,25 @@ def load_mission(mission_id: str) -> tuple[dict[str, Any], dict[str, Any]]:
     Note:
         plan 파일이 없으면 예외 발생 (execute.py, consolidate.py용)
     """
-    mission_path = MISSION_DIR / mission_id
+    mission, mission_path = _read_mission_file(mission_id, writable)
 
     try:
-        with open(mission_path / "mission.json") as f:
-            mission = json.load(f)
-    except FileNotFoundError:
-        raise MissionNotFoundError(f"미션을 찾을 수 없습니다: {mission_id}")
-    except json.JSONDecodeError as e:
-        raise InvalidMissionError(f"미션 파일이 유효하지 않습니다: {e}")
-
-    try:
-        with open(mission_path / "execution_plan.json") as f:
-            plan = json.load(f)
+        plan = read_json(mission_path / "execution_plan.json", PlanSchema)
     except FileNotFoundError:
         raise PlanNotFoundError(f"실행 계획을 찾을 수 없습니다: {mission_id}")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise InvalidMissionError(f"실행 계획 파일이 유효하지 않습니다: {e}")
 
     return mission, plan
 
 
-def load_mission_only(mission_id: str) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+def load_mission_only(mission_id: str, writable: bool = False) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
     """
     미션 로드 (plan은 Optional)
 
     Args:
         mission_id: 미션 ID
+        writable: 미션에 쓸 명령이면 True (보관된 미션은 ArchivedMissionError)
 
     Returns:
         (mission, plan) 튜플 (plan은 None일 수 있음)
@@ -64,23 +147,14 @@ def load_mission_only(mission_id: str) -> tuple[dict[str, Any], Optional[dict[st
     Note:
         monitor.py용 - plan 파일이 없어도 동작
     """
-    mission_path = MISSION_DIR / mission_id
-
-    try:
-        with open(mission_path / "mission.json") as f:
-            mission = json.load(f)
-    except FileNotFoundError:
-        raise MissionNotFoundError(f"미션을 찾을 수 없습니다: {mission_id}")
-    except json.JSONDecodeError as e:
-        raise InvalidMissionError(f"미션 파일이 유효하지 않습니다: {e}")
+    mission, mission_path = _read_mission_file(mission_id, writable)
 
     plan_file = mission_path / "execution_plan.json"
     plan: Optional[dict[str, Any]] = None
     if plan_file.exists():
         try:
-            with open(plan_file) as f:
-                plan = json.load(f)
-        except json.JSONDecodeError as e:
+            plan = read_json(plan_file, PlanSchema)
+        except ValueError as e:
             raise InvalidMissionError(f"실행 계획 파일이 유효하지 않습니다: {e}")
 
     return mission, plan
@@ -95,12 +169,12 @@ def update_mission_status(mission_path: Path, status: str, updates: Optional[dic
         status: 새로운 상태
         updates: 추가로 업데이트할 필드들
     """
+    ensure_writable(mission_path)
     try:
-        with open(mission_path / "mission.json") as f:
-            mission = json.load(f)
+        mission = read_json(mission_path / "mission.json")
     except FileNotFoundError:
         raise MissionNotFoundError(f"미션을 찾을 수 없습니다: {mission_path}")
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise InvalidMissionError(f"미션 파일이 유효하지 않습니다: {e}")
 
     mission["status"] = status
@@ -109,8 +183,7 @@ def update_mission_status(mission_path: Path, status: str, updates: Optional[dic
     if updates:
         mission.update(updates)
 
-    with open(mission_path / "mission.json", "w") as f:
-        json.dump(mission, f, indent=2, ensure_ascii=False)
+    write_json(mission_path / "mission.json", mission)
 
 
 def log_event(mission_path: Path, event: str, data: Optional[dict[str, Any]] = None) -> None:
@@ -122,13 +195,70 @@ def log_event(mission_path: Path, event: str, data: Optional[dict[str, Any]] = N
         event: 이벤트 이름
         data: 이벤트 데이터
     """
+    ensure_writable(mission_path)
     log_file = mission_path / "logs" / "execution.jsonl"
 
     entry: dict[str, Any] = {
         "timestamp": datetime.now().isoformat(),
         "event": event,
-        "data": data or {}
+        "data": data or {},
+        "trace_id": mission_trace_id(mission_path.name)
     }
+    span_id = current_span_id()
+    if span_id:
+        entry["span_id"] = span_id
+
+    with open(log_file, "ab") as f:
+        f.write(dumps(entry) + b"\n")
+
+
+def read_log_events(mission_path: Path, event: Optional[str] = None) -> list[dict[str, Any]]:
+    """
+    실행 로그 전체 읽기
+
+    Args:
+        mission_path: 미션 디렉토리 경로
+        event: 지정 시 해당 이벤트만 반환
+
+    Returns:
+        로그 엔트리 목록 (기록 순서)
+    """
+    log_file = mission_path / "logs" / "execution.jsonl"
+
+    if not log_file.exists():
+        return []
+
+    entries: list[dict[str, Any]] = []
+    with open(log_file) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event is None or entry.get("event") == event:
+                entries.append(entry)
+
+    return entries
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    선형 보간 백분위 계산
+
+    Args:
+        values: 표본 값 목록 (비어있으면 안 됨)
+        pct: 0~100 사이 백분위
+
+    Returns:
+        백분위 값
+    """
+    if not values:
+        raise ValueError("percentile requires at least one value")
 
-    with open(log_file, "a") as f:
-        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * min(max(pct, 0.0), 100.0) / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Validation Script
+에이전트 출력 내용 검증 (규칙 플러그인) 및 불량 출력 조기 반려
+"""
+
+import json
+import os
+import re
+import sys
+import time
+import argparse
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    from config import (
+        COMPLETION_MARKER, HEDGE_SUFFIX, VALIDATION_RULES, VALIDATION_MIN_LENGTH,
+        VALIDATION_FORBIDDEN_PATTERNS, VALIDATION_TYPE_RULES, VALIDATION_SETTLE_SECONDS
+    )
+    from utils import load_mission, log_event, read_log_events
+    from exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from runtime_stats import record_agent_finished
+except ImportError:
+    from .config import (
+        COMPLETION_MARKER, HEDGE_SUFFIX, VALIDATION_RULES, VALIDATION_MIN_LENGTH,
+        VALIDATION_FORBIDDEN_PATTERNS, VALIDATION_TYPE_RULES, VALIDATION_SETTLE_SECONDS
+    )
+    from .utils import load_mission, log_event, read_log_events
+    from .exceptions import MissionNotFoundError, PlanNotFoundError, ArchivedMissionError
+    from .runtime_stats import record_agent_finished
+
+
+# 규칙: (출력 내용, 에이전트 스펙) -> 이슈 메시지 목록 (통과 시 빈 목록)
+ValidationRule = Callable[[str, dict[str, Any]], list[str]]
+
+RULES: dict[str, ValidationRule] = {}
+
+HEADING_RE: re.Pattern = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$", re.MULTILINE)
+
+
+def register_rule(name: str) -> Callable[[ValidationRule], ValidationRule]:
+    """검증 규칙 등록 데코레이터 (VALIDATION_RULES에 이름을 넣어 활성화)"""
+    def decorator(rule: ValidationRule) -> ValidationRule:
+        RULES[name] = rule
+        return rule
+    return decorator
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """정규식 컴파일 (캐시)"""
+    return re.compile(pattern, re.MULTILINE)
+
+
+def required_headings(expected_output: str) -> list[str]:
+    """기대 출력에 적힌 마크다운 헤딩 = 결과에 있어야 할 헤딩"""
+    return HEADING_RE.findall(expected_output or "")
+
+
+def agent_specs(plan: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """계획에서 에이전트별 검증 스펙 구성"""
+    phase_agents: dict[str, dict[str, Any]] = {
+        a["id"]: a for phase in plan.get("phases", []) for a in phase["agents"]
+    }
+    specs: dict[str, dict[str, Any]] = {}
+
+    for cmd in plan.get("commands", []):
+        agent_id: str = cmd["agent_id"]
+        agent: dict[str, Any] = phase_agents.get(agent_id, {})
+        agent_type: Optional[str] = agent.get("type")
+        specs[agent_id] = {
+            "agent_id": agent_id,
+            "type": agent_type,
+            "mode": "spawn" if cmd.get("type", "spawn") == "spawn" else "existing",
+            "required_headings": required_headings(agent.get("expected_output", "")),
+            "completion_marker": bool(plan.get("completion_marker")),
+            "rules": VALIDATION_TYPE_RULES.get(agent_type, {})
+        }
+
+    return specs
+
+
+@lru_cache(maxsize=4096)
+def marker_pattern(agent_id: str) -> re.Pattern:
+    """완료 마커 한 줄 정규식 (헤지 복제본이 채택되면 마커에 복제본 라벨이 남음)"""
+    return re.compile(
+        rf"^{re.escape(COMPLETION_MARKER)}: {re.escape(agent_id)}(?:{re.escape(HEDGE_SUFFIX)})?\s*$"
+    )
+
+
+def has_completion_marker(content: str, agent_id: str) -> bool:
+    """마지막 비어 있지 않은 줄이 이 에이전트의 완료 마커인지"""
+    stripped: str = content.rstrip()
+    last_line: str = stripped[stripped.rfind("\n") + 1:]
+    return marker_pattern(agent_id).match(last_line) is not None
+
+
+def output_complete(output_file: Path, agent_id: str, finished: bool, now: float,
+                    settle_seconds: float = VALIDATION_SETTLE_SECONDS, mtime: Optional[float] = None,
+                    content: Optional[str] = None) -> bool:
+    """
+    출력 파일이 다 쓰였는지
+
+    마지막 시작 이후 agent_finished가 기록됐거나, settle_seconds 동안 바뀌지 않았거나,
+    완료 마커 줄로 끝나면 다 쓴 것으로 본다. mtime/content를 넘기면 파일을 다시 읽지 않는다.
+    """
+    if finished:
+        return True
+    if now - (output_file.stat().st_mtime if mtime is None else mtime) >= settle_seconds:
+        return True
+    if content is None:
+        content = output_file.read_bytes().decode("utf-8", errors="replace")
+    return has_completion_marker(content, agent_id)
+
+
+@register_rule("completion_marker")
+def check_completion_marker(content: str, spec: dict[str, Any]) -> list[str]:
+    """
+    spawn 에이전트 출력이 완료 마커 줄로 끝나는지 (본문 중간의 마커는 인정하지 않음)
+
+    파일에 마커를 쓰라는 지시가 없던 이전 계획(completion_marker 플래그 없음)에는 적용하지 않는다.
+    """
+    if spec.get("mode", "spawn") != "spawn" or not spec.get("completion_marker", True):
+        return []
+    if not has_completion_marker(content, spec["agent_id"]):
+        return ["완료 마커 없음 (잘린 출력 가능성)"]
+    return []
+
+
+@register_rule("min_length")
+def check_min_length(content: str, spec: dict[str, Any]) -> list[str]:
+    """최소 길이"""
+    minimum: int = spec.get("rules", {}).get("min_length", VALIDATION_MIN_LENGTH)
+    length: int = len(content.strip())
+    return [f"너무 짧음 ({length} < {minimum}자)"] if length < minimum else []
+
+
+@register_rule("required_headings")
+def check_required_headings(content: str, spec: dict[str, Any]) -> list[str]:
+    """기대 출력의 헤딩이 모두 있는지"""
+    expected: list[str] = spec.get("required_headings", [])
+    if not expected:
+        return []
+    present: set[str] = {h.casefold() for h in HEADING_RE.findall(content)}
+    missing: list[str] = [h for h in expected if h.casefold() not in present]
+    return [f"필수 헤딩 누락: {', '.join(missing)}"] if missing else []
+
+
+@register_rule("patterns")
+def check_patterns(content: str, spec: dict[str, Any]) -> list[str]:
+    """타입별 필수 패턴 / 공통+타입별 금지 패턴"""
+    rules: dict[str, Any] = spec.get("rules", {})
+    issues: list[str] = []
+
+    for pattern in rules.get("required", []):
+        if not compile_pattern(pattern).search(content):
+            issues.append(f"필수 패턴 없음: {pattern}")
+
+    for pattern in VALIDATION_FORBIDDEN_PATTERNS + rules.get("forbidden", []):
+        if compile_pattern(pattern).search(content):
+            issues.append(f"금지 패턴 발견: {pattern}")
+
+    return issues
+
+
+def check_output(content: str, spec: dict[str, Any], rules: Optional[list[str]] = None) -> list[str]:
+    """활성화된 규칙을 순서대로 적용해 이슈 목록 반환"""
+    issues: list[str] = []
+    for name in rules if rules is not None else VALIDATION_RULES:
+        issues.extend(RULES[name](content, spec))
+    return issues
+
+
+def reject_output(mission_path: Path, agent_id: str) -> Path:
+    """불량 출력을 outputs/.rejected/<시각>/ 으로 이동 (재디스패치 대상이 됨)"""
+    rejected_dir: Path = mission_path / "outputs" / ".rejected" / datetime.now().strftime("%Y%m%d_%H%M%S")
+    rejected_dir.mkdir(parents=True, exist_ok=True)
+    target: Path = rejected_dir / f"{agent_id}.md"
+    os.replace(mission_path / "outputs" / f"{agent_id}.md", target)
+    return target
+
+
+def validate_mission_outputs(mission_path: Path, plan: dict[str, Any], reject: bool = True,
+                             settle_seconds: float = VALIDATION_SETTLE_SECONDS) -> list[dict[str, Any]]:
+    """
+    끝난 에이전트의 새로 도착했거나 바뀐 출력만 검증 (증분)
+
+    마지막 시작 이후 agent_finished가 기록됐거나, 출력이 완료 마커 줄로 끝나거나,
+    settle_seconds 동안 바뀌지 않은 출력만 끝난 것으로 본다. 아직 쓰는 중인 출력은
+    기록 없이 건너뛰어 다음 호출에서 다시 본다 (실행 중인 에이전트를 반려하지 않음).
+    파일의 (mtime, size)가 마지막 output_validated 기록과 같아도 건너뛴다.
+    reject가 켜져 있으면 불량 출력을 격리하고 output_rejected를 기록해
+    스케줄러가 해당 에이전트를 다시 디스패치하게 한다. 시작 기록만 있는
+    에이전트의 정상 출력은 파일 수정 시각으로 agent_finished를 남긴다.
+
+    Returns:
+        이번에 검증한 출력 [{"agent_id", "valid", "issues"}]
+    """
+    outputs_dir: Path = mission_path / "outputs"
+    seen: dict[str, tuple[int, int]] = {}
+    started: set[str] = set()
+    finished: set[str] = set()
+    for e in read_log_events(mission_path):
+        agent_id: str = e["data"].get("agent_id")
+        if e["event"] == "output_validated":
+            seen[agent_id] = (e["data"].get("mtime_ns"), e["data"].get("size"))
+        elif e["event"] == "agent_started":
+            # 재디스패치되면 이전 시도의 종료 기록은 무효
+            started.add(agent_id)
+            finished.discard(agent_id)
+        elif e["event"] == "agent_finished":
+            finished.add(agent_id)
+
+    now: float = time.time()
+    checked: list[dict[str, Any]] = []
+
+    for agent_id, spec in agent_specs(plan).items():
+        output_file: Path = outputs_dir / f"{agent_id}.md"
+        try:
+            stat = output_file.stat()
+        except FileNotFoundError:
+            continue
+
+        if seen.get(agent_id) == (stat.st_mtime_ns, stat.st_size):
+            continue
+
+        content: str = output_file.read_bytes().decode("utf-8", errors="replace")
+        if not output_complete(output_file, agent_id, agent_id in finished, now, settle_seconds,
+                               stat.st_mtime, content):
+            continue
+
+        issues: list[str] = check_output(content, spec)
+        result: dict[str, Any] = {"agent_id": agent_id, "valid": not issues, "issues": issues}
+        log_event(mission_path, "output_validated", {
+            **result, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size
+        })
+
+        if issues and reject:
+            reject_output(mission_path, agent_id)
+            log_event(mission_path, "output_rejected", {"agent_id": agent_id, "issues": issues})
+            result["rejected"] = True
+        elif not issues and agent_id in started and agent_id not in finished:
+            record_agent_finished(mission_path, agent_id, {
+                "finished_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "source": "output"
+            })
+
+        checked.append(result)
+
+    return checked
+
+
+def print_results(mission_id: str, checked: list[dict[str, Any]]) -> None:
+    """검증 결과 출력"""
+    print(f"\n🧪 출력 검증: {mission_id}")
+    if not checked:
+        print("   새로 도착한 출력 없음")
+    for r in checked:
+        if r["valid"]:
+            print(f"   ✅ {r['agent_id']}")
+        else:
+            tag = " → 반려, 재디스패치 대기" if r.get("rejected") else ""
+            print(f"   ❌ {r['agent_id']}: {'; '.join(r['issues'])}{tag}")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Validation")
+    parser.add_argument("--mission", "-m", required=True, help="미션 ID")
+    parser.add_argument("--no-reject", action="store_true", help="불량 출력을 격리하지 않고 보고만")
+    parser.add_argument("--watch", "-w", action="store_true", help="출력이 도착할 때마다 검증")
+    parser.add_argument("--interval", "-i", type=int, default=10, help="감시 간격(초)")
+    parser.add_argument("--json", "-j", action="store_true", help="JSON 출력")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    try:
+        mission, plan = load_mission(args.mission, writable=True)
+    except (MissionNotFoundError, PlanNotFoundError, ArchivedMissionError) as e:
+        print(f"❌ 오류: {e}")
+        sys.exit(1)
+
+    mission_path: Path = Path(mission["path"])
+
+    if not args.watch:
+        checked = validate_mission_outputs(mission_path, plan, not args.no_reject)
+        if args.json:
+            print(json.dumps({"mission_id": mission["id"], "checked": checked}, indent=2, ensure_ascii=False))
+        else:
+            print_results(mission["id"], checked)
+        return
+
+    print(f"👀 출력 검증 감시 시작 (간격: {args.interval}초)")
+    print("   종료하려면 Ctrl+C")
+    try:
+        while True:
+            checked = validate_mission_outputs(mission_path, plan, not args.no_reject)
+            if checked:
+                print_results(mission["id"], checked)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("\n\n👋 검증 감시 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Agent Avengers - Worker Script
+모듈과 미션 캐시를 메모리에 올려 둔 상주 프로세스, Unix 소켓으로 avengers 명령 실행
+"""
+
+import io
+import os
+import signal
+import socket
+import socketserver
+import sys
+import argparse
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from config import WORKER_SOCKET, WORKER_PRELOAD
+    from avengers import COMMANDS, LOCAL_ONLY_FLAGS, decode_request, load_command, worker_env
+    from monitor import enable_log_cache
+    from prompt_templates import refresh_template_overrides
+except ImportError:
+    from .config import WORKER_SOCKET, WORKER_PRELOAD
+    from .avengers import COMMANDS, LOCAL_ONLY_FLAGS, decode_request, load_command, worker_env
+    from .monitor import enable_log_cache
+    from .prompt_templates import refresh_template_overrides
+
+
+def exit_code(code: Any) -> int:
+    """SystemExit.code → 프로세스 종료 코드 (문자열은 stderr에 쓰고 1)"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_command(name: str, args: list[str], cwd: str) -> tuple[int, str, str]:
+    """
+    명령 main()을 현재 프로세스에서 실행
+
+    sys.argv, 작업 디렉토리, stdout/stderr는 프로세스 전역이라 요청은 한 번에 하나씩 처리한다.
+
+    Returns:
+        (종료 코드, stdout, stderr)
+    """
+    out: io.StringIO = io.StringIO()
+    err: io.StringIO = io.StringIO()
+    saved_argv: list[str] = sys.argv
+    saved_cwd: str = os.getcwd()
+    code: int = 0
+
+    try:
+        os.chdir(cwd)
+        sys.argv = [f"avengers {name}", *args]
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                load_command(name).main()
+            except SystemExit as e:
+                code = exit_code(e.code)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+
+    return code, out.getvalue(), err.getvalue()
+
+
+def handle_request(data: bytes, env: dict[str, str]) -> bytes:
+    """
+    요청 처리 → 응답 바이트
+
+    응답은 "ok <종료 코드> <stdout 길이> <stderr 길이>\\n" 뒤에 stdout, stderr 본문.
+    환경 확인을 통과하면 프롬프트 템플릿 디렉토리가 바뀌었는지도 확인해, 바뀌었으면
+    캐시된 덮어쓰기/컴파일 결과를 버린다 (직접 실행과 같은 프롬프트).
+    실행할 수 없는 요청(환경 불일치, 알 수 없는 명령, 상주 실행 불가 옵션)은
+    "refused <사유>\\n"으로 돌려보내 클라이언트가 직접 실행하게 한다.
+    """
+    try:
+        name, args, cwd, client_env = decode_request(data)
+    except ValueError as e:
+        return f"refused {e}\n".encode()
+
+    if client_env != env:
+        return b"refused env\n"
+    if name not in COMMANDS or set(args) & set(LOCAL_ONLY_FLAGS.get(name, ())):
+        return f"refused {name}\n".encode()
+
+    refresh_template_overrides()
+    code, out, err = run_command(name, args, cwd)
+    out_bytes: bytes = out.encode()
+    err_bytes: bytes = err.encode()
+    return f"ok {code} {len(out_bytes)} {len(err_bytes)}\n".encode() + out_bytes + err_bytes
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+    """연결 하나 = 요청 하나 (클라이언트가 쓰기를 닫을 때까지 읽음)"""
+
+    def handle(self) -> None:
+        self.wfile.write(handle_request(self.rfile.read(), self.server.env))
+
+
+class WorkerServer(socketserver.UnixStreamServer):
+    """요청을 순서대로 처리하는 Unix 소켓 서버"""
+
+    def __init__(self, socket_path: str, preload: Optional[list[str]] = None) -> None:
+        self.socket_path: str = socket_path
+        self.env: dict[str, str] = worker_env()
+        for name in preload if preload is not None else WORKER_PRELOAD:
+            load_command(name)
+        enable_log_cache()
+        super().__init__(socket_path, WorkerHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.socket_path).unlink(missing_ok=True)
+
+
+def socket_in_use(socket_path: str) -> bool:
+    """이미 다른 워커가 응답하는 소켓인지 (아니면 남은 소켓 파일은 지워도 됨)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Agent Avengers - Worker")
+    parser.add_argument("--socket", "-s", default=WORKER_SOCKET, help="Unix 소켓 경로 (env: AVENGERS_WORKER_SOCKET)")
+
+    args: argparse.Namespace = parser.parse_args()
+    socket_path: Path = Path(args.socket)
+
+    if socket_path.exists():
+        if socket_in_use(str(socket_path)):
+            print(f"❌ 이미 실행 중인 워커: {socket_path}")
+            sys.exit(1)
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    server: WorkerServer = WorkerServer(str(socket_path))
+    # kill(SIGTERM)로 끝나도 finally에서 소켓 파일 정리
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"🛰️  워커 대기 중: {socket_path}")
+    print(f"   export AVENGERS_WORKER_SOCKET={socket_path}")
+    print("   종료하려면 Ctrl+C")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 워커 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -142,3 +142,13 @@ def sample_logs():
             "data": {"agent_id": "test_agent_00"}
         }
     ]
+
+
+@pytest.fixture
+def write_event():
+    """Helper that appends a log entry with a fixed timestamp to a mission's execution.jsonl"""
+    def write(mission_path, timestamp, event, data=None):
+        entry = {"timestamp": timestamp, "event": event, "data": data or {}}
+        with open(mission_path / "logs" / "execution.jsonl", "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    return write
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Tests for archive.py"""
+
+import json
+import sys
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import archive
+import utils
+from archive import (
+    archive_candidates,
+    archive_mission,
+    extract_archived,
+    load_archive_index,
+    restore_mission,
+)
+from exceptions import ArchivedMissionError, MissionNotFoundError
+
+
+def make_mission(root, mission_id, status="completed", completed_at="2026-01-01T00:00:00"):
+    path = root / mission_id
+    (path / "outputs").mkdir(parents=True)
+    (path / "logs").mkdir()
+    (path / "mission.json").write_text(json.dumps({
+        "id": mission_id, "path": str(path), "task": "archived task", "status": status,
+        "created_at": "2026-01-01T00:00:00", "completed_at": completed_at
+    }))
+    (path / "execution_plan.json").write_text(json.dumps({"mission_id": mission_id, "phases": [], "commands": []}))
+    (path / "outputs" / "a1.md").write_text("# Output\n" + "content " * 200)
+    (path / "logs" / "execution.jsonl").write_text('{"event": "mission_created", "data": {}}\n')
+    (path / "FINAL_REPORT.md").write_text("# Report")
+    return path
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """Isolated mission/archive/cache directories wired into archive and utils"""
+    mission_dir = tmp_path / "missions"
+    mission_dir.mkdir()
+    monkeypatch.setattr(archive, "MISSION_DIR", mission_dir)
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", mission_dir / "archive")
+    monkeypatch.setattr(archive, "ARCHIVE_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(utils, "MISSION_DIR", mission_dir)
+    return mission_dir
+
+
+class TestRetention:
+    """Tests for selecting missions to archive"""
+
+    def test_only_old_finished_missions(self, dirs):
+        make_mission(dirs, "old_done")
+        make_mission(dirs, "old_running", status="executing")
+        make_mission(dirs, "recent_done", completed_at="2026-03-01T00:00:00")
+
+        candidates = archive_candidates(dirs, older_than_days=14, now=datetime(2026, 3, 5))
+
+        assert [p.name for p in candidates] == ["old_done"]
+
+
+class TestArchive:
+    """Tests for packing, transparent reads and restore"""
+
+    def test_archive_packs_and_removes_loose_files(self, dirs):
+        path = make_mission(dirs, "m1")
+
+        entry = archive_mission(path)
+
+        assert not path.exists()
+        assert entry["archive"] == "missions-202601.zip"
+        assert set(entry["files"]) == {
+            "mission.json", "execution_plan.json", "outputs/a1.md", "logs/execution.jsonl", "FINAL_REPORT.md"
+        }
+        assert entry["compressed_bytes"] < entry["bytes"]
+        assert load_archive_index()["m1"]["status"] == "completed"
+
+    def test_missions_share_monthly_shard(self, dirs):
+        archive_mission(make_mission(dirs, "m1"))
+        archive_mission(make_mission(dirs, "m2"))
+
+        assert {e["archive"] for e in load_archive_index().values()} == {"missions-202601.zip"}
+        assert [p.name for p in (dirs / "archive").glob("*.zip")] == ["missions-202601.zip"]
+
+    def test_load_mission_reads_archive_transparently(self, dirs):
+        archive_mission(make_mission(dirs, "m1"))
+
+        mission, plan = utils.load_mission("m1")
+
+        assert mission["archived"] is True
+        assert plan["mission_id"] == "m1"
+        assert (Path(mission["path"]) / "outputs" / "a1.md").read_text().startswith("# Output")
+        assert utils.read_log_events(Path(mission["path"]))[0]["event"] == "mission_created"
+
+    def test_writers_refuse_archived_mission(self, dirs):
+        archive_mission(make_mission(dirs, "m1"))
+
+        with pytest.raises(ArchivedMissionError, match="archive.py --restore m1"):
+            utils.load_mission("m1", writable=True)
+
+        mission_path = Path(utils.load_mission_only("m1")[0]["path"])
+        with pytest.raises(ArchivedMissionError):
+            utils.log_event(mission_path, "agent_started", {"agent_id": "a1"})
+        with pytest.raises(ArchivedMissionError):
+            utils.update_mission_status(mission_path, "executing")
+        assert len(utils.read_log_events(mission_path)) == 1
+
+    def test_restored_mission_is_writable(self, dirs):
+        archive_mission(make_mission(dirs, "m1"))
+        restore_mission("m1")
+
+        mission, _ = utils.load_mission("m1", writable=True)
+        utils.log_event(Path(mission["path"]), "replanned")
+
+        assert utils.read_log_events(dirs / "m1", "replanned")
+
+    def test_unknown_mission_still_raises(self, dirs):
+        with pytest.raises(MissionNotFoundError):
+            utils.load_mission_only("nope")
+        assert extract_archived("nope") is None
+
+    def test_restore_and_rearchive(self, dirs):
+        archive_mission(make_mission(dirs, "m1"))
+        extract_archived("m1")
+
+        restored = restore_mission("m1")
+
+        assert restored == dirs / "m1"
+        assert (restored / "outputs" / "a1.md").exists()
+        assert not (restored / archive.ARCHIVE_EXTRACTED_MARKER).exists()
+        assert "m1" not in load_archive_index()
+
+        entry = archive_mission(restored)
+        assert entry["archive"] == "missions-202601-2.zip"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -225,6 +225,31 @@ class TestIntegration:
             
             assert plan["total_agents"] == 4
             assert len(plan["commands"]) == 4
+            assert plan["prompt_tokens"] == sum(c["prompt_tokens"] for c in plan["commands"])
+
+    def test_short_dependency_ids_resolved(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ["AVENGERS_WORKSPACE"] = tmpdir
+
+            import importlib
+            import assemble
+            importlib.reload(assemble)
+
+            mission = assemble.create_mission("App", priority="high")
+            subtasks = [
+                {"description": "요구사항 분석", "type": "analyst"},
+                {"description": "프론트엔드 구현", "type": "coder", "dependencies": ["agent_00"]},
+                {"description": "백엔드 구현", "type": "coder", "dependencies": ["agent_00"]}
+            ]
+            agents = [assemble.create_agent_config(st, mission["id"], i) for i, st in enumerate(subtasks)]
+
+            with open(assemble.save_execution_plan(mission, agents)) as f:
+                plan = json.load(f)
+
+            assert mission["priority"] == "high"
+            assert len(plan["phases"]) == 2
+            assert plan["phases"][1]["parallel"] is True
+            assert plan["phases"][1]["agents"][0]["dependencies"] == [f"{mission['id']}_agent_00"]
 
 
 if __name__ == "__main__":
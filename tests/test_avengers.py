@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Tests for the avengers entry point"""
+
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from avengers import COMMANDS, load_command, main
+
+
+class TestDispatch:
+    """Tests for subcommand dispatch"""
+
+    def test_usage_lists_commands(self, capsys):
+        assert main([]) == 0
+
+        out = capsys.readouterr().out
+        assert all(name in out for name in COMMANDS)
+
+    def test_unknown_command(self, capsys):
+        assert main(["deploy"]) == 2
+        assert "deploy" in capsys.readouterr().err
+
+    def test_subcommand_gets_its_own_argv(self, capsys, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["avengers"])
+        with pytest.raises(SystemExit) as exc:
+            main(["monitor", "--help"])
+
+        assert exc.value.code == 0
+        assert capsys.readouterr().out.startswith("usage: avengers monitor")
+
+    @pytest.mark.parametrize("name", sorted(COMMANDS))
+    def test_every_command_has_main(self, name):
+        assert callable(load_command(name).main)
+
+
+class TestLazyImports:
+    """Tests that startup only loads what the command needs"""
+
+    def loaded(self, code):
+        script = f"import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); {code}; print(' '.join(sorted(sys.modules)))"
+        proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        return set(proc.stdout.split())
+
+    def test_usage_imports_no_command_modules(self):
+        modules = self.loaded("import avengers; avengers.usage()")
+
+        assert not modules & {"assemble", "utils", "config", "json", "argparse"}
+
+    def test_heavy_modules_deferred(self):
+        modules = self.loaded("import monitor, consolidate")
+
+        assert not modules & {"cProfile", "pstats", "tracemalloc", "sqlite3", "zipfile", "archive", "search", "dedup"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
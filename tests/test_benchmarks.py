@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the benchmark suite helpers"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from synthetic import make_agents, make_mission_dir, make_subtasks, write_logs, write_outputs
+from bench_hotpaths import HOT_PATHS, compare, run_suite
+from bench_startup import parse_importtime
+from assemble import save_execution_plan
+
+
+class TestSynthetic:
+    """Tests for synthetic mission generators"""
+
+    @pytest.mark.parametrize("shape,phases", [("wide", 1), ("deep", 12)])
+    def test_shapes(self, tmp_path, shape, phases):
+        mission = make_mission_dir(tmp_path)
+        agents = make_agents(mission["id"], make_subtasks(12, shape))
+
+        save_execution_plan(mission, agents)
+
+        plan = json.loads((Path(mission["path"]) / "execution_plan.json").read_text())
+        assert plan["total_agents"] == 12
+        assert len(plan["phases"]) == phases
+
+    def test_random_is_seeded_and_acyclic(self):
+        subtasks = make_subtasks(50, "random", seed=7)
+
+        assert subtasks == make_subtasks(50, "random", seed=7)
+        for i, st in enumerate(subtasks):
+            assert all(int(d.split("_")[1]) < i for d in st["dependencies"])
+
+    def test_outputs_and_logs(self, tmp_path):
+        mission = make_mission_dir(tmp_path)
+        plan = {"commands": [{"agent_id": "a1"}, {"agent_id": "a2"}]}
+
+        write_outputs(Path(mission["path"]), plan, 4096)
+        write_logs(Path(mission["path"]), plan, 10)
+
+        assert (Path(mission["path"]) / "outputs" / "a2.md").read_text().endswith("MISSION_COMPLETE: a2\n")
+        lines = (Path(mission["path"]) / "logs" / "execution.jsonl").read_text().splitlines()
+        assert len(lines) == 10
+
+    def test_unknown_shape(self):
+        with pytest.raises(ValueError):
+            make_subtasks(3, "star")
+
+
+class TestRegressions:
+    """Tests for baseline comparison"""
+
+    def test_flags_slower_and_bigger(self):
+        baseline = {"read_logs/wide/10": {"seconds": 0.1, "peak_kb": 100}}
+        current = {"read_logs/wide/10": {"seconds": 0.2, "peak_kb": 110}}
+
+        regressions = compare(current, baseline, tolerance=0.25)
+
+        assert [(r["metric"], r["ratio"]) for r in regressions] == [("seconds", 2.0)]
+
+    def test_ignores_noise_and_new_cases(self):
+        baseline = {"read_logs/wide/10": {"seconds": 0.001, "peak_kb": 100}}
+        current = {
+            "read_logs/wide/10": {"seconds": 0.003, "peak_kb": 100},
+            "read_logs/deep/10": {"seconds": 9.0, "peak_kb": 9999}
+        }
+
+        assert compare(current, baseline) == []
+
+    def test_run_suite_covers_every_hot_path(self):
+        results = run_suite([5], ["wide"], output_bytes=512, log_events=20, repeat=1)
+
+        assert set(results) == {f"{name}/wide/5" for name in HOT_PATHS}
+        assert all(m["seconds"] >= 0 and m["peak_kb"] > 0 for m in results.values())
+
+
+class TestStartup:
+    """Tests for the CLI startup benchmark"""
+
+    def test_parse_importtime_top_level_only(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   monitor\n"
+            "import time:       300 |      51705 | monitor\n"
+        )
+
+        assert parse_importtime(stderr, "monitor") == 51705
+        assert parse_importtime(stderr, "assemble") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
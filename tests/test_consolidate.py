@@ -14,6 +14,10 @@ from consolidate import (
     collect_outputs,
     validate_outputs,
     generate_summary,
+    group_results,
+    generate_tree_report,
+    consolidate_incremental,
+    render_agent_section,
 )
 
 
@@ -62,6 +66,29 @@ class TestCollectOutputs:
             assert results[0]["status"] == "missing"
             assert results[0]["content"] is None
 
+    def test_parallel_collection_preserves_plan_order(self, tmp_path):
+        outputs_dir = tmp_path / "outputs"
+        outputs_dir.mkdir()
+        ids = [f"agent_{i:02d}" for i in range(20)]
+        for agent_id in ids[::2]:
+            (outputs_dir / f"{agent_id}.md").write_text(f"# {agent_id}")
+        plan = {"commands": [{"agent_id": a} for a in ids]}
+
+        results = collect_outputs(tmp_path, plan, workers=4)
+
+        assert [r["agent_id"] for r in results] == ids
+        assert [r["status"] for r in results[:2]] == ["completed", "missing"]
+        assert results == collect_outputs(tmp_path, plan, workers=1)
+
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        (tmp_path / "outputs").mkdir()
+        (tmp_path / "outputs" / "a1.md").write_bytes(b"ok \xff\xfe")
+
+        results = collect_outputs(tmp_path, {"commands": [{"agent_id": "a1"}]})
+
+        assert results[0]["status"] == "completed"
+        assert results[0]["content"].startswith("ok ")
+
 
 class TestValidateOutputs:
     """Test output validation"""
@@ -213,5 +240,108 @@ class TestConsolidateIntegration:
             assert "Data shows trend" in summary
 
 
+class TestTreeReport:
+    """Tests for hierarchical (map-reduce) consolidation"""
+
+    def _results(self, plan):
+        return [
+            {"agent_id": c["agent_id"], "status": "completed", "content": f"# {c['agent_id']}\nbody",
+             "file": "", "size": 10}
+            for c in plan["commands"]
+        ]
+
+    def test_group_by_phase_and_type(self, sample_plan):
+        results = self._results(sample_plan)
+
+        by_phase = group_results(results, sample_plan, "phase")
+        assert list(by_phase) == ["Phase 1", "Phase 2"]
+        assert [r["agent_id"] for r in by_phase["Phase 1"]] == ["test_agent_00", "test_agent_01"]
+
+        by_type = group_results(results, sample_plan, "type")
+        assert list(by_type) == ["researcher", "analyst", "writer"]
+
+    def test_agents_outside_phases_are_kept_group(self, sample_plan):
+        results = self._results(sample_plan) + [
+            {"agent_id": "old_agent", "status": "completed", "content": "x", "file": "", "size": 1}
+        ]
+        assert [r["agent_id"] for r in group_results(results, sample_plan)["유지됨"]] == ["old_agent"]
+
+    def test_tree_report_writes_group_files_and_toc(self, sample_plan, sample_mission, tmp_path):
+        results = self._results(sample_plan)
+        validation = validate_outputs(results)
+        report_dir = tmp_path / "reports"
+
+        report = generate_tree_report(sample_mission, sample_plan, results, validation, report_dir, "phase", workers=2)
+
+        assert sorted(p.name for p in report_dir.iterdir()) == ["phase_1.md", "phase_2.md"]
+        assert "## 목차" in report
+        assert "[Phase 1](reports/phase_1.md)" in report
+        # The top-level report only links to group reports
+        assert "body" not in report
+        assert "test_agent_02" in (report_dir / "phase_2.md").read_text()
+
+
+class TestIncrementalConsolidation:
+    """Tests for manifest-based incremental consolidation"""
+
+    def _write(self, mission_path, agent_id, text):
+        (mission_path / "outputs" / f"{agent_id}.md").write_text(text + f"\n\nMISSION_COMPLETE: {agent_id}\n")
+
+    def test_matches_full_rendering(self, temp_mission_dir, sample_plan, sample_agent_outputs):
+        for agent_id, content in list(sample_agent_outputs.items())[:2]:
+            (temp_mission_dir / "outputs" / f"{agent_id}.md").write_text(content)
+
+        sections, validation, stats = consolidate_incremental(temp_mission_dir, sample_plan)
+
+        results = collect_outputs(temp_mission_dir, sample_plan)
+        assert sections == [render_agent_section(r) for r in results]
+        assert validation == validate_outputs(results)
+        assert stats == {"rendered": 3, "reused": 0}
+
+        _, validated, _ = consolidate_incremental(temp_mission_dir, sample_plan, validate=True)
+        assert validated == validate_outputs(results, sample_plan)
+
+    def test_content_rules_are_opt_in(self, temp_mission_dir, sample_plan):
+        for agent_id in ("test_agent_00", "test_agent_01", "test_agent_02"):
+            (temp_mission_dir / "outputs" / f"{agent_id}.md").write_text("짧은 결과")
+
+        _, validation, _ = consolidate_incremental(temp_mission_dir, sample_plan)
+        assert validation["success"] is True
+
+        _, validation, _ = consolidate_incremental(temp_mission_dir, sample_plan, validate=True)
+        assert validation["invalid"] == 3
+
+    def test_only_changed_outputs_rerendered(self, temp_mission_dir, sample_plan):
+        for agent_id in ("test_agent_00", "test_agent_01"):
+            self._write(temp_mission_dir, agent_id, "# Result\n" + "finding " * 30)
+        consolidate_incremental(temp_mission_dir, sample_plan)
+
+        _, _, stats = consolidate_incremental(temp_mission_dir, sample_plan)
+        assert stats == {"rendered": 0, "reused": 3}
+
+        self._write(temp_mission_dir, "test_agent_01", "# Updated\n" + "new finding " * 30)
+        sections, _, stats = consolidate_incremental(temp_mission_dir, sample_plan)
+        assert stats == {"rendered": 1, "reused": 2}
+        assert "Updated" in sections[1]
+
+    def test_touched_but_identical_output_reused(self, temp_mission_dir, sample_plan):
+        self._write(temp_mission_dir, "test_agent_00", "# Result\n" + "finding " * 30)
+        consolidate_incremental(temp_mission_dir, sample_plan)
+
+        output = temp_mission_dir / "outputs" / "test_agent_00.md"
+        stat = output.stat()
+        os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        _, _, stats = consolidate_incremental(temp_mission_dir, sample_plan)
+        assert stats["rendered"] == 0
+
+    def test_full_rebuild_ignores_manifest(self, temp_mission_dir, sample_plan):
+        self._write(temp_mission_dir, "test_agent_00", "# Result\n" + "finding " * 30)
+        consolidate_incremental(temp_mission_dir, sample_plan)
+
+        _, _, stats = consolidate_incremental(temp_mission_dir, sample_plan, full=True)
+        assert stats == {"rendered": 3, "reused": 0}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
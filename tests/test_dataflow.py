@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Tests for dataflow.py"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from dataflow import (
+    UPSTREAM_HEADING,
+    agent_dependencies,
+    inject_upstream,
+    resolve_command_params,
+    resolve_plan_commands,
+    upstream_section,
+)
+from prompt_builder import estimate_tokens
+from execute import format_spawn_code, generate_openclaw_commands
+
+
+class TestAgentDependencies:
+    """Test dependency lookup from plans"""
+
+    def test_previous_phase_fallback(self, sample_plan):
+        deps = agent_dependencies(sample_plan)
+
+        assert deps["test_agent_00"] == []
+        assert deps["test_agent_02"] == ["test_agent_00", "test_agent_01"]
+
+    def test_recorded_dependencies_win(self, sample_plan):
+        sample_plan["phases"][1]["agents"][0]["dependencies"] = ["test_agent_01"]
+
+        assert agent_dependencies(sample_plan)["test_agent_02"] == ["test_agent_01"]
+
+
+class TestUpstreamSection:
+    """Test upstream content rendering"""
+
+    def test_inline_excerpt_and_missing(self, temp_mission_dir):
+        outputs = temp_mission_dir / "outputs"
+        (outputs / "short.md").write_text("# Short\nsmall result")
+        (outputs / "long.md").write_text("# Long\n" + "word " * 400)
+
+        section = upstream_section(temp_mission_dir, ["short", "long", "missing"], budget=100)
+
+        assert section.startswith(UPSTREAM_HEADING)
+        assert "small result" in section
+        assert "word " * 300 not in section
+        assert f"요약됨, 전체 {estimate_tokens((outputs / 'long.md').read_text())}토큰: {outputs / 'long.md'}" in section
+        assert f"{outputs / 'missing.md'} 참조" in section
+
+    def test_inject_before_expected_output(self):
+        prompt = "## 태스크\nT\n\n## 기대 출력\nE\n"
+
+        result = inject_upstream(prompt, "## 업스트림 결과\nU\n")
+
+        assert result.index("U") < result.index("## 기대 출력")
+        assert inject_upstream("no marker", "S").endswith("S")
+
+
+class TestResolveCommands:
+    """Test dispatch-time prompt resolution"""
+
+    def test_send_message_gets_upstream(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text("competitor data")
+
+        params = resolve_command_params(temp_mission_dir, sample_plan["commands"][2], ["test_agent_00"])
+
+        assert "competitor data" in params["message"]
+        # Original plan is untouched
+        assert "competitor data" not in sample_plan["commands"][2]["params"]["message"]
+
+    def test_plan_resolution_flows_into_commands(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_01.md").write_text("trend `X` rising")
+
+        commands = generate_openclaw_commands(resolve_plan_commands(sample_plan, temp_mission_dir))
+
+        send_code = commands[1]["commands"][0]["code"]
+        assert "trend \\`X\\` rising" in send_code
+        # Phase 1 agents have no upstream
+        assert UPSTREAM_HEADING not in commands[0]["commands"][0]["code"]
+
+    def test_spawn_code_escapes_template_literal(self):
+        params = {"task": "a `b` ${c}", "model": "sonnet", "runTimeoutSeconds": 1, "cleanup": "keep", "label": "l"}
+
+        assert "a \\`b\\` \\${c}" in format_spawn_code(params)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
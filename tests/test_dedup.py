@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Tests for dedup.py"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from dedup import (
+    dedupe_results,
+    minhash,
+    shingles,
+    similarity,
+    split_sections,
+)
+
+
+SHARED = ("The competitor landscape is consolidating with three major players holding most of the "
+          "market share while pricing pressure keeps increasing across every enterprise segment. ") * 3
+
+
+def result(agent_id, content):
+    return {"agent_id": agent_id, "status": "completed", "content": content, "file": "", "size": len(content)}
+
+
+class TestMinHash:
+    """Tests for shingling and signatures"""
+
+    def test_split_sections_keeps_preamble_and_headings(self):
+        sections = split_sections("intro\n## A\nbody a\n### B\nbody b\n")
+        assert [s["heading"] for s in sections] == ["", "## A", "### B"]
+        assert sections[1]["body"] == "body a\n"
+
+    def test_similarity_tracks_jaccard(self):
+        a = minhash(shingles(SHARED))
+        b = minhash(shingles(SHARED + " one extra closing sentence"))
+        c = minhash(shingles("completely unrelated text about cooking pasta with garlic and olive oil " * 3))
+
+        assert similarity(a, a) == 1.0
+        assert similarity(a, b) > 0.8
+        assert similarity(a, c) < 0.2
+
+    def test_signatures_are_deterministic(self):
+        assert minhash(shingles(SHARED)) == minhash(shingles(SHARED))
+
+
+class TestDedupeResults:
+    """Tests for collapsing near-duplicate sections"""
+
+    def test_near_duplicates_collapsed_with_cross_reference(self):
+        results = [
+            result("a1", f"## Market\n{SHARED}\n## Own\nalpha specific notes\n"),
+            result("a2", f"## Market overview\n{SHARED} Minor addendum.\n## Other\nbeta notes\n"),
+        ]
+
+        deduped, stats = dedupe_results(results)
+
+        assert stats["collapsed"] == 1
+        assert stats["saved_chars"] > 0
+        assert SHARED in deduped[0]["content"]
+        assert "유사 섹션: [a2](#a2)" in deduped[0]["content"]
+        assert SHARED not in deduped[1]["content"]
+        assert "[a1](#a1)의 'Market' 섹션과 거의 동일" in deduped[1]["content"]
+        assert "beta notes" in deduped[1]["content"]
+
+    def test_distinct_outputs_untouched(self):
+        results = [
+            result("a1", f"## Market\n{SHARED}\n"),
+            result("a2", "## Recipe\n" + "boil water add pasta and salt then drain and serve warm " * 4),
+            {"agent_id": "a3", "status": "missing", "content": None, "file": "", "size": 0},
+        ]
+
+        deduped, stats = dedupe_results(results)
+
+        assert stats["collapsed"] == 0
+        assert [r["content"] for r in deduped] == [r["content"] for r in results]
+
+    def test_short_and_same_agent_sections_not_compared(self):
+        results = [
+            result("a1", f"## A\n{SHARED}\n## B\n{SHARED}\n"),
+            result("a2", "## Done\nok\n"),
+            result("a3", "## Done\nok\n"),
+        ]
+
+        _, stats = dedupe_results(results)
+
+        assert stats["collapsed"] == 0
+
+    def test_same_agent_sections_never_share_a_cluster(self):
+        results = [
+            result("a1", f"## A\n{SHARED}\n## B\n{SHARED}\n"),
+            result("a2", f"## C\n{SHARED}\n"),
+        ]
+
+        deduped, stats = dedupe_results(results)
+
+        assert stats["collapsed"] == 1
+        assert deduped[0]["content"].count(SHARED) == 2
+        assert "[a1](#a1)" in deduped[1]["content"]
+        assert "[a1](#a1)" not in deduped[0]["content"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for dispatcher.py"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from dispatcher import (
+    EXISTING_POOL,
+    Dispatcher,
+    TokenBucket,
+    plan_dispatch,
+)
+from execute import apply_dispatch_schedule, generate_openclaw_commands
+
+
+LIMITS = {
+    "opus": {"max_concurrency": 2, "rate_per_minute": 60, "burst": 2},
+    "sonnet": {"max_concurrency": 3, "rate_per_minute": 600, "burst": 3}
+}
+
+
+def agent(agent_id, model, duration):
+    return {"id": agent_id, "model": model, "estimated_duration": duration}
+
+
+class TestTokenBucket:
+    """Test token bucket rate limiting"""
+
+    def test_burst_then_refill(self):
+        bucket = TokenBucket(rate_per_minute=60, burst=2, now=0.0)
+
+        assert bucket.try_acquire(0.0)
+        assert bucket.try_acquire(0.0)
+        assert not bucket.try_acquire(0.0)
+        assert bucket.wait_time(0.0) == pytest.approx(1.0)
+        assert bucket.try_acquire(1.0)
+
+    def test_capacity_caps_refill(self):
+        bucket = TokenBucket(rate_per_minute=60, burst=2, now=0.0)
+        bucket.refill(1000.0)
+
+        assert bucket.tokens == 2.0
+
+
+class TestDispatcher:
+    """Test per-model concurrency and queue ordering"""
+
+    def test_concurrency_limit_per_model(self):
+        now = [0.0]
+        dispatcher = Dispatcher(LIMITS, clock=lambda: now[0])
+        for i in range(4):
+            dispatcher.submit(agent(f"o{i}", "opus", 10))
+        dispatcher.submit(agent("s0", "sonnet", 10))
+
+        first = dispatcher.poll()
+
+        assert [a["id"] for a in first if a["model"] == "opus"] == ["o0", "o1"]
+        assert "s0" in [a["id"] for a in first]
+        assert dispatcher.pending == 2
+
+        # Slot released but bucket still empty until a token refills
+        dispatcher.release(first[0])
+        assert dispatcher.poll() == []
+        assert dispatcher.next_token_wait() == pytest.approx(1.0)
+
+        now[0] = 1.0
+        assert [a["id"] for a in dispatcher.poll()] == ["o2"]
+
+    def test_longest_work_dispatched_first(self):
+        dispatcher = Dispatcher({"opus": {"max_concurrency": 1, "rate_per_minute": 60, "burst": 1}}, clock=lambda: 0.0)
+        dispatcher.submit(agent("short", "opus", 10))
+        dispatcher.submit(agent("long", "opus", 500))
+
+        assert [a["id"] for a in dispatcher.poll()] == ["long"]
+
+    def test_send_agents_use_existing_pool(self):
+        dispatcher = Dispatcher({}, clock=lambda: 0.0)
+        dispatcher.submit({"id": "send", "model": None})
+        dispatcher.poll()
+
+        assert EXISTING_POOL in dispatcher.pools
+
+
+class TestPlanDispatch:
+    """Test schedule simulation"""
+
+    def test_batches_respect_limits(self):
+        agents = [agent(f"o{i}", "opus", 100) for i in range(3)] + [agent("s0", "sonnet", 50)]
+
+        schedule = {s["agent_id"]: s for s in plan_dispatch(agents, LIMITS)}
+
+        assert schedule["o0"]["batch"] == 1
+        assert schedule["s0"]["batch"] == 1
+        # Third opus agent waits for the first to finish
+        assert schedule["o2"]["start_offset"] == 100
+        assert schedule["o2"]["batch"] == 2
+
+    def test_rate_limit_spaces_dispatches(self):
+        limits = {"haiku": {"max_concurrency": 10, "rate_per_minute": 6, "burst": 1}}
+        agents = [agent(f"h{i}", "haiku", 1000) for i in range(3)]
+
+        offsets = [s["start_offset"] for s in plan_dispatch(agents, limits)]
+
+        assert offsets == [0, 10, 20]
+
+    def test_zero_capacity_raises(self):
+        limits = {"opus": {"max_concurrency": 0, "rate_per_minute": 60, "burst": 1}}
+
+        with pytest.raises(ValueError):
+            plan_dispatch([agent("o0", "opus", 10)], limits)
+
+
+class TestApplyDispatchSchedule:
+    """Test execute.py batching of phase commands"""
+
+    def test_commands_get_batches(self, sample_plan):
+        limits = {"sonnet": {"max_concurrency": 1, "rate_per_minute": 60, "burst": 1},
+                  "opus": {"max_concurrency": 1, "rate_per_minute": 60, "burst": 1}}
+        commands = apply_dispatch_schedule(generate_openclaw_commands(sample_plan), sample_plan, limits)
+
+        phase1 = commands[0]["commands"]
+        assert all(c["batch"] == 1 for c in phase1)
+        assert all(c["start_offset"] == 0 for c in phase1)
+        assert commands[1]["commands"][0]["batch"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,9 +11,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from execute import (
     generate_openclaw_commands,
+    record_execution_start,
     save_execution_script,
 )
 from exceptions import MissionNotFoundError
+from utils import read_log_events
 
 
 class TestGenerateOpenclawCommands:
@@ -73,6 +75,22 @@ class TestGenerateOpenclawCommands:
 
         assert commands == []
 
+    def test_hedge_commands_attached_to_spawn(self, sample_plan):
+        """Test that hedge duplicates are attached only to hedged agents"""
+        hedges = {
+            "test_agent_00": {
+                "after": 900,
+                "params": dict(sample_plan["commands"][0]["params"], label="test_agent_00__hedge")
+            }
+        }
+
+        commands = generate_openclaw_commands(sample_plan, hedges)
+
+        cmd0, cmd1 = commands[0]["commands"]
+        assert cmd0["hedge"]["after"] == 900
+        assert 'label: "test_agent_00__hedge"' in cmd0["hedge"]["code"]
+        assert "hedge" not in cmd1
+
     def test_agent_without_command(self):
         """Test handling agent with no matching command"""
         plan = {
@@ -91,6 +109,25 @@ class TestGenerateOpenclawCommands:
         assert len(commands) == 1
         assert len(commands[0]["commands"]) == 0
 
+    def test_prompts_by_reference(self, tmp_path, sample_plan):
+        """Test writing prompts to files and emitting only their paths"""
+        hedges = {
+            "test_agent_00": {
+                "after": 900,
+                "params": dict(sample_plan["commands"][0]["params"], label="test_agent_00__hedge")
+            }
+        }
+
+        commands = generate_openclaw_commands(sample_plan, hedges, prompt_dir=tmp_path)
+
+        cmd0 = commands[0]["commands"][0]
+        assert str(tmp_path / "test_agent_00.md") in cmd0["code"]
+        assert str(tmp_path / "test_agent_00__hedge.md") in cmd0["hedge"]["code"]
+        assert (tmp_path / "test_agent_00.md").read_text() == sample_plan["commands"][0]["params"]["task"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "test_agent_00.md", "test_agent_00__hedge.md", "test_agent_01.md", "test_agent_02.md"
+        ]
+
 
 class TestSaveExecutionScript:
     """Test execution script saving"""
@@ -135,6 +172,30 @@ class TestSaveExecutionScript:
         assert script_path.name == "execute_commands.md"
 
 
+class TestRecordExecutionStart:
+    """Test start events for full and phase-by-phase runs"""
+
+    def test_phase_runs_log_execution_started_once(self, temp_mission_dir, sample_mission, sample_plan):
+        (temp_mission_dir / "mission.json").write_text(json.dumps(sample_mission))
+
+        record_execution_start(temp_mission_dir, sample_mission, sample_plan, 2, phase=1, phase_agents=2)
+        mission = json.loads((temp_mission_dir / "mission.json").read_text())
+        record_execution_start(temp_mission_dir, mission, sample_plan, 2, phase=2, phase_agents=1)
+
+        started = read_log_events(temp_mission_dir, "execution_started")
+        assert [e["data"]["total_phases"] for e in started] == [2]
+        assert [e["data"]["phase"] for e in read_log_events(temp_mission_dir, "phase_started")] == [1, 2]
+        assert mission["status"] == "executing"
+
+    def test_full_run_has_no_phase_event(self, temp_mission_dir, sample_mission, sample_plan):
+        (temp_mission_dir / "mission.json").write_text(json.dumps(sample_mission))
+
+        record_execution_start(temp_mission_dir, sample_mission, sample_plan, 2)
+
+        assert len(read_log_events(temp_mission_dir, "execution_started")) == 1
+        assert read_log_events(temp_mission_dir, "phase_started") == []
+
+
 class TestLoadMissionError:
     """Test load_mission error handling"""
 
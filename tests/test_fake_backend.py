@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for fake_backend.py and the load generator"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+from fake_backend import FakeOpenClaw, fake_output, prompt_agent_type, prompt_section
+from assemble import generate_send_command, generate_spawn_command
+from validation import agent_specs, check_output
+
+
+AGENT = {
+    "id": "m1_agent_00",
+    "type": "coder",
+    "emoji": "💻",
+    "mode": "spawn",
+    "model": "sonnet",
+    "description": "스크래퍼 작성",
+    "inputs": ["url 목록"],
+    "expected_output": "## 요약\n## 코드",
+    "estimated_duration": 600,
+    "timeout": 3600,
+    "dependencies": []
+}
+
+
+SPEC = agent_specs({
+    "phases": [{"phase": 1, "agents": [AGENT]}],
+    "commands": [{"agent_id": AGENT["id"], "type": "spawn"}]
+})[AGENT["id"]]
+
+
+def spawn_params(tmp_path, **overrides):
+    agent = {**AGENT, **overrides}
+    return generate_spawn_command(agent, str(tmp_path))
+
+
+class TestPromptParsing:
+    """Tests for reading assemble prompts"""
+
+    def test_sections_keep_embedded_headings(self, tmp_path):
+        task = spawn_params(tmp_path)["task"]
+
+        assert prompt_section(task, "기대 출력") == "## 요약\n## 코드"
+        assert prompt_section(task, "출력 위치").endswith("outputs/m1_agent_00.md")
+        assert prompt_agent_type(task) == "coder"
+
+    def test_missing_section(self):
+        assert prompt_section("no sections here", "기대 출력") == ""
+        assert prompt_agent_type("no role line") is None
+
+    def test_fake_output_passes_validation(self):
+        content = fake_output("m1_agent_00", "## 요약\n## 코드")
+
+        assert check_output(content, SPEC) == []
+
+
+class TestFakeOpenClaw:
+    """Tests for simulated sessions"""
+
+    def make_backend(self, **rates):
+        return FakeOpenClaw(time_scale=0.0, failure_rates=rates, seed=1, max_workers=2)
+
+    def test_spawn_writes_output(self, tmp_path):
+        backend = self.make_backend()
+        try:
+            result = backend.sessions_spawn(spawn_params(tmp_path)).result()
+        finally:
+            backend.shutdown()
+
+        assert result["status"] == "ok"
+        content = (tmp_path / "outputs" / "m1_agent_00.md").read_text()
+        assert content.endswith("MISSION_COMPLETE: m1_agent_00\n")
+
+    def test_send_returns_reply(self, tmp_path):
+        agent = {**AGENT, "id": "m1_agent_01", "type": "writer", "mode": "send", "model": None}
+        params = generate_send_command(agent, "main")
+        backend = self.make_backend()
+        try:
+            result = backend.sessions_send(params).result()
+        finally:
+            backend.shutdown()
+
+        assert result["agent_id"] == "m1_agent_01"
+        assert "MISSION_COMPLETE: m1_agent_01" in result["reply"]
+        assert not (tmp_path / "outputs" / "m1_agent_01.md").exists()
+
+    @pytest.mark.parametrize("kind", ["timeout", "invalid"])
+    def test_injected_failures(self, tmp_path, kind):
+        backend = self.make_backend(**{kind: 1.0})
+        try:
+            result = backend.submit({"type": "spawn", "params": spawn_params(tmp_path)}).result()
+        finally:
+            backend.shutdown()
+
+        assert result["status"] == kind
+        output = tmp_path / "outputs" / "m1_agent_00.md"
+        if kind == "timeout":
+            assert not output.exists()
+        else:
+            assert check_output(output.read_text(), SPEC)
+
+    def test_injected_error_raises(self, tmp_path):
+        backend = self.make_backend(error=1.0)
+        try:
+            future = backend.submit({"type": "spawn", "params": spawn_params(tmp_path)})
+            with pytest.raises(RuntimeError):
+                future.result()
+        finally:
+            backend.shutdown()
+
+    def test_latency_over_timeout_is_timeout(self, tmp_path):
+        backend = self.make_backend()
+        try:
+            result = backend.sessions_spawn({**spawn_params(tmp_path), "runTimeoutSeconds": 0}).result()
+        finally:
+            backend.shutdown()
+
+        assert result["status"] == "timeout"
+
+
+class TestLoadGenerator:
+    """End-to-end tests through scheduler, backend and validation"""
+
+    def test_all_missions_complete_despite_failures(self, tmp_path):
+        from loadgen import create_missions, run_load
+        missions = create_missions(tmp_path, 3, 6, "random", seed=2)
+        backend = FakeOpenClaw(time_scale=0.00001, failure_rates={"timeout": 0.1, "invalid": 0.1}, seed=3)
+        try:
+            report = run_load(tmp_path, missions, backend, max_attempts=10)
+        finally:
+            backend.shutdown()
+
+        assert report["completed"] == 3
+        assert report["dispatches"] >= 18
+        assert report["outcomes"]["ok"] == 18
+        assert report["agent_latency"]["p50"] > 0
+
+    def test_exhausted_attempts_fail_mission(self, tmp_path):
+        from loadgen import create_missions, run_load
+        missions = create_missions(tmp_path, 1, 2, "wide")
+        backend = FakeOpenClaw(time_scale=0.00001, failure_rates={"timeout": 1.0}, seed=0)
+        try:
+            report = run_load(tmp_path, missions, backend, max_attempts=2)
+        finally:
+            backend.shutdown()
+
+        assert report["failed"] == 1
+        mission = json.loads((missions["load_0000"]["path"] / "mission.json").read_text())
+        assert mission["status"] == "failed"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for hedge.py"""
+
+import json
+import os
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from hedge import (
+    compute_hedge_delay,
+    generate_hedge_commands,
+    hedge_label,
+    hedge_summary,
+    resolve_hedges,
+)
+from utils import log_event, read_log_events, percentile
+
+
+class TestPercentile:
+    """Test percentile helper"""
+
+    def test_interpolates(self):
+        assert percentile([10, 20, 30, 40], 50) == 25
+        assert percentile([10, 20, 30, 40], 100) == 40
+        assert percentile([5], 90) == 5
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+
+class TestComputeHedgeDelay:
+    """Test hedge delay policy"""
+
+    def test_uses_percentile_with_enough_samples(self):
+        samples = [100, 200, 300, 400, 500]
+        assert compute_hedge_delay(1800, samples, pct=50, min_samples=5) == 300
+
+    def test_falls_back_to_timeout_ratio(self):
+        assert compute_hedge_delay(1800, [100], min_samples=5) == 900
+
+    def test_never_exceeds_timeout(self):
+        assert compute_hedge_delay(600, [5000] * 10, pct=90, min_samples=5) == 600
+
+
+class TestGenerateHedgeCommands:
+    """Test hedge command generation"""
+
+    def test_only_spawn_agents_are_hedged(self, temp_workspace, sample_plan):
+        store = Path(temp_workspace) / "runtime_stats.jsonl"
+        hedges = generate_hedge_commands(sample_plan, store_path=store)
+
+        assert set(hedges) == {"test_agent_00", "test_agent_01"}
+        assert hedges["test_agent_00"]["params"]["label"] == hedge_label("test_agent_00")
+        assert hedges["test_agent_00"]["after"] == 900
+
+    def test_delay_uses_runtime_store(self, temp_workspace, sample_plan):
+        store = Path(temp_workspace) / "runtime_stats.jsonl"
+        with open(store, "w") as f:
+            for i, duration in enumerate([100, 200, 300, 400, 500]):
+                f.write(json.dumps({
+                    "mission_id": "old", "agent_id": f"r{i}", "type": "researcher",
+                    "model": "sonnet", "duration": duration
+                }) + "\n")
+
+        hedges = generate_hedge_commands(sample_plan, pct=50, store_path=store)
+
+        assert hedges["test_agent_00"]["after"] == 300
+        assert hedges["test_agent_00"]["samples"] == 5
+        # analyst has no history → timeout ratio fallback
+        assert hedges["test_agent_01"]["after"] == 600
+
+    def test_hedge_prompt_targets_separate_output(self, temp_workspace):
+        plan = {
+            "phases": [{"phase": 1, "parallel": False, "agents": [{"id": "a1", "type": "writer"}]}],
+            "commands": [{
+                "agent_id": "a1",
+                "type": "spawn",
+                "params": {
+                    "task": "save to /m/outputs/a1.md\nMISSION_COMPLETE: a1",
+                    "model": "sonnet",
+                    "runTimeoutSeconds": 900,
+                    "cleanup": "keep",
+                    "label": "a1"
+                }
+            }]
+        }
+
+        params = generate_hedge_commands(plan, store_path=Path(temp_workspace) / "none.jsonl")["a1"]["params"]
+
+        assert f"outputs/{hedge_label('a1')}.md" in params["task"]
+        assert f"MISSION_COMPLETE: {hedge_label('a1')}" in params["task"]
+
+
+class TestResolveHedges:
+    """Test winner selection between primary and hedge outputs"""
+
+    def test_hedge_wins_when_primary_missing(self, temp_mission_dir, sample_plan):
+        outputs = temp_mission_dir / "outputs"
+        (outputs / f"{hedge_label('test_agent_00')}.md").write_text("hedge result")
+
+        resolutions = resolve_hedges(temp_mission_dir, sample_plan)
+
+        assert resolutions == [{"agent_id": "test_agent_00", "winner": "hedge", "cancel_label": "test_agent_00"}]
+        assert (outputs / "test_agent_00.md").read_text() == "hedge result"
+        assert not (outputs / f"{hedge_label('test_agent_00')}.md").exists()
+
+    def test_primary_wins_when_earlier(self, temp_mission_dir, sample_plan):
+        outputs = temp_mission_dir / "outputs"
+        primary = outputs / "test_agent_01.md"
+        hedge = outputs / f"{hedge_label('test_agent_01')}.md"
+        primary.write_text("primary result")
+        hedge.write_text("hedge result")
+        os.utime(primary, (1000, 1000))
+        os.utime(hedge, (2000, 2000))
+
+        resolutions = resolve_hedges(temp_mission_dir, sample_plan)
+
+        assert resolutions[0]["winner"] == "primary"
+        assert resolutions[0]["cancel_label"] == hedge_label("test_agent_01")
+        assert primary.read_text() == "primary result"
+        assert not hedge.exists()
+
+    def test_late_loser_is_discarded_once(self, temp_mission_dir, sample_plan):
+        outputs = temp_mission_dir / "outputs"
+        (outputs / f"{hedge_label('test_agent_00')}.md").write_text("hedge")
+        resolve_hedges(temp_mission_dir, sample_plan)
+
+        (outputs / f"{hedge_label('test_agent_00')}.md").write_text("late")
+        assert resolve_hedges(temp_mission_dir, sample_plan) == []
+        assert len(read_log_events(temp_mission_dir, "hedge_resolved")) == 1
+        assert (outputs / "test_agent_00.md").read_text() == "hedge"
+
+
+class TestHedgeSummary:
+    """Test win-rate reporting"""
+
+    def test_summary_reports_policy_and_win_rate(self, temp_mission_dir):
+        log_event(temp_mission_dir, "hedge_policy", {"percentile": 90})
+        log_event(temp_mission_dir, "hedge_resolved", {"agent_id": "a", "winner": "hedge"})
+        log_event(temp_mission_dir, "hedge_resolved", {"agent_id": "b", "winner": "primary"})
+
+        summary = hedge_summary(temp_mission_dir)
+
+        assert summary["policy"] == {"percentile": 90}
+        assert summary["resolved"] == 2
+        assert summary["hedge_wins"] == 1
+        assert summary["win_rate"] == 0.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Tests for metrics.py"""
+
+import json
+import shutil
+import sys
+import threading
+import urllib.request
+import pytest
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import metrics
+from metrics import (
+    MetricsHandler,
+    collect_metrics,
+    mission_observations,
+    render_metrics,
+    write_textfile,
+)
+from runtime_stats import record_agent_started
+from tracing import span
+from utils import log_event
+
+
+@pytest.fixture
+def missions(tmp_path, sample_mission, sample_plan, write_event):
+    """One running and one completed mission"""
+    root = tmp_path / "missions"
+    for mission_id, status in [("m_run", "executing"), ("m_done", "completed")]:
+        path = root / mission_id
+        (path / "outputs").mkdir(parents=True)
+        (path / "logs").mkdir()
+        (path / "mission.json").write_text(json.dumps({**sample_mission, "id": mission_id, "status": status}))
+        (path / "execution_plan.json").write_text(json.dumps(sample_plan))
+
+    done = root / "m_done"
+    write_event(done, "2026-02-06T12:00:00", "execution_started")
+    write_event(done, "2026-02-06T12:00:00", "agent_started", {"agent_id": "test_agent_00"})
+    write_event(done, "2026-02-06T12:00:10", "agent_started", {"agent_id": "test_agent_01"})
+    write_event(done, "2026-02-06T12:01:00", "agent_finished", {"agent_id": "test_agent_00"})
+    write_event(done, "2026-02-06T12:05:00", "agent_finished", {"agent_id": "test_agent_01"})
+    for agent_id in ("test_agent_00", "test_agent_01"):
+        (done / "outputs" / f"{agent_id}.md").write_text("# Result")
+    log_event(done, "output_rejected", {"agent_id": "test_agent_02", "issues": ["too short"]})
+
+    record_agent_started(root / "m_run", "test_agent_00")
+    return root
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    metrics._cache.clear()
+    yield
+    metrics._cache.clear()
+
+
+class TestObservations:
+    """Tests for per-mission observations"""
+
+    def test_counters_and_histograms(self, missions):
+        observations = mission_observations(missions / "m_done")
+
+        names = [c[0] for c in observations["counters"]]
+        assert names.count("agents_dispatched_total") == 2
+        assert names.count("agents_completed_total") == 2
+        assert names.count("agents_failed_total") == 1
+        histograms = {(name, label_set): value for name, label_set, value in observations["histograms"]}
+        assert histograms[("agent_runtime_seconds", (("type", "researcher"),))] == 60
+        assert histograms[("agent_runtime_seconds", (("type", "analyst"),))] == 290
+        assert histograms[("queue_wait_seconds", (("model", "opus"), ("type", "analyst")))] == 10
+        assert histograms[("plan_agents", ())] == 3
+
+    def test_consolidation_spans(self, missions):
+        with span(missions / "m_run", "consolidate.collect"):
+            pass
+
+        observations = mission_observations(missions / "m_run")
+
+        assert [h[:2] for h in observations["histograms"] if h[0] == "consolidate_seconds"] == [
+            ("consolidate_seconds", (("stage", "collect"),))
+        ]
+
+
+class TestExposition:
+    """Tests for the Prometheus text format"""
+
+    def test_aggregates_across_missions(self, missions):
+        text = render_metrics(collect_metrics(missions))
+
+        assert '# TYPE avengers_agents_dispatched_total counter' in text
+        assert 'avengers_missions{status="completed"} 1' in text
+        assert 'avengers_missions{status="executing"} 1' in text
+        assert 'avengers_agents_dispatched_total{model="sonnet",type="researcher"} 2' in text
+        assert 'avengers_agents_failed_total{model="default",type="writer"} 1' in text
+
+    def test_histogram_buckets_are_cumulative(self, missions):
+        text = render_metrics(collect_metrics(missions))
+
+        assert 'avengers_agent_runtime_seconds_bucket{type="analyst",le="120"} 0' in text
+        assert 'avengers_agent_runtime_seconds_bucket{type="analyst",le="300"} 1' in text
+        assert 'avengers_agent_runtime_seconds_bucket{type="analyst",le="+Inf"} 1' in text
+        assert 'avengers_agent_runtime_seconds_sum{type="analyst"} 290' in text
+        assert 'avengers_plan_agents_count 2' in text
+
+    def test_unchanged_missions_use_cache(self, missions, monkeypatch):
+        collect_metrics(missions)
+        calls = []
+        original = metrics.mission_observations
+        monkeypatch.setattr(metrics, "mission_observations", lambda p: calls.append(p.name) or original(p))
+
+        collect_metrics(missions)
+        assert calls == []
+
+        log_event(missions / "m_run", "agent_finished", {"agent_id": "test_agent_00"})
+        collect_metrics(missions)
+        assert calls == ["m_run"]
+
+    def test_counters_survive_removed_missions(self, missions):
+        series = ("agents_completed_total", (("model", "sonnet"), ("type", "researcher")))
+        assert collect_metrics(missions)["counters"][series] == 1
+
+        shutil.rmtree(missions / "m_done")
+        metrics._cache.clear()
+        collected = collect_metrics(missions)
+
+        assert collected["counters"][series] == 1
+        assert ("missions", (("status", "completed"),)) not in collected["gauges"]
+
+    def test_histograms_survive_removed_missions(self, missions):
+        before = render_metrics(collect_metrics(missions))
+        assert 'avengers_agent_runtime_seconds_count{type="analyst"} 1' in before
+
+        shutil.rmtree(missions / "m_done")
+        metrics._cache.clear()
+        after = render_metrics(collect_metrics(missions))
+
+        assert 'avengers_agent_runtime_seconds_bucket{type="analyst",le="300"} 1' in after
+        assert 'avengers_agent_runtime_seconds_sum{type="analyst"} 290' in after
+        assert 'avengers_plan_agents_count 2' in after
+
+    def test_concurrent_scrapes(self, missions):
+        errors = []
+
+        def scrape():
+            try:
+                for _ in range(5):
+                    metrics._cache.clear()
+                    collect_metrics(missions)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=scrape) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        series = ("agents_completed_total", (("model", "sonnet"), ("type", "researcher")))
+        assert collect_metrics(missions)["counters"][series] == 1
+
+    def test_counters_count_new_work_once(self, missions):
+        series = ("agents_completed_total", (("model", "sonnet"), ("type", "researcher")))
+        collect_metrics(missions)
+
+        (missions / "m_run" / "outputs" / "test_agent_00.md").write_text("# Result")
+        assert collect_metrics(missions)["counters"][series] == 2
+
+        (missions / "m_run" / "outputs" / "test_agent_00.md").unlink()
+        assert collect_metrics(missions)["counters"][series] == 2
+        (missions / "m_run" / "outputs" / "test_agent_00.md").write_text("# Result")
+        assert collect_metrics(missions)["counters"][series] == 2
+
+    def test_textfile_written_atomically(self, missions, tmp_path):
+        path = tmp_path / "collector" / "avengers.prom"
+
+        write_textfile(path, missions)
+
+        assert path.read_text().startswith("# HELP avengers_missions")
+        assert not path.with_name("avengers.prom.tmp").exists()
+
+    def test_http_endpoint(self, missions, monkeypatch):
+        monkeypatch.setattr(metrics, "MISSION_DIR", missions)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), MetricsHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert b'avengers_missions{status="completed"} 1' in response.read()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
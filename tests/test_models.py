@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for slotted mission/agent/plan models"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import assemble
+from models import AgentConfig, Command, Mission, Plan, intern_str
+
+SUBTASKS = [
+    {"description": "요구사항 분석", "type": "analyst"},
+    {"description": "프론트엔드 구현", "type": "coder", "dependencies": ["agent_00"]},
+    {"description": "기존 에이전트 검토", "type": "reviewer", "mode": "existing", "dependencies": ["agent_01"]}
+]
+
+
+@pytest.fixture
+def agents():
+    configs = [assemble.create_agent_config(st, "m1", i, {}) for i, st in enumerate(SUBTASKS)]
+    configs[2]["existing_agent_id"] = "watson"
+    return configs
+
+
+class TestAgentConfig:
+    """Tests for AgentConfig conversion and memory layout"""
+
+    def test_round_trip_keeps_shape_and_order(self, agents):
+        for agent in agents:
+            converted = AgentConfig.from_dict(agent).to_dict()
+
+            assert converted == agent
+            assert list(converted) == list(agent)
+
+    def test_unknown_keys_kept_in_extra(self, agents):
+        model = AgentConfig.from_dict(agents[2])
+
+        assert model.extra == {"existing_agent_id": "watson"}
+        assert AgentConfig.from_dict(agents[0]).extra is None
+
+    def test_slots(self, agents):
+        model = AgentConfig.from_dict(agents[0])
+
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.retries = 1
+
+    def test_repeated_strings_are_shared(self, agents):
+        # Decoded separately, equal strings are distinct objects until interned
+        first, second = json.loads(json.dumps(agents[1])), json.loads(json.dumps(agents[1]))
+        assert first["type"] is not second["type"]
+
+        a, b = AgentConfig.from_dict(first), AgentConfig.from_dict(second)
+
+        assert a.type is b.type and a.model is b.model and a.id is b.id
+
+    def test_intern_str_passes_non_strings(self):
+        assert intern_str(None) is None
+        assert intern_str(3) == 3
+
+
+class TestPlan:
+    """Tests for Plan/Phase/Command conversion"""
+
+    def test_round_trip_saved_plan(self, tmp_path, agents):
+        plan_path = assemble.save_execution_plan({"id": "m1", "path": str(tmp_path)}, agents)
+        data = json.loads(Path(plan_path).read_text())
+
+        plan = Plan.from_dict(data)
+
+        assert plan.to_dict() == data
+        assert [p.phase for p in plan.phases] == [1, 2, 3]
+        assert [a.id for a in plan.agents()] == [a["id"] for a in agents]
+        assert plan.command_index()["m1_agent_02"].type == "send"
+        assert plan.phases[1].agents[0].dependencies[0] is plan.phases[0].agents[0].id
+
+    def test_unknown_plan_keys_and_partial_entries(self, sample_plan):
+        plan = Plan.from_dict(sample_plan)
+
+        assert plan.extra == {"total_phases": 2}
+        assert plan.phases[0].agents[1].emoji == "🔍"
+        assert plan.to_dict()["total_phases"] == 2
+
+    def test_command_params_interned(self):
+        params = json.loads(json.dumps({"task": "x", "model": "claude-sonnet", "cleanup": "keep"}))
+
+        command = Command("m1_agent_00", "spawn", params)
+
+        assert command.params["model"] is sys.intern("claude-sonnet")
+
+
+class TestMission:
+    """Tests for Mission conversion"""
+
+    def test_round_trip_created_mission(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(assemble, "MISSION_DIR", tmp_path)
+        mission = assemble.create_mission("시장 조사", priority="high")
+        mission["updated_at"] = "2026-02-06T12:00:00"
+
+        model = Mission.from_dict(mission)
+
+        assert model.priority == "high"
+        assert model.extra == {"updated_at": "2026-02-06T12:00:00"}
+        assert model.to_dict() == mission
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
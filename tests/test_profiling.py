@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for profiling.py"""
+
+import cProfile
+import json
+import pstats
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from profiling import collapsed_stacks, hotspots, profiled
+from utils import read_log_events
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+def outer():
+    return busy(20000) + inner()
+
+
+def inner():
+    return busy(40000)
+
+
+def profile_outer():
+    profiler = cProfile.Profile()
+    profiler.runcall(outer)
+    return pstats.Stats(profiler)
+
+
+class TestAnalysis:
+    """Tests for hotspot and collapsed stack extraction"""
+
+    def test_hotspots_sorted_by_self_time(self):
+        spots = hotspots(profile_outer(), top=3)
+
+        assert len(spots) == 3
+        assert spots[0]["tottime"] >= spots[1]["tottime"] >= spots[2]["tottime"]
+        assert any("<genexpr>" in s["function"] for s in spots)
+
+    def test_collapsed_stacks_follow_call_paths(self):
+        stats = profile_outer()
+
+        stacks = collapsed_stacks(stats, root="cmd")
+
+        assert all(key.startswith("cmd;") for key in stacks)
+        via_inner = [k for k in stacks if ";inner (" in k and "<genexpr>" in k]
+        direct = [k for k in stacks if ";inner (" not in k and "<genexpr>" in k]
+        assert via_inner and direct
+        # inner handles twice the input, so its path gets more time
+        assert sum(stacks[k] for k in via_inner) > sum(stacks[k] for k in direct)
+        total_self = sum(entry[2] for entry in stats.stats.values()) * 1e6
+        assert sum(stacks.values()) == pytest.approx(total_self, rel=0.2)
+
+
+class TestProfiled:
+    """Tests for the --profile context manager"""
+
+    def test_disabled_yields_none(self, temp_mission_dir):
+        with profiled("monitor", False, temp_mission_dir) as session:
+            assert session is None
+
+        assert not list((temp_mission_dir / "logs").glob("profile_*"))
+
+    def test_writes_pstats_collapsed_and_event(self, temp_mission_dir, capsys):
+        with profiled("consolidate", True) as session:
+            session.attach(temp_mission_dir)
+            outer()
+
+        pstats_file = next((temp_mission_dir / "logs").glob("profile_consolidate_*.pstats"))
+        collapsed = pstats_file.with_suffix(".collapsed").read_text().splitlines()
+        assert any("outer (test_profiling.py" in line for line in collapsed)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+        assert pstats.Stats(str(pstats_file)).total_tt > 0
+
+        event = read_log_events(temp_mission_dir, "profile_saved")[0]["data"]
+        assert event["command"] == "consolidate"
+        assert event["peak_kb"] > 0
+        assert "🔥 프로파일 consolidate" in capsys.readouterr().err
+
+    def test_saves_on_exit_and_without_mission(self, capsys):
+        with pytest.raises(SystemExit):
+            with profiled("execute", True):
+                sys.exit(1)
+
+        assert "저장 생략" in capsys.readouterr().err
+
+    def test_monitor_json_output_stays_clean(self, tmp_path, sample_mission, sample_plan, monkeypatch, capsys):
+        import utils
+        import monitor
+        mission_path = tmp_path / "test_mission_123"
+        (mission_path / "logs").mkdir(parents=True)
+        (mission_path / "outputs").mkdir()
+        (mission_path / "mission.json").write_text(json.dumps({**sample_mission, "path": str(mission_path)}))
+        (mission_path / "execution_plan.json").write_text(json.dumps(sample_plan))
+        monkeypatch.setattr(utils, "MISSION_DIR", tmp_path)
+        monkeypatch.setattr(sys, "argv", ["monitor.py", "-m", "test_mission_123", "--json", "--profile"])
+
+        monitor.main()
+
+        out = capsys.readouterr()
+        assert json.loads(out.out)["mission"]["id"] == "test_mission_123"
+        assert "🔥 프로파일 monitor" in out.err
+        assert list((mission_path / "logs").glob("profile_monitor_*.collapsed"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
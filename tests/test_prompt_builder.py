@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for prompt_builder.py"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from prompt_builder import (
+    TRUNCATION_MARK,
+    allocate_budget,
+    estimate_tokens,
+    fit_agent_inputs,
+    fit_texts,
+    prompt_budget,
+    summarize_markdown,
+    truncate_to_tokens,
+)
+from assemble import build_agent_command, create_agent_config
+from config import DEFAULT_PROMPT_BUDGET
+
+
+LONG_DOC = "\n".join(
+    f"## Section {i}\nFirst sentence of section {i}. " + "Detail text here. " * 50
+    for i in range(10)
+)
+
+
+class TestEstimateTokens:
+    """Test the local tokenizer approximation"""
+
+    def test_ascii_and_korean(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("한국어") == 3
+
+    def test_unknown_model_budget(self):
+        assert prompt_budget("unknown") == DEFAULT_PROMPT_BUDGET
+        assert prompt_budget(None) == DEFAULT_PROMPT_BUDGET
+
+
+class TestSummarize:
+    """Test truncation and hierarchical summarization"""
+
+    def test_truncate_respects_budget(self):
+        result = truncate_to_tokens("line one\n" * 200, 50)
+
+        assert estimate_tokens(result) <= 50
+        assert result.endswith(TRUNCATION_MARK)
+
+    def test_outline_level(self):
+        summary = summarize_markdown(LONG_DOC, 200)
+
+        assert "## Section 9" in summary
+        assert "First sentence of section 0." in summary
+        assert "Detail text here" not in summary
+        assert estimate_tokens(summary) <= 200
+
+    def test_headings_level(self):
+        summary = summarize_markdown(LONG_DOC, 40)
+
+        assert "## Section 0" in summary
+        assert "First sentence" not in summary
+
+    def test_small_text_unchanged(self):
+        assert summarize_markdown("short", 100) == "short"
+
+
+class TestAllocation:
+    """Test budget distribution across inputs"""
+
+    def test_water_filling(self):
+        assert allocate_budget([10, 500, 1000], 310) == [10, 150, 150]
+        assert allocate_budget([10, 20], 100) == [10, 20]
+
+    def test_fit_texts_keeps_small_inputs_verbatim(self):
+        texts = ["tiny input", LONG_DOC]
+
+        fitted = fit_texts(texts, 150)
+
+        assert fitted[0] == "tiny input"
+        assert sum(estimate_tokens(t) for t in fitted) <= 150
+
+
+class TestBuildAgentCommand:
+    """Test budget-aware command construction"""
+
+    def test_oversize_inputs_are_fitted(self):
+        agent = create_agent_config({"description": "요약", "model": "haiku", "inputs": [LONG_DOC] * 20}, "m", 0, {})
+
+        command = build_agent_command(agent, "/tmp/m")
+
+        assert command["type"] == "spawn"
+        assert command["prompt_tokens"] <= prompt_budget("haiku")
+        assert command["prompt_tokens"] == estimate_tokens(command["params"]["task"])
+
+    def test_small_inputs_untouched(self):
+        agent = create_agent_config({"description": "조사", "inputs": ["A사"]}, "m", 0, {})
+
+        assert fit_agent_inputs(agent, 1000) is agent
+        assert "A사" in build_agent_command(agent, "/tmp/m")["params"]["task"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
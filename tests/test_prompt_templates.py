@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for compiled prompt templates"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import prompt_templates
+from prompt_templates import (
+    DEFAULT_EXPECTED_OUTPUT, NO_INPUTS, compile_template, format_inputs, load_template_overrides,
+    refresh_template_overrides, render_prompt, render_prompts, set_template_overrides
+)
+
+AGENT = {
+    "id": "m1_agent_00",
+    "type": "researcher",
+    "emoji": "🔬",
+    "description": "시장 조사 {not a field} `code` ${x}",
+    "inputs": ["회사 A", "quote \" and \\\\ backslash"],
+    "expected_output": "## 요약"
+}
+
+
+@pytest.fixture(autouse=True)
+def no_overrides():
+    set_template_overrides({})
+    yield
+    set_template_overrides(None)
+
+
+class TestDefaultTemplates:
+    """Tests for the built-in spawn/send prompts"""
+
+    def test_spawn_prompt(self):
+        prompt = render_prompt("spawn", AGENT, "/missions/m1")
+
+        assert "\n## 당신의 역할\n🔬 RESEARCHER 에이전트\n" in prompt
+        assert f"\n## 태스크\n{AGENT['description']}\n" in prompt
+        assert f"\n## 입력 데이터\n{json.dumps(AGENT['inputs'], ensure_ascii=False)}\n" in prompt
+        assert "/missions/m1/outputs/m1_agent_00.md" in prompt
+        assert prompt.count("MISSION_COMPLETE: m1_agent_00") == 2
+
+    def test_send_prompt_defaults(self):
+        agent = {"id": "a1", "description": "검토", "inputs": [], "expected_output": ""}
+
+        prompt = render_prompt("send", agent, label="watson")
+
+        assert f"\n## 입력 데이터\n{NO_INPUTS}\n" in prompt
+        assert f"\n## 기대 출력\n{DEFAULT_EXPECTED_OUTPUT}\n" in prompt
+        assert '"MISSION_COMPLETE: a1" 라고 알려줘' in prompt
+
+    def test_bulk_matches_single(self):
+        agents = [AGENT, {**AGENT, "id": "m1_agent_01", "type": "coder", "emoji": "💻", "inputs": []}]
+
+        assert render_prompts("spawn", agents, "/m") == [render_prompt("spawn", a, "/m") for a in agents]
+        assert render_prompts("send", agents, labels=["x", "y"]) == [
+            render_prompt("send", agents[0], label="x"), render_prompt("send", agents[1], label="y")
+        ]
+
+    @pytest.mark.parametrize("inputs", [
+        ["plain"], ["탭\t줄바꿈\n", "\x00\x1f", "😀  "], ["a", 1, None, {"k": ["v"]}], [{"nested": "한글"}]
+    ])
+    def test_format_inputs_matches_json_dumps(self, inputs):
+        assert format_inputs(inputs) == json.dumps(inputs, ensure_ascii=False)
+
+
+class TestCompile:
+    """Tests for template compilation"""
+
+    def test_static_fields_baked_in(self):
+        render = compile_template("{emoji}|{role}|{type}|{agent_id}", {"emoji": "💻", "type": "coder", "role": "CODER"})
+
+        assert render("d", "i", "e", "m", "a1", "") == "💻|CODER|coder|a1"
+
+    def test_literals_are_not_code(self):
+        text = "'''\"\"\" \\n {{braces}} {label!r:>8} __import__('os')"
+
+        render = compile_template(text)
+
+        assert render("", "", "", "", "", "w") == "'''\"\"\" \\n {braces}      'w' __import__('os')"
+
+    @pytest.mark.parametrize("text", [
+        "{unknown}", "{}", "{inputs[0]}", "{agent_id:'}", "{agent_id:{x}}", "{description!x}", "{emoji!x}"
+    ])
+    def test_rejects_bad_fields(self, text):
+        with pytest.raises(ValueError):
+            compile_template(text)
+
+
+class TestOverrides:
+    """Tests for user-overridable templates"""
+
+    def test_type_override_wins(self):
+        set_template_overrides({"spawn": "전체 {agent_id}", "spawn.coder": "{emoji} 코더 {agent_id}"})
+
+        assert render_prompt("spawn", {**AGENT, "type": "coder", "emoji": "💻"}) == "💻 코더 m1_agent_00"
+        assert render_prompt("spawn", AGENT) == "전체 m1_agent_00"
+        assert render_prompt("send", AGENT).startswith("\n# 🦸 Avengers Mission 요청")
+
+    def test_load_from_directory(self, tmp_path):
+        (tmp_path / "spawn.writer.md").write_text("작가 {agent_id}")
+        (tmp_path / "send.md").write_text("보내기 {agent_id}")
+        (tmp_path / "notes.md").write_text("무시")
+
+        assert load_template_overrides(tmp_path) == {"send": "보내기 {agent_id}", "spawn.writer": "작가 {agent_id}"}
+        assert load_template_overrides(tmp_path / "missing") == {}
+
+    def test_refresh_picks_up_edited_templates(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(prompt_templates, "PROMPT_TEMPLATE_DIR", str(tmp_path))
+        (tmp_path / "spawn.md").write_text("v1 {agent_id}")
+        set_template_overrides(None)
+        assert render_prompt("spawn", AGENT) == "v1 m1_agent_00"
+
+        assert refresh_template_overrides() is False
+        (tmp_path / "spawn.md").write_text("version 2 {agent_id}")
+
+        assert refresh_template_overrides() is True
+        assert render_prompt("spawn", AGENT) == "version 2 m1_agent_00"
+
+    def test_refresh_keeps_explicit_overrides(self):
+        set_template_overrides({"spawn": "고정 {agent_id}"})
+
+        assert refresh_template_overrides() is False
+        assert render_prompt("spawn", AGENT) == "고정 m1_agent_00"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
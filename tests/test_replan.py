@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Tests for replan.py"""
+
+import json
+import os
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from assemble import create_agent_config, save_execution_plan
+from execute import generate_openclaw_commands
+from replan import diff_plan, replan_mission
+from runtime_stats import plan_agent_info
+from validation import agent_specs
+from utils import read_log_events
+
+
+SUBTASKS = [
+    {"description": "A사 조사", "type": "researcher"},
+    {"description": "B사 조사", "type": "researcher"},
+    {"description": "비교 분석", "type": "analyst", "dependencies": ["agent_00", "agent_01"]},
+    {"description": "리포트 작성", "type": "writer", "dependencies": ["agent_02"]}
+]
+
+
+@pytest.fixture
+def planned_mission(temp_mission_dir):
+    """Mission with an initial plan and all outputs finished"""
+    mission = {"id": "test_mission_123", "path": str(temp_mission_dir), "task": "t",
+               "status": "executing", "created_at": "2026-02-06T12:00:00"}
+    (temp_mission_dir / "mission.json").write_text(json.dumps(mission))
+
+    agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(SUBTASKS)]
+    with open(save_execution_plan(mission, agents)) as f:
+        plan = json.load(f)
+
+    for a in agents:
+        (temp_mission_dir / "outputs" / f"{a['id']}.md").write_text(f"output {a['id']}")
+
+    return mission, plan
+
+
+def agent_ids(n):
+    return [f"test_mission_123_agent_{i:02d}" for i in n]
+
+
+class TestDiffPlan:
+    """Test diffing new subtasks against an existing plan"""
+
+    def test_no_changes_keeps_everything(self, planned_mission):
+        mission, plan = planned_mission
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(SUBTASKS)]
+
+        diff, _ = diff_plan(mission["id"], plan, agents, set(agent_ids(range(4))))
+
+        assert diff["kept"] == agent_ids(range(4))
+        assert diff["changed"] == diff["added"] == diff["removed"] == diff["downstream"] == []
+
+    def test_change_propagates_downstream_only(self, planned_mission):
+        mission, plan = planned_mission
+        subtasks = [dict(st) for st in SUBTASKS]
+        subtasks[1]["description"] = "B사 심층 조사"
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(subtasks)]
+
+        diff, _ = diff_plan(mission["id"], plan, agents, set(agent_ids(range(4))))
+
+        assert diff["changed"] == agent_ids([1])
+        assert diff["downstream"] == agent_ids([2, 3])
+        assert diff["kept"] == agent_ids([0])
+
+    def test_added_and_removed(self, planned_mission):
+        mission, plan = planned_mission
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(SUBTASKS[:2])]
+
+        diff, _ = diff_plan(mission["id"], plan, agents, set(agent_ids(range(4))))
+
+        assert diff["removed"] == agent_ids([2, 3])
+        assert diff["kept"] == agent_ids([0, 1])
+
+
+    def test_inserted_subtask_keeps_later_agents(self, planned_mission):
+        mission, plan = planned_mission
+        subtasks = [{"description": "C사 조사", "type": "researcher"}] + [
+            dict(st, dependencies=[f"agent_{int(d[-2:]) + 1:02d}" for d in st.get("dependencies", [])])
+            for st in SUBTASKS
+        ]
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(subtasks)]
+
+        diff, matched = diff_plan(mission["id"], plan, agents, set(agent_ids(range(4))))
+
+        assert diff["kept"] == agent_ids(range(4))
+        assert diff["added"] == agent_ids([4])
+        assert diff["changed"] == diff["removed"] == diff["downstream"] == []
+        assert matched[3]["dependencies"] == agent_ids([0, 1])
+
+    def test_removed_subtask_keeps_unrelated_agents(self, planned_mission):
+        mission, plan = planned_mission
+        subtasks = [SUBTASKS[1], dict(SUBTASKS[2], dependencies=["agent_00"]), dict(SUBTASKS[3], dependencies=["agent_01"])]
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(subtasks)]
+
+        diff, _ = diff_plan(mission["id"], plan, agents, set(agent_ids(range(4))))
+
+        assert diff["removed"] == agent_ids([0])
+        assert diff["changed"] == agent_ids([2])
+        assert diff["downstream"] == agent_ids([3])
+        assert diff["kept"] == agent_ids([1])
+
+    def test_plan_without_fingerprints_is_unknown(self, planned_mission):
+        mission, plan = planned_mission
+        legacy = {k: v for k, v in plan.items() if k != "fingerprints"}
+        agents = [create_agent_config(st, mission["id"], i, {}) for i, st in enumerate(SUBTASKS)]
+
+        diff, _ = diff_plan(mission["id"], legacy, agents, set(agent_ids([0, 1])))
+
+        assert diff["unknown"] == agent_ids(range(4))
+        assert diff["kept"] == agent_ids([0, 1])
+        assert diff["changed"] == diff["downstream"] == []
+
+
+class TestReplanMission:
+    """Test applying a replan"""
+
+    def test_replan_archives_stale_and_recomputes_phases(self, planned_mission, temp_mission_dir):
+        mission, plan = planned_mission
+        subtasks = [dict(st) for st in SUBTASKS]
+        subtasks[3]["expected_output"] = "경영진 요약 포함"
+
+        diff, plan_path = replan_mission(mission, plan, subtasks)
+
+        with open(plan_path) as f:
+            new_plan = json.load(f)
+
+        last = agent_ids([3])[0]
+        assert diff["changed"] == [last]
+        assert new_plan["completed_agents"] == agent_ids(range(3))
+        assert [[(a["id"], a["status"]) for a in p["agents"]] for p in new_plan["phases"]] == [
+            [(agent_ids([0])[0], "completed"), (agent_ids([1])[0], "completed")],
+            [(agent_ids([2])[0], "completed")],
+            [(last, "pending")]
+        ]
+        emitted = [c["agent_id"] for p in generate_openclaw_commands(new_plan) for c in p["commands"]]
+        assert emitted == [last]
+        assert plan_agent_info(new_plan)[agent_ids([2])[0]]["type"] == "analyst"
+        assert agent_specs(new_plan)[agent_ids([0])[0]]["type"] == "researcher"
+        assert len(new_plan["commands"]) == 4
+        assert not (temp_mission_dir / "outputs" / f"{last}.md").exists()
+        assert list((temp_mission_dir / "outputs" / ".stale").rglob(f"{last}.md"))
+        assert read_log_events(temp_mission_dir, "replanned")[0]["data"]["invalidated"] == [last]
+
+    def test_dry_run_changes_nothing(self, planned_mission, temp_mission_dir):
+        mission, plan = planned_mission
+        before = (temp_mission_dir / "execution_plan.json").read_text()
+
+        replan_mission(mission, plan, [dict(SUBTASKS[0], description="변경")], dry_run=True)
+
+        assert (temp_mission_dir / "execution_plan.json").read_text() == before
+        assert len(list((temp_mission_dir / "outputs").glob("*.md"))) == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
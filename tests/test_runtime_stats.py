@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Tests for runtime_stats.py"""
+
+import os
+import sys
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from runtime_stats import (
+    adaptive_timeout,
+    collect_mission_samples,
+    compute_runtime_stats,
+    estimate_agent_runtimes,
+    estimate_duration,
+    ingest_mission,
+    load_runtime_model,
+    plan_agent_info,
+    record_agent_finished,
+    record_agent_started,
+)
+from assemble import create_agent_config
+from config import RUNTIME_MIN_TIMEOUT, RUNTIME_TIMEOUT_MULTIPLIER
+
+
+def make_samples(agent_type, model, durations):
+    return [
+        {"mission_id": "m", "agent_id": f"{agent_type}_{i}", "type": agent_type, "model": model, "duration": d}
+        for i, d in enumerate(durations)
+    ]
+
+
+class TestPlanAgentInfo:
+    """Test extraction of per-agent metadata from plans"""
+
+    def test_type_model_and_prompt_size(self, sample_plan):
+        info = plan_agent_info(sample_plan)
+
+        assert info["test_agent_00"] == {"type": "researcher", "model": "sonnet", "prompt_size": len("Research competitors")}
+        assert info["test_agent_02"]["model"] is None
+        assert info["test_agent_02"]["prompt_size"] == len("Write final report")
+
+
+class TestCollectMissionSamples:
+    """Test sample collection from execution events"""
+
+    def test_prefers_start_finish_events(self, temp_mission_dir, sample_plan, write_event):
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "agent_started", {"agent_id": "test_agent_00"})
+        write_event(temp_mission_dir, "2026-02-06T12:05:00", "agent_finished", {"agent_id": "test_agent_00"})
+
+        samples = collect_mission_samples(temp_mission_dir, sample_plan)
+
+        assert len(samples) == 1
+        assert samples[0]["agent_id"] == "test_agent_00"
+        assert samples[0]["duration"] == pytest.approx(300)
+        assert samples[0]["model"] == "sonnet"
+
+    def test_output_mtime_fallback(self, temp_mission_dir, sample_plan, write_event):
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "execution_started")
+        base = datetime.fromisoformat("2026-02-06T12:00:00").timestamp()
+
+        outputs = temp_mission_dir / "outputs"
+        for agent_id, offset in [("test_agent_00", 100), ("test_agent_01", 300), ("test_agent_02", 500)]:
+            path = outputs / f"{agent_id}.md"
+            path.write_text("done")
+            os.utime(path, (base + offset, base + offset))
+
+        runtimes = {r["agent_id"]: r["duration"] for r in estimate_agent_runtimes(temp_mission_dir, sample_plan)}
+
+        assert runtimes["test_agent_00"] == pytest.approx(100)
+        assert runtimes["test_agent_01"] == pytest.approx(300)
+        # Phase 2 starts when phase 1's last output landed
+        assert runtimes["test_agent_02"] == pytest.approx(200)
+
+    def test_no_events(self, temp_mission_dir, sample_plan):
+        assert collect_mission_samples(temp_mission_dir, sample_plan) == []
+
+
+class TestIngestMission:
+    """Test appending samples to the store"""
+
+    def test_ingest_is_idempotent(self, temp_mission_dir, sample_plan, temp_workspace, write_event):
+        store = Path(temp_workspace) / "runtime_stats.jsonl"
+        record_agent_started(temp_mission_dir, "test_agent_00")
+        record_agent_finished(temp_mission_dir, "test_agent_00")
+        # Same-second start/finish pairs carry no information
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "agent_started", {"agent_id": "test_agent_01"})
+        write_event(temp_mission_dir, "2026-02-06T12:10:00", "agent_finished", {"agent_id": "test_agent_01"})
+
+        assert ingest_mission(temp_mission_dir, sample_plan, store) >= 1
+        assert ingest_mission(temp_mission_dir, sample_plan, store) == 0
+
+        stats = load_runtime_model(store)
+        assert stats["analyst"]["count"] == 1
+        assert stats["analyst/opus"]["p50"] == pytest.approx(600)
+
+
+class TestAdaptiveTimeout:
+    """Test timeout and duration estimation"""
+
+    def test_default_without_samples(self):
+        assert adaptive_timeout("coder", "opus", 2400, {}) == 2400
+        assert estimate_duration("coder", "opus", 2400, {}) == 1200
+
+    def test_uses_observed_percentile(self):
+        stats = compute_runtime_stats(make_samples("coder", "opus", [400] * 10))
+
+        assert adaptive_timeout("coder", "opus", 2400, stats) == int(400 * RUNTIME_TIMEOUT_MULTIPLIER)
+        assert estimate_duration("coder", "opus", 2400, stats) == 400
+
+    def test_falls_back_to_type_when_model_sparse(self):
+        samples = make_samples("coder", "opus", [400] * 10) + make_samples("coder", "haiku", [100])
+        stats = compute_runtime_stats(samples)
+
+        assert estimate_duration("coder", "haiku", 2400, stats) == 400
+
+    def test_minimum_timeout(self):
+        stats = compute_runtime_stats(make_samples("reviewer", "opus", [5] * 10))
+
+        assert adaptive_timeout("reviewer", "opus", 600, stats) == RUNTIME_MIN_TIMEOUT
+
+    def test_create_agent_config_uses_runtime_model(self):
+        stats = compute_runtime_stats(make_samples("researcher", "sonnet", [200] * 10))
+
+        config = create_agent_config({"description": "조사"}, "m", 0, stats)
+        assert config["timeout"] == int(200 * RUNTIME_TIMEOUT_MULTIPLIER)
+        assert config["estimated_duration"] == 200
+
+        config = create_agent_config({"description": "조사", "timeout": 42}, "m", 1, stats)
+        assert config["timeout"] == 42
+
+    def test_create_agent_config_defaults_to_static_timeout(self, monkeypatch):
+        import assemble
+        import runtime_stats
+
+        def fail(*args, **kwargs):
+            raise AssertionError("runtime model must not be loaded")
+
+        monkeypatch.setattr(assemble, "load_runtime_model", fail)
+        monkeypatch.setattr(runtime_stats, "load_runtime_model", fail)
+
+        config = assemble.create_agent_config({"description": "조사", "type": "researcher"}, "m", 0)
+        assert config["timeout"] == assemble.AGENT_TYPES["researcher"]["timeout"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
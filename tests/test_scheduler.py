@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Tests for scheduler.py"""
+
+import json
+import sys
+import time
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from scheduler import (
+    agent_states,
+    dispatch,
+    load_active_missions,
+    mission_weight,
+    schedule_next,
+)
+from utils import read_log_events
+
+
+LIMITS = {"sonnet": {"max_concurrency": 100, "rate_per_minute": 6000, "burst": 100}}
+
+
+def make_mission(root, mission_id, n_agents, priority="normal", status="executing", duration=100):
+    """Create a single-phase mission with n spawn agents on disk"""
+    path = root / mission_id
+    (path / "outputs").mkdir(parents=True)
+    (path / "logs").mkdir()
+    agents = [{"id": f"{mission_id}_agent_{i:02d}", "type": "researcher", "emoji": "🔬",
+               "mode": "spawn", "model": "sonnet", "estimated_duration": duration,
+               "dependencies": [], "description": "d"} for i in range(n_agents)]
+    plan = {
+        "mission_id": mission_id,
+        "total_agents": n_agents,
+        "phases": [{"phase": 1, "parallel": True, "agents": agents}],
+        "commands": [{"agent_id": a["id"], "type": "spawn", "params": {
+            "task": "t", "model": "sonnet", "runTimeoutSeconds": 600, "cleanup": "keep", "label": a["id"]
+        }} for a in agents]
+    }
+    mission = {"id": mission_id, "path": str(path), "task": "t", "status": status,
+               "priority": priority, "created_at": "2026-02-06T12:00:00"}
+    (path / "mission.json").write_text(json.dumps(mission))
+    (path / "execution_plan.json").write_text(json.dumps(plan))
+    return path
+
+
+class TestMissionWeight:
+    """Test priority weights"""
+
+    def test_known_and_default_priorities(self):
+        assert mission_weight({"priority": "urgent"}) > mission_weight({"priority": "low"})
+        assert mission_weight({}) == mission_weight({"priority": "normal"})
+        assert mission_weight({"priority": "bogus"}) == mission_weight({"priority": "normal"})
+
+
+class TestAgentStates:
+    """Test readiness computation"""
+
+    def test_dependency_based_states(self, temp_mission_dir, sample_plan):
+        sample_plan["phases"][1]["agents"][0]["dependencies"] = ["test_agent_00"]
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text("done\nMISSION_COMPLETE: test_agent_00\n")
+
+        states = agent_states(temp_mission_dir, sample_plan)
+
+        assert states == {"test_agent_00": "done", "test_agent_01": "ready", "test_agent_02": "ready"}
+
+    def test_output_still_being_written_is_not_done(self, temp_mission_dir, sample_plan):
+        from runtime_stats import record_agent_finished, record_agent_started
+        sample_plan["phases"][1]["agents"][0]["dependencies"] = ["test_agent_00"]
+        record_agent_started(temp_mission_dir, "test_agent_00")
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text("partial")
+
+        states = agent_states(temp_mission_dir, sample_plan)
+        assert states["test_agent_00"] == "running"
+        assert states["test_agent_02"] == "blocked"
+
+        record_agent_finished(temp_mission_dir, "test_agent_00")
+        states = agent_states(temp_mission_dir, sample_plan)
+        assert states["test_agent_00"] == "done"
+        assert states["test_agent_02"] == "ready"
+
+    def test_phase_fallback_without_dependencies(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text("done")
+
+        states = agent_states(temp_mission_dir, sample_plan)
+
+        assert states["test_agent_02"] == "blocked"
+
+    def test_started_agents_are_running(self, temp_mission_dir, sample_plan):
+        from runtime_stats import record_agent_started
+        record_agent_started(temp_mission_dir, "test_agent_01")
+
+        assert agent_states(temp_mission_dir, sample_plan)["test_agent_01"] == "running"
+
+    def test_rejected_output_becomes_ready_again(self, temp_mission_dir, sample_plan):
+        from runtime_stats import record_agent_finished, record_agent_started
+        from validation import validate_mission_outputs
+        record_agent_started(temp_mission_dir, "test_agent_01")
+        (temp_mission_dir / "outputs" / "test_agent_01.md").write_text("truncated")
+        record_agent_finished(temp_mission_dir, "test_agent_01")
+
+        validate_mission_outputs(temp_mission_dir, sample_plan)
+
+        assert agent_states(temp_mission_dir, sample_plan)["test_agent_01"] == "ready"
+
+    def test_failed_agent_becomes_ready_again(self, temp_mission_dir, sample_plan):
+        from runtime_stats import record_agent_failed, record_agent_started
+        record_agent_started(temp_mission_dir, "test_agent_01")
+        record_agent_failed(temp_mission_dir, "test_agent_01", {"reason": "timeout"})
+
+        assert agent_states(temp_mission_dir, sample_plan)["test_agent_01"] == "ready"
+
+
+class TestScheduleNext:
+    """Test weighted fair queuing across missions"""
+
+    def test_only_executing_missions_loaded(self, temp_workspace):
+        root = Path(temp_workspace)
+        make_mission(root, "m_exec", 2)
+        make_mission(root, "m_done", 2, status="completed")
+
+        assert [m["mission"]["id"] for m in load_active_missions(root)] == ["m_exec"]
+
+    def test_small_mission_not_starved(self, temp_workspace):
+        root = Path(temp_workspace)
+        make_mission(root, "big", 1000)
+        make_mission(root, "small", 2)
+
+        selected = schedule_next(load_active_missions(root), limit=4, limits=LIMITS)
+
+        assert [s["mission_id"] for s in selected].count("small") == 2
+
+    def test_priority_weights_share(self, temp_workspace):
+        root = Path(temp_workspace)
+        make_mission(root, "low", 50, priority="low")
+        make_mission(root, "urgent", 50, priority="urgent")
+
+        selected = schedule_next(load_active_missions(root), limit=18, limits=LIMITS)
+        counts = {mid: [s["mission_id"] for s in selected].count(mid) for mid in ("low", "urgent")}
+
+        assert counts["urgent"] == 8 * counts["low"]
+
+    def test_capacity_shared_across_missions(self, temp_workspace):
+        root = Path(temp_workspace)
+        make_mission(root, "a", 5)
+        make_mission(root, "b", 5)
+        limits = {"sonnet": {"max_concurrency": 3, "rate_per_minute": 60, "burst": 3}}
+
+        assert len(schedule_next(load_active_missions(root), limits=limits)) == 3
+
+    def test_rate_limit_enforced_across_calls(self, temp_workspace):
+        root = Path(temp_workspace)
+        make_mission(root, "a", 5)
+        make_mission(root, "b", 5)
+        limits = {"sonnet": {"max_concurrency": 100, "rate_per_minute": 6, "burst": 2}}
+
+        first = schedule_next(load_active_missions(root), limits=limits)
+        assert len(first) == 2
+        dispatch(first)
+
+        # Burst is spent; the next call replays the logged starts instead of starting full
+        assert schedule_next(load_active_missions(root), limits=limits) == []
+        # One token refills every 10 seconds
+        later = schedule_next(load_active_missions(root), limits=limits, now=time.time() + 10)
+        assert len(later) == 1
+
+    def test_dispatch_records_start(self, temp_workspace):
+        root = Path(temp_workspace)
+        path = make_mission(root, "m", 2)
+        missions = load_active_missions(root)
+
+        result = dispatch(schedule_next(missions, limit=1, limits=LIMITS))
+
+        assert "sessions_spawn" in result[0]["code"]
+        assert len(read_log_events(path, "agent_started")) == 1
+        # Already-dispatched agent is now running and not selected again
+        again = schedule_next(load_active_missions(root), limits=LIMITS)
+        assert [s["agent"]["id"] for s in again] == ["m_agent_01"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
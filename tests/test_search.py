@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for search.py"""
+
+import json
+import shutil
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from search import (
+    build_query,
+    index_all,
+    index_mission,
+    open_index,
+    search,
+    update_index,
+)
+from utils import log_event
+
+
+@pytest.fixture
+def missions(tmp_path, sample_plan):
+    """Two missions on disk with outputs and logs"""
+    root = tmp_path / "missions"
+    for mission_id, task, output in [
+        ("m_alpha", "경쟁사 가격 조사", "# 결과\n\n경쟁사를 조사한 결과 가격 인하 추세가 확인됨"),
+        ("m_beta", "Kubernetes autoscaling review", "# Findings\n\nHorizontal pod autoscaler thresholds are too low"),
+    ]:
+        path = root / mission_id
+        (path / "outputs").mkdir(parents=True)
+        (path / "logs").mkdir()
+        (path / "mission.json").write_text(json.dumps({"id": mission_id, "task": task}, ensure_ascii=False))
+        (path / "execution_plan.json").write_text(json.dumps(sample_plan))
+        (path / "outputs" / "test_agent_00.md").write_text(output)
+        log_event(path, "execution_started", {"note": f"{mission_id} started"})
+    return root
+
+
+@pytest.fixture
+def conn(tmp_path):
+    connection = open_index(tmp_path / "index.db")
+    yield connection
+    connection.close()
+
+
+class TestIndexing:
+    """Tests for building and updating the index"""
+
+    def test_index_all_is_incremental(self, conn, missions):
+        assert index_all(conn, missions) == {"missions": 2, "indexed": 2, "removed": 0}
+        assert index_all(conn, missions)["indexed"] == 0
+
+        (missions / "m_beta" / "outputs" / "test_agent_01.md").write_text("new result")
+        assert index_all(conn, missions)["indexed"] == 1
+
+    def test_removed_missions_dropped(self, conn, missions):
+        index_all(conn, missions)
+        shutil.rmtree(missions / "m_beta")
+
+        assert index_all(conn, missions)["removed"] == 1
+        assert search(conn, "autoscaler") == []
+
+    def test_archived_missions_stay_searchable(self, conn, missions, tmp_path):
+        index_all(conn, missions, archive_dir=tmp_path / "archive")
+        (tmp_path / "archive").mkdir()
+        (tmp_path / "archive" / "index.json").write_text(json.dumps({"m_beta": {}}))
+        shutil.rmtree(missions / "m_beta")
+
+        assert index_all(conn, missions, archive_dir=tmp_path / "archive")["removed"] == 0
+        assert search(conn, "autoscaler")
+
+    def test_reindex_replaces_documents(self, conn, missions):
+        index_mission(conn, missions / "m_alpha")
+        (missions / "m_alpha" / "outputs" / "test_agent_00.md").write_text("# 결과\n\n완전히 새로운 내용")
+        index_mission(conn, missions / "m_alpha")
+
+        assert search(conn, "가격 인하", kind="output") == []
+        assert len(search(conn, "새로운", kind="output")) == 1
+
+    def test_update_index_helper(self, tmp_path, missions):
+        index_path = tmp_path / "other.db"
+        assert update_index(missions / "m_alpha", index_path) is True
+        assert update_index(missions / "m_alpha", index_path) is False
+
+
+class TestSearch:
+    """Tests for querying the index"""
+
+    def test_prefix_matching_for_korean_particles(self, conn, missions):
+        index_all(conn, missions)
+
+        hits = search(conn, "경쟁사 가격")
+
+        assert hits
+        assert {h["mission_id"] for h in hits} == {"m_alpha"}
+        assert {"task", "output"} <= {h["kind"] for h in hits}
+
+    def test_filters_and_snippets(self, conn, missions):
+        index_all(conn, missions)
+
+        hits = search(conn, "autoscaler", kind="output")
+
+        assert [(h["mission_id"], h["ref"]) for h in hits] == [("m_beta", "test_agent_00")]
+        assert "[autoscaler]" in hits[0]["snippet"]
+        assert search(conn, "autoscaler", mission_id="m_alpha") == []
+
+    def test_log_events_indexed(self, conn, missions):
+        index_all(conn, missions)
+        assert search(conn, "started", kind="log")
+
+    def test_build_query(self):
+        assert build_query("시장 분석") == '"시장"* "분석"*'
+        assert build_query('"exact phrase"') == '"exact phrase"'
+        assert build_query("!!!") == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for JSON serialization and schema validation"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import serialization
+from serialization import (
+    DECODERS, MissionSchema, PlanSchema, SchemaError, compile_schema, dumps, loads, read_json, validate, write_json
+)
+from exceptions import InvalidMissionError
+
+
+class TestCodec:
+    """Tests for encoding and decoding across backends"""
+
+    @pytest.mark.parametrize("backend", sorted(DECODERS))
+    def test_round_trip(self, backend):
+        obj = {"id": "m1", "task": "시장 조사", "phases": [{"phase": 1, "agents": []}], "ratio": 0.5}
+
+        assert loads(dumps(obj, backend=backend), backend) == obj
+        assert loads(dumps(obj, pretty=True, backend=backend).decode(), backend) == obj
+
+    @pytest.mark.parametrize("backend", sorted(DECODERS))
+    def test_compact_by_default(self, backend):
+        data = dumps({"a": [1, 2], "b": "한글"}, backend=backend)
+
+        assert b"\n" not in data and b" " not in data
+        assert "한글".encode() in data
+
+    @pytest.mark.parametrize("backend", sorted(DECODERS))
+    def test_syntax_error_is_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            loads(b"{not json", backend)
+
+
+class TestSchema:
+    """Tests for plan and mission structure validation"""
+
+    def test_sample_plan_is_valid(self, sample_plan, sample_mission):
+        validate(sample_plan, PlanSchema)
+        validate(sample_mission, MissionSchema)
+
+    def test_missing_required_key(self, sample_plan):
+        del sample_plan["commands"]
+
+        with pytest.raises(SchemaError, match="commands"):
+            validate(sample_plan, PlanSchema)
+
+    def test_wrong_nested_type_reports_location(self, sample_plan):
+        sample_plan["phases"][1]["agents"][0]["dependencies"] = "agent_00"
+
+        with pytest.raises(SchemaError, match=r"\$\.phases\[1\]\.agents\[0\]\.dependencies"):
+            compile_schema(PlanSchema)(sample_plan, "$")
+
+    def test_bool_is_not_int(self, sample_plan):
+        sample_plan["phases"][0]["phase"] = True
+
+        with pytest.raises(SchemaError):
+            validate(sample_plan, PlanSchema)
+
+    def test_optional_and_unknown_keys_allowed(self, sample_plan):
+        sample_plan["phases"][0]["agents"][0]["model"] = None
+        sample_plan["something_new"] = {"x": 1}
+
+        validate(sample_plan, PlanSchema)
+
+
+class TestFiles:
+    """Tests for file helpers and the loaders that use them"""
+
+    def test_write_then_read(self, tmp_path, sample_plan):
+        path = tmp_path / "plan.json"
+        write_json(path, sample_plan)
+
+        assert read_json(path, PlanSchema) == sample_plan
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_validated_read_parses_once(self, tmp_path, sample_plan, monkeypatch):
+        path = tmp_path / "plan.json"
+        write_json(path, {**sample_plan, "something_new": {"x": 1}})
+        calls = []
+        original = serialization.loads
+        monkeypatch.setattr(serialization, "loads", lambda data, backend=None: calls.append(1) or original(data))
+
+        data = read_json(path, PlanSchema)
+
+        assert calls == [1]
+        assert data["something_new"] == {"x": 1}
+
+    def test_pretty_write(self, tmp_path):
+        path = tmp_path / "mission.json"
+        write_json(path, {"id": "m1", "status": "executing"}, pretty=True)
+
+        assert path.read_text().splitlines()[1] == '  "id": "m1",'
+
+    def test_validation_can_be_disabled(self, tmp_path, monkeypatch):
+        path = tmp_path / "plan.json"
+        path.write_text("{}")
+        monkeypatch.setattr(serialization, "JSON_VALIDATE", False)
+
+        assert read_json(path, PlanSchema) == {}
+
+    def test_load_mission_rejects_malformed_plan(self, temp_mission_dir, sample_mission, sample_plan, monkeypatch):
+        import utils
+
+        monkeypatch.setattr(utils, "MISSION_DIR", temp_mission_dir.parent)
+        sample_plan["phases"] = {"1": []}
+        (temp_mission_dir / "mission.json").write_text(json.dumps(sample_mission))
+        (temp_mission_dir / "execution_plan.json").write_text(json.dumps(sample_plan))
+
+        with pytest.raises(InvalidMissionError, match="phases"):
+            utils.load_mission(sample_mission["id"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
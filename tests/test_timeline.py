@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Tests for timeline.py"""
+
+import json
+import os
+import sys
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from timeline import (
+    build_timeline,
+    critical_path,
+    export_timeline,
+    merge_intervals,
+    timeline_stats,
+    to_chrome_trace,
+)
+from runtime_stats import collect_mission_samples, record_agent_started
+from utils import read_log_events
+from validation import validate_mission_outputs
+
+
+@pytest.fixture
+def logged_mission(temp_mission_dir, write_event):
+    """Phase 1 has a 40s gap, phase 2 starts 30s after phase 1 ends"""
+    for timestamp, event, agent_id in [
+        ("2026-02-06T12:00:00", "execution_started", None),
+        ("2026-02-06T12:00:00", "agent_started", "test_agent_00"),
+        ("2026-02-06T12:01:00", "agent_finished", "test_agent_00"),
+        ("2026-02-06T12:01:40", "agent_started", "test_agent_01"),
+        ("2026-02-06T12:05:00", "agent_finished", "test_agent_01"),
+        ("2026-02-06T12:05:30", "agent_started", "test_agent_02"),
+        ("2026-02-06T12:06:30", "agent_finished", "test_agent_02"),
+    ]:
+        write_event(temp_mission_dir, timestamp, event, {"agent_id": agent_id} if agent_id else {})
+    return temp_mission_dir
+
+
+class TestTimeline:
+    """Tests for reconstructing agent bars"""
+
+    def test_bars_relative_to_execution_start(self, logged_mission, sample_plan):
+        timeline = build_timeline(logged_mission, sample_plan)
+
+        assert [(b["agent_id"], b["phase"], b["start"], b["end"]) for b in timeline["bars"]] == [
+            ("test_agent_00", 1, 0, 60),
+            ("test_agent_01", 1, 100, 300),
+            ("test_agent_02", 2, 330, 390),
+        ]
+        assert timeline["bars"][1]["model"] == "opus"
+
+    def test_empty_mission(self, temp_mission_dir, sample_plan):
+        timeline = build_timeline(temp_mission_dir, sample_plan)
+        assert timeline["bars"] == []
+        assert timeline_stats(timeline, sample_plan)["makespan"] == 0
+
+
+class TestStats:
+    """Tests for utilization, idle gaps and critical path"""
+
+    def test_utilization_and_phases(self, logged_mission, sample_plan):
+        stats = timeline_stats(build_timeline(logged_mission, sample_plan), sample_plan)
+
+        assert stats["makespan"] == 390
+        assert stats["busy"] == 320
+        assert stats["peak_concurrency"] == 1
+        assert stats["utilization"] == round(320 / 390, 3)
+        assert [(p["phase"], p["idle"], p["wait_before"]) for p in stats["phases"]] == [(1, 40, 0), (2, 0, 30)]
+
+    def test_critical_path_uses_actual_durations(self, logged_mission, sample_plan):
+        stats = timeline_stats(build_timeline(logged_mission, sample_plan), sample_plan)
+
+        assert stats["critical_path"] == {
+            "length": 260, "agents": ["test_agent_01", "test_agent_02"], "efficiency": round(260 / 390, 3)
+        }
+
+    def test_critical_path_respects_explicit_dependencies(self, sample_plan):
+        sample_plan["phases"][1]["agents"][0]["dependencies"] = ["test_agent_00"]
+
+        length, path = critical_path(sample_plan, {"test_agent_00": 10, "test_agent_01": 50, "test_agent_02": 5})
+
+        assert (length, path) == (50, ["test_agent_01"])
+
+    def test_merge_intervals(self):
+        assert merge_intervals([(5, 8), (0, 3), (2, 4), (8, 9)]) == [(0, 4), (5, 9)]
+
+
+class TestExport:
+    """Tests for the HTML/SVG and Chrome trace outputs"""
+
+    def test_chrome_trace_events(self, logged_mission, sample_plan, sample_mission):
+        trace = to_chrome_trace(sample_mission, build_timeline(logged_mission, sample_plan))
+
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert [(e["name"], e["ts"], e["dur"]) for e in complete] == [
+            ("test_agent_00", 0, 60_000_000),
+            ("test_agent_01", 100_000_000, 200_000_000),
+            ("test_agent_02", 330_000_000, 60_000_000),
+        ]
+        assert len({e["tid"] for e in complete}) == 3
+
+    @pytest.mark.parametrize("fmt,name", [("html", "timeline.html"), ("svg", "timeline.svg"),
+                                          ("chrome", "timeline.trace.json")])
+    def test_export_formats(self, logged_mission, sample_plan, sample_mission, fmt, name):
+        mission = {**sample_mission, "path": str(logged_mission)}
+
+        path, stats = export_timeline(mission, sample_plan, fmt)
+
+        assert path == logged_mission / "reports" / name
+        content = path.read_text()
+        if fmt == "chrome":
+            assert json.loads(content)["traceEvents"]
+        else:
+            assert content.count("<rect") == 3
+            assert 'stroke="#000"' in content
+        assert stats["agents"] == 3
+
+
+class TestFinishEvents:
+    """Tests for agent_finished events recorded from arriving outputs"""
+
+    def test_validation_records_finish_at_output_mtime(self, temp_mission_dir, sample_plan):
+        record_agent_started(temp_mission_dir, "test_agent_00")
+        output = temp_mission_dir / "outputs" / "test_agent_00.md"
+        output.write_text("# Result\n\n" + "valid research content " * 20 + "\nMISSION_COMPLETE: test_agent_00")
+        mtime = datetime(2030, 1, 1, 12, 0, 0).timestamp()
+        os.utime(output, (mtime, mtime))
+
+        validate_mission_outputs(temp_mission_dir, sample_plan)
+        output.touch()
+        validate_mission_outputs(temp_mission_dir, sample_plan)
+
+        finished = read_log_events(temp_mission_dir, "agent_finished")
+        assert len(finished) == 1
+        assert finished[0]["data"]["source"] == "output"
+        sample = collect_mission_samples(temp_mission_dir, sample_plan)[0]
+        assert sample["finished_at"] == mtime
+
+    def test_no_finish_without_start(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text(
+            "# Result\n\n" + "valid research content " * 20 + "\nMISSION_COMPLETE: test_agent_00"
+        )
+
+        validate_mission_outputs(temp_mission_dir, sample_plan)
+
+        assert read_log_events(temp_mission_dir, "agent_finished") == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
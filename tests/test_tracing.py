@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for tracing.py"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from tracing import (
+    build_spans,
+    derived_span_id,
+    export_trace,
+    root_span_id,
+    span,
+    to_otlp,
+)
+from utils import log_event, mission_trace_id, read_log_events
+
+
+@pytest.fixture
+def mission(temp_mission_dir, sample_mission):
+    return {**sample_mission, "path": str(temp_mission_dir), "status": "completed"}
+
+
+class TestSpanContext:
+    """Tests for recording spans during the lifecycle"""
+
+    def test_nested_spans_link_parents(self, temp_mission_dir):
+        with span(temp_mission_dir, "outer", {"a": 1}):
+            with span(temp_mission_dir, "inner") as attrs:
+                attrs["items"] = 3
+
+        inner, outer = [e["data"] for e in read_log_events(temp_mission_dir, "span")]
+        assert inner["name"] == "inner"
+        assert inner["parent_span_id"] == outer["span_id"]
+        assert inner["attributes"] == {"items": 3}
+        assert outer["parent_span_id"] == root_span_id("test_mission_123")
+        assert outer["start"] <= inner["start"] <= inner["end"] <= outer["end"]
+
+    def test_log_events_carry_trace_and_span_ids(self, temp_mission_dir):
+        log_event(temp_mission_dir, "before")
+        with span(temp_mission_dir, "work"):
+            log_event(temp_mission_dir, "inside")
+
+        before, inside, recorded = read_log_events(temp_mission_dir)
+        assert before["trace_id"] == mission_trace_id("test_mission_123")
+        assert "span_id" not in before
+        assert inside["span_id"] == recorded["data"]["span_id"]
+
+    def test_error_status_on_exception(self, temp_mission_dir):
+        with pytest.raises(ValueError):
+            with span(temp_mission_dir, "failing"):
+                raise ValueError("boom")
+
+        assert read_log_events(temp_mission_dir, "span")[0]["data"]["status"] == "error"
+
+
+class TestBuildSpans:
+    """Tests for reconstructing the trace from mission logs"""
+
+    def test_agent_and_queue_spans(self, temp_mission_dir, sample_plan, mission, write_event):
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "execution_started")
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "agent_started", {"agent_id": "test_agent_00"})
+        write_event(temp_mission_dir, "2026-02-06T12:00:05", "agent_started", {"agent_id": "test_agent_01"})
+        write_event(temp_mission_dir, "2026-02-06T12:01:00", "agent_finished", {"agent_id": "test_agent_00"})
+        write_event(temp_mission_dir, "2026-02-06T12:02:00", "agent_finished", {"agent_id": "test_agent_01"})
+        write_event(temp_mission_dir, "2026-02-06T12:02:30", "agent_started", {"agent_id": "test_agent_02"})
+        write_event(temp_mission_dir, "2026-02-06T12:03:00", "agent_finished", {"agent_id": "test_agent_02"})
+
+        spans = {sp["name"]: sp for sp in build_spans(mission, sample_plan)}
+
+        root = spans["mission test_mission_123"]
+        assert root["parent_span_id"] is None
+        assert spans["agent test_agent_00"]["end"] - spans["agent test_agent_00"]["start"] == 60
+        assert spans["agent test_agent_02"]["parent_span_id"] == root["span_id"]
+        assert "queue test_agent_00" not in spans
+        assert spans["queue test_agent_01"]["attributes"]["queue.wait_seconds"] == 5
+        # 02는 마지막 의존 에이전트(01)가 끝난 뒤 30초 대기
+        assert spans["queue test_agent_02"]["attributes"]["queue.wait_seconds"] == 30
+        assert root["end"] - root["start"] == 180
+
+    def test_includes_recorded_spans(self, temp_mission_dir, sample_plan, mission):
+        with span(temp_mission_dir, "consolidate.render"):
+            pass
+
+        spans = build_spans(mission, sample_plan)
+
+        assert [sp["name"] for sp in spans] == ["mission test_mission_123", "consolidate.render"]
+        assert spans[1]["parent_span_id"] == spans[0]["span_id"]
+
+
+class TestOtlpExport:
+    """Tests for the OTLP JSON document"""
+
+    def test_otlp_structure(self, temp_mission_dir, sample_plan, mission):
+        with span(temp_mission_dir, "execute", {"phase": 1, "hedge": False}):
+            pass
+
+        doc = to_otlp(mission, build_spans(mission, sample_plan))
+
+        resource = doc["resourceSpans"][0]
+        assert {"key": "service.name", "value": {"stringValue": "agent-avengers"}} in resource["resource"]["attributes"]
+        root, execute = resource["scopeSpans"][0]["spans"]
+        assert {root["traceId"], execute["traceId"]} == {mission_trace_id("test_mission_123")}
+        assert "parentSpanId" not in root
+        assert execute["parentSpanId"] == root["spanId"]
+        assert int(execute["endTimeUnixNano"]) >= int(execute["startTimeUnixNano"])
+        assert {"key": "phase", "value": {"intValue": "1"}} in execute["attributes"]
+        assert {"key": "hedge", "value": {"boolValue": False}} in execute["attributes"]
+
+    def test_export_writes_file(self, temp_mission_dir, sample_plan, mission, write_event):
+        write_event(temp_mission_dir, "2026-02-06T12:00:00", "agent_started", {"agent_id": "test_agent_00"})
+        write_event(temp_mission_dir, "2026-02-06T12:01:00", "agent_finished", {"agent_id": "test_agent_00"})
+
+        path, count = export_trace(mission, sample_plan)
+
+        assert path == temp_mission_dir / "logs" / "trace.otlp.json"
+        assert count == 2
+        spans = json.loads(path.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert spans[1]["spanId"] == derived_span_id("test_mission_123", "test_agent_00")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Tests for validation.py"""
+
+import os
+import sys
+import time
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from validation import (
+    RULES,
+    agent_specs,
+    check_output,
+    register_rule,
+    required_headings,
+    validate_mission_outputs,
+)
+from consolidate import collect_outputs, validate_outputs
+from utils import read_log_events
+
+
+def good_output(agent_id, extra=""):
+    return f"# Result\n\n{'findings ' * 20}\n{extra}\nMISSION_COMPLETE: {agent_id}\n"
+
+
+def settle(path):
+    """Backdate a file past the settle window"""
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+
+
+def spec(agent_id="a1", **overrides):
+    return {"agent_id": agent_id, "type": "researcher", "mode": "spawn",
+            "required_headings": [], "rules": {}, **overrides}
+
+
+class TestRules:
+    """Tests for individual validation rules"""
+
+    def test_good_output_passes(self):
+        assert check_output(good_output("a1"), spec()) == []
+
+    def test_missing_marker_detected(self):
+        issues = check_output(good_output("a1").replace("MISSION_COMPLETE: a1", ""), spec())
+        assert any("완료 마커" in i for i in issues)
+
+    def test_marker_not_required_for_legacy_plans(self, sample_plan):
+        content = good_output("a1").replace("MISSION_COMPLETE: a1", "")
+        legacy = {**agent_specs(sample_plan)["test_agent_00"], "agent_id": "a1"}
+
+        assert check_output(content, legacy) == []
+        assert check_output(content, {**legacy, "completion_marker": True})
+
+    def test_marker_not_required_for_existing_sessions(self):
+        content = good_output("a1").replace("MISSION_COMPLETE: a1", "")
+        assert check_output(content, spec(mode="existing")) == []
+
+    def test_hedge_label_marker_accepted(self):
+        assert check_output(good_output("a1__hedge"), spec()) == []
+
+    def test_marker_must_be_last_line(self):
+        truncated = f"MISSION_COMPLETE: a1\n{good_output('a1')}".replace("\nMISSION_COMPLETE: a1\n", "\n")
+        assert any("완료 마커" in i for i in check_output(truncated, spec()))
+        assert check_output(good_output("a1") + "\n  \n", spec()) == []
+
+    def test_marker_for_other_agent_rejected(self):
+        for agent_id in ("a10", "a1__hedge2", "a1 extra"):
+            assert any("완료 마커" in i for i in check_output(good_output(agent_id), spec()))
+
+    def test_min_length_per_type(self):
+        assert any("너무 짧음" in i for i in check_output("MISSION_COMPLETE: a1", spec()))
+        assert check_output("x" * 60 + "\nMISSION_COMPLETE: a1", spec(rules={"min_length": 10})) == []
+
+    def test_required_headings_from_expected_output(self):
+        headings = required_headings("보고서:\n## 요약\n## 결론\n")
+        assert headings == ["요약", "결론"]
+
+        issues = check_output(good_output("a1", "## 요약\n"), spec(required_headings=headings))
+        assert issues == ["필수 헤딩 누락: 결론"]
+
+    def test_forbidden_and_required_patterns(self):
+        error_page = good_output("a1", "<html><body>502</body></html>")
+        assert any("금지 패턴" in i for i in check_output(error_page, spec()))
+
+        coder = spec(rules={"required": [r"```"]})
+        assert any("필수 패턴" in i for i in check_output(good_output("a1"), coder))
+        assert check_output(good_output("a1", "```py\npass\n```"), coder) == []
+
+    def test_custom_rule_registration(self):
+        @register_rule("no_todo")
+        def no_todo(content, spec):
+            return ["TODO 남음"] if "TODO" in content else []
+
+        try:
+            assert check_output(good_output("a1", "TODO"), spec(), rules=["no_todo"]) == ["TODO 남음"]
+        finally:
+            RULES.pop("no_todo")
+
+
+class TestIncrementalValidation:
+    """Tests for validate_mission_outputs"""
+
+    def test_agent_specs_from_plan(self, sample_plan):
+        specs = agent_specs(sample_plan)
+        assert specs["test_agent_00"]["type"] == "researcher"
+        assert specs["test_agent_02"]["mode"] == "existing"
+
+    def test_bad_output_rejected_and_logged(self, temp_mission_dir, sample_plan):
+        outputs = temp_mission_dir / "outputs"
+        (outputs / "test_agent_00.md").write_text(good_output("test_agent_00"))
+        (outputs / "test_agent_01.md").write_text("partial")
+        settle(outputs / "test_agent_01.md")
+
+        checked = validate_mission_outputs(temp_mission_dir, sample_plan)
+
+        assert {r["agent_id"]: r["valid"] for r in checked} == {"test_agent_00": True, "test_agent_01": False}
+        assert not (outputs / "test_agent_01.md").exists()
+        assert list((outputs / ".rejected").glob("*/test_agent_01.md"))
+        rejected = read_log_events(temp_mission_dir, "output_rejected")
+        assert [e["data"]["agent_id"] for e in rejected] == ["test_agent_01"]
+
+    def test_unchanged_outputs_skipped(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text(good_output("test_agent_00"))
+
+        assert len(validate_mission_outputs(temp_mission_dir, sample_plan)) == 1
+        assert validate_mission_outputs(temp_mission_dir, sample_plan) == []
+
+    def test_in_flight_output_not_validated(self, temp_mission_dir, sample_plan):
+        from runtime_stats import record_agent_finished, record_agent_started
+        output = temp_mission_dir / "outputs" / "test_agent_00.md"
+        record_agent_finished(temp_mission_dir, "test_agent_00")
+        record_agent_started(temp_mission_dir, "test_agent_00")
+        output.write_text("# Result\n절반만 쓴")
+
+        assert validate_mission_outputs(temp_mission_dir, sample_plan) == []
+        assert output.exists()
+        assert read_log_events(temp_mission_dir, "output_validated") == []
+
+        record_agent_finished(temp_mission_dir, "test_agent_00")
+        checked = validate_mission_outputs(temp_mission_dir, sample_plan)
+        assert [r.get("rejected") for r in checked] == [True]
+
+    def test_report_only_mode_keeps_file(self, temp_mission_dir, sample_plan):
+        (temp_mission_dir / "outputs" / "test_agent_00.md").write_text("partial")
+        settle(temp_mission_dir / "outputs" / "test_agent_00.md")
+
+        validate_mission_outputs(temp_mission_dir, sample_plan, reject=False)
+
+        assert (temp_mission_dir / "outputs" / "test_agent_00.md").exists()
+
+    def test_consolidate_counts_invalid_outputs(self, temp_mission_dir, sample_plan):
+        outputs = temp_mission_dir / "outputs"
+        (outputs / "test_agent_00.md").write_text(good_output("test_agent_00"))
+        (outputs / "test_agent_01.md").write_text("<html>error</html>")
+        (outputs / "test_agent_02.md").write_text("# Report\n" + "text " * 80)
+
+        validation = validate_outputs(collect_outputs(temp_mission_dir, sample_plan), sample_plan)
+
+        assert validation["completed"] == 2
+        assert validation["invalid"] == 1
+        assert validation["success"] is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
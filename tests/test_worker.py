@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for worker.py and the avengers worker client"""
+
+import json
+import os
+import sys
+import threading
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import monitor
+from avengers import decode_request, encode_request, run_in_worker, worker_env
+from worker import WorkerServer, handle_request, run_command
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Worker serving on a temporary socket in a background thread"""
+    socket_path = str(tmp_path / "w.sock")
+    srv = WorkerServer(socket_path, preload=["monitor"])
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    srv.shutdown()
+    srv.server_close()
+    monitor._log_tails = None
+
+
+class TestProtocol:
+    """Tests for request encoding and handling"""
+
+    def test_request_round_trip(self):
+        data = encode_request("monitor", ["-m", "m 1", "--json"], "/tmp", {"AVENGERS_X": "a=b"})
+
+        assert decode_request(data) == ("monitor", ["-m", "m 1", "--json"], "/tmp", {"AVENGERS_X": "a=b"})
+
+    def test_protocol_version_checked(self):
+        with pytest.raises(ValueError):
+            decode_request(b"0\0/tmp\0\0monitor")
+
+    def test_refuses_mismatched_env_and_local_only_flags(self):
+        env = worker_env()
+
+        assert handle_request(encode_request("monitor", [], "/", {**env, "AVENGERS_PROFILE": "1"}), env) == b"refused env\n"
+        assert handle_request(encode_request("monitor", ["-m", "x", "-w"], "/", env), env).startswith(b"refused")
+        assert handle_request(encode_request("deploy", [], "/", env), env).startswith(b"refused")
+
+    def test_response_carries_exit_code_and_streams(self):
+        env = worker_env()
+
+        header, _, body = handle_request(encode_request("monitor", ["--bogus"], "/", env), env).partition(b"\n")
+
+        status, code, out_len, err_len = header.split()
+        assert (status, code, out_len) == (b"ok", b"2", b"0")
+        assert b"error" in body and len(body) == int(err_len)
+
+    def test_edited_templates_refreshed_per_request(self, tmp_path, monkeypatch):
+        import prompt_templates
+        monkeypatch.setattr(prompt_templates, "PROMPT_TEMPLATE_DIR", str(tmp_path))
+        (tmp_path / "spawn.md").write_text("v1 {agent_id}")
+        prompt_templates.set_template_overrides(None)
+        prompt_templates.template_source("spawn", "coder")
+        env = worker_env()
+
+        (tmp_path / "spawn.md").write_text("version 2 {agent_id}")
+        handle_request(encode_request("monitor", ["--bogus"], "/", env), env)
+
+        assert prompt_templates.template_source("spawn", "coder") == "version 2 {agent_id}"
+        prompt_templates.set_template_overrides(None)
+
+
+class TestRunCommand:
+    """Tests for running a command inside the worker process"""
+
+    def test_restores_process_state(self, tmp_path):
+        argv, cwd = list(sys.argv), os.getcwd()
+
+        code, out, err = run_command("monitor", ["--help"], str(tmp_path))
+
+        assert code == 0
+        assert out.startswith("usage: avengers monitor")
+        assert sys.argv == argv and os.getcwd() == cwd
+
+    def test_exception_becomes_exit_code(self, monkeypatch):
+        def boom():
+            raise RuntimeError("kaboom")
+        monkeypatch.setattr(monitor, "main", boom)
+
+        code, out, err = run_command("monitor", [], "/")
+
+        assert code == 1
+        assert "RuntimeError: kaboom" in err
+
+
+class TestClient:
+    """End-to-end tests over the Unix socket"""
+
+    def test_forwards_output_and_exit_code(self, server, capfd):
+        assert run_in_worker(server, "monitor", ["--help"]) == 0
+        assert capfd.readouterr().out.startswith("usage: avengers monitor")
+
+        assert run_in_worker(server, "monitor", ["-m", "missing_mission"]) == 1
+        assert "missing_mission" in capfd.readouterr().out
+
+    def test_falls_back_when_no_worker(self, tmp_path):
+        assert run_in_worker(str(tmp_path / "none.sock"), "monitor", ["--help"]) is None
+
+
+class TestLogTailCache:
+    """Tests for the incremental log reader enabled in worker mode"""
+
+    def write(self, mission_path, *events, mode="a"):
+        with open(mission_path / "logs" / "execution.jsonl", mode) as f:
+            for event in events:
+                f.write(json.dumps({"timestamp": "2026-01-01T00:00:00", "event": event}) + "\n")
+
+    def test_reads_only_appended_lines(self, temp_mission_dir, monkeypatch):
+        monkeypatch.setattr(monitor, "_log_tails", {})
+        self.write(temp_mission_dir, "a", "b", "c")
+
+        assert [e["event"] for e in monitor.read_logs(temp_mission_dir, limit=2)] == ["b", "c"]
+
+        self.write(temp_mission_dir, "d")
+        with open(temp_mission_dir / "logs" / "execution.jsonl", "a") as f:
+            f.write('{"event": "partial"')
+        assert [e["event"] for e in monitor.read_logs(temp_mission_dir, limit=2)] == ["c", "d"]
+
+        with open(temp_mission_dir / "logs" / "execution.jsonl", "a") as f:
+            f.write(', "timestamp": "x"}\n')
+        assert [e["event"] for e in monitor.read_logs(temp_mission_dir, limit=2)] == ["d", "partial"]
+
+    def test_rewritten_log_is_reread(self, temp_mission_dir, monkeypatch):
+        monkeypatch.setattr(monitor, "_log_tails", {})
+        self.write(temp_mission_dir, "a", "b", "c")
+        monitor.read_logs(temp_mission_dir)
+
+        self.write(temp_mission_dir, "x", mode="w")
+
+        assert [e["event"] for e in monitor.read_logs(temp_mission_dir)] == ["x"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])